@@ -5,14 +5,17 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
-from django.core.cache import cache, caches
+from django.core.cache import cache
 from django.db.models.signals import post_migrate
 
+from gyrinx.cache import tags as cache_tags
 from gyrinx.site.models import BANNER_CACHE_KEYS
 
 # Re-export the local task-queue driver fixture so tests can request `task_queue`
 # to drive the durable queue in manual mode (inject duplicates/failures/drops).
 from gyrinx.tasks.testing import task_queue  # noqa: F401
+from n23.content.catalogue import _reset_catalogue
+from n23.content.expansion_engine import _reset_engine
 from n23.content.models import (
     ContentBook,
     ContentEquipment,
@@ -23,7 +26,9 @@ from n23.content.models import (
     ContentWeaponAccessory,
     ContentWeaponProfile,
 )
+from n23.content.models.metadata import _reset_page_ref_index
 from n23.content.models.skill import ContentSkill, ContentSkillCategory
+from n23.content.pack_scope import _reset_scope
 from n23.content.statlines import set_fighter_stats
 from n23.core.models.action import ListAction, ListActionType
 from n23.core.models.campaign import Campaign
@@ -63,6 +68,43 @@ def django_test_settings():
     tracing._reset_tracing()
     tracing._init_tracing()
 
+    # Keep n26's modifier index out of the process-wide cache, so a test's
+    # query count never depends on which tests warmed it first
+    settings.N26_MODIFIER_INDEX_CACHE = False
+
+    # Nor on which tests left a gang sheet snapshot behind
+    settings.N26_GANG_SHEET_SNAPSHOTS = False
+
+    # Nor on which ingest plans an earlier test kept
+    settings.N26_INGEST_PLAN_CACHE = False
+
+    # Nor on which hire lists an earlier test built
+    settings.N26_HIRE_LIST_CACHE = False
+
+    # Nor on which content fighters n23's catalogue already holds
+    settings.N23_CONTENT_CATALOGUE = False
+
+    # Nor on which pack-owned ids an earlier test loaded
+    settings.N23_PACK_SCOPE_CACHE = False
+
+    # Nor on which expansion matches an earlier test remembered
+    settings.N23_EXPANSION_ENGINE = False
+
+    # Never sample a test client request for its queries: the capture would
+    # sit around the test's own django_assert_num_queries
+    settings.QUERY_BUDGET_SAMPLE_RATE = 0
+
+    # Keep each user's unread count out of the shared cache, as above
+    settings.NOTIFICATION_COUNT_CACHE = False
+
+    # Cache tag versions are this process's own: never re-read from the
+    # shared cache, so no test counts a version query
+    settings.SHARED_CACHE_TAG_TTL = None
+
+    # Write analytics events inside log_event, so a test sees the row at once
+    # and no flusher thread writes outside the test's transaction
+    settings.ANALYTICS_EVENT_SINK = "sync"
+
     # Use faster password hasher for tests (MD5 instead of PBKDF2)
     settings.PASSWORD_HASHERS = [
         "django.contrib.auth.hashers.MD5PasswordHasher",
@@ -71,24 +113,34 @@ def django_test_settings():
 
 @pytest.fixture(autouse=True)
 def clear_content_page_ref_cache():
-    """Empty the per-title page-ref cache before every test.
+    """Forget the page ref index before every test.
 
-    ``ContentPageRef.find_similar`` caches one entry per title in a process-local
-    ``LocMemCache``, and it sits in the fighter-card render path. Nothing else
-    clears it — every other autouse fixture here is session-scoped — so its
-    contents at test start depend on which tests ran earlier *in the same xdist
-    worker*, and it keeps filling while a test runs.
+    ``ContentPageRef.find_similar`` answers from a process-wide index of every
+    page ref, and it sits in the fighter-card render path. Nothing else clears
+    it — every other autouse fixture here is session-scoped — so whether a test
+    pays the query that builds it depends on which tests ran earlier *in the
+    same xdist worker*, and its rows on what those tests had created.
 
     That makes query counts depend on worker history and on how many renders have
     already happened, which is what made the relative query-count tests in
     test_crew.py flaky on CI but not locally (#2114).
 
-    Only this cache is cleared. The ``default`` cache deliberately holds the
+    The content catalogue, pack scope and expansion engine are forgotten too,
+    for tests that turn them on.
+
+    Only the index and those caches are cleared. The ``default`` cache deliberately holds the
     ``BANNER_CACHE_KEYS`` entries from ``django_test_settings`` so the banner
     query stays out of every test's count; clearing that here would put the
     query back.
+
+    Cache tags are reset too: a test that saved a banner or a page ref has moved
+    its tag, and the keys built from it would no longer be the seeded ones.
     """
-    caches["content_page_ref_cache"].clear()
+    _reset_page_ref_index()
+    _reset_catalogue()
+    _reset_scope()
+    _reset_engine()
+    cache_tags._reset()
     yield
 
 
@@ -5,13 +5,13 @@ from datetime import timedelta
 
 from django.contrib import admin
 from django.contrib.auth import get_user_model
-from django.db.models import Count
+from django.db.models import Count, Sum
 from django.db.models.functions import TruncDate
 from django.shortcuts import render
 from django.urls import path
 from django.utils import timezone
 
-from gyrinx.analytics.models import Event
+from gyrinx.analytics.models import DailyEventCount, DailySeriesCount
 from gyrinx.analytics.nouns import Edition
 from gyrinx.analytics.registry import growth_series
 
@@ -126,17 +126,19 @@ class AnalyticsAdminSite(admin.site.__class__):
         A noun belongs to one edition, so the lines never merge two products
         into one; the filter is there to stop one edition's busiest actions
         crowding the other's out of the top ten.
+
+        Read from the daily rollups (``gyrinx.analytics.rollup``), not from
+        ``Event``: whole days, as of the rollup's last run.
         """
-        events = Event.objects.all()
+        counts = DailyEventCount.objects.filter(day__gte=start_date.date())
         if edition is not None:
-            events = events.filter(edition=edition)
+            counts = counts.filter(edition=edition)
 
         # First get top 10 event types
         top_event_types = (
-            events.filter(created__gte=start_date)
-            .exclude(verb="view")
+            counts.exclude(verb="view")
             .values("noun", "verb")
-            .annotate(total=Count("id"))
+            .annotate(total=Sum("count"))
             .order_by("-total")[:10]
         )
 
@@ -145,15 +147,13 @@ class AnalyticsAdminSite(admin.site.__class__):
 
         # Get daily counts for these top events
         daily_events = (
-            events.filter(
-                created__gte=start_date,
+            counts.filter(
                 noun__in=[e[0] for e in top_events],
                 verb__in=[e[1] for e in top_events],
             )
-            .annotate(date=TruncDate("created"))
-            .values("date", "noun", "verb")
-            .annotate(count=Count("id"))
-            .order_by("date")
+            .values("day", "noun", "verb")
+            .annotate(total=Sum("count"))
+            .order_by("day")
         )
 
         # Group by event type
@@ -163,7 +163,7 @@ class AnalyticsAdminSite(admin.site.__class__):
             event_type = f"{entry['noun']} - {entry['verb']}"
             # Only include if it's one of our top events
             if (entry["noun"], entry["verb"]) in top_events:
-                series_data[event_type][entry["date"]] = entry["count"]
+                series_data[event_type][entry["day"]] = entry["total"]
 
         # Generate all dates in the range
         current_date = start_date.date()
@@ -221,9 +221,17 @@ class AnalyticsAdminSite(admin.site.__class__):
         Every line says which edition it belongs to, so picking one leaves
         only that product's lines. Nothing is summed across editions here:
         each line stays its own.
+
+        The counts come from the daily rollups rather than from each series'
+        ``daily_counts``, which the rollup task calls instead.
         """
         series = growth_series(edition)
-        counts_by_series = [s.daily_counts(start_date) for s in series]
+        rolled_up = defaultdict(dict)
+        for key, day, count in DailySeriesCount.objects.filter(
+            series_key__in=[s.key for s in series], day__gte=start_date.date()
+        ).values_list("series_key", "day", "count"):
+            rolled_up[key][day] = count
+        counts_by_series = [rolled_up[s.key] for s in series]
 
         datasets = [
             {
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class AnalyticsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "gyrinx.analytics"
+
+    def ready(self):
+        from django.core.signals import request_finished
+
+        from gyrinx.analytics.sink import flush_at_request_end
+
+        request_finished.connect(
+            flush_at_request_end, dispatch_uid="analytics_flush_at_request_end"
+        )
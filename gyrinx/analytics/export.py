@@ -0,0 +1,25 @@
+"""The analytics event table as a streaming export (see :mod:`gyrinx.export`).
+
+What the Streamlit tooling in ``analytics/streamlit`` reads, without a dump
+restore or an ad-hoc query. IP addresses and session ids stay behind: the
+tooling counts actions, and a file that leaves the database should carry no
+more about a person than that needs.
+"""
+
+from gyrinx.export import Export
+
+EVENTS = Export(
+    "events",
+    (
+        ("id", "pk"),
+        ("created", "created"),
+        ("user_id", "owner_id"),
+        ("noun", "noun"),
+        ("verb", "verb"),
+        ("edition", "edition"),
+        ("object_type", "object_type__model"),
+        ("object_id", "object_id"),
+        ("field", "field"),
+        ("context", "context"),
+    ),
+)
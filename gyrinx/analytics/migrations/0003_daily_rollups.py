@@ -0,0 +1,109 @@
+# Generated by Django 6.0.7 on 2026-10-16 11:40
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analytics", "0002_event_edition"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyEventCount",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(auto_now=True, db_index=True)),
+                ("day", models.DateField()),
+                ("noun", models.CharField(max_length=50)),
+                ("verb", models.CharField(max_length=50)),
+                (
+                    "edition",
+                    models.CharField(
+                        choices=[
+                            ("platform", "Platform"),
+                            ("n23", "N23"),
+                            ("n26", "N26"),
+                            ("unknown", "Unknown"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "daily event count",
+                "verbose_name_plural": "daily event counts",
+                "ordering": ["day"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "noun", "verb", "edition"),
+                        name="dailyeventcount_one_per_day",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="DailySeriesCount",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(auto_now=True, db_index=True)),
+                ("day", models.DateField()),
+                ("series_key", models.CharField(max_length=100)),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "daily series count",
+                "verbose_name_plural": "daily series counts",
+                "ordering": ["day"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("series_key", "day"),
+                        name="dailyseriescount_one_per_day",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="RollupWatermark",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(auto_now=True, db_index=True)),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("day", models.DateField()),
+            ],
+            options={
+                "verbose_name": "rollup watermark",
+                "verbose_name_plural": "rollup watermarks",
+            },
+        ),
+    ]
@@ -3,12 +3,14 @@ import logging
 import re
 from enum import Enum
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
 
 from gyrinx.analytics.nouns import Edition, edition_for_noun, noun_choices
 from gyrinx.base_models import AppBase
+from gyrinx.models import Base
 from gyrinx.tracker import track
 
 logger = logging.getLogger(__name__)
@@ -166,14 +168,20 @@ class Event(AppBase):
 
     def save(self, *args, **kwargs):
         """Override save to also log the event to the log stream."""
+        self.fill_edition()
+        super().save(*args, **kwargs)
+        self.log_to_stream()
+
+    def fill_edition(self):
+        """Derive the edition from the noun, unless one was given."""
         # Derived here rather than in log_event so that anything writing an
         # Event — a signal, a test, a shell — gets the dimension filled in.
         # An explicit edition is left alone.
         if not self.edition or self.edition == Edition.UNKNOWN:
             self.edition = edition_for_noun(self.noun)
 
-        super().save(*args, **kwargs)
-
+    def log_to_stream(self):
+        """Emit this (written) event to the log stream. Never raises."""
         try:
             # Track user event. The event name needs no edition prefix: a noun
             # belongs to one edition only, so "event_create_gang" and
@@ -200,6 +208,78 @@ class Event(AppBase):
             logger.exception("Failed to log event to stream")
 
 
+class DailyEventCount(Base):
+    """How many events of one noun/verb/edition happened on one day.
+
+    A rollup of ``Event``, written by ``gyrinx.analytics.rollup`` and read by
+    the dashboard, so a dashboard load groups a few thousand rows rather than
+    the whole event table.
+    """
+
+    day = models.DateField()
+    noun = models.CharField(max_length=50)
+    verb = models.CharField(max_length=50)
+    edition = models.CharField(max_length=20, choices=Edition.choices)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "noun", "verb", "edition"],
+                name="dailyeventcount_one_per_day",
+            ),
+        ]
+        ordering = ["day"]
+        verbose_name = "daily event count"
+        verbose_name_plural = "daily event counts"
+
+    def __str__(self):
+        return f"{self.day} {self.verb} {self.noun}: {self.count}"
+
+
+class DailySeriesCount(Base):
+    """One registered growth series' count for one day.
+
+    ``series_key`` is the ``GrowthSeries.key``; the count is what its
+    ``daily_counts`` said about that day when the rollup last ran.
+    """
+
+    day = models.DateField()
+    series_key = models.CharField(max_length=100)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["series_key", "day"],
+                name="dailyseriescount_one_per_day",
+            ),
+        ]
+        ordering = ["day"]
+        verbose_name = "daily series count"
+        verbose_name_plural = "daily series counts"
+
+    def __str__(self):
+        return f"{self.day} {self.series_key}: {self.count}"
+
+
+class RollupWatermark(Base):
+    """The first day a rollup still has to recompute.
+
+    Days before it are final; the rollup starts from it on its next run.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    day = models.DateField()
+
+    class Meta:
+        verbose_name = "rollup watermark"
+        verbose_name_plural = "rollup watermarks"
+
+    def __str__(self):
+        return f"{self.name} from {self.day}"
+
+
 def ensure_json_serializable(data):
     """
     Recursively ensure all data is JSON serializable.
@@ -297,7 +377,10 @@ def log_event(
         **context: Additional context data to store in the JSON field
 
     Returns:
-        Event: The created Event instance, or None if an error occurred
+        Event: The created Event instance, or None if an error occurred. With
+        ``ANALYTICS_EVENT_SINK = "buffered"`` it is queued rather than written,
+        once the surrounding transaction commits: the row lands when the sink
+        next flushes (see gyrinx.analytics.sink).
 
     Example:
         log_event(
@@ -347,7 +430,17 @@ def log_event(
             event_data["object_id"] = object_id if as_uuid is None else as_uuid()
             event_data["object_type"] = ContentType.objects.get_for_model(object)
 
-        return Event.objects.create(**event_data)
+        event = Event(**event_data)
+        if settings.ANALYTICS_EVENT_SINK == "buffered":
+            # Written by the sink, off the request path — and queued only if
+            # the action commits: one that rolled back logged nothing.
+            from gyrinx.analytics.sink import get_sink
+
+            sink = get_sink()
+            transaction.on_commit(lambda: sink.put(event), robust=True)
+        else:
+            event.save()
+        return event
     except Exception as e:
         # Log the error but don't crash the application
         logger.error(
@@ -8,7 +8,8 @@ day since <date>?". The platform does the cumulating and the Chart.js shaping.
 
 Editions register from their admin package, which Django imports during
 ``admin.autodiscover()`` — see ``n23/core/admin/analytics.py``. Registration is
-therefore complete long before any dashboard request is served.
+therefore complete long before any dashboard request is served, or any rollup
+task run.
 
 An empty registry is not an error: the chart simply has no lines.
 """
@@ -32,9 +33,11 @@ __all__ = [
 class GrowthSeries:
     """One line on the cumulative-growth chart.
 
-    ``daily_counts`` is called with the window's start datetime and returns a
-    mapping of day to "how many were created that day". Days with none may be
-    omitted — the platform accumulates the values and fills the gaps.
+    ``daily_counts`` is called with a start datetime and returns a mapping of
+    day to "how many were created that day". Days with none may be omitted —
+    the platform accumulates the values and fills the gaps. It is called by
+    the scheduled rollup (``gyrinx.analytics.rollup``), not per dashboard
+    load, so it may be as slow as a full count of its table.
 
     ``edition`` says whose line it is, so the dashboard can show one product at
     a time. Two editions' gangs are not one number, and a chart that adds them
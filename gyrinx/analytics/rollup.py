@@ -0,0 +1,144 @@
+"""
+Daily rollups of what the analytics dashboard charts.
+
+The dashboard used to run its ``TruncDate``/``Count`` group-bys over the whole
+``Event`` table — and over each edition's content tables, through the growth
+series — on every load, so it got slower with every event written. It reads
+``DailyEventCount`` and ``DailySeriesCount`` instead: one row per day per
+line, written here by the scheduled ``roll_up_analytics`` task.
+
+Each rollup keeps a ``RollupWatermark``: the first day it has not finished
+with. A run recomputes whole days from the watermark onward, replaces the rows
+it held for them, and moves the watermark to today — today is still filling
+up, so the next run does it again. A day before the watermark is never read
+from the source again, which is what keeps a run's cost flat however large
+``Event`` grows. A new growth series has no watermark yet, so its first run
+fills in its whole history.
+
+Events are append-only, so a finished day's event counts stay right. A growth
+series' need not: "lists still being built, by the day they were created"
+changes for old days whenever an old list is archived. ``rebuild=True``
+recomputes from the start; ``restate_growth_series`` does that for the series
+nightly, so their history drifts for at most a day.
+
+The dashboard is as fresh as the last run — see ``ROLLUP_SCHEDULE`` in
+``gyrinx/analytics/tasks.py``.
+"""
+
+import logging
+from datetime import date, datetime, time
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from gyrinx.analytics.models import (
+    DailyEventCount,
+    DailySeriesCount,
+    Event,
+    RollupWatermark,
+)
+from gyrinx.analytics.registry import GrowthSeries, growth_series
+
+logger = logging.getLogger(__name__)
+
+# Where a rollup with no watermark starts: before anything on the site existed.
+ROLLUP_EPOCH = date(2000, 1, 1)
+
+# The event rollup's watermark. Each growth series has its own (see
+# ``series_watermark``), so a newly registered series is backfilled without
+# redoing the others.
+EVENTS_WATERMARK = "events"
+
+ROLLUP_BATCH_SIZE = 1000
+
+
+def series_watermark(key: str) -> str:
+    return f"series:{key}"
+
+
+def roll_up(*, now: datetime | None = None, rebuild: bool = False) -> dict:
+    """Bring every rollup up to ``now``.
+
+    Returns how many rows each rollup wrote, keyed by watermark name. A series
+    whose ``daily_counts`` fails is logged and left for the next run; it does
+    not cost the others theirs.
+    """
+    today = timezone.localdate(now)
+    written = {EVENTS_WATERMARK: roll_up_events(today=today, rebuild=rebuild)}
+    written.update(roll_up_series(today=today, rebuild=rebuild))
+    return written
+
+
+def roll_up_events(*, today: date, rebuild: bool = False) -> int:
+    """Recount events per day, noun, verb and edition from the watermark on."""
+
+    def count(start):
+        rows = (
+            Event.objects.filter(created__gte=_start_of(start))
+            .annotate(_day=TruncDate("created"))
+            .values("_day", "noun", "verb", "edition")
+            .annotate(_count=Count("id"))
+            .order_by()
+        )
+        return [
+            DailyEventCount(
+                day=row["_day"],
+                noun=row["noun"],
+                verb=row["verb"],
+                edition=row["edition"],
+                count=row["_count"],
+            )
+            for row in rows
+        ]
+
+    return _roll(EVENTS_WATERMARK, DailyEventCount.objects.all(), count, today, rebuild)
+
+
+def roll_up_series(*, today: date, rebuild: bool = False) -> dict[str, int]:
+    """Recount every registered growth series from its own watermark on."""
+    written = {}
+    for series in growth_series():
+        name = series_watermark(series.key)
+        try:
+            written[name] = _roll_up_one_series(series, today=today, rebuild=rebuild)
+        except Exception:
+            logger.exception("Rolling up growth series %s failed", series.key)
+    return written
+
+
+def _roll_up_one_series(series: GrowthSeries, *, today: date, rebuild: bool) -> int:
+    def count(start):
+        return [
+            DailySeriesCount(day=day, series_key=series.key, count=n)
+            for day, n in series.daily_counts(_start_of(start)).items()
+            if n
+        ]
+
+    held = DailySeriesCount.objects.filter(series_key=series.key)
+    return _roll(series_watermark(series.key), held, count, today, rebuild)
+
+
+def _roll(name, held, count, today, rebuild) -> int:
+    """Replace the days from ``name``'s watermark on with ``count(start)``.
+
+    The watermark row is locked for the whole run, so two overlapping runs of
+    one rollup take turns rather than both inserting the same days.
+    """
+    with transaction.atomic():
+        watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(
+            name=name, defaults={"day": ROLLUP_EPOCH}
+        )
+        start = ROLLUP_EPOCH if rebuild else watermark.day
+        rows = count(start)
+        held.filter(day__gte=start).delete()
+        held.model.objects.bulk_create(rows, batch_size=ROLLUP_BATCH_SIZE)
+        watermark.day = today
+        watermark.save(update_fields=["day", "modified"])
+    return len(rows)
+
+
+def _start_of(day: date) -> datetime:
+    """Midnight at the start of ``day``, in the zone ``TruncDate`` groups by."""
+    return timezone.make_aware(datetime.combine(day, time.min))
@@ -0,0 +1,200 @@
+"""
+A buffered sink for analytics events, written off the request path.
+
+``log_event`` runs inside almost every user action. Writing its ``Event`` row
+there puts an INSERT round trip on the latency of dice rolls and list edits
+for a row nobody reads during the request. With ``ANALYTICS_EVENT_SINK =
+"buffered"`` the event is built (and validated) in the request as before, but
+only queued here; a daemon thread writes the queue with ``bulk_create``
+whenever it reaches ``ANALYTICS_EVENT_BATCH_SIZE`` events or
+``ANALYTICS_EVENT_FLUSH_SECONDS`` have passed, whichever is first.
+
+An event is queued only once the transaction that logged it commits, so an
+action that rolled back logs nothing. What a request queued is written when
+its response has gone out (``flush_at_request_end``): a worker that is
+shut down or has its CPU throttled between requests never strands a request's
+events behind a flusher thread that cannot run. The thread is the backstop for
+events logged outside a request — tasks, commands.
+
+``bulk_create`` sends no signals, so after each write the sink sends
+``post_save`` for every row itself. The receivers that move a list's or a
+campaign's ``modified`` on an event run as they do for ``save()``, and so does
+the log stream line each event emits.
+
+What that gives up, deliberately:
+
+- **Durability across a crash.** Events queued when a process dies are lost.
+  They are analytics, not records; the sink flushes at interpreter exit to
+  keep that to crashes.
+- **Exact timestamps.** ``created`` is stamped when the row is written, so it
+  can trail the action by up to one flush interval.
+- **Unbounded memory.** The buffer holds at most ``ANALYTICS_EVENT_BUFFER``
+  events. Past that, new events are dropped and counted, and the count is
+  reported through ``track("analytics_events_dropped")`` on the next flush.
+
+``"sync"`` writes each event in ``log_event`` as before; tests use it, so an
+event exists the moment the code under test has logged it.
+"""
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models.signals import post_save
+
+from gyrinx.tracker import track
+
+logger = logging.getLogger(__name__)
+
+
+class EventSink:
+    """A bounded in-process queue of unsaved ``Event``s and their flusher."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 100,
+        max_buffer: int = 5000,
+        flush_interval: float = 2.0,
+        background: bool = True,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.max_buffer = max(self.batch_size, max_buffer)
+        self.flush_interval = flush_interval
+        self.background = background
+        self._buffer = []
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def put(self, event) -> bool:
+        """Queue an unsaved ``Event``. False if the buffer was full and the
+        event was dropped."""
+        event.fill_edition()
+        with self._lock:
+            if len(self._buffer) >= self.max_buffer:
+                self._dropped += 1
+                return False
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.batch_size
+        if self.background:
+            self._ensure_started()
+            if full:
+                self._wake.set()
+        return True
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """Write everything queued so far. Returns how many events were written."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            track("analytics_events_dropped", n=dropped, max_buffer=self.max_buffer)
+        if not batch:
+            return 0
+
+        from gyrinx.analytics.models import Event
+
+        try:
+            with transaction.atomic():
+                Event.objects.bulk_create(batch, batch_size=self.batch_size)
+            written = batch
+        except Exception:
+            # One bad row must not cost the rest of the batch.
+            logger.exception("Bulk write of %s analytics events failed", len(batch))
+            written = self._write_each(batch)
+
+        for event in written:
+            # What save() would have set off. Robust: a failing receiver must
+            # not cost the other events theirs; Django logs what it raised.
+            post_save.send_robust(
+                sender=Event,
+                instance=event,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=event._state.db,
+            )
+            event.log_to_stream()
+        return len(written)
+
+    def _write_each(self, batch):
+        from gyrinx.analytics.models import Event
+
+        written = []
+        for event in batch:
+            try:
+                with transaction.atomic():
+                    Event.objects.bulk_create([event])
+                written.append(event)
+            except Exception:
+                logger.exception("Failed to log event: %s %s", event.noun, event.verb)
+        if len(written) < len(batch):
+            track("analytics_events_failed", n=len(batch) - len(written))
+        return written
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="gyrinx-analytics-sink", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Never let a flush failure kill the flusher.
+                logger.exception("Analytics event flush failed")
+            finally:
+                # The flusher's connection is its own; never leave it stale.
+                close_old_connections()
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_sink() -> EventSink:
+    """The process's sink, built from settings on first use."""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = EventSink(
+                    batch_size=settings.ANALYTICS_EVENT_BATCH_SIZE,
+                    max_buffer=settings.ANALYTICS_EVENT_BUFFER,
+                    flush_interval=settings.ANALYTICS_EVENT_FLUSH_SECONDS,
+                )
+    return _sink
+
+
+def flush_at_request_end(sender, **kwargs):
+    """Write what is queued once a response has gone out.
+
+    ``request_finished`` fires after the response is sent, so the write stays
+    off the latency the reader sees, but happens while the worker is still
+    serving the request and is neither throttled nor shutting down.
+    """
+    sink = _sink
+    if sink is None or not sink.pending():
+        return
+    try:
+        sink.flush()
+    except Exception:
+        logger.exception("Analytics event flush failed")
@@ -0,0 +1,43 @@
+"""Background tasks that keep the analytics dashboard's rollups current.
+
+See ``gyrinx.analytics.rollup`` for what is rolled up and why.
+"""
+
+import logging
+
+from django.tasks import task
+from django.utils import timezone
+
+from gyrinx.analytics import rollup
+from gyrinx.tasks import TaskRoute
+
+logger = logging.getLogger(__name__)
+
+# How stale the dashboard may be. Each run only recounts the days since the
+# last one, so running often is cheap.
+ROLLUP_SCHEDULE = "*/10 * * * *"
+
+# When the growth series' history is recounted from the start. Quiet hours: it
+# reads each series' whole table.
+RESTATE_SCHEDULE = "30 3 * * *"
+
+
+@task
+def roll_up_analytics():
+    """Bring the dashboard's daily rollups up to now."""
+    written = rollup.roll_up()
+    logger.info("Analytics rollup wrote %s", written)
+
+
+@task
+def restate_growth_series():
+    """Recount every growth series from the start, so archived and deleted
+    objects drop out of the days they were created on."""
+    written = rollup.roll_up_series(today=timezone.localdate(), rebuild=True)
+    logger.info("Growth series restated: %s", written)
+
+
+task_routes = [
+    TaskRoute(roll_up_analytics, schedule=ROLLUP_SCHEDULE),
+    TaskRoute(restate_growth_series, schedule=RESTATE_SCHEDULE),
+]
@@ -27,7 +27,7 @@ from django.contrib.staticfiles import finders
 from django.core.cache import cache
 
 from gyrinx import artwork
-from gyrinx.svg import sanitize_inline_svg
+from gyrinx.svg import cached_inline_svg
 
 
 @dataclass(frozen=True)
@@ -104,25 +104,14 @@ def _committed_svg(badge: BadgeDef) -> str:
 
 
 def _uploaded_svg(address: str) -> str:
-    """Read and clean uploaded artwork, cached against the cleaned result.
+    """Read and clean uploaded artwork, cached against its content.
 
     Colour is kept: a badge is identity artwork, so flattening it to the
     surrounding text colour would throw away the thing that makes it worth
     having. Sanitising happens here, at render, rather than at upload, so
     tightening the allowlist re-secures artwork that is already stored.
     """
-    raw = artwork.read(address)
-    if not raw:
-        return ""
-
-    cache_key = f"badge_artwork:{sha256(raw.encode('utf-8')).hexdigest()}"
-    cached = cache.get(cache_key)
-    if cached is not None:
-        return cached
-
-    cleaned = sanitize_inline_svg(raw, preserve_colour=True)
-    cache.set(cache_key, cleaned)
-    return cleaned
+    return cached_inline_svg(artwork.read(address), preserve_colour=True)
 
 
 # Patreon tiers, lowest to highest. ``rank`` drives "tiers up to and including
@@ -0,0 +1,191 @@
+"""
+Benchmarks: wall-clock, queries and peak memory against a stored baseline.
+
+The query-count tests pin how many round trips a page makes; they say nothing
+about how long one takes, or how much it allocates, once a gang is the size of
+a real campaign gang. The benchmark suites (``bench_*.py`` under
+``n23/core/tests/benchmarks`` and ``n26/tests/benchmarks``) seed datasets that
+size and measure the hot paths against them. They are not part of the test
+run — the ``python_files`` pattern leaves them out — and are run locally,
+serially, against Postgres::
+
+    scripts/benchmark.sh            # measure, and flag regressions
+    scripts/benchmark.sh --update   # measure, and record as the new baseline
+
+Each benchmark asks for the ``benchmark`` fixture — its suite's conftest
+defines it, over ``check`` here — and hands it the thing to run::
+
+    def test_list_detail(benchmark, client, heavy_gang):
+        url = reverse("core:list", args=[heavy_gang.id])
+        benchmark("list_detail", lambda: client.get(url))
+
+A run is measured three ways. Queries and peak memory come from one pass under
+``capture_queries`` and ``tracemalloc`` — both slow what they watch — and
+time is the median of ``BENCHMARK_ROUNDS`` unwatched passes after a warm-up.
+
+The test run turns the process caches off (``django_test_settings`` in the
+root conftest), so that no test's query count depends on the tests before it.
+A benchmark is measuring the process production runs, so each suite's conftest
+puts ``PRODUCTION_SETTINGS`` back to their deployed values and starts the
+caches cold: the watched pass fills them, and the timed passes read them.
+
+The baseline is a JSON file of the last recorded measurements, by name
+(``BENCHMARK_BASELINE``, default ``.benchmarks/baseline.json``). It is not
+committed: timings are a property of the machine, so a baseline is recorded on
+``main`` and a branch is measured against it on the same machine. A benchmark
+fails when its queries rise at all, or when its time or peak memory rise by
+more than the tolerance and by more than the noise floor.
+"""
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from gyrinx import settings as deployed
+from gyrinx.query import capture_queries
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Unwatched passes timed per benchmark, after one warm-up pass.
+ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "5"))
+
+# How far time or peak memory may rise over the baseline before it is a
+# regression, as a fraction of the baseline.
+TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.25"))
+
+# Rises smaller than these are noise, whatever fraction they are: a 2ms view
+# that takes 3ms has not regressed.
+TIME_FLOOR_SECONDS = 0.005
+MEMORY_FLOOR_BYTES = 256 * 1024
+
+# Settings the test run changes from what is deployed, that a benchmark
+# measures with as deployed. QUERY_BUDGET_SAMPLE_RATE stays at the test run's
+# 0: a sampled request would be captured twice over, and timed at random.
+PRODUCTION_SETTINGS = (
+    "ANALYTICS_EVENT_SINK",
+    "N23_CONTENT_CATALOGUE",
+    "N23_EXPANSION_ENGINE",
+    "N23_PACK_SCOPE_CACHE",
+    "N26_GANG_SHEET_SNAPSHOTS",
+    "N26_HIRE_LIST_CACHE",
+    "N26_INGEST_PLAN_CACHE",
+    "N26_MODIFIER_INDEX_CACHE",
+    "NOTIFICATION_COUNT_CACHE",
+    "SHARED_CACHE_TAG_TTL",
+)
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """One benchmark's numbers: queries, median seconds, peak bytes."""
+
+    name: str
+    queries: int
+    seconds: float
+    peak_bytes: int
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.queries} queries, "
+            f"{self.seconds * 1000:.1f}ms, {self.peak_bytes / 1024:.0f}KiB peak"
+        )
+
+
+def measure(name, run, rounds=ROUNDS):
+    """Run ``run`` once watched and ``rounds`` times timed; return the numbers.
+
+    The warm-up pass is the watched one, so the first-call costs it pays — a
+    cold content type cache, a template compiled — are counted in its queries
+    and memory, as they would be for the first request a process serves, but
+    kept out of the timing.
+    """
+    tracemalloc.start()
+    try:
+        _, queries = capture_queries(run)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    return Measurement(
+        name=name,
+        queries=queries.count,
+        seconds=statistics.median(timings),
+        peak_bytes=peak,
+    )
+
+
+class Baseline:
+    """The stored measurements a run is compared with, and recorded into."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        try:
+            self.entries = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            self.entries = {}
+
+    def regressions(self, measurement):
+        """What got worse than the baseline, in words; empty if nothing did."""
+        recorded = self.entries.get(measurement.name)
+        if recorded is None:
+            return []
+        found = []
+        if measurement.queries > recorded["queries"]:
+            found.append(
+                f"queries rose from {recorded['queries']} to {measurement.queries}"
+            )
+        if _rose(recorded["seconds"], measurement.seconds, TIME_FLOOR_SECONDS):
+            found.append(
+                f"time rose from {recorded['seconds'] * 1000:.1f}ms "
+                f"to {measurement.seconds * 1000:.1f}ms"
+            )
+        if _rose(recorded["peak_bytes"], measurement.peak_bytes, MEMORY_FLOOR_BYTES):
+            found.append(
+                f"peak memory rose from {recorded['peak_bytes'] / 1024:.0f}KiB "
+                f"to {measurement.peak_bytes / 1024:.0f}KiB"
+            )
+        return found
+
+    def record(self, measurement):
+        """Store one measurement as its name's baseline, keeping the rest."""
+        entry = asdict(measurement)
+        del entry["name"]
+        self.entries[measurement.name] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n")
+
+
+def _rose(before, after, floor):
+    return after - before > max(before * TOLERANCE, floor)
+
+
+def baseline_path():
+    return Path(os.getenv("BENCHMARK_BASELINE", ROOT / ".benchmarks" / "baseline.json"))
+
+
+def production_settings():
+    """Each of ``PRODUCTION_SETTINGS`` with its deployed value, by name."""
+    return {name: getattr(deployed, name) for name in PRODUCTION_SETTINGS}
+
+
+def check(name, run, baseline, rounds=ROUNDS):
+    """Measure ``run`` and return the measurement, with what regressed in words.
+
+    With ``BENCHMARK_UPDATE=1`` the measurement is recorded into ``baseline``
+    instead, and nothing has regressed.
+    """
+    measurement = measure(name, run, rounds=rounds)
+    if os.getenv("BENCHMARK_UPDATE") == "1":
+        baseline.record(measurement)
+        return measurement, []
+    return measurement, baseline.regressions(measurement)
@@ -0,0 +1,10 @@
+"""A cache every process shares, and tags that invalidate keys everywhere.
+
+``caches["shared"]`` is a Postgres-backed Django cache (``backends``): a
+``delete()`` on it reaches every instance at once. ``tags`` lets a per-process
+cache keep its free reads and still be invalidated from any instance.
+"""
+
+from gyrinx.cache.tags import SHARED, invalidate, shared_cache, tagged_key
+
+__all__ = ["SHARED", "invalidate", "shared_cache", "tagged_key"]
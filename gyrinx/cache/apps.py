@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class CacheConfig(AppConfig):
+    name = "gyrinx.cache"
+    verbose_name = "Shared Cache"
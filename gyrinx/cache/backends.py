@@ -0,0 +1,141 @@
+"""
+A Django cache backend kept in a Postgres table.
+
+Every process reads and writes the same rows, so a ``delete()`` here is seen
+by every Cloud Run instance at once — which a per-process ``LocMemCache``
+cannot offer. It needs no infrastructure beyond the database the site already
+has, and it works the same locally as in production.
+
+It is not fast: each lookup is a primary-key query. Put it behind per-process
+caches for hot paths (``gyrinx.cache.tags`` is built for that) and use it
+directly only where being right everywhere matters more than a round trip.
+
+Expired rows are not served. They are deleted on a sample of writes
+(``OPTIONS["CULL_PROBABILITY"]``, one write in a hundred by default) rather
+than by a sweeper.
+"""
+
+# Values are pickled as Django's own database cache does: the table is written
+# only by this backend, in the site's own database, so nothing loaded from it
+# came from a user.
+import pickle  # nosec B403 - our own cache table, written only by this backend
+import random
+from datetime import UTC, datetime
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+
+class PostgresCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._cull_probability = options.get("CULL_PROBABILITY", 0.01)
+
+    @property
+    def _entries(self):
+        from gyrinx.cache.models import CacheEntry
+
+        return CacheEntry.objects
+
+    def _live(self):
+        now = timezone.now()
+        return self._entries.filter(Q(expires__isnull=True) | Q(expires__gt=now))
+
+    def _expires(self, timeout):
+        at = self.get_backend_timeout(timeout)
+        return None if at is None else datetime.fromtimestamp(at, tz=UTC)
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        value = self._live().filter(key=key).values_list("value", flat=True).first()
+        return default if value is None else pickle.loads(value)  # nosec B301 - our own cache table
+
+    def get_many(self, keys, version=None):
+        made = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not made:
+            return {}
+        rows = self._live().filter(key__in=made).values_list("key", "value")
+        return {made[key]: pickle.loads(value) for key, value in rows}  # nosec B301 - our own cache table
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.set_many({key: value}, timeout=timeout, version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        if timeout is not None and timeout <= 0:
+            self.delete_many(data, version=version)
+            return []
+        from gyrinx.cache.models import CacheEntry
+
+        expires = self._expires(timeout)
+        entries = [
+            CacheEntry(
+                key=self.make_and_validate_key(key, version=version),
+                value=pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                expires=expires,
+            )
+            for key, value in data.items()
+        ]
+        if entries:
+            self._entries.bulk_create(
+                entries,
+                update_conflicts=True,
+                unique_fields=["key"],
+                update_fields=["value", "expires"],
+            )
+            self._maybe_cull()
+        return []
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        made = self.make_and_validate_key(key, version=version)
+        now = timezone.now()
+        # An expired entry is no entry: take its place.
+        self._entries.filter(key=made, expires__lte=now).delete()
+        try:
+            with transaction.atomic():
+                self._entries.create(
+                    key=made,
+                    value=pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                    expires=self._expires(timeout),
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(self._live().filter(key=key).update(expires=self._expires(timeout)))
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._live().filter(key=key).exists()
+
+    def incr(self, key, delta=1, version=None):
+        made = self.make_and_validate_key(key, version=version)
+        with transaction.atomic():
+            entry = self._live().select_for_update().filter(key=made).first()
+            if entry is None:
+                raise ValueError(f"Key '{key}' not found")
+            value = pickle.loads(entry.value) + delta  # nosec B301 - our own cache table
+            entry.value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            entry.save(update_fields=["value"])
+        return value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        deleted, _ = self._entries.filter(key=key).delete()
+        return bool(deleted)
+
+    def delete_many(self, keys, version=None):
+        made = [self.make_and_validate_key(key, version=version) for key in keys]
+        if made:
+            self._entries.filter(key__in=made).delete()
+
+    def clear(self):
+        self._entries.all().delete()
+
+    def _maybe_cull(self):
+        if random.random() < self._cull_probability:  # nosec B311 - sampling, not crypto
+            self._entries.filter(expires__lte=timezone.now()).delete()
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.7 on 2026-10-16 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CacheEntry",
+            fields=[
+                (
+                    "key",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("value", models.BinaryField()),
+                (
+                    "expires",
+                    models.DateTimeField(
+                        blank=True,
+                        db_index=True,
+                        help_text="When the entry stops being served; null for never.",
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "cache entry",
+                "verbose_name_plural": "cache entries",
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class CacheEntry(models.Model):
+    """One entry in the shared cache (``gyrinx.cache.backends.PostgresCache``).
+
+    Read and written only through ``caches["shared"]``; nothing else should
+    touch the table. ``value`` is pickled.
+    """
+
+    key = models.CharField(max_length=255, primary_key=True)
+    value = models.BinaryField()
+    expires = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="When the entry stops being served; null for never.",
+    )
+
+    class Meta:
+        verbose_name = "cache entry"
+        verbose_name_plural = "cache entries"
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,115 @@
+"""
+Invalidating a per-process cache's keys from any process.
+
+A ``LocMemCache`` costs nothing to read, but ``cache.delete()`` only reaches
+the process it runs in: an admin edit on one Cloud Run instance leaves every
+other instance serving the old answer until its entry times out. Tags fix that
+without giving up the free reads. Build the key with ``tagged_key`` and
+invalidate the tag when what it describes changes::
+
+    key = tagged_key(f"site_banner_live:{edition}", "site_banner")
+    banner = cache.get(key)
+    ...
+    invalidate("site_banner")  # in Banner.save()
+
+``tagged_key`` folds each tag's current version into the key, so invalidating
+a tag moves every key built with it to one nothing has written yet. The old
+entries are never read again and age out on their own timeout.
+
+A tag's version moves:
+
+- **In this process, at once**, so the request that made the change never
+  reads its own stale entry.
+- **In every other process, within ``SHARED_CACHE_TAG_TTL`` seconds.** The
+  committed version lives in the shared cache (``caches["shared"]``), written
+  on commit, and each process re-reads it at most that often. ``None`` never
+  re-reads: versions are then this process's alone, which is what tests want.
+
+A tag nobody has invalidated leaves the key as it was, so adopting a tag does
+not cold-start a cache.
+
+Call ``invalidate`` wherever the data changes — a queryset ``update()`` or
+``bulk_create()`` sends no signal to hang it on.
+"""
+
+import itertools
+import logging
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+#: The ``CACHES`` alias every process shares.
+SHARED = "shared"
+
+_generation = itertools.count(1)
+#: tag -> the generation this process last moved it to.
+_local: dict[str, int] = {}
+#: tag -> ``(committed version, when it was read)``, as last seen here.
+_seen: dict[str, tuple[str, float]] = {}
+
+
+def shared_cache():
+    """The cache every process reads and writes — see ``gyrinx.cache.backends``."""
+    return caches[SHARED]
+
+
+def tagged_key(key: str, *tags: str) -> str:
+    """``key``, moved on whenever one of ``tags`` is invalidated."""
+    committed = _committed(tags)
+    parts = []
+    for tag in tags:
+        version, local = committed[tag], _local.get(tag)
+        if version or local:
+            parts.append(f"{tag}={version}.{local or 0}")
+    if not parts:
+        return key
+    return f"{key}@{','.join(parts)}"
+
+
+def invalidate(*tags: str) -> None:
+    """Move ``tags`` here now, and everywhere once the transaction commits."""
+    for tag in tags:
+        _local[tag] = next(_generation)
+    transaction.on_commit(lambda: _publish(tags))
+
+
+def _committed(tags) -> dict[str, str]:
+    ttl = settings.SHARED_CACHE_TAG_TTL
+    if ttl is None:
+        return dict.fromkeys(tags, "")
+    now = time.monotonic()
+    stale = [tag for tag in tags if tag not in _seen or now - _seen[tag][1] >= ttl]
+    if stale:
+        try:
+            found = shared_cache().get_many([_version_key(tag) for tag in stale])
+        except Exception:
+            # Better an old version than a broken page; retried on next use.
+            logger.warning("Could not read cache tag versions", exc_info=True)
+            return {tag: _seen.get(tag, ("", 0))[0] for tag in tags}
+        for tag in stale:
+            _seen[tag] = (found.get(_version_key(tag), ""), now)
+    return {tag: _seen[tag][0] for tag in tags}
+
+
+def _publish(tags) -> None:
+    # A fresh token rather than a counter: two instances invalidating at once
+    # both move the version, and no read-modify-write is needed to do it.
+    shared_cache().set_many({_version_key(tag): uuid.uuid4().hex for tag in tags}, None)
+    for tag in tags:
+        # Read it back on next use: another process may have moved it too.
+        _seen.pop(tag, None)
+
+
+def _version_key(tag: str) -> str:
+    return f"cache_tag:{tag}"
+
+
+def _reset() -> None:
+    """Forget every version seen or made here. For tests."""
+    _local.clear()
+    _seen.clear()
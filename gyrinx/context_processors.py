@@ -6,12 +6,14 @@ from django.conf import settings
 from django.core.cache import cache
 from django.db import DatabaseError, InterfaceError, OperationalError
 
+from gyrinx.cache import tagged_key
 from gyrinx.editions import N23, edition_for_path
 from gyrinx.site.models import (
     BANNER_CACHE_KEYS,
+    BANNER_CACHE_TAG,
     BANNER_CACHE_TIMEOUT,
     Banner,
-    Notification,
+    unread_notification_count,
 )
 
 logger = logging.getLogger(__name__)
@@ -20,18 +22,16 @@ logger = logging.getLogger(__name__)
 def notifications(request):
     """Add the unread notification count for the navbar badge (authenticated only).
 
-    A single COUNT backed by a partial index — cheap and always correct. We do not
-    cache it: the cache backend is per-process ``LocMemCache``, so a cached per-user
-    count couldn't be invalidated reliably across instances. Never raises — a failure
-    here must not break page rendering.
+    Read from the shared cache, which every write to the user's inbox clears on
+    every instance; a miss is a single COUNT backed by a partial index. See
+    ``unread_notification_count``. Never raises — a failure here must not break
+    page rendering.
     """
     context = {"unread_notification_count": 0}
     try:
         user = getattr(request, "user", None)
         if user is not None and user.is_authenticated:
-            context["unread_notification_count"] = (
-                Notification.objects.unread_count_for(user)
-            )
+            context["unread_notification_count"] = unread_notification_count(user)
     except (DatabaseError, OperationalError, InterfaceError) as e:
         logger.warning(
             f"Database error while counting notifications: {type(e).__name__}: {e}"
@@ -74,7 +74,7 @@ def site_banner(request):
     context = {"banner": None}
 
     edition = edition_for_path(request.path) or N23
-    cache_key = BANNER_CACHE_KEYS[edition]
+    cache_key = tagged_key(BANNER_CACHE_KEYS[edition], BANNER_CACHE_TAG)
 
     # Try to get banner from cache first
     live_banner = cache.get(cache_key)
@@ -1,7 +1,10 @@
 """Platform middleware — edition-agnostic request handling."""
 
+import logging
+import random
 from datetime import datetime
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import RequestDataTooBig
 from django.http import HttpResponse, HttpResponseRedirect
@@ -29,6 +32,10 @@ from gyrinx.impersonation import (
     IMPERSONATE_STARTED_KEY,
     can_impersonate,
 )
+from gyrinx.query import budget_of, capture_queries
+from gyrinx.tracker import track
+
+logger = logging.getLogger(__name__)
 
 
 class ClearLoggingRequestMiddleware:
@@ -108,6 +115,73 @@ class RequestSizeExceptionMiddleware:
         return None
 
 
+class QueryBudgetMiddleware:
+    """Count the queries of a sample of live requests, and say which repeat.
+
+    ``QUERY_BUDGET_SAMPLE_RATE`` of requests run under ``capture_queries``.
+    Each one sampled emits ``track("request_queries")`` with its view, query
+    count (``n``) and database milliseconds (``value``), which is what a
+    per-view chart is drawn from. Then, as warnings:
+
+    - a view over the budget it declared with ``gyrinx.query.query_budget``
+      (or ``QUERY_BUDGET_DEFAULT``, where it declared none);
+    - every statement shape run ``QUERY_BUDGET_REPEAT_THRESHOLD`` times or
+      more in the one request — an N+1 — with the stack it was run from.
+
+    Only measures: nothing is refused. Queries made while a streaming response
+    is read out come after the count and are not in it. Sits high in
+    ``MIDDLEWARE`` so the session and user lookups are counted too.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.QUERY_BUDGET_SAMPLE_RATE
+        if rate <= 0 or random.random() >= rate:  # nosec B311 - sampling, not crypto
+            return self.get_response(request)
+
+        threshold = settings.QUERY_BUDGET_REPEAT_THRESHOLD
+        response, info = capture_queries(
+            lambda: self.get_response(request), stack_after=threshold
+        )
+        try:
+            self._report(request, response, info, threshold)
+        except Exception:
+            # A report is never worth the response it is about.
+            logger.warning("Could not report request queries", exc_info=True)
+        return response
+
+    @staticmethod
+    def _report(request, response, info, threshold):
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else "unresolved"
+        budget = budget_of(match.func) if match else None
+        if budget is None:
+            budget = settings.QUERY_BUDGET_DEFAULT
+
+        track(
+            "request_queries",
+            n=info.count,
+            value=round(info.total_time * 1000, 1),
+            view=view,
+            method=request.method,
+            status=response.status_code,
+            budget=budget,
+        )
+        if budget is not None and info.count > budget:
+            logger.warning(
+                "%s ran %s queries, over its budget of %s", view, info.count, budget
+            )
+            track("query_budget_exceeded", n=info.count, view=view, budget=budget)
+        for shape, runs in info.repeated(threshold):
+            stack = "\n  ".join(info.stacks.get(shape, []))
+            logger.warning(
+                "%s ran one query %s times: %s\n  %s", view, runs, shape, stack
+            )
+            track("query_repeated", n=runs, view=view, shape=shape[:500])
+
+
 class EditionMiddleware:
     """Remember which edition a reader is in, and answer for them where the
     address cannot.
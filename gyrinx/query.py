@@ -18,13 +18,24 @@ Or as a decorator:
         return "ok"
 
     (result, info) = do_work()
+
+``fingerprint`` reduces a statement to its shape, so the same query run for
+forty rows counts as one shape run forty times; ``capture_queries(...,
+stack_after=n)`` notes where the n-th run of any shape came from. The
+``QueryBudgetMiddleware`` uses both on a sample of live requests, and
+``query_budget`` declares what a view is expected to stay within.
 """
 
 import logging
+import re
+import traceback
+from collections import Counter
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+from django.conf import settings
 from django.db import connections
 from django.test.utils import CaptureQueriesContext
 
@@ -46,10 +57,85 @@ class QueryInfo:
     count: int
     total_time: float
     queries: list[dict[str, str]]  # each has "sql" and "time" (string seconds)
+    #: fingerprint -> where it ran from, for each shape run ``stack_after``
+    #: times or more. Empty unless ``capture_queries`` was asked for stacks.
+    stacks: dict[str, list[str]] = field(default_factory=dict)
+
+    def shapes(self) -> Counter:
+        """How many times each fingerprint ran."""
+        return Counter(fingerprint(q.get("sql") or "") for q in self.queries)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Shapes run at least ``threshold`` times, most-run first — the N+1s."""
+        return [
+            (shape, n) for shape, n in self.shapes().most_common() if n >= threshold
+        ]
+
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_PLACEHOLDER = re.compile(r"%(?:\([^)]*\))?s")
+_STRING = re.compile(r"'(?:''|[^'])*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """The shape of a statement, with the values it was run for taken out.
+
+    Literals become ``?`` and a list of them ``(...)``, so ``WHERE id IN (1,
+    2)`` and ``WHERE id IN (3)`` are one shape. So do the driver's ``%s`` and
+    ``%(name)s`` placeholders, which is what a statement logged without its
+    values (``executemany``) still carries. Comments go too: SqlCommenter
+    tags every statement with the route, which would otherwise split a shape
+    by where it was run from.
+    """
+    sql = _COMMENT.sub("", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def query_budget(n: int):
+    """Declare the most queries a view should run.
+
+    Goes on a view function or a class-based view. Nothing is enforced: the
+    ``QueryBudgetMiddleware`` logs a sampled request that went over, so a
+    regression shows in the logs before anyone feels it.
+    """
+
+    def deco(view):
+        view.query_budget = n
+        return view
+
+    return deco
+
+
+def budget_of(view) -> int | None:
+    """The budget ``query_budget`` declared on a resolved view, if any."""
+    budget = getattr(view, "query_budget", None)
+    if budget is None:
+        budget = getattr(getattr(view, "view_class", None), "query_budget", None)
+    return budget
+
+
+def _caller(limit: int = 8) -> list[str]:
+    """This project's frames on the current stack, innermost last."""
+    root = str(Path(settings.BASE_DIR))
+    frames = [
+        f"{frame.filename.removeprefix(root + '/')}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()[:-1]
+        if frame.filename.startswith(root)
+        and "site-packages" not in frame.filename
+        and not frame.filename.endswith("gyrinx/query.py")
+    ]
+    return frames[-limit:]
 
 
 def capture_queries(
-    func: Callable[[], Any], *, using: str = "default"
+    func: Callable[[], Any], *, using: str = "default", stack_after: int | None = None
 ) -> tuple[Any, QueryInfo]:
     """Run a callable with SQL query capture enabled.
 
@@ -64,6 +150,8 @@ def capture_queries(
         func: Zero-argument callable to execute (wrap with ``lambda`` if needed to
             bind arguments).
         using: Django database alias to capture against (defaults to ``"default"``).
+        stack_after: When set, record the calling stack of the ``stack_after``-th
+            run of each shape in ``info.stacks``. Only that one run pays for it.
 
     Returns:
         A tuple ``(result, info)`` where:
@@ -88,8 +176,35 @@ def capture_queries(
         True
     """
     conn = connections[using]
+    stacks = {}
     with CaptureQueriesContext(conn) as ctx:
-        result = func()
+        if stack_after is None:
+            result = func()
+        else:
+            runs = Counter()
+
+            def note_stack(execute, sql, params, many, context):
+                result = execute(sql, params, many, context)
+                # Keyed on the statement as the capture logs it, values and
+                # all, so it is the same shape ``info.shapes()`` counts: a
+                # template and its interpolation part ways on a boolean or
+                # a NULL, which no fingerprint can see past.
+                if many:
+                    # Logged as "<n> times: <template>"; the count fingerprints
+                    # to ``?`` either way.
+                    logged = f"? times: {sql}"
+                else:
+                    logged = conn.ops.last_executed_query(
+                        context["cursor"].cursor, sql, params
+                    )
+                shape = fingerprint(logged or sql)
+                runs[shape] += 1
+                if runs[shape] == stack_after:
+                    stacks[shape] = _caller()
+                return result
+
+            with conn.execute_wrapper(note_stack):
+                result = func()
 
     # ctx.captured_queries is a list of {"sql": "...", "time": "..."} (time as string seconds)
     total_time = sum(float(q.get("time") or 0.0) for q in ctx.captured_queries)
@@ -98,6 +213,7 @@ def capture_queries(
         count=len(ctx.captured_queries),
         total_time=total_time,
         queries=ctx.captured_queries,
+        stacks=stacks,
     )
     return result, info
 
@@ -184,6 +184,7 @@ INSTALLED_APPS = [
     "gyrinx.maintenance",
     "gyrinx.pages",
     "gyrinx.api",
+    "gyrinx.cache",
     "gyrinx.tasks.apps.TasksConfig",
     "tinymce",
     "storages",
@@ -197,6 +198,9 @@ MIDDLEWARE = [
     "gyrinx.middleware.ClearLoggingRequestMiddleware",
     # Google Cloud Logging - must be early to capture request for trace correlation
     "google.cloud.logging_v2.handlers.middleware.RequestMiddleware",
+    # Counts the queries of sampled requests; below RequestMiddleware so what
+    # it logs carries the request's trace.
+    "gyrinx.middleware.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     # Catch RequestDataTooBig early and return 400 instead of 500
@@ -296,27 +300,34 @@ DATABASES = {
 # Caching
 # https://docs.djangoproject.com/en/6.0/topics/cache/
 
-# Both caches are per-process LocMemCache, so every container starts cold and
-# each gunicorn worker keeps its own copy. That is tolerable only if the cache is
-# big enough to hold the whole working set — the default MAX_ENTRIES of 300 is
-# not. Production has 420 rules + 120 skills resolving against 570 page refs, so
-# at the default the cache culled a third of itself continuously and the hit rate
-# collapsed under crawl load, putting an unindexable LIKE query on the database
-# for every rule on every fighter card. Sized well above the working set so it
-# behaves as a cache rather than a rotating buffer.
+# The default cache is a per-process LocMemCache, so every container starts cold
+# and each gunicorn worker keeps its own copy. That is tolerable only if the
+# cache is big enough to hold the whole working set — the default MAX_ENTRIES of
+# 300 is not. Production has 420 rules + 120 skills each caching its rendered
+# page ref, so at the default the cache culled a third of itself continuously
+# and the hit rate collapsed under crawl load. Sized well above the working set
+# so it behaves as a cache rather than a rotating buffer. (Page refs themselves
+# are held whole per process: see ContentPageRef.find_similar.)
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "unique-snowflake",
         "OPTIONS": {"MAX_ENTRIES": 5000, "CULL_FREQUENCY": 10},
     },
-    "content_page_ref_cache": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "content-page-ref-cache",
-        "OPTIONS": {"MAX_ENTRIES": 5000, "CULL_FREQUENCY": 10},
+    # Shared by every process: a delete here reaches every instance. A query
+    # per lookup, so hot paths keep a per-process cache and invalidate it
+    # through gyrinx.cache.tags instead. See gyrinx/cache/.
+    "shared": {
+        "BACKEND": "gyrinx.cache.backends.PostgresCache",
+        "TIMEOUT": 300,
     },
 }
 
+# How stale another process's view of a cache tag may be, in seconds: the
+# longest an invalidation takes to reach every instance. See
+# gyrinx/cache/tags.py.
+SHARED_CACHE_TAG_TTL = int(os.getenv("SHARED_CACHE_TAG_TTL", "10"))
+
 # Authentication
 # Using django-allauth for authentication
 # https://django-allauth.readthedocs.io/en/latest/installation.html
@@ -567,6 +578,21 @@ SQLCOMMENTER_WITH_APP_NAME = True
 # Tracing configuration
 # Options: "off" (no-op), "console" (print to stdout), "gcp" (Google Cloud Trace)
 TRACING_MODE = os.getenv("TRACING_MODE", "off")
+# What @traced functions emit while tracing is on: "spans" (one per call) or
+# "aggregate" (per-function call counts and sampled timings, logged every
+# TRACING_AGGREGATE_SECONDS). Explicit span() blocks are spans either way.
+TRACING_TRACED_MODE = os.getenv("TRACING_TRACED_MODE", "spans")
+# In aggregate mode every call is counted, and one in this many is timed.
+TRACING_AGGREGATE_SAMPLE_EVERY = int(os.getenv("TRACING_AGGREGATE_SAMPLE_EVERY", "16"))
+TRACING_AGGREGATE_SECONDS = float(os.getenv("TRACING_AGGREGATE_SECONDS", "60"))
+
+# Query budgets (gyrinx.middleware.QueryBudgetMiddleware)
+# The fraction of requests whose queries are counted and fingerprinted.
+QUERY_BUDGET_SAMPLE_RATE = float(os.getenv("QUERY_BUDGET_SAMPLE_RATE", "0.01"))
+# One statement shape run this many times in a request is logged as an N+1.
+QUERY_BUDGET_REPEAT_THRESHOLD = int(os.getenv("QUERY_BUDGET_REPEAT_THRESHOLD", "10"))
+# The budget of a view that declares none with gyrinx.query.query_budget.
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "100"))
 
 # Background tasks configuration
 # https://docs.djangoproject.com/en/6.0/topics/tasks/
@@ -585,7 +611,70 @@ TASKS = {
 # Environment for task topic naming (dev/staging/prod)
 TASKS_ENVIRONMENT = os.getenv("TASKS_ENVIRONMENT", "dev")
 
+# Analytics events: "buffered" queues log_event's rows in-process once their
+# transaction commits, and writes them in batches after the response has gone
+# out (or from a background thread, outside a request); "sync" writes each one
+# inside log_event. Tests use "sync". See gyrinx/analytics/sink.py.
+ANALYTICS_EVENT_SINK = os.getenv("ANALYTICS_EVENT_SINK", "buffered")
+ANALYTICS_EVENT_BATCH_SIZE = int(os.getenv("ANALYTICS_EVENT_BATCH_SIZE", "100"))
+ANALYTICS_EVENT_BUFFER = int(os.getenv("ANALYTICS_EVENT_BUFFER", "5000"))
+ANALYTICS_EVENT_FLUSH_SECONDS = float(os.getenv("ANALYTICS_EVENT_FLUSH_SECONDS", "2.0"))
+
+# Audited reconcile (/admin/maintenance/): a full run is split into this many
+# chains over disjoint list id ranges, run concurrently; each batch is sized to
+# take about RECONCILE_BATCH_SECONDS at the per-list latency seen so far. Keep
+# that well inside the task's ack deadline (600s).
+RECONCILE_SHARDS = int(os.getenv("RECONCILE_SHARDS", "4"))
+RECONCILE_BATCH_SECONDS = float(os.getenv("RECONCILE_BATCH_SECONDS", "30"))
+
 
 # n26: the pack new content lands in when none is specified.
 DEFAULT_CONTENT_PACK_SLUG = os.environ.get("DEFAULT_CONTENT_PACK_SLUG", "n26")
 DEFAULT_CONTENT_PACK_NAME = os.environ.get("DEFAULT_CONTENT_PACK_NAME", "N26")
+
+# n26: how stale another process's view of library content may be, in seconds.
+# Edits invalidate content caches in the process that made them at once; every
+# other process re-reads the committed version at most this often, so this is
+# the longest an admin edit can take to show up everywhere. See
+# n26/library/version.py.
+N26_LIBRARY_VERSION_TTL = int(os.getenv("N26_LIBRARY_VERSION_TTL", "10"))
+
+# n23: share prefetched content fighters across every fighter card this
+# process renders, dropped whenever content moves. See
+# n23/content/catalogue.py. Tests turn it off, as below.
+N23_CONTENT_CATALOGUE = os.getenv("N23_CONTENT_CATALOGUE", "True") == "True"
+
+# n23: hold the ids of pack-owned content per process, so hiding pack content
+# from a default content query is an id check rather than a subquery per row.
+# See n23/content/pack_scope.py. Tests turn it off, as below.
+N23_PACK_SCOPE_CACHE = os.getenv("N23_PACK_SCOPE_CACHE", "True") == "True"
+
+# n23: match equipment list expansions in memory, from rules read once per
+# content version, rather than with an aggregate per fighter category. See
+# n23/content/expansion_engine.py. Tests turn it off, as below.
+N23_EXPANSION_ENGINE = os.getenv("N23_EXPANSION_ENGINE", "True") == "True"
+
+# n26: keep each carrier's hydrated modifiers between requests, keyed on the
+# library version, so build_modifier_index touches the database only for
+# carriers it has not seen since content last changed. Tests turn it off —
+# what they count must not depend on what ran before them in the worker.
+N26_MODIFIER_INDEX_CACHE = os.getenv("N26_MODIFIER_INDEX_CACHE", "True") == "True"
+
+# n26: keep the plan of an author's held ingest sheets between the preview and
+# the import, until the sheets or library content move. See plan_held in
+# n26/library/ingest.py. Tests turn it off, as above.
+N26_INGEST_PLAN_CACHE = os.getenv("N26_INGEST_PLAN_CACHE", "True") == "True"
+
+# n26: keep each gang type's hire list, priced and sectioned, until library
+# content moves. See kept_hire_list in n26/core/hire.py. Tests turn it off, as
+# above.
+N26_HIRE_LIST_CACHE = os.getenv("N26_HIRE_LIST_CACHE", "True") == "True"
+
+# n26: serve readers of a gang the sheet last rendered for it, until the gang
+# or library content moves. See n26/core/snapshot.py. Tests turn it off, as
+# above.
+N26_GANG_SHEET_SNAPSHOTS = os.getenv("N26_GANG_SHEET_SNAPSHOTS", "True") == "True"
+
+# Keep each user's unread-notification count in the shared cache, dropped
+# whenever their inbox changes. Tests turn it off, as above.
+NOTIFICATION_COUNT_CACHE = os.getenv("NOTIFICATION_COUNT_CACHE", "True") == "True"
@@ -6,15 +6,16 @@ sits beside it).
 import logging
 from itertools import islice
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 from simple_history.models import HistoricalRecords
 
 from gyrinx.base_models import AppBase
+from gyrinx.cache import invalidate, shared_cache
 from gyrinx.history_aware_manager import HistoryAwareManager
 from gyrinx.models import Base
 from gyrinx.site import icons as banner_icons
@@ -30,6 +31,13 @@ BANNER_CACHE_KEYS = {
     "n26": "site_banner_live:n26",
 }
 BANNER_CACHE_TIMEOUT = 300  # 5 minutes
+# The keys above are per-process; saving a banner invalidates this tag, which
+# reaches every instance's keys (see gyrinx.cache.tags).
+BANNER_CACHE_TAG = "site_banner"
+
+# How long a user's unread count may sit in the shared cache. Every write to
+# their inbox drops it, so this only bounds a count raced by a concurrent write.
+UNREAD_COUNT_CACHE_TIMEOUT = 300
 
 
 class Banner(AppBase):
@@ -121,15 +129,13 @@ class Banner(AppBase):
                     **{flag: False}
                 )
         super().save(*args, **kwargs)
-        # Clear the banner caches when any banner is saved
-        for key in BANNER_CACHE_KEYS.values():
-            cache.delete(key)
+        # Clear the banner caches, on every instance, when any banner is saved
+        invalidate(BANNER_CACHE_TAG)
 
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
-        # Clear the banner caches when any banner is deleted
-        for key in BANNER_CACHE_KEYS.values():
-            cache.delete(key)
+        # Clear the banner caches, on every instance, when any banner is deleted
+        invalidate(BANNER_CACHE_TAG)
 
     def clean(self):
         super().clean()
@@ -429,6 +435,16 @@ class Notification(AppBase):
             return "Gyrinx"
         return self.sender.get_username()
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        forget_unread_counts([self.owner_id])
+
+    def delete(self, *args, **kwargs):
+        owner_id = self.owner_id
+        result = super().delete(*args, **kwargs)
+        forget_unread_counts([owner_id])
+        return result
+
     def mark_read(self, *, commit=True):
         if not self.is_read:
             self.is_read = True
@@ -444,6 +460,44 @@ class Notification(AppBase):
                 self.save(update_fields=["is_read", "read_at", "modified"])
 
 
+def _unread_count_key(user_id):
+    return f"notifications_unread:{user_id}"
+
+
+def unread_notification_count(user):
+    """The navbar badge's count for ``user``.
+
+    Kept in the shared cache when ``NOTIFICATION_COUNT_CACHE`` is on, so a
+    change made on one instance is seen on the next request to any other.
+    """
+    if not settings.NOTIFICATION_COUNT_CACHE:
+        return Notification.objects.unread_count_for(user)
+    cache = shared_cache()
+    key = _unread_count_key(user.pk)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.unread_count_for(user)
+        cache.set(key, count, UNREAD_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def forget_unread_counts(user_ids):
+    """Those users' inboxes changed: drop their cached unread counts.
+
+    ``save()`` and ``delete()`` call this; anything writing notifications in
+    bulk — ``bulk_create``, a queryset ``update()`` — must call it too. Dropped
+    now, so the rest of this request sees the change, and again on commit, so
+    a count read by another request mid-transaction is not left behind.
+    """
+    if not settings.NOTIFICATION_COUNT_CACHE:
+        return
+    keys = [_unread_count_key(user_id) for user_id in set(user_ids) if user_id]
+    if not keys:
+        return
+    shared_cache().delete_many(keys)
+    transaction.on_commit(lambda: shared_cache().delete_many(keys))
+
+
 #
 # Creation service — mirrors log_event: module-level, never-raises, no request needed.
 #
@@ -631,6 +685,7 @@ def notify_many(
         objs = build()
         while batch := list(islice(objs, batch_size)):
             Notification.objects.bulk_create(batch, batch_size=batch_size)
+            forget_unread_counts(n.owner_id for n in batch)
             created += len(batch)
     except Exception:
         logger.exception("notify_many failed for subject=%r", subject)
@@ -13,9 +13,12 @@ text colour — cannot lean on the browser treating it as an opaque ``<img>``, s
 the markup goes through an explicit SVG allowlist before it is ever marked safe.
 
 Sanitisation runs at render time, not at save time, so tightening the allowlist
-later re-secures content that is already stored. Callers cache the result; this
-module does not, because what makes a good cache key depends on where the
-markup came from.
+later re-secures content that is already stored. ``cached_inline_svg`` keeps
+the result against a hash of the markup itself and the options it was cleaned
+with, so a drawing is cleaned once whichever row, page or surface draws it, and
+edited artwork lands on a key of its own with nothing to invalidate. A caller
+with a better key than the content — one that avoids reading the file at all —
+caches ``sanitize_inline_svg`` itself.
 
 Implementation note: ``bleach`` produces correctly-cased SVG markup (it
 preserves ``viewBox`` and other camelCase attributes), so we keep its output
@@ -25,8 +28,10 @@ lowercase ``viewBox`` and the gradient/clipPath attributes and corrupt the icon.
 """
 
 import re
+from hashlib import sha256
 
 import bleach
+from django.core.cache import cache
 
 # Only structural/presentational SVG elements. Notably excludes <script>,
 # <style>, <foreignObject>, <a> and anything that can execute or embed HTML.
@@ -120,6 +125,13 @@ SVG_ALLOWED_ATTRS = {
     "mask": _PRESENTATION_ATTRS + ["maskUnits", "x", "y", "width", "height"],
 }
 
+_CACHE_PREFIX = "inline-svg:"
+
+#: How long cleaned markup stays cached. Long, because the key is the content:
+#: nothing stored under it can go stale, and a deploy that tightens the
+#: allowlist starts every process's cache afresh.
+_CACHE_SECONDS = 24 * 60 * 60
+
 _SVG_START_TAG_RE = re.compile(r"<svg\b([^>]*)>", re.IGNORECASE)
 _ATTR_RE = re.compile(r'([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*"([^"]*)"')
 _SVG_NS = "http://www.w3.org/2000/svg"
@@ -315,3 +327,22 @@ def sanitize_inline_svg(
     start_tag = f"<svg {' '.join(parts)}>"
 
     return start_tag + cleaned[match.end() :]
+
+
+def cached_inline_svg(raw: str, **options) -> str:
+    """``sanitize_inline_svg``, kept against a hash of the markup and options.
+
+    Takes the same keyword options. Two rows drawing the same drawing share
+    one cleaning, and so do two surfaces asking for it the same way.
+    """
+    if not raw:
+        return ""
+
+    digest = sha256(raw.encode("utf-8"))
+    digest.update(repr(sorted(options.items())).encode("utf-8"))
+    cache_key = _CACHE_PREFIX + digest.hexdigest()
+    cleaned = cache.get(cache_key)
+    if cleaned is None:
+        cleaned = sanitize_inline_svg(raw, **options)
+        cache.set(cache_key, cleaned, _CACHE_SECONDS)
+    return cleaned
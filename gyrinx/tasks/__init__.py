@@ -29,8 +29,13 @@ Example:
 
     # Enqueue from anywhere
     send_welcome_email.enqueue(user_id=user.id)
+
+    # Or, for an idempotent task that reads the latest state when it runs,
+    # collapse a burst of enqueues into one delivery per key
+    enqueue_coalesced(refresh_list_facts, key=list_id, window=60, list_id=list_id)
 """
 
+from gyrinx.tasks.coalesce import enqueue_coalesced
 from gyrinx.tasks.route import TaskRoute
 
-__all__ = ["TaskRoute"]
+__all__ = ["TaskRoute", "enqueue_coalesced"]
@@ -0,0 +1,113 @@
+"""
+Coalescing enqueue: one delivery per key, however many times it is asked for.
+
+Some tasks are idempotent heals that read the latest state when they run —
+``refresh_list_facts`` recomputes a list from the database, whatever made it
+dirty. Enqueueing one of those ten times in a burst buys ten deliveries that
+all do the same work. ``enqueue_coalesced`` enqueues the first and drops the
+rest for as long as that first delivery is still pending::
+
+    enqueue_coalesced(refresh_list_facts, key=str(lst.pk), window=60,
+                      list_id=str(lst.pk))
+
+The claim is a ``PendingTaskKey`` row, so it holds across processes and under
+every backend (Pub/Sub and the local ``DatabaseBackend`` alike):
+
+- the first enqueue inserts the row and enqueues; the ``task_enqueued`` signal
+  stamps the new ``task_id`` onto it;
+- later enqueues for the key find the row held and return ``None``;
+- when the delivery starts (``task_started``) the row is deleted, so a change
+  made while the task runs — or after it — queues a fresh delivery. Nothing
+  is ever coalesced into a run that has already read the state.
+
+``window`` is how long a claim may stand without its delivery starting. It
+exists because Pub/Sub publishing is fire-and-forget: a lost message would
+otherwise hold its key forever. After the window the next enqueue takes the
+claim over. Keep it comfortably longer than the queue's normal latency.
+
+This is not a trailing-edge debounce: ``PubSubBackend`` cannot defer delivery,
+and a task that reads the latest state on start needs none.
+"""
+
+import contextvars
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from gyrinx.tracker import track
+
+# The claim being enqueued right now, if any: ``(task_name, key)``. Set only
+# for the duration of ``task.enqueue()``, so the ``task_enqueued`` receiver can
+# stamp the task_id before an eager backend has even run the task.
+_enqueuing = contextvars.ContextVar("gyrinx_tasks_coalesce_enqueuing", default=None)
+
+
+def enqueue_coalesced(task, *args, key: str, window: int, **kwargs):
+    """Enqueue ``task(*args, **kwargs)`` unless a delivery for ``key`` is pending.
+
+    Args:
+        task: The Django Task to enqueue.
+        key: What the delivery is for (e.g. a list id). Scoped to the task, so
+            two tasks may use the same key independently.
+        window: Seconds a claim may stand before its delivery starts.
+        *args, **kwargs: Passed to ``task.enqueue``.
+
+    Returns:
+        The ``TaskResult`` of the enqueue, or ``None`` if it was coalesced into
+        one already pending.
+    """
+    from gyrinx.tasks.models import PendingTaskKey
+
+    task_name = task.name
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=window)
+
+    # Take over a stale claim, else make a new one; a held claim is neither.
+    claimed = PendingTaskKey.objects.filter(
+        task_name=task_name, key=key, expires_at__lte=now
+    ).update(task_id="", expires_at=expires_at)
+    if not claimed:
+        try:
+            with transaction.atomic():
+                PendingTaskKey.objects.create(
+                    task_name=task_name, key=key, expires_at=expires_at
+                )
+        except IntegrityError:
+            track("task_enqueue_coalesced", task_name=task_name, key=key)
+            return None
+
+    token = _enqueuing.set((task_name, key))
+    try:
+        return task.enqueue(*args, **kwargs)
+    except Exception:
+        # Nothing is on its way, so nothing may hold the key.
+        release(task_name, key)
+        raise
+    finally:
+        _enqueuing.reset(token)
+
+
+def release(task_name: str, key: str) -> None:
+    """Drop the claim on ``key``, so the next enqueue goes through."""
+    from gyrinx.tasks.models import PendingTaskKey
+
+    PendingTaskKey.objects.filter(task_name=task_name, key=key).delete()
+
+
+def claim_enqueued(task_id: str) -> None:
+    """Stamp the delivery just enqueued onto the claim that asked for it."""
+    from gyrinx.tasks.models import PendingTaskKey
+
+    enqueuing = _enqueuing.get()
+    if enqueuing is None:
+        return
+    task_name, key = enqueuing
+    PendingTaskKey.objects.filter(task_name=task_name, key=key).update(task_id=task_id)
+
+
+def release_started(task_id: str) -> None:
+    """A delivery has started: whatever it held is no longer pending."""
+    from gyrinx.tasks.models import PendingTaskKey
+
+    PendingTaskKey.objects.filter(task_id=task_id).delete()
@@ -63,7 +63,16 @@ _pool = None
 _pool_lock = threading.Lock()
 
 
-def get_worker_pool(*, num_workers, lease_seconds, poll_interval, fault):
+def get_worker_pool(
+    *,
+    num_workers,
+    lease_seconds,
+    poll_interval,
+    fault,
+    batch_size=10,
+    idle_timeout=30.0,
+    listen=True,
+):
     global _pool
     if _pool is not None:
         return _pool
@@ -76,6 +85,9 @@ def get_worker_pool(*, num_workers, lease_seconds, poll_interval, fault):
                 lease_seconds=lease_seconds,
                 poll_interval=poll_interval,
                 fault=fault,
+                batch_size=batch_size,
+                idle_timeout=idle_timeout,
+                listen=listen,
             )
     return _pool
 
@@ -107,6 +119,11 @@ class DatabaseBackend(BaseTaskBackend):
         self.num_workers = int(opts.get("num_workers", 2))
         self.lease_seconds = int(opts.get("lease_seconds", 300))
         self.poll_interval = float(opts.get("poll_interval", 1.0))
+        # Rows a worker claims per transaction, how long an idle worker sleeps
+        # at most, and whether idle workers wake on a Postgres NOTIFY.
+        self.batch_size = int(opts.get("batch_size", 10))
+        self.idle_timeout = float(opts.get("idle_timeout", 30.0))
+        self.listen = bool(opts.get("listen", True))
         self.default_max_attempts = int(opts.get("max_attempts", 5))
         # Fault knobs come from OPTIONS if given, else from env (dev-server chaos).
         if "faults" in opts:
@@ -183,9 +200,17 @@ class DatabaseBackend(BaseTaskBackend):
                 lease_seconds=self.lease_seconds,
                 poll_interval=self.poll_interval,
                 fault=self.fault,
+                batch_size=self.batch_size,
+                idle_timeout=self.idle_timeout,
+                listen=self.listen,
             )
             pool.ensure_started()
             pool.notify()
+            if self.listen:
+                from gyrinx.tasks.worker import notify_enqueued
+
+                # Delivered on commit, to whichever process's workers are idle.
+                notify_enqueued()
 
         # manual: leave the row for the test driver to deliver.
         return task_result
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.7 on 2026-10-16 09:12
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0005_add_queued_task"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingTaskKey",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(auto_now=True, db_index=True)),
+                ("task_name", models.CharField(max_length=255)),
+                ("key", models.CharField(max_length=255)),
+                (
+                    "task_id",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        default="",
+                        help_text="The delivery holding the claim; blank until it is enqueued.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        help_text="After this the claim is stale and the next enqueue takes it over."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending Task Key",
+                "verbose_name_plural": "Pending Task Keys",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("task_name", "key"),
+                        name="pendingtaskkey_one_per_key",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -8,7 +8,7 @@ allowing result retrieval and status tracking for async tasks.
 import logging
 
 from django.db import models, transaction
-from django.db.models import Q
+from django.db.models import F, Q
 from django.utils import timezone
 
 from gyrinx.models import Base
@@ -16,7 +16,7 @@ from gyrinx.state_machine import StateMachine
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["TaskExecution", "QueuedTask"]
+__all__ = ["TaskExecution", "QueuedTask", "PendingTaskKey"]
 
 
 class TaskExecution(Base):
@@ -224,11 +224,31 @@ class QueuedTaskManager(models.Manager.from_queryset(QueuedTaskQuerySet)):
     def claim_one(self, *, worker_id, lease, now=None, ignore_schedule=False):
         """Atomically claim the next deliverable row and return it, or ``None``.
 
+        ``claim_batch`` with ``n=1``; see there.
+        """
+        rows = self.claim_batch(
+            1,
+            worker_id=worker_id,
+            lease=lease,
+            now=now,
+            ignore_schedule=ignore_schedule,
+        )
+        return rows[0] if rows else None
+
+    def claim_batch(self, n, *, worker_id, lease, now=None, ignore_schedule=False):
+        """Atomically claim up to ``n`` deliverable rows, oldest first.
+
         Uses ``SELECT … FOR UPDATE SKIP LOCKED`` so concurrent workers never grab
         the same row and a slow/locked row never blocks the pool. Claiming bumps
         ``attempts`` and stamps a visibility lease (``locked_until`` /
-        ``locked_by``); if the worker dies before deleting the row, the lease
-        lapses and the row becomes deliverable again (at-least-once).
+        ``locked_by``) on every row, in one ``UPDATE`` for the whole batch; if
+        the worker dies before deleting a row, its lease lapses and the row
+        becomes deliverable again (at-least-once).
+
+        Each row's lease runs from the claim, not from when the worker gets to
+        it, so a worker must not start a row whose lease has already lapsed —
+        another worker may have reclaimed it. Keep ``n`` small enough that a
+        batch finishes well inside one lease.
 
         ``ignore_schedule=True`` (used by the manual test driver) ignores
         ``available_at`` so retries fire immediately instead of waiting out the
@@ -241,20 +261,26 @@ class QueuedTaskManager(models.Manager.from_queryset(QueuedTaskQuerySet)):
                 base = base.filter(
                     Q(locked_until__isnull=True) | Q(locked_until__lte=now)
                 )
-            row = (
-                base.select_for_update(skip_locked=True)
-                .order_by("available_at", "created")
-                .first()
+            rows = list(
+                base.select_for_update(skip_locked=True).order_by(
+                    "available_at", "created"
+                )[:n]
             )
-            if row is None:
-                return None
-            row.attempts += 1
-            row.locked_until = now + lease
-            row.locked_by = worker_id
-            row.save(
-                update_fields=["attempts", "locked_until", "locked_by", "modified"]
+            if not rows:
+                return []
+            locked_until = now + lease
+            self.filter(pk__in=[row.pk for row in rows]).update(
+                attempts=F("attempts") + 1,
+                locked_until=locked_until,
+                locked_by=worker_id,
+                modified=now,
             )
-            return row
+            for row in rows:
+                row.attempts += 1
+                row.locked_until = locked_until
+                row.locked_by = worker_id
+                row.modified = now
+            return rows
 
 
 class QueuedTask(Base):
@@ -315,3 +341,45 @@ class QueuedTask(Base):
     @property
     def attempts_exhausted(self) -> bool:
         return self.attempts >= self.max_attempts
+
+
+class PendingTaskKey(Base):
+    """A coalescing claim: a delivery for ``(task_name, key)`` is on its way.
+
+    Written by ``gyrinx.tasks.coalesce.enqueue_coalesced`` and read by nothing
+    else. While a row is held, further coalesced enqueues for the same key are
+    dropped — the delivery already in flight will read the latest state when it
+    runs. The row is deleted when that delivery starts (``task_started``), so
+    anything that changes after the task has begun queues a fresh one.
+
+    ``expires_at`` bounds the claim: Pub/Sub publishing is fire-and-forget, and
+    a lost message must not hold the key forever. An expired row is taken over
+    by the next enqueue. Works the same under every backend, because the claim
+    lives in the database rather than in the transport.
+    """
+
+    task_name = models.CharField(max_length=255)
+    key = models.CharField(max_length=255)
+    task_id = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        db_index=True,
+        help_text="The delivery holding the claim; blank until it is enqueued.",
+    )
+    expires_at = models.DateTimeField(
+        help_text="After this the claim is stale and the next enqueue takes it over.",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task_name", "key"],
+                name="pendingtaskkey_one_per_key",
+            ),
+        ]
+        verbose_name = "Pending Task Key"
+        verbose_name_plural = "Pending Task Keys"
+
+    def __str__(self):
+        return f"{self.task_name}:{self.key} (until {self.expires_at})"
@@ -14,6 +14,7 @@ from django.tasks.base import TaskResultStatus
 from django.tasks.signals import task_enqueued, task_finished, task_started
 from django.utils import timezone
 
+from gyrinx.tasks import coalesce
 from gyrinx.tasks.models import TaskExecution
 from gyrinx.tracing import traced
 
@@ -53,6 +54,10 @@ def handle_task_enqueued(sender, task_result, **kwargs):
         task_result.id,
     )
 
+    # If this enqueue came through enqueue_coalesced, its claim now names the
+    # delivery that will release it.
+    coalesce.claim_enqueued(task_result.id)
+
 
 @receiver(task_started)
 @traced("signal_task_started")
@@ -72,6 +77,10 @@ def handle_task_started(sender, task_result, **kwargs):
         sender: The backend class executing the task
         task_result: TaskResult instance with task metadata
     """
+    # Whatever this delivery was holding a coalescing claim for, it now reads
+    # the latest state itself — later changes need a delivery of their own.
+    coalesce.release_started(task_result.id)
+
     try:
         execution = TaskExecution.objects.select_for_update().get(
             task_id=task_result.id
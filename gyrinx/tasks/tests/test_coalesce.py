@@ -0,0 +1,92 @@
+"""
+Tests for coalesced enqueue (gyrinx.tasks.coalesce).
+
+A burst of enqueues for one key is one delivery while it is pending; the claim
+is released when that delivery starts, so later changes get their own; and a
+claim whose delivery never arrived lapses after its window.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.tasks import task
+from django.utils import timezone
+
+from gyrinx.tasks.coalesce import enqueue_coalesced
+from gyrinx.tasks.models import PendingTaskKey
+
+_side_effects: list = []
+
+
+@task
+def _heal_task(name: str):
+    _side_effects.append(name)
+
+
+@pytest.fixture(autouse=True)
+def _register_test_tasks(monkeypatch):
+    from gyrinx.tasks import registry, route
+
+    monkeypatch.setattr(registry, "_tasks", [route.TaskRoute(_heal_task)])
+    _side_effects.clear()
+    yield
+
+
+@pytest.mark.django_db
+def test_a_burst_is_one_delivery(task_queue):
+    first = enqueue_coalesced(_heal_task, "a", key="a", window=60)
+    assert first is not None
+    assert enqueue_coalesced(_heal_task, "a", key="a", window=60) is None
+    assert enqueue_coalesced(_heal_task, "a", key="a", window=60) is None
+
+    assert task_queue.pending() == 1
+    assert PendingTaskKey.objects.get().task_id == first.id
+
+    task_queue.deliver_all()
+    assert _side_effects == ["a"]
+
+
+@pytest.mark.django_db
+def test_keys_coalesce_independently(task_queue):
+    enqueue_coalesced(_heal_task, "a", key="a", window=60)
+    enqueue_coalesced(_heal_task, "b", key="b", window=60)
+
+    task_queue.deliver_all()
+    assert sorted(_side_effects) == ["a", "b"]
+
+
+@pytest.mark.django_db
+def test_a_started_delivery_releases_the_key(task_queue):
+    enqueue_coalesced(_heal_task, "a", key="a", window=60)
+    task_queue.deliver_all()
+    assert not PendingTaskKey.objects.exists()
+
+    # Dirtied again after the heal read the state: that needs its own.
+    assert enqueue_coalesced(_heal_task, "a", key="a", window=60) is not None
+    task_queue.deliver_all()
+    assert _side_effects == ["a", "a"]
+
+
+@pytest.mark.django_db
+def test_a_lost_delivery_lapses_after_the_window(task_queue):
+    enqueue_coalesced(_heal_task, "a", key="a", window=60)
+    task_queue.drop_next()
+    task_queue.deliver_all()
+    assert _side_effects == []
+
+    # Still held: the message might only be slow.
+    assert enqueue_coalesced(_heal_task, "a", key="a", window=60) is None
+
+    PendingTaskKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+    assert enqueue_coalesced(_heal_task, "a", key="a", window=60) is not None
+    task_queue.deliver_all()
+    assert _side_effects == ["a"]
+
+
+@pytest.mark.django_db
+def test_eager_runs_and_leaves_nothing_held():
+    enqueue_coalesced(_heal_task, "a", key="a", window=60)
+    enqueue_coalesced(_heal_task, "a", key="a", window=60)
+
+    assert _side_effects == ["a", "a"]
+    assert not PendingTaskKey.objects.exists()
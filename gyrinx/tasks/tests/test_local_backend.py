@@ -373,3 +373,233 @@ def test_reclaim_does_not_clobber_completed_execution():
     assert execution.status == "SUCCESSFUL"  # not reset to READY / regenerated
     assert execution.finished_at == finished_at
     assert QueuedTask.objects.count() == 0
+
+
+# =============================================================================
+# Batched claims
+# =============================================================================
+
+
+def _queue(n, **fields):
+    from django.utils import timezone
+
+    now = timezone.now()
+    return [
+        QueuedTask.objects.create(
+            task_id=f"batch-{i}",
+            task_name="_record_task",
+            args=[str(i)],
+            kwargs={},
+            enqueued_at=now,
+            available_at=now,
+            **fields,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.django_db
+def test_claim_batch_leases_every_row_in_one_claim(django_assert_max_num_queries):
+    from datetime import timedelta
+
+    _queue(5)
+
+    # SAVEPOINT, SELECT … FOR UPDATE, one UPDATE for the lot, RELEASE — the
+    # same however many rows are claimed.
+    with django_assert_max_num_queries(4):
+        batch = QueuedTask.objects.claim_batch(
+            3, worker_id="w1", lease=timedelta(seconds=60)
+        )
+
+    assert [qt.task_id for qt in batch] == ["batch-0", "batch-1", "batch-2"]
+    claimed = QueuedTask.objects.filter(locked_by="w1")
+    assert claimed.count() == 3
+    assert all(qt.attempts == 1 for qt in claimed)
+    assert all(qt.attempts == 1 and qt.locked_by == "w1" for qt in batch)
+
+
+@pytest.mark.django_db
+def test_claim_batch_skips_leased_rows():
+    from datetime import timedelta
+
+    _queue(4)
+    lease = timedelta(seconds=60)
+    first = QueuedTask.objects.claim_batch(3, worker_id="w1", lease=lease)
+    second = QueuedTask.objects.claim_batch(3, worker_id="w2", lease=lease)
+
+    assert {qt.task_id for qt in first}.isdisjoint(qt.task_id for qt in second)
+    assert len(second) == 1
+    assert QueuedTask.objects.claim_batch(3, worker_id="w3", lease=lease) == []
+
+
+@pytest.mark.django_db
+def test_claim_one_is_a_batch_of_one():
+    from datetime import timedelta
+
+    _queue(2)
+    qt = QueuedTask.objects.claim_one(worker_id="w1", lease=timedelta(seconds=60))
+
+    assert qt.task_id == "batch-0"
+    assert QueuedTask.objects.filter(locked_by="w1").count() == 1
+
+
+# =============================================================================
+# The worker pool: wake-ups, idle waits and lapsed leases
+# =============================================================================
+
+
+def _started(pool, target):
+    """Run one of ``pool``'s loops on a thread that ``pool.stop()`` joins."""
+    import threading
+
+    from django.db import connection
+
+    def run():
+        try:
+            target()
+        finally:
+            # Each thread has its own connection; leaving it open strands it.
+            connection.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    pool._threads.append(thread)
+    return thread
+
+
+@pytest.mark.django_db(transaction=True)
+def test_a_notify_wakes_the_listener_only_once_committed():
+    from django.db import transaction
+
+    from gyrinx.tasks.worker import TaskWorkerPool, notify_enqueued
+
+    pool = TaskWorkerPool(num_workers=1, idle_timeout=0.1)
+    _started(pool, pool._listen)
+    try:
+        assert pool._listening.wait(5)
+        # The listener wakes the workers once on connecting, for anything
+        # queued while nobody was listening.
+        assert pool._wake.wait(5)
+        pool._wake.clear()
+
+        with transaction.atomic():
+            notify_enqueued()
+            assert not pool._wake.wait(0.5)
+        assert pool._wake.wait(5)
+    finally:
+        pool.stop()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_an_enqueue_elsewhere_wakes_an_idle_worker():
+    """Polling is slower than the test will wait: only the NOTIFY can get the
+    row delivered in time."""
+    import time
+
+    from gyrinx.tasks.worker import TaskWorkerPool, notify_enqueued
+
+    pool = TaskWorkerPool(num_workers=1, poll_interval=60, idle_timeout=60)
+    _started(pool, pool._loop)
+    _started(pool, pool._listen)
+    try:
+        assert pool._listening.wait(5)
+        # Let the worker answer the listener's connect-time wake, find the
+        # queue empty and go back to sleep.
+        time.sleep(0.5)
+        _queue(1)
+        notify_enqueued()
+
+        deadline = time.monotonic() + 5
+        while QueuedTask.objects.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert _side_effects == ["0"]
+    finally:
+        # The listener only looks at _stop between notifications.
+        pool._stop.set()
+        notify_enqueued()
+        pool.stop()
+
+
+@pytest.mark.django_db
+def test_idle_wait_without_a_listener_is_the_poll_interval():
+    from gyrinx.tasks.worker import TaskWorkerPool
+
+    _queue(1)
+    pool = TaskWorkerPool(poll_interval=2.0, idle_timeout=30.0)
+
+    assert pool._idle_wait() == 2.0
+
+
+@pytest.mark.django_db
+def test_idle_wait_while_listening_runs_to_the_next_row_due():
+    """A deferred row and a leased one are both due before the idle timeout;
+    the wait ends at the sooner of the two."""
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from gyrinx.tasks.worker import TaskWorkerPool
+
+    pool = TaskWorkerPool(poll_interval=1.0, idle_timeout=30.0)
+    pool._listening.set()
+    assert pool._idle_wait() == 30.0
+
+    deferred, leased = _queue(2)
+    now = timezone.now()
+    QueuedTask.objects.filter(pk=deferred.pk).update(
+        available_at=now + timedelta(seconds=20)
+    )
+    QueuedTask.objects.filter(pk=leased.pk).update(
+        locked_until=now + timedelta(seconds=10), locked_by="w1"
+    )
+    assert 9 < pool._idle_wait() <= 10
+
+    QueuedTask.objects.filter(pk=leased.pk).update(
+        locked_until=now + timedelta(seconds=90)
+    )
+    QueuedTask.objects.filter(pk=deferred.pk).update(
+        available_at=now + timedelta(seconds=60)
+    )
+    assert pool._idle_wait() == 30.0
+
+    QueuedTask.objects.filter(pk=deferred.pk).update(
+        available_at=now - timedelta(seconds=5)
+    )
+    assert pool._idle_wait() == pytest.approx(0.1)
+
+
+@pytest.mark.django_db
+def test_a_batch_row_whose_lease_lapsed_is_left_for_its_new_owner(monkeypatch, caplog):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from gyrinx.tasks import worker
+    from gyrinx.tasks.worker import TaskWorkerPool
+
+    # The loop runs on the test's own connection, inside its transaction.
+    monkeypatch.setattr(worker, "close_old_connections", lambda: None)
+    _queue(2)
+    batch = QueuedTask.objects.claim_batch(
+        2, worker_id="w1", lease=timedelta(seconds=60)
+    )
+    # As if delivering the first row took longer than the lease.
+    batch[1].locked_until = timezone.now() - timedelta(seconds=1)
+    pool = TaskWorkerPool(num_workers=1)
+    claims = iter([batch])
+
+    def claim_batch(*args, **kwargs):
+        claimed = next(claims, [])
+        if not claimed:
+            pool._stop.set()
+            pool._wake.set()
+        return claimed
+
+    monkeypatch.setattr(QueuedTask.objects, "claim_batch", claim_batch)
+    with caplog.at_level("WARNING", logger="gyrinx.tasks.worker"):
+        pool._loop()
+
+    assert _side_effects == ["0"]
+    left = QueuedTask.objects.get()
+    assert (left.task_id, left.attempts, left.locked_by) == ("batch-1", 1, "w1")
+    assert "Lease on batch-1 lapsed before delivery" in caplog.text
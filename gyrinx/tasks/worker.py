@@ -7,9 +7,12 @@ This module holds:
   success, reschedule with backoff on failure, give up after ``max_attempts``).
   Shared by the background worker pool and the manual pytest driver so both take
   the exact same delivery path.
-- :class:`TaskWorkerPool` — a small pool of daemon threads that poll the queue and
-  call :func:`deliver`. Lazily started by the ``DatabaseBackend`` in ``worker``
-  mode (the dev server); never started under tests.
+- :class:`TaskWorkerPool` — a small pool of daemon threads that claim rows from
+  the queue in batches and call :func:`deliver` on each. Lazily started by the
+  ``DatabaseBackend`` in ``worker`` mode (the dev server); never started under
+  tests. Idle workers sleep until an enqueue wakes them — in-process through an
+  event, from any process through Postgres ``LISTEN``/``NOTIFY`` — and otherwise
+  only until the next deferred row falls due.
 
 Nothing here runs in production — prod delivers via Pub/Sub push.
 """
@@ -19,7 +22,8 @@ import logging
 import threading
 from datetime import timedelta
 
-from django.db import close_old_connections
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.models import Min, Q
 from django.utils import timezone
 
 from gyrinx.tasks.executor import run_task
@@ -32,6 +36,23 @@ logger = logging.getLogger(__name__)
 DEFAULT_MIN_RETRY_DELAY = 10
 DEFAULT_MAX_RETRY_DELAY = 600
 
+# The Postgres channel an enqueue NOTIFYs and idle workers LISTEN on.
+NOTIFY_CHANNEL = "gyrinx_tasks"
+
+
+def notify_enqueued(using=DEFAULT_DB_ALIAS) -> None:
+    """Tell listening workers in every process that a row was queued.
+
+    Postgres holds a ``NOTIFY`` until the transaction commits, so a worker is
+    never woken to look for a row it cannot see yet. A no-op on other
+    databases, where workers fall back to polling.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, '')", [NOTIFY_CHANNEL])
+
 
 class InjectedFailure(Exception):
     """Raised (conceptually) to represent a fault-injected delivery failure —
@@ -230,11 +251,18 @@ def deliver(
 
 
 class TaskWorkerPool:
-    """A pool of daemon threads that poll the durable queue and deliver tasks.
+    """A pool of daemon threads that drain the durable queue in batches.
 
     Used only under the dev server. Threads are daemons: a runserver autoreload
     kills them, but the durable rows survive and are reclaimed once their lease
     lapses — so an interrupted task is redelivered rather than lost.
+
+    Each worker claims up to ``batch_size`` rows per transaction and delivers
+    them in turn, claiming again as soon as the batch is done. When the queue
+    is empty it sleeps until woken: by ``notify()`` from an enqueue in this
+    process, by a Postgres ``NOTIFY`` from an enqueue in any process (one
+    listener thread per pool), or at the latest when the next deferred row is
+    due. ``poll_interval`` bounds that sleep where there is no listener.
     """
 
     def __init__(
@@ -244,14 +272,21 @@ class TaskWorkerPool:
         lease_seconds: int = 300,
         poll_interval: float = 1.0,
         fault: FaultConfig | None = None,
+        batch_size: int = 10,
+        idle_timeout: float = 30.0,
+        listen: bool = True,
     ):
         self.num_workers = max(1, num_workers)
         self.lease = timedelta(seconds=lease_seconds)
         self.poll_interval = poll_interval
         self.fault = fault or FaultConfig.disabled()
+        self.batch_size = max(1, batch_size)
+        self.idle_timeout = idle_timeout
+        self.listen = listen
         self._threads: list[threading.Thread] = []
         self._stop = threading.Event()
         self._wake = threading.Event()
+        self._listening = threading.Event()
         self._started = False
         self._lock = threading.Lock()
 
@@ -267,6 +302,12 @@ class TaskWorkerPool:
                 t = threading.Thread(target=self._loop, name=name, daemon=True)
                 t.start()
                 self._threads.append(t)
+            if self.listen and connections[DEFAULT_DB_ALIAS].vendor == "postgresql":
+                t = threading.Thread(
+                    target=self._listen, name="gyrinx-task-listener", daemon=True
+                )
+                t.start()
+                self._threads.append(t)
             self._started = True
             logger.info(
                 "Started local task worker pool (%s worker(s)%s)",
@@ -275,8 +316,7 @@ class TaskWorkerPool:
             )
 
     def notify(self) -> None:
-        """Nudge idle workers that new work may be available (optimisation over
-        pure polling)."""
+        """Wake idle workers: new work may be available."""
         self._wake.set()
 
     def stop(self, timeout: float = 5.0) -> None:
@@ -296,35 +336,104 @@ class TaskWorkerPool:
         if not still_alive:
             self._stop.clear()
             self._wake.clear()
+            self._listening.clear()
+
+    def _idle_wait(self) -> float:
+        """How long an idle worker may sleep before it must look again.
+
+        Without a listener, ``poll_interval``. With one, until the next row that
+        no ``NOTIFY`` will announce — a deferred task, a retry waiting out its
+        backoff, a lapsing lease — capped at ``idle_timeout``.
+        """
+        from gyrinx.tasks.models import QueuedTask
+
+        if not self._listening.is_set():
+            return self.poll_interval
+        now = timezone.now()
+        due = QueuedTask.objects.aggregate(
+            available=Min("available_at", filter=Q(locked_until__isnull=True)),
+            leased=Min("locked_until"),
+        )
+        wait = self.idle_timeout
+        for when in due.values():
+            if when is not None:
+                wait = min(wait, (when - now).total_seconds())
+        return max(self.poll_interval / 10, wait)
 
     def _loop(self) -> None:
         from gyrinx.tasks.models import QueuedTask
 
         worker_id = threading.current_thread().name
         while not self._stop.is_set():
-            # Each poll cycle gets a fresh connection state; a worker thread must
+            # Each claim cycle gets a fresh connection state; a worker thread must
             # not hang onto (or share) a request's DB connection.
             close_old_connections()
+            # Cleared before the claim, so an enqueue that lands after an empty
+            # look still wakes the wait below.
+            self._wake.clear()
             try:
-                qt = QueuedTask.objects.claim_one(worker_id=worker_id, lease=self.lease)
+                batch = QueuedTask.objects.claim_batch(
+                    self.batch_size, worker_id=worker_id, lease=self.lease
+                )
             except Exception:
                 logger.exception("Task worker failed to claim; backing off")
-                qt = None
-
-            if qt is None:
-                self._wake.wait(self.poll_interval)
-                self._wake.clear()
+                batch = None
+
+            if not batch:
+                try:
+                    wait = self.poll_interval if batch is None else self._idle_wait()
+                except Exception:
+                    logger.exception("Task worker failed to read the queue")
+                    wait = self.poll_interval
+                self._wake.wait(wait)
                 continue
 
+            for qt in batch:
+                if self._stop.is_set():
+                    # Unstarted rows are redelivered when their lease lapses.
+                    break
+                if timezone.now() >= qt.locked_until:
+                    # The lease ran out while earlier rows were delivered;
+                    # another worker may already own this one.
+                    logger.warning(
+                        "Lease on %s lapsed before delivery; leaving it",
+                        qt.task_id,
+                    )
+                    continue
+                try:
+                    deliver(qt, fault=self.fault)
+                except Exception:
+                    # deliver() shouldn't raise for task failures, but never let
+                    # an unexpected error kill the worker thread.
+                    logger.exception(
+                        "Unexpected error delivering task %s; leaving row for "
+                        "lease expiry / redelivery",
+                        getattr(qt, "task_id", "?"),
+                    )
+            close_old_connections()
+
+    def _listen(self) -> None:
+        """Turn Postgres ``NOTIFY``s into wake-ups, on a connection of its own.
+
+        Django's connections are per thread and transactional; a listener needs
+        one that stays open in autocommit and is never handed to a query. If it
+        fails the workers fall back to polling until it reconnects.
+        """
+        while not self._stop.is_set():
+            wrapper = connections.create_connection(DEFAULT_DB_ALIAS)
             try:
-                deliver(qt, fault=self.fault)
+                wrapper.ensure_connection()
+                raw = wrapper.connection
+                raw.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                self._listening.set()
+                # Anything queued while nobody was listening.
+                self._wake.set()
+                while not self._stop.is_set():
+                    for _ in raw.notifies(timeout=self.idle_timeout, stop_after=1):
+                        self._wake.set()
             except Exception:
-                # deliver() shouldn't raise for task failures, but never let an
-                # unexpected error kill the worker thread.
-                logger.exception(
-                    "Unexpected error delivering task %s; leaving row for lease "
-                    "expiry / redelivery",
-                    getattr(qt, "task_id", "?"),
-                )
+                logger.exception("Task queue listener failed; polling until it is back")
+                self._stop.wait(self.idle_timeout)
             finally:
-                close_old_connections()
+                self._listening.clear()
+                wrapper.close()
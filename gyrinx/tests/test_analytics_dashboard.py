@@ -17,6 +17,7 @@ from gyrinx.analytics.registry import (
     growth_series,
     register_growth_series,
 )
+from gyrinx.analytics.rollup import roll_up
 
 
 @pytest.fixture
@@ -58,6 +59,7 @@ def test_growth_chart_counts_the_editions_objects(
     lst = make_list("Growth Gang")
     make_list_fighter(lst, "Growth Fighter")
     make_campaign("Growth Campaign")
+    roll_up()
 
     client.force_login(dashboard_admin)
     resp = client.get(reverse("admin:analytics_dashboard"))
@@ -0,0 +1,158 @@
+"""The daily rollups the analytics dashboard reads.
+
+A run recounts only the days from its watermark on, so these pin both halves
+of that: what is recounted lands correctly and replaces what was there, and
+what is behind the watermark is left alone unless a rebuild asks for it.
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from gyrinx.analytics import registry
+from gyrinx.analytics.models import (
+    DailyEventCount,
+    DailySeriesCount,
+    Event,
+    EventVerb,
+    RollupWatermark,
+    log_event,
+)
+from gyrinx.analytics.registry import GrowthSeries, register_growth_series
+from gyrinx.analytics.rollup import (
+    EVENTS_WATERMARK,
+    roll_up,
+    roll_up_events,
+    series_watermark,
+)
+from gyrinx.tasks.registry import get_all_tasks
+from n23.core.events import EventNoun
+
+
+def _counts():
+    return {
+        (row.day, row.noun, row.verb, row.edition): row.count
+        for row in DailyEventCount.objects.all()
+    }
+
+
+@pytest.fixture
+def extra_series():
+    """Register throwaway series for the test, and drop them after."""
+    keys = []
+
+    def register(key, daily_counts):
+        register_growth_series(
+            GrowthSeries(
+                key=key,
+                label=key,
+                border_color="rgb(0, 0, 0)",
+                background_color="rgba(0, 0, 0, 0.2)",
+                daily_counts=daily_counts,
+                edition="n23",
+            )
+        )
+        keys.append(key)
+
+    yield register
+    for key in keys:
+        registry._series.pop(key, None)
+
+
+@pytest.mark.django_db
+def test_events_are_counted_per_day_noun_verb_and_edition(user):
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.VIEW)
+
+    roll_up()
+
+    today = timezone.localdate()
+    assert _counts() == {
+        (today, "list", "create", "n23"): 2,
+        (today, "list", "view", "n23"): 1,
+    }
+    assert RollupWatermark.objects.get(name=EVENTS_WATERMARK).day == today
+
+
+@pytest.mark.django_db
+def test_a_rerun_replaces_the_open_day_rather_than_adding_to_it(user):
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    roll_up()
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    roll_up()
+
+    assert list(_counts().values()) == [2]
+
+
+@pytest.mark.django_db
+def test_days_behind_the_watermark_are_not_recounted(user):
+    today = timezone.localdate()
+    roll_up()
+    # Written "yesterday", after yesterday was already finished.
+    late = log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    Event.objects.filter(pk=late.pk).update(created=timezone.now() - timedelta(days=1))
+
+    roll_up_events(today=today)
+    assert _counts() == {}
+
+    roll_up_events(today=today, rebuild=True)
+    assert _counts() == {(today - timedelta(days=1), "list", "create", "n23"): 1}
+
+
+@pytest.mark.django_db
+def test_a_new_series_is_backfilled_from_the_start(extra_series):
+    long_ago = timezone.localdate() - timedelta(days=400)
+    extra_series("test_backfilled", lambda start: {long_ago: 3})
+
+    roll_up()
+
+    row = DailySeriesCount.objects.get(series_key="test_backfilled")
+    assert (row.day, row.count) == (long_ago, 3)
+    assert RollupWatermark.objects.filter(
+        name=series_watermark("test_backfilled")
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_a_failing_series_does_not_cost_the_others(extra_series):
+    today = timezone.localdate()
+
+    def broken(start):
+        raise RuntimeError("boom")
+
+    extra_series("test_broken", broken)
+    extra_series("test_fine", lambda start: {today: 1})
+
+    written = roll_up()
+
+    assert series_watermark("test_broken") not in written
+    assert written[series_watermark("test_fine")] == 1
+    assert not RollupWatermark.objects.filter(
+        name=series_watermark("test_broken")
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_the_dashboard_charts_the_rolled_up_events(client, make_user, user):
+    admin_user = make_user("rollup-admin", "password")
+    admin_user.is_staff = admin_user.is_superuser = True
+    admin_user.save()
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    roll_up()
+
+    client.force_login(admin_user)
+    resp = client.get(reverse("admin:analytics_dashboard"))
+
+    datasets = json.loads(resp.context["events_data"])["datasets"]
+    assert ("list - create", 1) in [(d["label"], d["data"][-1]) for d in datasets]
+
+
+def test_the_rollups_are_scheduled():
+    routes = {route.name: route for route in get_all_tasks()}
+
+    assert routes["roll_up_analytics"].schedule is not None
+    assert routes["restate_growth_series"].schedule is not None
@@ -0,0 +1,154 @@
+"""The buffered analytics sink.
+
+log_event can hand its row to a sink that writes in batches off the request
+path. These pin what that must not cost: every queued event is written, with
+its edition, in one statement per batch; what an event moves on save — a
+list's or a campaign's ``modified`` — it still moves; an action that rolled
+back logs nothing; the buffer is bounded and counts what it drops; and "sync"
+still writes at once.
+
+An event is queued when its transaction commits, and a test runs inside one
+that never does, so logging is wrapped to run the commit callbacks.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+from django.utils import timezone
+
+from gyrinx.analytics import sink as sink_module
+from gyrinx.analytics.models import Event, EventVerb, log_event
+from gyrinx.analytics.nouns import Edition
+from gyrinx.analytics.sink import EventSink, flush_at_request_end
+from n23.core.events import EventNoun
+from n23.core.models.campaign import Campaign
+from n23.core.models.list import List
+
+
+@pytest.fixture
+def sink(settings):
+    """The buffered mode, with a sink whose flushes the test drives."""
+    settings.ANALYTICS_EVENT_SINK = "buffered"
+    sink = EventSink(batch_size=10, max_buffer=20, background=False)
+    with patch("gyrinx.analytics.sink.get_sink", return_value=sink):
+        yield sink
+
+
+@pytest.fixture
+def logged(django_capture_on_commit_callbacks):
+    """log_event, as an action that commits would call it."""
+
+    def _log(**kwargs):
+        with django_capture_on_commit_callbacks(execute=True):
+            return log_event(**kwargs)
+
+    return _log
+
+
+@pytest.mark.django_db
+def test_buffered_events_are_written_on_flush(
+    sink, logged, user, django_assert_max_num_queries
+):
+    for _ in range(3):
+        logged(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+
+    assert not Event.objects.exists()
+    assert sink.pending() == 3
+
+    # One INSERT for the batch, inside its savepoint. These events name no
+    # list or campaign, so their post_save receivers have nothing to update.
+    with django_assert_max_num_queries(3):
+        assert sink.flush() == 3
+
+    assert Event.objects.count() == 3
+    assert set(Event.objects.values_list("edition", flat=True)) == {Edition.N23}
+    assert sink.pending() == 0
+
+
+@pytest.mark.django_db
+def test_a_flush_emits_each_event_to_the_stream(sink, logged, user):
+    logged(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+
+    with patch("gyrinx.analytics.models.track") as track:
+        sink.flush()
+
+    track.assert_called_once()
+    assert track.call_args.args[0] == "event_create_list"
+
+
+@pytest.mark.django_db
+def test_a_full_buffer_drops_and_counts(sink, logged, user):
+    for _ in range(25):
+        logged(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+
+    assert sink.pending() == 20
+    with patch("gyrinx.analytics.sink.track") as track:
+        sink.flush()
+
+    track.assert_called_once_with("analytics_events_dropped", n=5, max_buffer=20)
+    assert Event.objects.count() == 20
+
+
+@pytest.mark.django_db
+def test_one_bad_event_does_not_cost_the_batch(sink, logged, user):
+    logged(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    bad = logged(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+    bad.session_id = "x" * 100  # longer than the column
+
+    assert sink.flush() == 1
+    assert Event.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_a_flush_moves_the_list_and_campaign_modified(
+    sink, logged, user, make_list, campaign
+):
+    lst = make_list("Buffered")
+    yesterday = timezone.now() - timedelta(days=1)
+    List.objects.filter(pk=lst.pk).update(modified=yesterday)
+    Campaign.objects.filter(pk=campaign.pk).update(modified=yesterday)
+
+    logged(
+        user=user,
+        noun=EventNoun.LIST,
+        verb=EventVerb.UPDATE,
+        list_id=str(lst.pk),
+        campaign_id=str(campaign.pk),
+    )
+    sink.flush()
+
+    event = Event.objects.get()
+    assert List.objects.get(pk=lst.pk).modified == event.created
+    assert Campaign.objects.get(pk=campaign.pk).modified == event.created
+
+
+@pytest.mark.django_db
+def test_an_action_that_rolled_back_logs_nothing(
+    sink, user, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError), transaction.atomic():
+            log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+            raise RuntimeError
+
+    assert sink.pending() == 0
+
+
+@pytest.mark.django_db
+def test_the_end_of_a_request_writes_what_it_queued(sink, logged, user):
+    logged(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+
+    with patch.object(sink_module, "_sink", sink):
+        flush_at_request_end(sender=None)
+
+    assert sink.pending() == 0
+    assert Event.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_sync_writes_inside_log_event(user):
+    event = log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.CREATE)
+
+    assert Event.objects.filter(pk=event.pk).exists()
@@ -0,0 +1,97 @@
+"""The benchmark harness: what it measures, and what it calls a regression."""
+
+import time
+
+import pytest
+from django.contrib.auth.models import User
+
+from gyrinx.benchmark import (
+    PRODUCTION_SETTINGS,
+    Baseline,
+    Measurement,
+    check,
+    measure,
+    production_settings,
+)
+
+
+def test_a_measurement_counts_the_watched_pass_only(db):
+    runs = []
+
+    def run():
+        runs.append(User.objects.count())
+
+    measured = measure("users", run, rounds=3)
+
+    assert len(runs) == 4
+    assert measured.queries == 1
+    assert measured.seconds >= 0
+    assert measured.peak_bytes > 0
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    recorded = Baseline(tmp_path / "baseline.json")
+    recorded.record(
+        Measurement(name="page", queries=10, seconds=0.1, peak_bytes=4 * 1024 * 1024)
+    )
+    return Baseline(tmp_path / "baseline.json")
+
+
+def test_a_recorded_baseline_is_read_back(baseline):
+    assert baseline.entries == {
+        "page": {"queries": 10, "seconds": 0.1, "peak_bytes": 4 * 1024 * 1024}
+    }
+
+
+def test_noise_is_not_a_regression(baseline):
+    same = Measurement(name="page", queries=10, seconds=0.11, peak_bytes=4300000)
+    assert baseline.regressions(same) == []
+
+
+def test_one_more_query_is_a_regression(baseline):
+    found = baseline.regressions(
+        Measurement(name="page", queries=11, seconds=0.1, peak_bytes=4 * 1024 * 1024)
+    )
+    assert found == ["queries rose from 10 to 11"]
+
+
+def test_time_and_memory_past_the_tolerance_are_regressions(baseline):
+    found = baseline.regressions(
+        Measurement(name="page", queries=10, seconds=0.2, peak_bytes=8 * 1024 * 1024)
+    )
+    assert found == [
+        "time rose from 100.0ms to 200.0ms",
+        "peak memory rose from 4096KiB to 8192KiB",
+    ]
+
+
+def test_a_benchmark_with_no_baseline_passes(baseline):
+    new = Measurement(name="other", queries=99, seconds=9, peak_bytes=1)
+    assert baseline.regressions(new) == []
+
+
+def test_a_check_reports_what_regressed(baseline):
+    measured, found = check("page", lambda: time.sleep(0.25), baseline, rounds=1)
+
+    assert measured.seconds >= 0.25
+    assert found == [f"time rose from 100.0ms to {measured.seconds * 1000:.1f}ms"]
+
+
+def test_a_check_while_updating_records_instead(baseline, monkeypatch):
+    monkeypatch.setenv("BENCHMARK_UPDATE", "1")
+
+    measured, found = check("page", lambda: time.sleep(0.25), baseline, rounds=1)
+
+    assert found == []
+    assert Baseline(baseline.path).entries["page"]["seconds"] == measured.seconds
+
+
+def test_production_settings_are_the_deployed_ones_the_test_run_changed(settings):
+    deployed = production_settings()
+
+    assert set(deployed) == set(PRODUCTION_SETTINGS)
+    assert settings.N26_HIRE_LIST_CACHE is False
+    assert deployed["N26_HIRE_LIST_CACHE"] is True
+    assert settings.SHARED_CACHE_TAG_TTL is None
+    assert deployed["SHARED_CACHE_TAG_TTL"] == 10
@@ -5,8 +5,9 @@ from django.core.cache import cache
 from django.db import DatabaseError, InterfaceError, OperationalError
 from django.test import RequestFactory
 
+from gyrinx.cache import tagged_key
 from gyrinx.context_processors import site_banner
-from gyrinx.site.models import BANNER_CACHE_KEYS, Banner
+from gyrinx.site.models import BANNER_CACHE_KEYS, BANNER_CACHE_TAG, Banner
 
 
 @pytest.fixture
@@ -16,7 +17,7 @@ def request_factory():
 
 def clear_banner_cache():
     for key in BANNER_CACHE_KEYS.values():
-        cache.delete(key)
+        cache.delete(tagged_key(key, BANNER_CACHE_TAG))
 
 
 @pytest.mark.django_db
@@ -233,14 +234,14 @@ def test_banner_save_clears_cache():
     """Test that saving a banner clears the caches for both editions."""
     # Set something in both caches
     for key in BANNER_CACHE_KEYS.values():
-        cache.set(key, "test_value", 300)
+        cache.set(tagged_key(key, BANNER_CACHE_TAG), "test_value", 300)
 
     # Create and save a banner
     Banner.objects.create(text="Test Banner", live_n23=True)
 
     # Caches should be cleared
     for key in BANNER_CACHE_KEYS.values():
-        assert cache.get(key) is None
+        assert cache.get(tagged_key(key, BANNER_CACHE_TAG)) is None
 
 
 @pytest.mark.django_db
@@ -251,11 +252,11 @@ def test_banner_delete_clears_cache():
 
     # Set something in both caches
     for key in BANNER_CACHE_KEYS.values():
-        cache.set(key, "test_value", 300)
+        cache.set(tagged_key(key, BANNER_CACHE_TAG), "test_value", 300)
 
     # Delete the banner
     banner.delete()
 
     # Caches should be cleared
     for key in BANNER_CACHE_KEYS.values():
-        assert cache.get(key) is None
+        assert cache.get(tagged_key(key, BANNER_CACHE_TAG)) is None
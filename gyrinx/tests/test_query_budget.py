@@ -0,0 +1,134 @@
+"""The query budget: fingerprinting statements, and the middleware that
+samples live requests for their counts, their budgets and their N+1s."""
+
+from unittest.mock import Mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import ResolverMatch
+from django.views import View
+
+from gyrinx.middleware import QueryBudgetMiddleware
+from gyrinx.query import budget_of, capture_queries, fingerprint, query_budget
+
+
+@pytest.fixture
+def sampled(settings, monkeypatch):
+    """Every request sampled; a shape run three times is an N+1."""
+    settings.QUERY_BUDGET_SAMPLE_RATE = 1
+    settings.QUERY_BUDGET_REPEAT_THRESHOLD = 3
+    settings.QUERY_BUDGET_DEFAULT = 100
+    tracked = Mock()
+    monkeypatch.setattr("gyrinx.middleware.track", tracked)
+    return tracked
+
+
+def _events(tracked):
+    return {c.args[0]: c.kwargs for c in tracked.call_args_list}
+
+
+@query_budget(2)
+def _one_user_at_a_time(request):
+    for pk in range(1, 5):
+        User.objects.filter(pk=pk).first()
+    return HttpResponse("ok")
+
+
+def _request(view):
+    request = RequestFactory().get("/users/")
+    request.resolver_match = ResolverMatch(view, (), {}, url_name="users")
+    return request
+
+
+def test_a_fingerprint_takes_the_values_out():
+    assert fingerprint(
+        "SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'it''s' LIMIT 21"
+        " /*route='/a/'*/"
+    ) == fingerprint("SELECT *  FROM t WHERE id IN (9) AND name = 'x' LIMIT 1")
+
+
+def test_a_fingerprint_keeps_names_that_carry_digits():
+    assert fingerprint('SELECT "t1"."col_2" FROM t1') == ('SELECT "t1"."col_2" FROM t1')
+
+
+@pytest.mark.django_db
+def test_a_repeated_shape_is_recorded_with_where_it_ran_from():
+    _, info = capture_queries(
+        lambda: [User.objects.filter(pk=pk).first() for pk in range(3)],
+        stack_after=3,
+    )
+
+    [(shape, runs)] = info.repeated(3)
+    assert runs == 3
+    assert list(info.stacks) == [shape]
+    assert any(
+        "test_query_budget.py" in frame and "<lambda>" in frame
+        for frame in info.stacks[shape]
+    )
+
+
+@pytest.mark.django_db
+def test_a_shape_run_with_booleans_and_nulls_is_keyed_as_it_is_counted():
+    _, info = capture_queries(
+        lambda: [
+            User.objects.filter(is_active=True, last_login=None, pk=pk).first()
+            for pk in range(2)
+        ],
+        stack_after=2,
+    )
+
+    [(shape, _)] = info.repeated(2)
+    assert info.stacks[shape]
+
+
+def test_a_fingerprint_reads_placeholders_as_values():
+    assert fingerprint("SELECT * FROM t WHERE a = %s AND b = %(b)s") == (
+        fingerprint("SELECT * FROM t WHERE a = 1 AND b = 'x'")
+    )
+
+
+@pytest.mark.django_db
+def test_a_sampled_request_reports_its_count_budget_and_repeats(sampled, caplog):
+    response = QueryBudgetMiddleware(_one_user_at_a_time)(_request(_one_user_at_a_time))
+
+    assert response.status_code == 200
+    events = _events(sampled)
+    assert events["request_queries"]["n"] == 4
+    assert events["request_queries"]["view"] == "users"
+    assert events["request_queries"]["budget"] == 2
+    assert events["query_budget_exceeded"]["n"] == 4
+    assert events["query_repeated"]["n"] == 4
+    assert "over its budget of 2" in caplog.text
+    assert "_one_user_at_a_time" in caplog.text
+
+
+@pytest.mark.django_db
+def test_a_view_within_its_budget_only_reports_its_count(sampled):
+    def one_query(request):
+        User.objects.exists()
+        return HttpResponse("ok")
+
+    QueryBudgetMiddleware(one_query)(_request(one_query))
+
+    assert list(_events(sampled)) == ["request_queries"]
+
+
+def test_an_unsampled_request_is_left_alone(sampled, settings):
+    settings.QUERY_BUDGET_SAMPLE_RATE = 0
+    response = QueryBudgetMiddleware(lambda request: HttpResponse("ok"))(
+        RequestFactory().get("/")
+    )
+
+    assert response.status_code == 200
+    sampled.assert_not_called()
+
+
+def test_a_class_based_view_declares_its_budget_on_the_class():
+    @query_budget(12)
+    class Listing(View):
+        pass
+
+    assert budget_of(Listing.as_view()) == 12
+    assert budget_of(View.as_view()) is None
@@ -0,0 +1,165 @@
+"""The shared cache, and the tags that invalidate per-process caches from anywhere.
+
+``caches["shared"]`` is a table every instance reads, so these check it
+behaves as a Django cache should. The tag tests stand in for a second process
+by forgetting what this one has seen: its keys must still move once the
+invalidation has committed.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+
+from gyrinx.cache import invalidate, shared_cache, tagged_key
+from gyrinx.cache import tags as cache_tags
+from gyrinx.cache.models import CacheEntry
+from gyrinx.context_processors import notifications as notifications_cp
+from gyrinx.site.models import notify
+from n23.content.models import ContentBook, ContentPageRef
+
+
+@pytest.fixture
+def cross_process(settings):
+    """Re-read committed tag versions on every use, as a cold process would."""
+    settings.SHARED_CACHE_TAG_TTL = 0
+
+
+@pytest.fixture
+def count_cache(settings):
+    settings.NOTIFICATION_COUNT_CACHE = True
+
+
+def _badge(user):
+    request = RequestFactory().get("/")
+    request.user = user
+    return notifications_cp(request)["unread_notification_count"]
+
+
+@pytest.mark.django_db
+def test_the_shared_cache_round_trips():
+    cache = shared_cache()
+    cache.set("k", {"a": [1, 2]})
+
+    assert cache.get("k") == {"a": [1, 2]}
+    assert cache.get_many(["k", "missing"]) == {"k": {"a": [1, 2]}}
+    assert cache.delete("k")
+    assert cache.get("k", "gone") == "gone"
+
+
+@pytest.mark.django_db
+def test_an_expired_entry_is_not_served_and_can_be_added_over():
+    cache = shared_cache()
+    cache.set("k", 1)
+    CacheEntry.objects.update(expires=timezone.now() - timedelta(seconds=1))
+
+    assert cache.get("k") is None
+    assert cache.add("k", 2)
+    assert not cache.add("k", 3)
+    assert cache.get("k") == 2
+
+
+@pytest.mark.django_db
+def test_incr_counts_on_the_stored_value():
+    cache = shared_cache()
+    cache.set("n", 1, None)
+
+    assert cache.incr("n", 2) == 3
+    assert cache.get("n") == 3
+    with pytest.raises(ValueError):
+        cache.incr("missing")
+
+
+def test_an_untouched_tag_leaves_the_key_alone():
+    assert tagged_key("plain", "never-invalidated") == "plain"
+
+
+@pytest.mark.django_db
+def test_invalidating_moves_the_key_here_at_once():
+    before = tagged_key("k", "t")
+    invalidate("t")
+
+    assert tagged_key("k", "t") != before
+    assert tagged_key("other", "unrelated") == "other"
+
+
+@pytest.mark.django_db
+def test_an_invalidation_reaches_other_processes_on_commit(
+    cross_process, django_capture_on_commit_callbacks
+):
+    before = tagged_key("k", "t")
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate("t")
+
+    # Another process: it never made the change, only sees what was committed.
+    cache_tags._local.clear()
+    cache_tags._seen.clear()
+    assert tagged_key("k", "t") not in (before, "k")
+
+
+@pytest.mark.django_db
+def test_an_uncommitted_invalidation_stays_in_its_process(cross_process):
+    invalidate("t")
+
+    cache_tags._local.clear()
+    cache_tags._seen.clear()
+    assert tagged_key("k", "t") == "k"
+
+
+@pytest.mark.django_db
+def test_the_unread_count_is_read_from_the_shared_cache(
+    count_cache, user, django_assert_num_queries
+):
+    notify(recipient=user, subject="a")
+    assert _badge(user) == 1
+
+    # A primary-key read of the cached count, not the COUNT.
+    with django_assert_num_queries(1):
+        assert _badge(user) == 1
+
+
+@pytest.mark.django_db
+def test_any_inbox_change_drops_the_cached_count(count_cache, user):
+    first = notify(recipient=user, subject="a")
+    assert _badge(user) == 1
+
+    notify(recipient=user, subject="b")
+    assert _badge(user) == 2
+
+    first.mark_read()
+    assert _badge(user) == 1
+
+
+@pytest.mark.django_db
+def test_a_bulk_action_drops_the_cached_count(count_cache, client, user):
+    for i in range(3):
+        notify(recipient=user, subject=f"n-{i}")
+    assert _badge(user) == 3
+
+    client.force_login(user)
+    client.post(
+        reverse("core:notifications-bulk"),
+        {"action": "mark_read", "all": "1", "bucket": "inbox", "status": "unread"},
+    )
+    assert _badge(user) == 0
+
+
+@pytest.mark.django_db
+def test_the_count_cache_is_never_consulted_for_anonymous(count_cache):
+    assert _badge(AnonymousUser()) == 0
+    assert not CacheEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_editing_a_page_ref_moves_every_cached_lookup():
+    book = ContentBook.objects.create(name="Core Rulebook", shortname="Core")
+    ref = ContentPageRef.objects.create(book=book, title="Agility", page="1")
+    assert [r.page for r in ContentPageRef.find_similar("Agility")] == ["1"]
+
+    ref.page = "2"
+    ref.save()
+
+    assert [r.page for r in ContentPageRef.find_similar("Agility")] == ["2"]
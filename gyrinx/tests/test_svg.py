@@ -4,7 +4,11 @@ Both editions draw stored artwork inline, so what this rejects is the whole of
 what stops a piece of authored artwork from running script in a reader's page.
 """
 
-from gyrinx.svg import sanitize_inline_svg
+from unittest import mock
+
+from django.core.cache import cache
+
+from gyrinx.svg import cached_inline_svg, sanitize_inline_svg
 
 SIMPLE_SVG = (
     '<svg xmlns="http://www.w3.org/2000/svg" width="48" height="48" '
@@ -297,3 +301,18 @@ def test_preserve_colour_does_not_reopen_the_script_hole():
     assert "<script" not in out.lower()
     assert "onclick" not in out.lower()
     assert 'fill="#abc"' in out
+
+
+def test_cached_markup_is_cleaned_once_per_drawing_and_options():
+    cache.clear()
+    with mock.patch(
+        "gyrinx.svg.sanitize_inline_svg", wraps=sanitize_inline_svg
+    ) as cleaner:
+        first = cached_inline_svg(SIMPLE_SVG)
+        assert cached_inline_svg(SIMPLE_SVG) == first
+        # Cleaned another way, it is another entry.
+        kept = cached_inline_svg(SIMPLE_SVG, preserve_colour=True)
+    assert cleaner.call_count == 2
+    assert first == sanitize_inline_svg(SIMPLE_SVG)
+    assert kept == sanitize_inline_svg(SIMPLE_SVG, preserve_colour=True)
+    cache.clear()
@@ -269,3 +269,98 @@ def test_traced_decorator_propagates_exceptions_when_enabled(tracing_enabled):
     # Verify exception was recorded
     mock_span.record_exception.assert_called_once()
     mock_span.set_status.assert_called_once()
+
+
+# Cost when off, and aggregate mode
+
+
+def test_traced_returns_the_function_itself_when_tracing_is_settled_off(
+    tracing_disabled,
+):
+    """A process started with tracing off pays nothing per call."""
+
+    def hot_path():
+        return "ok"
+
+    assert tracing.traced("hot_path")(hot_path) is hot_path
+
+
+def test_span_is_one_shared_no_op_when_disabled(tracing_disabled):
+    assert tracing.span("a", key="value") is tracing.span("b")
+
+
+def test_traced_decorated_while_enabled_goes_quiet_when_disabled(tracing_enabled):
+    """A function wrapped before tracing was turned off checks, and skips."""
+
+    @tracing.traced("was_traced")
+    def sample_function():
+        return "ok"
+
+    tracing._tracing_enabled = False
+    assert sample_function() == "ok"
+    tracing._tracer.start_as_current_span.assert_not_called()
+
+
+@pytest.fixture
+def tracing_aggregated(tracing_enabled, settings, monkeypatch):
+    """Tracing on, with @traced counting and timing every second call."""
+    settings.TRACING_TRACED_MODE = "aggregate"
+    settings.TRACING_AGGREGATE_SAMPLE_EVERY = 2
+    settings.TRACING_AGGREGATE_SECONDS = 3600
+    tracing._init_aggregating()
+    tracked = Mock()
+    monkeypatch.setattr(tracing, "track", tracked)
+    yield tracked
+    tracing._aggregating = False
+    tracing._timings.clear()
+
+
+def test_aggregate_mode_counts_calls_instead_of_making_spans(tracing_aggregated):
+    @tracing.traced("listfighter_mods")
+    def mods():
+        return []
+
+    for _ in range(5):
+        assert mods() == []
+
+    tracing._tracer.start_as_current_span.assert_not_called()
+    assert tracing.export_timings() == 1
+    tracing_aggregated.assert_called_once()
+    args, kwargs = tracing_aggregated.call_args
+    assert args == ("traced_function",)
+    assert kwargs["function"] == "listfighter_mods"
+    assert kwargs["n"] == 5
+    assert kwargs["timed"] == 2
+
+
+def test_an_export_starts_the_counts_over(tracing_aggregated):
+    @tracing.traced()
+    def once():
+        return None
+
+    once()
+    tracing.export_timings()
+    tracing_aggregated.reset_mock()
+
+    assert tracing.export_timings() == 0
+    tracing_aggregated.assert_not_called()
+
+
+def test_aggregate_mode_still_raises(tracing_aggregated):
+    @tracing.traced("failing_function")
+    def failing_function():
+        raise RuntimeError("Function failed")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="Function failed"):
+            failing_function()
+
+    tracing.export_timings()
+    assert tracing_aggregated.call_args.kwargs["n"] == 2
+
+
+def test_explicit_spans_are_still_spans_in_aggregate_mode(tracing_aggregated):
+    with tracing.span("outer"):
+        pass
+
+    tracing._tracer.start_as_current_span.assert_called_once_with("outer")
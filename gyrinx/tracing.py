@@ -23,18 +23,36 @@ Typical usage:
         return fighter.get_stats()
 
 Error handling is automatic - exceptions are recorded on spans and re-raised.
+
+Both cost next to nothing when tracing is off. ``span()`` hands back one
+shared no-op context manager, and ``@traced`` returns the function itself,
+undecorated, when tracing was already settled off by the time it ran — as it
+is for everything imported after this module in a process started with
+TRACING_MODE="off". A function decorated before that checks one flag per call.
+
+``@traced`` wraps hot paths (``ListFighter._mods``, ``facts_from_db``), so a
+list page would emit a span per fighter per property. With
+TRACING_TRACED_MODE="aggregate" it emits none: every call is counted, one in
+TRACING_AGGREGATE_SAMPLE_EVERY is timed, and the totals are logged through
+``track("traced_function")`` every TRACING_AGGREGATE_SECONDS and at exit.
+Explicit ``span()`` blocks still make spans.
 """
 
+import atexit
 import logging
 import os
 import sys
+import threading
+import time
 from collections.abc import Callable, Generator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from functools import wraps
 from typing import Any
 
 from django.conf import settings
 
+from gyrinx.tracker import track
+
 logger = logging.getLogger(__name__)
 
 # Module-level state
@@ -42,6 +60,17 @@ _tracing_enabled = False
 _tracer = None
 _initialized = False
 
+# Aggregate mode: @traced calls counted and sampled, not spanned
+_aggregating = False
+_sample_every = 16
+_export_every = 60.0
+_exported_at = 0.0
+_timings: dict[str, _Timing] = {}
+_export_lock = threading.Lock()
+_exit_registered = False
+
+_NO_SPAN = nullcontext()
+
 
 def _get_project_id():
     """Get GCP project ID with fallback for Cloud Run."""
@@ -171,6 +200,7 @@ def _init_tracing() -> None:
         # Get tracer for manual spans
         _tracer = trace.get_tracer("gyrinx.tracing")
         _tracing_enabled = True
+        _init_aggregating()
 
         sampler_info = ", forced sampling" if _should_force_sampling() else ""
         logger.info(
@@ -184,10 +214,29 @@ def _init_tracing() -> None:
         logger.error(f"Failed to initialize OpenTelemetry tracing: {e}", exc_info=True)
 
 
-@contextmanager
+def _init_aggregating() -> None:
+    """Read the aggregate-mode settings; see the module docstring."""
+    global _aggregating, _sample_every, _export_every, _exported_at
+    global _exit_registered
+
+    _aggregating = getattr(settings, "TRACING_TRACED_MODE", "spans") == "aggregate"
+    if not _aggregating:
+        return
+    _sample_every = max(1, getattr(settings, "TRACING_AGGREGATE_SAMPLE_EVERY", 16))
+    _export_every = getattr(settings, "TRACING_AGGREGATE_SECONDS", 60.0)
+    _exported_at = time.monotonic()
+    if not _exit_registered:
+        atexit.register(export_timings)
+        _exit_registered = True
+    logger.info(
+        f"@traced functions aggregated (timing 1 in {_sample_every}, "
+        f"exported every {_export_every}s)"
+    )
+
+
 def span(
     name: str, *, record_exception: bool = True, **attributes: Any
-) -> Generator[Any | None]:
+) -> AbstractContextManager[Any | None]:
     """Create a custom span as a context manager.
 
     Args:
@@ -203,9 +252,14 @@ def span(
             total = sum(fighter.cost for fighter in lst.fighters.all())
     """
     if not _tracing_enabled or _tracer is None:
-        yield None
-        return
+        return _NO_SPAN
+    return _span(name, record_exception, attributes)
+
 
+@contextmanager
+def _span(
+    name: str, record_exception: bool, attributes: dict[str, Any]
+) -> Generator[Any]:
     with _tracer.start_as_current_span(name) as current_span:
         # Add attributes
         for key, value in attributes.items():
@@ -244,10 +298,18 @@ def traced(name: str | None = None, **default_attributes: Any) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
+        if _initialized and not _tracing_enabled:
+            # Off for the life of this process: there is nothing to wrap.
+            return func
+
         span_name = name or func.__name__
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _tracing_enabled:
+                return func(*args, **kwargs)
+            if _aggregating:
+                return _timed(span_name, func, args, kwargs)
             with span(span_name, **default_attributes):
                 return func(*args, **kwargs)
 
@@ -256,6 +318,67 @@ def traced(name: str | None = None, **default_attributes: Any) -> Callable:
     return decorator
 
 
+class _Timing:
+    """Calls of one @traced function since the last export."""
+
+    __slots__ = ("calls", "timed", "ns")
+
+    def __init__(self):
+        self.calls = 0
+        self.timed = 0
+        self.ns = 0
+
+
+def _timed(name: str, func: Callable, args, kwargs) -> Any:
+    # Unlocked: two threads counting at once can lose a call, which an
+    # aggregate can afford and a lock on every call could not.
+    timing = _timings.get(name)
+    if timing is None:
+        timing = _timings.setdefault(name, _Timing())
+    timing.calls += 1
+    if timing.calls % _sample_every:
+        return func(*args, **kwargs)
+
+    start = time.perf_counter_ns()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timing.timed += 1
+        timing.ns += time.perf_counter_ns() - start
+        if time.monotonic() - _exported_at >= _export_every:
+            export_timings(blocking=False)
+
+
+def export_timings(blocking: bool = True) -> int:
+    """Log what each @traced function cost since the last export, and start over.
+
+    One ``track("traced_function")`` per function: ``n`` is its calls and
+    ``value`` its estimated total milliseconds, the mean of the timed calls
+    times all of them. Returns how many functions were reported.
+    """
+    global _timings, _exported_at
+
+    if not _export_lock.acquire(blocking=blocking):
+        return 0  # Another thread is exporting these already.
+    try:
+        taken, _timings = _timings, {}
+        _exported_at = time.monotonic()
+    finally:
+        _export_lock.release()
+
+    for function, timing in sorted(taken.items()):
+        mean_ms = timing.ns / timing.timed / 1e6 if timing.timed else 0.0
+        track(
+            "traced_function",
+            n=timing.calls,
+            value=round(mean_ms * timing.calls, 3),
+            function=function,
+            timed=timing.timed,
+            mean_ms=round(mean_ms, 4),
+        )
+    return len(taken)
+
+
 def is_tracing_enabled() -> bool:
     """Check if tracing is currently enabled.
 
@@ -345,10 +468,12 @@ def _reset_tracing() -> None:
     - Each test worker process is isolated from others
     - The global OpenTelemetry state doesn't affect mock-based tests
     """
-    global _tracing_enabled, _tracer, _initialized
+    global _tracing_enabled, _tracer, _initialized, _aggregating
     _tracing_enabled = False
     _tracer = None
     _initialized = False
+    _aggregating = False
+    _timings.clear()
 
 
 # Initialize tracing on module import.
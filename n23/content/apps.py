@@ -10,3 +10,10 @@ class ContentConfig(AppConfig):
     # Edition-prefixed for the admin index, as on CoreConfig. Display
     # only — the label above is the contract.
     verbose_name = "N23 · Content"
+
+    def ready(self):
+        """Drop the content catalogue and pack scope whenever they change."""
+        from n23.content import catalogue, pack_scope
+
+        catalogue.connect(self)
+        pack_scope.connect()
@@ -0,0 +1,205 @@
+"""Content fighters, loaded once per process and shared by every fighter card.
+
+``ListFighterQuerySet.with_related_data`` used to prefetch each fighter's
+content — its type's skills, rules, counters, house restrictions, default
+gear and equipment list — on every request, for every user, though it is the
+same rulebook every time. The catalogue holds those ``ContentFighter``
+instances, fully prefetched, and hands them to each list fighter it loads, so
+a gang's render queries only the rows its player owns.
+
+Entries are keyed on the fighter type and the packs it was read through:
+skills and rules are pack-scoped, so a list subscribed to packs gets its own
+entry. Instances are shared by every caller in the process: read them, do not
+change them.
+
+The catalogue is stamped with ``CONTENT_CACHE_TAG`` and dropped whole when
+the tag moves. Any save, delete or many-to-many change to a content row or a
+pack item moves it (``connect``); a queryset ``update()`` or bulk load sends
+no signal, and ``CATALOGUE_SECONDS`` bounds how long one of those can hide.
+"""
+
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Prefetch
+from django.db.models.query import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from gyrinx.cache import invalidate, tagged_key
+from gyrinx.tracing import traced
+
+# Moved by any change to library content or pack membership (see
+# gyrinx.cache.tags), so every process's catalogue starts again.
+CONTENT_CACHE_TAG = "content"
+
+# How long a catalogue may live without the tag moving.
+CATALOGUE_SECONDS = 3600
+
+# Fighter types times pack combinations seen. Past this the catalogue starts
+# again rather than grow without end in a long-lived process.
+CATALOGUE_MAX_ENTRIES = 5000
+
+# The ListFighter foreign keys the catalogue fills.
+FIGHTER_FIELDS = (
+    "content_fighter",
+    "legacy_content_fighter",
+    "promoted_content_fighter",
+)
+
+
+class _Catalogue:
+    """Prefetched content fighters by ``(pk, packs key)``."""
+
+    def __init__(self, stamp):
+        self.stamp = stamp
+        self.built = time.monotonic()
+        self.fighters = {}
+
+    def stale(self, stamp):
+        return (
+            stamp != self.stamp
+            or time.monotonic() - self.built >= CATALOGUE_SECONDS
+            or len(self.fighters) >= CATALOGUE_MAX_ENTRIES
+        )
+
+    def get(self, ids, packs, packs_key):
+        missing = {pk for pk in ids if (pk, packs_key) not in self.fighters}
+        if missing:
+            for fighter in _load(missing, packs):
+                self.fighters[(fighter.pk, packs_key)] = fighter
+        return {
+            pk: self.fighters[(pk, packs_key)]
+            for pk in ids
+            if (pk, packs_key) in self.fighters
+        }
+
+
+_catalogue = None
+
+
+def _reset_catalogue():
+    """Forget the catalogue, so the next lookup rebuilds it. For tests."""
+    global _catalogue
+    _catalogue = None
+
+
+def _current():
+    global _catalogue
+    # The tag's version is the catalogue's: moving it is what drops it.
+    stamp = tagged_key("content_catalogue", CONTENT_CACHE_TAG)
+    catalogue = _catalogue
+    if catalogue is None or catalogue.stale(stamp):
+        # Swapped in whole, so a concurrent render reads the old catalogue or
+        # the new one and never half of either.
+        catalogue = _catalogue = _Catalogue(stamp)
+    return catalogue
+
+
+def _packs_key(packs):
+    if packs is None:
+        return None
+    if isinstance(packs, QuerySet):
+        return frozenset(packs.values_list("pk", flat=True))
+    return frozenset(pack.pk for pack in packs)
+
+
+def _load(ids, packs):
+    """The content fighters ``ids``, with everything a fighter card reads."""
+    from n23.content.models import (
+        ContentEquipmentInjuryLink,
+        ContentFighter,
+        ContentRule,
+        ContentSkill,
+        ContentWeaponAccessory,
+        ContentWeaponProfile,
+    )
+
+    if packs is not None:
+        skills = Prefetch(
+            "skills",
+            queryset=ContentSkill.objects.with_packs(
+                packs, include_archived_items=True
+            ),
+        )
+        rules = Prefetch(
+            "rules",
+            queryset=ContentRule.objects.with_packs(packs, include_archived_items=True),
+        )
+    else:
+        skills, rules = "skills", "rules"
+
+    # The lookups with_related_data made through content_fighter, less the
+    # prefix. all_content() where it did so, for the same reasons.
+    return list(
+        ContentFighter.objects.all_content()
+        .filter(pk__in=ids)
+        .select_related("house", "custom_statline")
+        .prefetch_related(
+            skills,
+            rules,
+            "counters",
+            "house__restricted_equipment_categories__restricted_to",
+            Prefetch(
+                "default_assignments__equipment__contentweaponprofile_set",
+                queryset=ContentWeaponProfile.objects.all_content(),
+            ),
+            Prefetch(
+                "default_assignments__weapon_profiles_field",
+                queryset=ContentWeaponProfile.objects.all_content(),
+            ),
+            Prefetch(
+                "default_assignments__weapon_accessories_field",
+                queryset=ContentWeaponAccessory.objects.all_content().prefetch_related(
+                    "modifiers"
+                ),
+            ),
+            Prefetch(
+                "default_assignments__equipment__injury_links",
+                queryset=ContentEquipmentInjuryLink.objects.all_content(),
+            ),
+            "contentfighterequipmentlistitem_set",
+        )
+    )
+
+
+def enabled():
+    return settings.N23_CONTENT_CATALOGUE
+
+
+@traced("content_catalogue_attach")
+def attach(list_fighters, packs=None):
+    """Point each list fighter's content fighters at the catalogue's."""
+    ids = {
+        pk
+        for fighter in list_fighters
+        for name in FIGHTER_FIELDS
+        if (pk := getattr(fighter, f"{name}_id")) is not None
+    }
+    if not ids:
+        return
+    found = _current().get(ids, packs, _packs_key(packs))
+    for name in FIGHTER_FIELDS:
+        field = list_fighters[0]._meta.get_field(name)
+        for fighter in list_fighters:
+            pk = getattr(fighter, field.attname)
+            if pk in found:
+                field.set_cached_value(fighter, found[pk])
+
+
+def _content_changed(sender, **kwargs):
+    # A many-to-many signal fires before and after; one move is enough.
+    if kwargs.get("action", "post_").startswith("post_"):
+        invalidate(CONTENT_CACHE_TAG)
+
+
+def connect(app_config):
+    """Watch every content model, through tables too, and pack membership."""
+    models = list(app_config.get_models(include_auto_created=True))
+    models.append(apps.get_model("core", "CustomContentPackItem"))
+    for model in models:
+        uid = f"content_catalogue_{model._meta.label_lower}"
+        post_save.connect(_content_changed, sender=model, dispatch_uid=uid)
+        post_delete.connect(_content_changed, sender=model, dispatch_uid=uid)
+        # A many-to-many change is sent by its through model, declared or not.
+        m2m_changed.connect(_content_changed, sender=model, dispatch_uid=uid)
@@ -0,0 +1,191 @@
+"""Equipment list expansions, matched in memory.
+
+Which expansions apply to a fighter depends only on the list's house, its
+active attribute values and the fighter's category — yet
+``ContentEquipmentListExpansion.get_applicable_expansions`` answered it with a
+``Count(..., distinct=True)`` aggregate over every expansion and its
+polymorphic rules, once per fighter category on every list view and
+equipment page.
+
+The engine reads every expansion's rules and items once per content version,
+and matches them in Python: an expansion applies when it has rules and every
+one of them matches, as in the aggregate. Answers are kept in a bounded LRU
+keyed on ``(house, attribute values, fighter category)``, so a repeat lookup
+costs no queries. The LRU is shared by every thread in the worker, so a lock
+covers each lookup with its move or eviction.
+
+It reads expansions and items through their default managers, as the
+aggregate did, so pack content stays out. The engine is stamped with the
+content cache tag (``n23.content.catalogue.CONTENT_CACHE_TAG``), which any
+save, delete or many-to-many change to content moves. ``ENGINE_SECONDS``
+bounds how long a queryset ``update()`` can hide.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+
+from gyrinx.cache import tagged_key
+from n23.content.catalogue import CONTENT_CACHE_TAG
+
+# How long an engine may live without the content tag moving.
+ENGINE_SECONDS = 3600
+
+# Distinct (house, attribute values, category) inputs remembered.
+MAX_MATCHES = 2048
+
+HOUSE, ATTRIBUTE, CATEGORY = "house", "attribute", "category"
+
+
+class _Engine:
+    """Every expansion's rules and items, and the answers given so far."""
+
+    def __init__(self, stamp):
+        from n23.content.models import (
+            ContentEquipmentListExpansion,
+            ContentEquipmentListExpansionItem,
+            ContentEquipmentListExpansionRuleByAttribute,
+            ContentEquipmentListExpansionRuleByFighterCategory,
+            ContentEquipmentListExpansionRuleByHouse,
+        )
+
+        self.stamp = stamp
+        self.built = time.monotonic()
+        self.matches = OrderedDict()
+        self._lock = threading.Lock()
+
+        tests = {}
+        for (
+            pk,
+            house_id,
+        ) in ContentEquipmentListExpansionRuleByHouse.objects.non_polymorphic().values_list(
+            "pk", "house_id"
+        ):
+            tests[pk] = (HOUSE, house_id)
+        values = defaultdict(set)
+        for (
+            pk,
+            value_id,
+        ) in ContentEquipmentListExpansionRuleByAttribute.objects.non_polymorphic().values_list(
+            "pk", "attribute_values"
+        ):
+            if value_id is not None:
+                values[pk].add(value_id)
+            tests[pk] = (ATTRIBUTE, values[pk])
+        for (
+            pk,
+            categories,
+        ) in ContentEquipmentListExpansionRuleByFighterCategory.objects.non_polymorphic().values_list(
+            "pk", "fighter_categories"
+        ):
+            if isinstance(categories, str):
+                categories = categories.split(",")
+            tests[pk] = (CATEGORY, frozenset(categories or ()))
+
+        # In name order, as the aggregate returned them: where two expansions
+        # price the same item, the later one's cost is the one that stands.
+        self.rules = {}
+        for pk, rule_id in ContentEquipmentListExpansion.objects.order_by(
+            "name"
+        ).values_list("pk", "rules"):
+            rules = self.rules.setdefault(pk, [])
+            if rule_id is not None:
+                # A rule of no known kind matches nothing, as in the aggregate.
+                rules.append(tests.get(rule_id, (None, None)))
+
+        self.items = defaultdict(list)
+        for (
+            expansion_id,
+            equipment_id,
+            profile_id,
+            cost,
+        ) in ContentEquipmentListExpansionItem.objects.filter(
+            expansion_id__in=self.rules
+        ).values_list("expansion_id", "equipment_id", "weapon_profile_id", "cost"):
+            self.items[expansion_id].append((equipment_id, profile_id, cost))
+
+    def stale(self, stamp):
+        return stamp != self.stamp or time.monotonic() - self.built >= ENGINE_SECONDS
+
+    def match(self, key):
+        """The ids of the expansions that apply to ``key``, in name order."""
+        with self._lock:
+            found = self.matches.get(key)
+            if found is not None:
+                self.matches.move_to_end(key)
+                return found
+        house_id, value_ids, category = key
+        found = tuple(
+            pk
+            for pk, rules in self.rules.items()
+            if rules
+            and all(
+                _matches(kind, wanted, house_id, value_ids, category)
+                for kind, wanted in rules
+            )
+        )
+        with self._lock:
+            self.matches[key] = found
+            if len(self.matches) > MAX_MATCHES:
+                self.matches.popitem(last=False)
+        return found
+
+
+def _matches(kind, wanted, house_id, value_ids, category):
+    if kind == HOUSE:
+        return wanted == house_id
+    if kind == ATTRIBUTE:
+        return not wanted.isdisjoint(value_ids)
+    if kind == CATEGORY:
+        return bool(category) and category in wanted
+    return False
+
+
+_engine = None
+
+
+def _reset_engine():
+    """Forget the engine, so the next lookup reads expansions again. For tests."""
+    global _engine
+    _engine = None
+
+
+def _current():
+    global _engine
+    stamp = tagged_key("content_expansion_engine", CONTENT_CACHE_TAG)
+    engine = _engine
+    if engine is None or engine.stale(stamp):
+        engine = _engine = _Engine(stamp)
+    return engine
+
+
+def enabled():
+    return settings.N23_EXPANSION_ENGINE
+
+
+def key(rule_inputs):
+    """The inputs an expansion's rules can see, as a hashable key."""
+    input_list = rule_inputs.list
+    fighter = rule_inputs.fighter
+    category = rule_inputs.fighter_category or (
+        fighter.get_category() if fighter else None
+    )
+    return (
+        input_list.content_house_id,
+        frozenset(aa.attribute_value_id for aa in input_list.active_attributes_cached),
+        category or None,
+    )
+
+
+def applicable_ids(rule_inputs):
+    """The ids of the expansions that apply to ``rule_inputs``, in name order."""
+    return _current().match(key(rule_inputs))
+
+
+def items(expansion_ids):
+    """``(equipment_id, weapon_profile_id, cost)`` for each expansion's items."""
+    engine = _current()
+    for pk in expansion_ids:
+        yield from engine.items.get(pk, ())
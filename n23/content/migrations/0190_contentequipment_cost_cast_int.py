@@ -0,0 +1,32 @@
+# Generated by Django 6.0.7 on 2026-10-16 09:12
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0189_drop_legacy_fighter_stat_columns"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contentequipment",
+            name="cost_cast_int",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        models.Q(("cost__regex", "^-?\\d{1,9}$")),
+                        then=django.db.models.functions.comparison.Cast(
+                            "cost", models.IntegerField()
+                        ),
+                    ),
+                    default=0,
+                ),
+                output_field=models.IntegerField(),
+                verbose_name="Cost (as a number)",
+            ),
+        ),
+    ]
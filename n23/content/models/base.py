@@ -36,12 +36,23 @@ class ContentQuerySet(models.QuerySet):
             content_type__model=self.model._meta.model_name,
         )
 
-    def exclude_pack_content(self):
-        """Exclude content that belongs to any pack."""
+    def _in_any_pack(self):
+        """The condition "this row belongs to a pack", archived items included.
+
+        Read from the per-process set in ``n23.content.pack_scope`` when
+        ``N23_PACK_SCOPE_CACHE`` is on, otherwise asked of the database.
+        """
         from django.db.models import Exists, OuterRef
 
-        pack_exists = self._pack_items_for_model().filter(object_id=OuterRef("pk"))
-        return self.filter(~Exists(pack_exists))
+        from n23.content import pack_scope
+
+        if pack_scope.enabled():
+            return pack_scope.PackOwned(self.model)
+        return Exists(self._pack_items_for_model().filter(object_id=OuterRef("pk")))
+
+    def exclude_pack_content(self):
+        """Exclude content that belongs to any pack."""
+        return self.filter(~self._in_any_pack())
 
     def with_packs(self, packs, include_archived_items=False):
         """Return items not in any pack plus items from specified packs.
@@ -58,15 +69,13 @@ class ContentQuerySet(models.QuerySet):
         subscribed to the pack. See "Domain Rules → Content packs: archive
         semantics" in CLAUDE.md.
         """
-        from django.db.models import Exists, OuterRef
+        from django.db.models import Q
 
-        pack_items = self._pack_items_for_model().filter(object_id=OuterRef("pk"))
-        not_in_any_pack = ~Exists(pack_items)
-        membership = pack_items.filter(pack__in=packs)
+        membership = self._pack_items_for_model().filter(pack__in=packs)
         if not include_archived_items:
             membership = membership.filter(archived=False)
-        in_specified_packs = Exists(membership)
-        return self.filter(not_in_any_pack | in_specified_packs)
+        in_specified_packs = Q(pk__in=membership.values("object_id"))
+        return self.filter(Q(~self._in_any_pack()) | in_specified_packs)
 
 
 class ContentManager(models.Manager):
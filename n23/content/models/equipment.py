@@ -162,7 +162,8 @@ class ContentFighterEquipmentCategoryLimit(Content):
 class ContentEquipmentManager(ContentManager):
     """
     Custom manager for :model:`content.ContentEquipment` model, providing annotated
-    default querysets (cost as integer, presence of weapon profiles, etc.).
+    default querysets (presence of weapon profiles, etc.). The integer cost is
+    the stored ``cost_cast_int`` column, not an annotation.
     """
 
     def _annotate_default(self, qs):
@@ -170,13 +171,6 @@ class ContentEquipmentManager(ContentManager):
         from .weapon import ContentWeaponProfile
 
         return qs.annotate(
-            cost_cast_int=Case(
-                When(
-                    Q(cost__regex=r"^-?\d+$"),
-                    then=Cast("cost", models.IntegerField()),
-                ),
-                default=0,
-            ),
             has_weapon_profiles=Exists(
                 ContentWeaponProfile.objects.all_content().filter(
                     equipment=OuterRef("pk")
@@ -406,6 +400,24 @@ class ContentEquipment(FighterCostMixin, Content):
         null=False,
     )
 
+    # The text cost as an integer: what every cost annotation and sort reads.
+    # Generated by the database and indexed, so a picker over the whole
+    # catalogue does not run a regex and a cast per row on every query. A
+    # non-numeric cost ("Varies") is 0, as is one too long for an integer.
+    cost_cast_int = models.GeneratedField(
+        expression=Case(
+            When(
+                Q(cost__regex=r"^-?\d{1,9}$"),
+                then=Cast("cost", models.IntegerField()),
+            ),
+            default=0,
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        db_index=True,
+        verbose_name="Cost (as a number)",
+    )
+
     rarity = models.CharField(
         max_length=1,
         choices=[
@@ -477,7 +489,8 @@ class ContentEquipment(FighterCostMixin, Content):
         ),
     )
 
-    history = HistoricalRecords()
+    # The generated cost follows from ``cost``, which history already keeps.
+    history = HistoricalRecords(excluded_fields=["cost_cast_int"])
 
     def __str__(self):
         return self.name
@@ -85,9 +85,21 @@ class ContentEquipmentListExpansion(Content):
         Get all expansions that apply to the given rule inputs.
 
         Supports both fighter instance and direct fighter_category specification.
+        Matched in memory by ``n23.content.expansion_engine`` when
+        ``N23_EXPANSION_ENGINE`` is on.
         """
+        from n23.content import expansion_engine
+
         from .attribute import ContentAttribute  # noqa: F401
 
+        if expansion_engine.enabled():
+            ids = expansion_engine.applicable_ids(rule_inputs)
+            return cls.objects.filter(id__in=ids).prefetch_related(
+                "rules",
+                "items__equipment",
+                "items__weapon_profile",
+            )
+
         input_list = rule_inputs.list
         input_fighter = rule_inputs.fighter
         input_fighter_category = rule_inputs.fighter_category
@@ -174,33 +186,39 @@ class ContentEquipmentListExpansion(Content):
         Returns a queryset of ContentEquipment with cost annotations.
         Also includes weapon profiles when specified.
         """
+        from n23.content import expansion_engine
+
         from .equipment import ContentEquipment
 
-        expansions = cls.get_applicable_expansions(rule_inputs)
+        if expansion_engine.enabled():
+            # Rules and items from memory: only the equipment is queried.
+            items = expansion_engine.items(expansion_engine.applicable_ids(rule_inputs))
+        else:
+            expansions = cls.get_applicable_expansions(rule_inputs)
+
+            # Prefetch items to avoid N+1 queries
+            prefetched_expansions = cls.objects.filter(
+                id__in=[e.id for e in expansions]
+            ).prefetch_related("items", "items__weapon_profile")
+            items = (
+                (item.equipment_id, item.weapon_profile_id, item.cost)
+                for expansion in prefetched_expansions
+                for item in expansion.items.all()
+            )
 
         # Get all equipment IDs and profile IDs from applicable expansions
         equipment_data = {}  # Maps equipment_id -> {cost, profiles: {profile_id: cost}}
 
-        # Prefetch items to avoid N+1 queries
-        prefetched_expansions = cls.objects.filter(
-            id__in=[e.id for e in expansions]
-        ).prefetch_related("items", "items__weapon_profile")
-
-        for expansion in prefetched_expansions:
-            for item in expansion.items.all():
-                eq_id = item.equipment_id
-
-                if eq_id not in equipment_data:
-                    equipment_data[eq_id] = {"cost": None, "profiles": {}}
-
-                if item.weapon_profile_id:
-                    # This is a specific weapon profile
-                    equipment_data[eq_id]["profiles"][item.weapon_profile_id] = (
-                        item.cost
-                    )
-                else:
-                    # This is base equipment
-                    equipment_data[eq_id]["cost"] = item.cost
+        for eq_id, weapon_profile_id, cost in items:
+            if eq_id not in equipment_data:
+                equipment_data[eq_id] = {"cost": None, "profiles": {}}
+
+            if weapon_profile_id:
+                # This is a specific weapon profile
+                equipment_data[eq_id]["profiles"][weapon_profile_id] = cost
+            else:
+                # This is base equipment
+                equipment_data[eq_id]["cost"] = cost
 
         # Get the equipment and annotate with cost overrides
         equipment_ids = list(equipment_data.keys())
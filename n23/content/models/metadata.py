@@ -8,16 +8,20 @@ This module contains:
 - ContentPageRef: Page references to rulebooks
 """
 
-import hashlib
+import time
+from collections import defaultdict
 from difflib import SequenceMatcher
 
-from django.core.cache import caches
 from django.db import models
 from django.db.models import Case, Q, When
 from django.db.models.functions import Cast
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.functional import cached_property
 from simple_history.models import HistoricalRecords
 
+from gyrinx.cache import invalidate, tagged_key
+
 from .base import Content
 
 
@@ -152,8 +156,83 @@ class ContentPolicy(Content):
         verbose_name_plural = "Policies"
 
 
-# Distinguishes "cached, and the answer is nothing" from "not cached".
-_MISSING = object()
+# Invalidated whenever a page ref is saved or deleted, so an admin edit moves
+# every process's page ref index on (see gyrinx.cache.tags).
+PAGE_REF_CACHE_TAG = "content_page_ref"
+
+# Edits through the model move the tag, but a queryset update() or bulk load
+# sends no signal; this bounds how long one of those can hide.
+PAGE_REF_INDEX_SECONDS = 3600
+
+# Fragments shorter than this are matched by scanning every title.
+_GRAM = 3
+
+
+def _grams(text):
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class _PageRefIndex:
+    """Every page ref in memory, found by any fragment of its title.
+
+    Rulelines, skills and traits on every fighter card look their titles up,
+    and ``icontains`` is a LIKE no database index serves. There are a few
+    hundred refs, so a process holds them all and answers from a trigram
+    index instead: the refs holding every trigram of the fragment are the
+    only candidates, and each is then checked for the fragment itself.
+
+    Refs are held in the model's ordering, with their book and parents
+    attached, so ``bookref()`` on one costs no query. They are shared by every
+    caller in the process: read them, do not change them.
+    """
+
+    def __init__(self, stamp):
+        self.stamp = stamp
+        self.built = time.monotonic()
+        self.refs = list(ContentPageRef.objects.select_related("book"))
+        by_id = {ref.pk: ref for ref in self.refs}
+        parent = ContentPageRef.parent.field
+        for ref in self.refs:
+            if ref.parent_id in by_id:
+                parent.set_cached_value(ref, by_id[ref.parent_id])
+        # UPPER(), as Postgres folds case for icontains.
+        self.titles = [ref.title.upper() for ref in self.refs]
+        self.grams = defaultdict(set)
+        for i, title in enumerate(self.titles):
+            for gram in _grams(title):
+                self.grams[gram].add(i)
+
+    def stale(self, stamp):
+        return (
+            stamp != self.stamp
+            or time.monotonic() - self.built >= PAGE_REF_INDEX_SECONDS
+        )
+
+    def search(self, title, filters):
+        needle = title.upper()
+        grams = _grams(needle)
+        if grams:
+            candidates = set.intersection(
+                *(self.grams.get(gram, set()) for gram in grams)
+            )
+            positions = sorted(candidates)
+        else:
+            positions = range(len(self.refs))
+        return [
+            self.refs[i]
+            for i in positions
+            if needle in self.titles[i]
+            and all(getattr(self.refs[i], k) == v for k, v in filters.items())
+        ]
+
+
+_page_ref_index = None
+
+
+def _reset_page_ref_index():
+    """Forget the page ref index, so the next lookup rebuilds it. For tests."""
+    global _page_ref_index
+    _page_ref_index = None
 
 
 class ContentPageRef(Content):
@@ -219,43 +298,29 @@ class ContentPageRef(Content):
     def find_similar(cls, title: str, **kwargs):
         """
         Finds references whose titles match or are similar to the given string.
-        Uses caching to avoid repeated lookups. Returns a QuerySet.
+        Returns a list, answered from the process's page ref index.
+
+        ``kwargs`` filter as they would ``filter()``. Plain field lookups
+        (``category="Skills"``) are answered by the index too; anything else
+        goes to the database.
         """
-        cache = caches["content_page_ref_cache"]
-        # Include the kwargs in the key: the same title looked up with and without
-        # a category is two different questions with two different answers.
-        #
-        # Hashed, because titles are free text: spaces and control characters in a
-        # raw key make Django emit a CacheKeyWarning on every single lookup (page
-        # ref titles like "The Path We Follow" did this on essentially every
-        # request). LocMemCache tolerates the characters, but the warning is real
-        # in the sense that this key would be invalid against memcached — hashing
-        # fixes the log noise and the latent backend constraint together.
-        digest = hashlib.md5(
-            f"{title}:{sorted(kwargs.items())}".encode(), usedforsecurity=False
-        ).hexdigest()
-        key = f"content_page_ref_cache:{digest}"
-        # Sentinel rather than a truthiness test. An empty result is falsy, so
-        # `if cached:` treated "we looked and there is nothing" as a cache miss —
-        # meaning any title without a page ref re-ran an unindexable LIKE query on
-        # every single call and could never be cached.
-        cached = cache.get(key, _MISSING)
-        if cached is not _MISSING:
-            return cached
-
-        # Evaluated to a list before caching. A QuerySet is lazy, and caching one
-        # stores a re-runnable query rather than the answer.
-        refs = list(
-            ContentPageRef.objects.filter(**kwargs).filter(
-                Q(title__icontains=title) | Q(title=title)
+        global _page_ref_index
+
+        if not all(k in _INDEXED_FILTERS for k in kwargs):
+            return list(
+                ContentPageRef.objects.filter(**kwargs).filter(
+                    Q(title__icontains=title) | Q(title=title)
+                )
             )
-        )
-        # An hour, not forever: with MAX_ENTRIES well above the working set
-        # nothing is evicted, so a permanent entry would hide admin edits to page
-        # refs until the container restarted. An hour costs at most one requery
-        # per title per process and self-heals.
-        cache.set(key, refs, 3600)
-        return refs
+
+        # The tag's version is the index's: moving it is what rebuilds it.
+        stamp = tagged_key("content_page_ref_index", PAGE_REF_CACHE_TAG)
+        index = _page_ref_index
+        if index is None or index.stale(stamp):
+            # Swapped in whole, so a concurrent lookup reads the old index or
+            # the new one and never half of either.
+            index = _page_ref_index = _PageRefIndex(stamp)
+        return index.search(title, kwargs)
 
     # TODO: Move this to a custom Manager
     @classmethod
@@ -314,3 +379,24 @@ class ContentPageRef(Content):
             "book__shortname",
             "title",
         )
+
+
+@receiver(
+    post_save, sender=ContentPageRef, dispatch_uid="content_page_ref_invalidate_save"
+)
+@receiver(
+    post_delete,
+    sender=ContentPageRef,
+    dispatch_uid="content_page_ref_invalidate_delete",
+)
+def invalidate_page_ref_cache(sender, **kwargs):
+    invalidate(PAGE_REF_CACHE_TAG)
+
+
+# The filters find_similar answers from its index: fields a ref holds itself.
+_INDEXED_FILTERS = frozenset(
+    name
+    for field in ContentPageRef._meta.concrete_fields
+    for name in {field.name, field.attname}
+    if not field.is_relation or name == field.attname
+)
@@ -188,6 +188,9 @@ register_cost_change(
 # actions, and hand the work to the async task.
 # =============================================================================
 
+# Lists swept and recorded per transaction by _create_content_cost_change_actions.
+COST_CHANGE_BATCH_SIZE = 100
+
 
 def _affected_list_ids(instance, include_archived: bool = False) -> list:
     """Return the distinct ids of lists affected by a content cost change.
@@ -399,9 +402,11 @@ def _create_content_cost_change_actions(instance, before_snapshots=None, old_cos
 
     This function:
     1. Finds all affected lists via the instance's set_dirty relationships
-    2. For each list, recalculates costs via facts_from_db(update=True)
-    3. Creates a CONTENT_COST_CHANGE action with the rating/stash deltas
-    4. In campaign mode, applies credits_delta (charges for increases, refunds decreases)
+    2. Rewrites the pinned amounts on every affected list in a few set-based
+       statements per batch of lists
+    3. Recalculates the batch's costs in one recompute_list_facts pass
+    4. Creates a CONTENT_COST_CHANGE action with the rating/stash deltas
+    5. In campaign mode, applies credits_delta (charges for increases, refunds decreases)
 
     Args:
         instance: The content model instance that had its cost changed
@@ -411,10 +416,9 @@ def _create_content_cost_change_actions(instance, before_snapshots=None, old_cos
             running can't zero out the delta. When omitted, the live cached values
             are used (correct for synchronous/direct callers).
     """
-    from n23.core.cost.pin_sweep import rewrite_pinned_amounts_for_list
-    from n23.core.models.action import ListAction, ListActionType
+    from n23.core.cost.pin_sweep import rewrite_pinned_amounts_for_lists
+    from n23.core.cost.recompute import recompute_list_facts
     from n23.core.models.list import List
-    from n23.core.tasks import refresh_list_facts
 
     # Find affected lists based on the model type. The rewrite domain also
     # includes lists reachable only through archived rows (their amounts are
@@ -429,172 +433,272 @@ def _create_content_cost_change_actions(instance, before_snapshots=None, old_cos
     live_list_ids = set(list_ids)
     instance_name = _instance_display_name(instance)
 
-    # For each list: rewrite pinned amounts, recalculate, create action.
-    # Each list is processed in its own transaction for consistency:
-    # either all changes succeed (amounts rewritten, facts updated, action
-    # created, credits applied) or none do (transaction rolls back, list stays
-    # dirty — and unrewritten — for a later redelivery).
-    for list_id in rewrite_list_ids:
+    # Lists are processed a batch at a time, each batch in one transaction:
+    # either every list in it gets its changes (amounts rewritten, facts
+    # updated, action created, credits applied) or none does. A popular item
+    # touches thousands of lists, and a transaction (and sweep) per list made
+    # one price edit thousands of round trips. Sorted, so concurrent
+    # deliveries take the list locks in the same order.
+    rewrite_list_ids = sorted(rewrite_list_ids)
+    for start in range(0, len(rewrite_list_ids), COST_CHANGE_BATCH_SIZE):
+        batch = rewrite_list_ids[start : start + COST_CHANGE_BATCH_SIZE]
         try:
             with transaction.atomic():
-                # Lock the list row for the duration of this per-list
-                # transaction. This task is at-least-once and can be delivered
-                # to two workers concurrently; without the lock, both pass the
-                # ListAction.exists() idempotency guard below (and both read the
-                # pre-rewrite pinned amounts) before either commits, so both
-                # create an action and both apply_credit_delta — double-charging
-                # campaign credits. The lock serialises concurrent deliveries so
-                # the second one sees the first's committed action/amounts and
-                # skips. Mirrors reconcile_list's select_for_update pattern.
-                lst = List.objects.select_for_update().get(id=list_id)
+                # Lock every list in the batch for the whole batch
+                # transaction. This task is at-least-once and can be
+                # delivered to two workers concurrently; without the lock,
+                # both pass the ListAction.exists() idempotency guard (and
+                # both read the pre-rewrite pinned amounts) before either
+                # commits, so both create an action and both
+                # apply_credit_delta — double-charging campaign credits. The
+                # lock serialises concurrent deliveries so the second one
+                # sees the first's committed actions/amounts and skips.
+                # Mirrors reconcile_list's select_for_update pattern. Lists
+                # deleted since enumeration simply aren't returned. Everything
+                # done under the locks is set-based — a fixed number of
+                # queries for the batch — except writing the actions and
+                # credits of the lists that actually moved.
+                lists = List.objects.select_for_update().filter(id__in=batch)
+                locked = {lst.id: lst for lst in lists.order_by("id")}
 
                 # Rewrite pinned amounts FIRST (#1826 §4.7 ordering): any
-                # recompute — the facts_from_db below or a later lazy
-                # view recalc — must sum already-updated amounts. Rewriting
-                # after would snap the caches back to the old amounts or
-                # double-count the correction on the next recompute.
-                sweep = rewrite_pinned_amounts_for_list(
-                    instance, lst, old_cost=old_cost
+                # recompute — the facts_from_db in the recording below or a
+                # later lazy view recalc — must sum already-updated amounts.
+                # Rewriting after would snap the caches back to the old
+                # amounts or double-count the correction on the next
+                # recompute.
+                sweeps = rewrite_pinned_amounts_for_lists(
+                    instance, list(locked), old_cost=old_cost
                 )
 
                 # Archived-only lists get the rewrite but no action
-                # processing — nothing cache-visible moved, and the snapshot
-                # fallback has no baseline for them.
-                if list_id not in live_list_ids:
-                    continue
-
-                if sweep.use_row_deltas:
-                    # Per-row amount deltas: Σ(new − old pinned amount) over
-                    # the rows the sweep rewrote. Unlike the snapshot fallback
-                    # below, this is independent of anything else landing on
-                    # the list between enqueue and this task running — a
-                    # racing user purchase used to be folded into this
-                    # action's delta and double-charged in campaign credits.
-                    # Redelivery is naturally idempotent: the second rewrite
-                    # produces a zero delta and skips out here.
-                    facts = lst.facts_from_db(update=True)
-                    rating_delta = sweep.rating_delta
-                    stash_delta = sweep.stash_delta
-                    total_delta = rating_delta + stash_delta
-                    # Check each delta, not the sum: +N rating / -N stash
-                    # cancels to zero while both books moved, and skipping
-                    # here (after facts committed the movement) would break
-                    # the action chain.
-                    if rating_delta == 0 and stash_delta == 0:
-                        continue
-                    # Chain the action off the recomputed head so anything
-                    # that landed in the window keeps its own audit trail.
-                    old_rating = facts.rating - rating_delta
-                    old_stash = facts.stash - stash_delta
-                else:
-                    # Snapshot fallback: UNPINNED rows reprice live, so their
-                    # movement only exists as recompute-vs-baseline. This is
-                    # today's machinery, race included; it retires per-list as
-                    # the Phase 8 backfill pins rows.
-                    #
-                    # Capture before state.
-                    #
-                    # This task runs asynchronously (after commit), so a user may view
-                    # the affected list before it runs. Viewing a dirty list lazily
-                    # recalculates and writes the *new* values into rating_current/
-                    # stash_current (via get_clean_list_or_404 -> facts_from_db) WITHOUT
-                    # recording an action — which would make the live rating_current a
-                    # zero-delta baseline here, silently dropping the action (and, in
-                    # campaign mode, the credit adjustment). So prefer the pre-change
-                    # snapshot captured synchronously at enqueue time; fall back to the
-                    # live value only when no snapshot was supplied (e.g. direct calls).
-                    snapshot = (
-                        before_snapshots.get(str(list_id)) if before_snapshots else None
-                    )
-                    if snapshot is not None:
-                        old_rating, old_stash = snapshot
-                    else:
-                        old_rating = lst.rating_current
-                        old_stash = lst.stash_current
-
-                    # Idempotency: if this exact change was already recorded for this
-                    # list (same content subject + same pre-change baseline), don't
-                    # duplicate it. With a frozen snapshot a redelivery would otherwise
-                    # recompute a non-zero delta and double-charge campaign credits.
-                    if ListAction.objects.filter(
-                        list=lst,
-                        action_type=ListActionType.CONTENT_COST_CHANGE,
-                        subject_id=instance.pk,
-                        rating_before=old_rating,
-                        stash_before=old_stash,
-                    ).exists():
-                        continue
-
-                    # Recalculate with the new content costs (clears dirty flags on list and children)
-                    facts = lst.facts_from_db(update=True)
-
-                    # Compute deltas
-                    rating_delta = facts.rating - old_rating
-                    stash_delta = facts.stash - old_stash
-                    total_delta = rating_delta + stash_delta
-
-                    # Skip if no actual cost change (e.g., override in place)
-                    # This happens when a base cost changes but a fighter-specific
-                    # override (ContentFighterEquipmentListItem, etc.) takes
-                    # precedence. Check each delta, not the sum — +N rating /
-                    # -N stash cancels while both books moved.
-                    if rating_delta == 0 and stash_delta == 0:
-                        continue
-
-                # In campaign mode, adjust credits (charge more or refund)
-                # Positive delta = cost increased = charge credits (negative)
-                # Negative delta = cost decreased = refund credits (positive)
-                is_campaign = lst.is_campaign_mode
-                credits_delta = -total_delta if is_campaign else 0
-
-                # Format the cost change for the description
-                cost_change_str = format_cost_display(total_delta, show_sign=True)
-
-                # Record the action — facts_from_db already updated the
-                # rating/stash caches, and create_action is a pure record.
-                # The campaign credit adjustment is applied
-                # explicitly afterwards, inside the same per-list transaction
-                # and behind the same idempotency guards above, so a
-                # redelivery can't double-charge.
-                lst.create_action(
-                    action_type=ListActionType.CONTENT_COST_CHANGE,
-                    description=f"{instance_name} changed cost ({cost_change_str})",
-                    # Record the content instance as the subject so the task can
-                    # detect (and skip) an already-recorded change on redelivery.
-                    subject_app=instance._meta.app_label,
-                    subject_type=instance._meta.model_name,
-                    subject_id=instance.pk,
-                    rating_before=old_rating,
-                    stash_before=old_stash,
-                    rating_delta=rating_delta,
-                    stash_delta=stash_delta,
-                    credits_delta=credits_delta,
+                # processing — nothing cache-visible moved, and the
+                # snapshot fallback has no baseline for them. The locked
+                # instances keep their pre-recompute caches, which the
+                # snapshot fallback reads as its baseline.
+                live = [list_id for list_id in locked if list_id in live_list_ids]
+                recorded = _recorded_baselines(
+                    instance,
+                    [list_id for list_id in live if not sweeps[list_id].use_row_deltas],
                 )
-                if is_campaign:
-                    lst.apply_credit_delta(credits_delta)
-        except List.DoesNotExist:
-            continue
-        except Exception as e:
-            # Log error but continue processing other lists. The per-list
-            # transaction rolled back, so the amount rewrite was undone and
-            # no action was recorded.
-            logger.error(
-                f"Failed to create CONTENT_COST_CHANGE action for list {list_id}: {e}"
+                facts = recompute_list_facts(live)
+                for list_id in live:
+                    _record_content_cost_change(
+                        instance,
+                        instance_name,
+                        locked[list_id],
+                        sweeps[list_id],
+                        before_snapshots,
+                        facts[list_id],
+                        recorded,
+                    )
+        except Exception:
+            # The batch rolled back whole. Redo it a list at a time so one
+            # bad list costs only itself, as it did before batching.
+            logger.warning(
+                "CONTENT_COST_CHANGE batch failed; retrying its lists one by one",
+                exc_info=True,
             )
-            # Index pages show last-good numbers and never recompute, so give
-            # the failed list a background heal rather than waiting for a
-            # detail-page view. The heal clears dirty but recomputes against
-            # the UNREWRITTEN (pre-correction) amounts, and the audit action
-            # is still missing — a task redelivery is the real recovery, and
-            # it works regardless of the dirty flag (the sweep re-runs the
-            # rewrite and recompute unconditionally).
-            try:
-                refresh_list_facts.enqueue(list_id=str(list_id))
-            except Exception:
-                logger.warning(
-                    f"Failed to enqueue facts refresh for list {list_id}",
-                    exc_info=True,
+            for list_id in batch:
+                _create_content_cost_change_action_for_list(
+                    instance,
+                    instance_name,
+                    list_id,
+                    list_id in live_list_ids,
+                    before_snapshots,
+                    old_cost,
+                )
+
+
+def _create_content_cost_change_action_for_list(
+    instance, instance_name, list_id, live, before_snapshots, old_cost
+):
+    """The per-list form of ``_create_content_cost_change_actions``' batch.
+
+    One transaction for the one list: either all its changes succeed or none
+    do (transaction rolls back, list stays dirty — and unrewritten — for a
+    later redelivery).
+    """
+    from n23.core.cost.pin_sweep import rewrite_pinned_amounts_for_list
+    from n23.core.models.list import List
+    from n23.core.tasks import refresh_list_facts
+
+    try:
+        with transaction.atomic():
+            lst = List.objects.select_for_update().get(id=list_id)
+            sweep = rewrite_pinned_amounts_for_list(instance, lst, old_cost=old_cost)
+            if live:
+                _record_content_cost_change(
+                    instance, instance_name, lst, sweep, before_snapshots
                 )
+    except List.DoesNotExist:
+        return
+    except Exception as e:
+        # Log error but continue processing other lists. The per-list
+        # transaction rolled back, so the amount rewrite was undone and
+        # no action was recorded.
+        logger.error(
+            f"Failed to create CONTENT_COST_CHANGE action for list {list_id}: {e}"
+        )
+        # Index pages show last-good numbers and never recompute, so give
+        # the failed list a background heal rather than waiting for a
+        # detail-page view. The heal clears dirty but recomputes against
+        # the UNREWRITTEN (pre-correction) amounts, and the audit action
+        # is still missing — a task redelivery is the real recovery, and
+        # it works regardless of the dirty flag (the sweep re-runs the
+        # rewrite and recompute unconditionally).
+        try:
+            refresh_list_facts.enqueue(list_id=str(list_id))
+        except Exception:
+            logger.warning(
+                f"Failed to enqueue facts refresh for list {list_id}",
+                exc_info=True,
+            )
+
+
+def _recorded_baselines(instance, list_ids) -> set:
+    """The snapshot fallback's idempotency guard, read for many lists at once.
+
+    ``(list_id, rating_before, stash_before)`` of every CONTENT_COST_CHANGE
+    already recorded against ``instance`` on ``list_ids``.
+    """
+    from n23.core.models.action import ListAction, ListActionType
+
+    if not list_ids:
+        return set()
+    return set(
+        ListAction.objects.filter(
+            list_id__in=list_ids,
+            action_type=ListActionType.CONTENT_COST_CHANGE,
+            subject_id=instance.pk,
+        ).values_list("list_id", "rating_before", "stash_before")
+    )
+
+
+def _record_content_cost_change(
+    instance, instance_name, lst, sweep, before_snapshots, facts=None, recorded=None
+):
+    """Recompute one locked, already-rewritten list and record its action.
+
+    Runs inside the caller's transaction, which holds ``lst``'s row lock. A
+    batch passes the ``facts`` it already recomputed for the list and the
+    ``recorded`` baselines from ``_recorded_baselines``; without them, both
+    are read here for the one list.
+    """
+    from n23.core.models.action import ListAction, ListActionType
+
+    if sweep.use_row_deltas:
+        # Per-row amount deltas: Σ(new − old pinned amount) over
+        # the rows the sweep rewrote. Unlike the snapshot fallback
+        # below, this is independent of anything else landing on
+        # the list between enqueue and this task running — a
+        # racing user purchase used to be folded into this
+        # action's delta and double-charged in campaign credits.
+        # Redelivery is naturally idempotent: the second rewrite
+        # produces a zero delta and skips out here.
+        if facts is None:
+            facts = lst.facts_from_db(update=True)
+        rating_delta = sweep.rating_delta
+        stash_delta = sweep.stash_delta
+        total_delta = rating_delta + stash_delta
+        # Check each delta, not the sum: +N rating / -N stash
+        # cancels to zero while both books moved, and skipping
+        # here (after facts committed the movement) would break
+        # the action chain.
+        if rating_delta == 0 and stash_delta == 0:
+            return
+        # Chain the action off the recomputed head so anything
+        # that landed in the window keeps its own audit trail.
+        old_rating = facts.rating - rating_delta
+        old_stash = facts.stash - stash_delta
+    else:
+        # Snapshot fallback: UNPINNED rows reprice live, so their
+        # movement only exists as recompute-vs-baseline. This is
+        # today's machinery, race included; it retires per-list as
+        # the Phase 8 backfill pins rows.
+        #
+        # Capture before state.
+        #
+        # This task runs asynchronously (after commit), so a user may view
+        # the affected list before it runs. Viewing a dirty list lazily
+        # recalculates and writes the *new* values into rating_current/
+        # stash_current (via get_clean_list_or_404 -> facts_from_db) WITHOUT
+        # recording an action — which would make the live rating_current a
+        # zero-delta baseline here, silently dropping the action (and, in
+        # campaign mode, the credit adjustment). So prefer the pre-change
+        # snapshot captured synchronously at enqueue time; fall back to the
+        # live value only when no snapshot was supplied (e.g. direct calls).
+        snapshot = before_snapshots.get(str(lst.id)) if before_snapshots else None
+        if snapshot is not None:
+            old_rating, old_stash = snapshot
+        else:
+            old_rating = lst.rating_current
+            old_stash = lst.stash_current
+
+        # Idempotency: if this exact change was already recorded for this
+        # list (same content subject + same pre-change baseline), don't
+        # duplicate it. With a frozen snapshot a redelivery would otherwise
+        # recompute a non-zero delta and double-charge campaign credits.
+        if recorded is not None:
+            if (lst.id, old_rating, old_stash) in recorded:
+                return
+        elif ListAction.objects.filter(
+            list=lst,
+            action_type=ListActionType.CONTENT_COST_CHANGE,
+            subject_id=instance.pk,
+            rating_before=old_rating,
+            stash_before=old_stash,
+        ).exists():
+            return
+
+        # Recalculate with the new content costs (clears dirty flags on list and children)
+        if facts is None:
+            facts = lst.facts_from_db(update=True)
+
+        # Compute deltas
+        rating_delta = facts.rating - old_rating
+        stash_delta = facts.stash - old_stash
+        total_delta = rating_delta + stash_delta
+
+        # Skip if no actual cost change (e.g., override in place)
+        # This happens when a base cost changes but a fighter-specific
+        # override (ContentFighterEquipmentListItem, etc.) takes
+        # precedence. Check each delta, not the sum — +N rating /
+        # -N stash cancels while both books moved.
+        if rating_delta == 0 and stash_delta == 0:
+            return
+
+    # In campaign mode, adjust credits (charge more or refund)
+    # Positive delta = cost increased = charge credits (negative)
+    # Negative delta = cost decreased = refund credits (positive)
+    is_campaign = lst.is_campaign_mode
+    credits_delta = -total_delta if is_campaign else 0
+
+    # Format the cost change for the description
+    cost_change_str = format_cost_display(total_delta, show_sign=True)
+
+    # Record the action — the recompute already updated the
+    # rating/stash caches, and create_action is a pure record.
+    # The campaign credit adjustment is applied
+    # explicitly afterwards, inside the same transaction as the rewrite
+    # and behind the same idempotency guards above, so a
+    # redelivery can't double-charge.
+    lst.create_action(
+        action_type=ListActionType.CONTENT_COST_CHANGE,
+        description=f"{instance_name} changed cost ({cost_change_str})",
+        # Record the content instance as the subject so the task can
+        # detect (and skip) an already-recorded change on redelivery.
+        subject_app=instance._meta.app_label,
+        subject_type=instance._meta.model_name,
+        subject_id=instance.pk,
+        rating_before=old_rating,
+        stash_before=old_stash,
+        rating_delta=rating_delta,
+        stash_delta=stash_delta,
+        credits_delta=credits_delta,
+    )
+    if is_campaign:
+        lst.apply_credit_delta(credits_delta)
 
 
 # Post-save signal handlers that create actions after content saves
@@ -0,0 +1,126 @@
+"""Which content rows belong to a pack, held once per process.
+
+``ContentManager`` hides pack content from every default query, and used to
+ask the database each time: a ``NOT EXISTS`` against ``CustomContentPackItem``
+joined through ``django_content_type``, with ``with_packs`` adding a second
+``EXISTS`` on top. That ran on nearly every content query — each prefetch in
+``ListFighterQuerySet.with_related_data`` included — though pack membership
+is a small part of the library and rarely changes.
+
+This module keeps the ids of every row any pack holds, archived items
+included, by model. ``PackOwned`` is the condition "this row is in a pack",
+compiled as ``pk = ANY(<those ids>)`` — one array parameter, however many ids
+— and to nothing at all for a model no pack holds. Inclusion of the packs a
+list subscribes to stays in the database, as a plain ``IN`` over their items.
+
+The ids are read when the query is compiled, not when the queryset is built,
+so a queryset made at import time — a model form's choices, a ``Prefetch`` —
+never carries an old set.
+
+The set is stamped with ``PACK_SCOPE_TAG`` and dropped when the tag moves: any
+save or delete of a pack item moves it (``connect``). A queryset ``update()``
+or bulk load of pack items sends no signal, and ``PACK_SCOPE_SECONDS`` bounds
+how long one of those can hide.
+"""
+
+import time
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db.models import BooleanField, Expression, F
+from django.db.models.signals import post_delete, post_save
+
+from gyrinx.cache import invalidate, tagged_key
+
+# Moved by any change to pack membership (see gyrinx.cache.tags), so every
+# process's set is read again.
+PACK_SCOPE_TAG = "content_pack_scope"
+
+# How long a set may live without the tag moving.
+PACK_SCOPE_SECONDS = 600
+
+
+class _Scope:
+    """Pack-owned ids by ``(app_label, model_name)``."""
+
+    def __init__(self, stamp):
+        from n23.core.models.pack import CustomContentPackItem
+
+        self.stamp = stamp
+        self.built = time.monotonic()
+        items = CustomContentPackItem.objects.values_list(
+            "content_type__app_label", "content_type__model", "object_id"
+        )
+        owned = defaultdict(set)
+        for app_label, model_name, object_id in items.iterator():
+            owned[(app_label, model_name)].add(object_id)
+        self.owned = {key: frozenset(ids) for key, ids in owned.items()}
+
+    def stale(self, stamp):
+        return (
+            stamp != self.stamp or time.monotonic() - self.built >= PACK_SCOPE_SECONDS
+        )
+
+
+_scope = None
+
+
+def _reset_scope():
+    """Forget the pack-owned ids, so the next query reads them again. For tests."""
+    global _scope
+    _scope = None
+
+
+def owned_ids(model):
+    """The ids of ``model``'s rows that any pack holds."""
+    global _scope
+    stamp = tagged_key("content_pack_scope", PACK_SCOPE_TAG)
+    scope = _scope
+    if scope is None or scope.stale(stamp):
+        scope = _scope = _Scope(stamp)
+    return scope.owned.get((model._meta.app_label, model._meta.model_name), ())
+
+
+def enabled():
+    return settings.N23_PACK_SCOPE_CACHE
+
+
+class PackOwned(Expression):
+    """True for the rows of ``model`` that belong to a pack, archived or not."""
+
+    conditional = True
+    output_field = BooleanField()
+
+    def __init__(self, model, pk=None):
+        super().__init__()
+        self.model = model
+        self.pk = F("pk") if pk is None else pk
+
+    def get_source_expressions(self):
+        return [self.pk]
+
+    def set_source_expressions(self, exprs):
+        (self.pk,) = exprs
+
+    def as_sql(self, compiler, connection):
+        ids = owned_ids(self.model)
+        if not ids:
+            # No row is in a pack: Django drops the condition, or the query.
+            raise EmptyResultSet
+        pk_sql, params = compiler.compile(self.pk)
+        return f"{pk_sql} = ANY(%s)", (*params, list(ids))
+
+
+def _membership_changed(sender, **kwargs):
+    invalidate(PACK_SCOPE_TAG)
+
+
+def connect():
+    """Watch pack items, which are the whole of pack membership."""
+    model = apps.get_model("core", "CustomContentPackItem")
+    for signal in (post_save, post_delete):
+        signal.connect(
+            _membership_changed, sender=model, dispatch_uid="content_pack_scope"
+        )
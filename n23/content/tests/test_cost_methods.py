@@ -139,6 +139,27 @@ def test_content_equipment_cost_for_fighter_int_with_annotation():
     assert equipment_with_cost.cost_for_fighter_int() == 75
 
 
+@pytest.mark.django_db
+def test_content_equipment_cost_cast_int_is_stored():
+    """Test the generated integer cost follows the text cost, even past save()."""
+    category = ContentEquipmentCategory.objects.create(
+        name="Test Category", group="Gear"
+    )
+    priced = ContentEquipment.objects.create(
+        name="Priced", category=category, cost="100"
+    )
+    ContentEquipment.objects.create(name="Varies", category=category, cost="2D6X10")
+    ContentEquipment.objects.create(name="Huge", category=category, cost="9" * 12)
+
+    ContentEquipment.objects.filter(pk=priced.pk).update(cost="-15")
+
+    assert dict(
+        ContentEquipment.objects.filter(category=category)
+        .order_by("cost_cast_int")
+        .values_list("name", "cost_cast_int")
+    ) == {"Priced": -15, "Varies": 0, "Huge": 0}
+
+
 # ContentWeaponProfile cost methods tests
 
 
@@ -1,9 +1,10 @@
 """
-Cache-key behaviour for ContentPageRef.find_similar.
+ContentPageRef.find_similar, answered from the process's page ref index.
 
 Page ref titles are free text ("The Path We Follow", "Scout Drone (18\")"), and
 using them raw in a cache key made Django emit a CacheKeyWarning on essentially
-every request in production.
+every request in production. The index keys on nothing, but the lookups with
+awkward titles stay pinned.
 """
 
 import warnings
@@ -12,8 +13,8 @@ import pytest
 
 from n23.content.models import ContentBook, ContentPageRef
 
-# The page-ref cache is emptied before every test by an autouse fixture in the
-# root conftest, so these tests each start from an empty cache.
+# The page ref index is forgotten before every test by an autouse fixture in
+# the root conftest, so these tests each start by building it.
 
 
 @pytest.fixture
@@ -81,3 +82,55 @@ def test_empty_result_is_cached(django_assert_num_queries):
     list(ContentPageRef.find_similar("Nothing Matches This"))
     with django_assert_num_queries(0):
         assert list(ContentPageRef.find_similar("Nothing Matches This")) == []
+
+
+@pytest.mark.django_db
+def test_every_title_is_answered_from_one_query(page_ref, django_assert_num_queries):
+    """A cold process pays one load, not one LIKE per title."""
+    with django_assert_num_queries(1):
+        assert ContentPageRef.find_similar("The Path We Follow") == [page_ref]
+        assert ContentPageRef.find_similar("path we") == [page_ref]
+        assert ContentPageRef.find_similar("Nothing Matches This") == []
+        assert ContentPageRef.find_similar("Pa") == [page_ref]
+
+
+@pytest.mark.django_db
+def test_results_keep_the_model_ordering(page_ref):
+    book = page_ref.book
+    first = ContentPageRef.objects.create(
+        book=book, title="Follow Me", page="3", category="Rules"
+    )
+
+    assert ContentPageRef.find_similar("follow") == [first, page_ref]
+
+
+@pytest.mark.django_db
+def test_a_bookref_costs_no_query(page_ref, django_assert_num_queries):
+    child = ContentPageRef.objects.create(
+        book=page_ref.book, title="Path Walker", parent=page_ref, category="Skills"
+    )
+    [found] = ContentPageRef.find_similar("Path Walker")
+
+    with django_assert_num_queries(0):
+        assert found == child
+        assert found.bookref() == "Core p120"
+
+
+@pytest.mark.django_db
+def test_saving_a_ref_rebuilds_the_index(page_ref):
+    assert ContentPageRef.find_similar("Fresh Title") == []
+
+    page_ref.title = "Fresh Title"
+    page_ref.save()
+
+    assert ContentPageRef.find_similar("Fresh Title") == [page_ref]
+
+
+@pytest.mark.django_db
+def test_filters_the_index_cannot_answer_go_to_the_database(page_ref):
+    assert ContentPageRef.find_similar(
+        "The Path We Follow", book__shortname="Core"
+    ) == [page_ref]
+    assert (
+        ContentPageRef.find_similar("The Path We Follow", book__shortname="Nope") == []
+    )
@@ -20,6 +20,7 @@ import logging
 import traceback
 from datetime import date
 
+from django.conf import settings
 from django.contrib import messages
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
@@ -120,7 +121,7 @@ def reconcile_lists_view(request):
         if running:
             messages.error(
                 request,
-                "A reconcile run is already RUNNING — one chain at a "
+                "A reconcile run is already RUNNING — one run at a "
                 "time. If the task runner died and this is stale, mark "
                 "that record Failed in the Backfills admin first.",
             )
@@ -137,6 +138,8 @@ def reconcile_lists_view(request):
             backfill_id=str(backfill.id),
             user_id=request.user.pk,
             list_id=list_id,
+            shards=settings.RECONCILE_SHARDS,
+            target_seconds=settings.RECONCILE_BATCH_SECONDS,
         )
         messages.success(
             request,
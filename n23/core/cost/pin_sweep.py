@@ -8,6 +8,11 @@ caller (`_create_content_cost_change_actions`) runs the rewrite BEFORE any
 recompute or dirty processing, so `facts_from_db` sums already-updated
 amounts; rewriting after would either snap the caches back or double-count.
 
+A sweep covers a batch of lists at once: flat rewrites are one UPDATE over
+every affected row, and the per-list deltas come from a grouped aggregate
+over the same rows, so a popular item costs the same handful of queries for
+a thousand lists as for one.
+
 The sweep domains are partitioned by pin_state (§4.1):
 
 - SOURCE rows are found by pin-FK equality — holder-independent, so gear
@@ -30,7 +35,7 @@ semantics (facts exclude archived rows).
 
 from dataclasses import dataclass, field
 
-from django.db.models import Q
+from django.db.models import Count, F, Q, Sum
 
 from n23.content.signals import get_new_cost
 from n23.core.models.list import (
@@ -69,8 +74,15 @@ class PinSweep:
         return self.rating_delta + self.stash_delta
 
 
-def rewrite_pinned_amounts_for_list(instance, lst, old_cost=None) -> PinSweep:
-    """Rewrite pinned amounts on ``lst`` affected by a change to ``instance``.
+def rewrite_pinned_amounts_for_lists(instance, list_ids, old_cost=None) -> dict:
+    """Rewrite pinned amounts on every list in ``list_ids`` affected by ``instance``.
+
+    The bulk form of ``rewrite_pinned_amounts_for_list``: each rewrite is one
+    UPDATE over the affected rows of all the lists, and the per-list deltas
+    come from one grouped aggregate per row set, so the query count does not
+    grow with the number of lists. Locking is the caller's job — hold every
+    list in ``list_ids`` with ``select_for_update`` for the duration, exactly
+    as the per-list form requires of its one list.
 
     ``old_cost`` is the source's pre-change value (captured by the pre_save
     handler and carried through the task payload). Amount-snapshot DERIVED
@@ -80,19 +92,22 @@ def rewrite_pinned_amounts_for_list(instance, lst, old_cost=None) -> PinSweep:
     rungs that were never corrected. Without ``old_cost`` those rows are
     left untouched and the list is flagged has_masked (snapshot fallback).
 
-    Returns a PinSweep carrying the per-row deltas and whether the caller
-    can use them as the audit delta (`use_row_deltas`) or must fall back to
-    the snapshot-vs-recompute computation (UNPINNED rows present, masked
-    rows, or a source model pins don't apply to).
+    Returns ``{list_id: PinSweep}`` for every id in ``list_ids``, each
+    carrying that list's per-row deltas and whether the caller can use them
+    as the audit delta (`use_row_deltas`) or must fall back to the
+    snapshot-vs-recompute computation (UNPINNED rows present, masked rows,
+    or a source model pins don't apply to).
     """
     handler = _SWEEP_HANDLERS.get(type(instance).__name__)
     if handler is None:
-        return PinSweep()
+        return {list_id: PinSweep() for list_id in list_ids}
+    sweeps = _Sweeps()
     if handler in _NEEDS_OLD_COST:
-        sweep = handler(instance, lst, old_cost)
+        handler(instance, list_ids, sweeps, old_cost)
     else:
-        sweep = handler(instance, lst)
-    if sweep.touched_assignments:
+        handler(instance, list_ids, sweeps)
+    touched = set().union(*(sweep.touched_assignments for sweep in sweeps.values()))
+    if touched:
         # Sweeps do two jobs: rewrite amounts, THEN mark dirty (§4.7). The
         # enqueue-time set_dirty is not enough — an action landing in the
         # enqueue-to-task window (a purchase, say) refreshes the fighter's
@@ -101,47 +116,71 @@ def rewrite_pinned_amounts_for_list(instance, lst, old_cost=None) -> PinSweep:
         # and leave its cache stale against the rewritten amounts.
         bulk_mark_assignments_dirty(
             ListFighterEquipmentAssignment.objects.filter(
-                pk__in=sweep.touched_assignments,
+                pk__in=touched,
                 archived=False,
                 list_fighter__archived=False,
             )
         )
-    return sweep
+    return {list_id: sweeps[list_id] for list_id in list_ids}
+
+
+def rewrite_pinned_amounts_for_list(instance, lst, old_cost=None) -> PinSweep:
+    """Rewrite pinned amounts on ``lst`` affected by a change to ``instance``.
+
+    See ``rewrite_pinned_amounts_for_lists``; this is its one-list form.
+    """
+    return rewrite_pinned_amounts_for_lists(instance, [lst.pk], old_cost)[lst.pk]
+
+
+class _Sweeps(dict):
+    """list id -> that list's PinSweep, created on first touch."""
+
+    def __missing__(self, list_id):
+        sweep = self[list_id] = PinSweep(pin_capable=True)
+        return sweep
 
 
 # --- Row-set helpers ---------------------------------------------------------
 
+# Lookup prefix from a through row to its assignment.
+_THROUGH = "listfighterequipmentassignment__"
 
-def _base_rows(lst):
-    return ListFighterEquipmentAssignment.objects.filter(list_fighter__list=lst)
+
+def _base_rows(list_ids):
+    return ListFighterEquipmentAssignment.objects.filter(
+        list_fighter__list_id__in=list_ids
+    )
 
 
-def _profile_rows(lst):
+def _profile_rows(list_ids):
     return ListFighterEquipmentAssignmentProfile.objects.filter(
-        listfighterequipmentassignment__list_fighter__list=lst
+        listfighterequipmentassignment__list_fighter__list_id__in=list_ids
     )
 
 
-def _accessory_rows(lst):
+def _accessory_rows(list_ids):
     return ListFighterEquipmentAssignmentAccessory.objects.filter(
-        listfighterequipmentassignment__list_fighter__list=lst
+        listfighterequipmentassignment__list_fighter__list_id__in=list_ids
     )
 
 
-def _upgrade_rows(lst):
+def _upgrade_rows(list_ids):
     return ListFighterEquipmentAssignmentUpgrade.objects.filter(
-        listfighterequipmentassignment__list_fighter__list=lst
+        listfighterequipmentassignment__list_fighter__list_id__in=list_ids
     )
 
 
-def _live_through(qs):
-    """Through rows whose assignment and fighter are unarchived (cache-visible)."""
+def _live(qs, prefix=""):
+    """Rows whose assignment and fighter are unarchived (cache-visible)."""
     return qs.filter(
-        listfighterequipmentassignment__archived=False,
-        listfighterequipmentassignment__list_fighter__archived=False,
+        **{f"{prefix}archived": False, f"{prefix}list_fighter__archived": False}
     )
 
 
+def _live_through(qs):
+    return _live(qs, _THROUGH)
+
+
 def _holder_context_q(fighter, prefix=""):
     """The legacy holder-keyed sweep condition, for the unpinned checks."""
     return (
@@ -151,6 +190,13 @@ def _holder_context_q(fighter, prefix=""):
     )
 
 
+def _flag(sweeps, qs, attr, prefix=""):
+    """Set ``attr`` on the sweep of every list with a row in ``qs``."""
+    list_ids = qs.order_by().values_list(f"{prefix}list_fighter__list_id", flat=True)
+    for list_id in list_ids.distinct():
+        setattr(sweeps[list_id], attr, True)
+
+
 def _bucket(sweep, assignment, delta):
     """Accumulate a row delta into rating or stash; archived rows move nothing.
 
@@ -170,6 +216,29 @@ def _bucket(sweep, assignment, delta):
         sweep.rating_delta += delta
 
 
+def _book(sweeps, qs, field, prefix="", amount=None, delta=None):
+    """``_bucket`` for a whole row set, as one grouped aggregate.
+
+    ``qs`` holds the live, unmasked rows about to move to ``amount`` (or by
+    ``delta``); their Σ(new − old) lands on each list's rating or stash.
+    """
+    grouped = (
+        qs.filter(**{f"{prefix}total_cost_override__isnull": True})
+        .order_by()
+        .values_list(
+            f"{prefix}list_fighter__list_id",
+            f"{prefix}list_fighter__content_fighter__is_stash",
+        )
+        .annotate(rows=Count("pk"), old=Sum(field))
+    )
+    for list_id, is_stash, rows, old in grouped:
+        moved = rows * delta if delta is not None else rows * amount - old
+        if is_stash:
+            sweeps[list_id].stash_delta += moved
+        else:
+            sweeps[list_id].rating_delta += moved
+
+
 def _flush(model, updates, field):
     by_value = {}
     for pk, new in updates:
@@ -178,65 +247,74 @@ def _flush(model, updates, field):
         model.objects.filter(pk__in=pks).update(**{field: value})
 
 
-def _rewrite_base_rows(qs, new_amount_for, sweep):
-    """Rewrite pinned_base_amount; returns ids of assignments that changed."""
-    changed = []
-    updates = []
-    for assignment in qs.select_related("list_fighter__content_fighter"):
-        new = new_amount_for(assignment)
-        if new is None or new == assignment.pinned_base_amount:
-            continue
-        # cost_override and linked-child-zero outrank the base pin in
-        # resolution: the base contribution is exactly unchanged, so the
-        # amount is rewritten but no movement is booked.
-        base_masked = (
-            assignment.cost_override is not None
-            or assignment.linked_equipment_parent_id is not None
-        )
-        if not base_masked:
-            _bucket(sweep, assignment, new - assignment.pinned_base_amount)
-        updates.append((assignment.pk, new))
-        changed.append(assignment.pk)
-        sweep.touched_assignments.add(assignment.pk)
-    _flush(ListFighterEquipmentAssignment, updates, "pinned_base_amount")
-    sweep.rewrote += len(updates)
-    return changed
+def _rewrite_base_rows(qs, new, sweeps):
+    """Rewrite pinned_base_amount to ``new``; returns ids of assignments that changed."""
+    if new is None:
+        return []
+    qs = qs.exclude(pinned_base_amount=new)
+    rows = list(qs.values_list("pk", "list_fighter__list_id"))
+    if not rows:
+        return []
+    # cost_override and linked-child-zero outrank the base pin in
+    # resolution: the base contribution is exactly unchanged, so the
+    # amount is rewritten but no movement is booked.
+    _book(
+        sweeps,
+        _live(qs).filter(
+            cost_override__isnull=True, linked_equipment_parent__isnull=True
+        ),
+        "pinned_base_amount",
+        amount=new,
+    )
+    qs.update(pinned_base_amount=new)
+    for pk, list_id in rows:
+        sweeps[list_id].rewrote += 1
+        sweeps[list_id].touched_assignments.add(pk)
+    return [pk for pk, _ in rows]
 
 
-def _rewrite_through_rows(model, qs, new_amount_for, sweep, defaults_can_mask=False):
-    updates = []
-    for row in qs.select_related(
-        "listfighterequipmentassignment__list_fighter__content_fighter"
-    ):
-        new = new_amount_for(row)
-        if new is None or new == row.pinned_amount:
-            continue
-        assignment = row.listfighterequipmentassignment
-        if assignment.archived or assignment.list_fighter.archived:
-            # Rewrite only: archived rows move no caches and must not mask —
-            # a sticky has_masked from an archived row would force the whole
-            # list back onto the racy snapshot fallback for nothing.
-            pass
-        elif defaults_can_mask and assignment.from_default_assignment_id is not None:
-            # A from-default assignment frees SOME profiles/accessories (by
-            # membership in the default's component sets) — resolution-exact
-            # pricing needs the recompute, so flag for the snapshot fallback.
-            sweep.has_masked = True
-        else:
-            _bucket(sweep, assignment, new - row.pinned_amount)
-        updates.append((row.pk, new))
-        sweep.touched_assignments.add(row.listfighterequipmentassignment_id)
-    _flush(model, updates, "pinned_amount")
-    sweep.rewrote += len(updates)
+def _rewrite_through_rows(qs, sweeps, amount=None, delta=None, defaults_can_mask=False):
+    """Rewrite pinned_amount to ``amount``, or move it by ``delta``."""
+    if amount is None and not delta:
+        return
+    if amount is not None:
+        qs = qs.exclude(pinned_amount=amount)
+    rows = list(
+        qs.values_list(
+            "listfighterequipmentassignment_id", f"{_THROUGH}list_fighter__list_id"
+        )
+    )
+    if not rows:
+        return
+    # Archived rows are rewritten only: they move no caches and must not
+    # mask — a sticky has_masked from an archived row would force the whole
+    # list back onto the racy snapshot fallback for nothing.
+    moving = _live_through(qs)
+    if defaults_can_mask:
+        # A from-default assignment frees SOME profiles/accessories (by
+        # membership in the default's component sets) — resolution-exact
+        # pricing needs the recompute, so flag for the snapshot fallback.
+        masked = Q(**{f"{_THROUGH}from_default_assignment__isnull": False})
+        _flag(sweeps, moving.filter(masked), "has_masked", _THROUGH)
+        moving = moving.exclude(masked)
+    _book(sweeps, moving, "pinned_amount", _THROUGH, amount=amount, delta=delta)
+    if amount is not None:
+        qs.update(pinned_amount=amount)
+    else:
+        qs.update(pinned_amount=F("pinned_amount") + delta)
+    for assignment_id, list_id in rows:
+        sweeps[list_id].rewrote += 1
+        sweeps[list_id].touched_assignments.add(assignment_id)
 
 
-def _rederive_accessory_rows(qs, sweep, require_expression):
+def _rederive_accessory_rows(qs, sweeps, require_expression):
     """Re-derive DERIVED accessory amounts against their assignment's base.
 
     ``require_expression`` distinguishes the base-rewrite cascade (only
     expression accessories depend on the base) from a direct accessory
     change (every DERIVED row for it re-derives — the evaluator falls back
-    to the flat cost when there is no expression).
+    to the flat cost when there is no expression). The evaluator runs per
+    row, so unlike the flat rewrites this stays a walk over the rows.
     """
     qs = qs.filter(pin_state=PinState.DERIVED)
     if require_expression:
@@ -248,6 +326,7 @@ def _rederive_accessory_rows(qs, sweep, require_expression):
         "listfighterequipmentassignment__list_fighter__content_fighter",
     ):
         assignment = row.listfighterequipmentassignment
+        sweep = sweeps[assignment.list_fighter.list_id]
         base = base_cache.get(assignment.pk)
         if base is None:
             # Fresh fetch: the base amount may have been rewritten earlier in
@@ -266,9 +345,9 @@ def _rederive_accessory_rows(qs, sweep, require_expression):
         else:
             _bucket(sweep, assignment, new - row.pinned_amount)
         updates.append((row.pk, new))
+        sweep.rewrote += 1
         sweep.touched_assignments.add(assignment.pk)
     _flush(ListFighterEquipmentAssignmentAccessory, updates, "pinned_amount")
-    sweep.rewrote += len(updates)
 
 
 def _expression_rows(qs):
@@ -277,123 +356,111 @@ def _expression_rows(qs):
     )
 
 
-def _cascade_expression_accessories(lst, changed_assignment_ids, sweep):
+def _cascade_expression_accessories(list_ids, changed_assignment_ids, sweeps):
     """Base corrections cascade to same-assignment expression accessories."""
     if not changed_assignment_ids:
         return
     _rederive_accessory_rows(
-        _accessory_rows(lst).filter(
+        _accessory_rows(list_ids).filter(
             listfighterequipmentassignment_id__in=changed_assignment_ids
         ),
-        sweep,
+        sweeps,
         require_expression=True,
     )
     # An UNPINNED expression accessory on a rewritten base reprices live off
     # the new base amount: its movement is in the recompute but not in the
     # per-row deltas, so it forces the snapshot fallback like any other
     # live-repricing UNPINNED row.
-    if _expression_rows(
-        _live_through(
-            _accessory_rows(lst).filter(
-                listfighterequipmentassignment_id__in=changed_assignment_ids,
-                pin_state=PinState.UNPINNED,
+    _flag(
+        sweeps,
+        _expression_rows(
+            _live_through(
+                _accessory_rows(list_ids).filter(
+                    listfighterequipmentassignment_id__in=changed_assignment_ids,
+                    pin_state=PinState.UNPINNED,
+                )
             )
-        )
-    ).exists():
-        sweep.has_unpinned = True
+        ),
+        "has_unpinned",
+        _THROUGH,
+    )
 
 
 # --- Per-source sweeps: catalog models ---------------------------------------
 
 
-def _sweep_equipment(instance, lst):
-    sweep = PinSweep(pin_capable=True)
-    new = get_new_cost(instance, "cost")
+def _sweep_equipment(instance, list_ids, sweeps):
     changed = _rewrite_base_rows(
-        _base_rows(lst).filter(
+        _base_rows(list_ids).filter(
             content_equipment=instance, pinned_base_state=PinState.CATALOG
         ),
-        lambda a: new,
-        sweep,
+        get_new_cost(instance, "cost"),
+        sweeps,
     )
     # DERIVED expression rows re-derive whenever their base input changed —
     # whether the base was a rewritten pin or an UNPINNED base repricing
     # live off this source. Re-derivation reads the row's true
     # base_cost_int(), so a base that didn't actually move is a no-op.
-    live_bases = _base_rows(lst).filter(
+    live_bases = _base_rows(list_ids).filter(
         content_equipment=instance, pinned_base_state=PinState.UNPINNED
     )
     _cascade_expression_accessories(
-        lst, changed + list(live_bases.values_list("pk", flat=True)), sweep
-    )
-    sweep.has_unpinned = sweep.has_unpinned or (
-        _base_rows(lst)
-        .filter(
-            content_equipment=instance,
-            pinned_base_state=PinState.UNPINNED,
-            archived=False,
-            list_fighter__archived=False,
-        )
-        .exists()
+        list_ids, changed + list(live_bases.values_list("pk", flat=True)), sweeps
     )
-    return sweep
+    _flag(sweeps, _live(live_bases), "has_unpinned")
 
 
-def _sweep_weapon_profile(instance, lst):
-    sweep = PinSweep(pin_capable=True)
-    new = get_new_cost(instance, "cost")
+def _sweep_weapon_profile(instance, list_ids, sweeps):
     _rewrite_through_rows(
-        ListFighterEquipmentAssignmentProfile,
-        _profile_rows(lst).filter(
+        _profile_rows(list_ids).filter(
             contentweaponprofile=instance, pin_state=PinState.CATALOG
         ),
-        lambda r: new,
-        sweep,
+        sweeps,
+        amount=get_new_cost(instance, "cost"),
         defaults_can_mask=True,
     )
-    sweep.has_unpinned = (
-        sweep.has_unpinned
-        or _live_through(
-            _profile_rows(lst).filter(
+    _flag(
+        sweeps,
+        _live_through(
+            _profile_rows(list_ids).filter(
                 contentweaponprofile=instance, pin_state=PinState.UNPINNED
             )
-        ).exists()
+        ),
+        "has_unpinned",
+        _THROUGH,
     )
-    return sweep
 
 
-def _sweep_weapon_accessory(instance, lst):
-    sweep = PinSweep(pin_capable=True)
-    new = get_new_cost(instance, "cost")
+def _sweep_weapon_accessory(instance, list_ids, sweeps):
     _rewrite_through_rows(
-        ListFighterEquipmentAssignmentAccessory,
-        _accessory_rows(lst).filter(
+        _accessory_rows(list_ids).filter(
             contentweaponaccessory=instance, pin_state=PinState.CATALOG
         ),
-        lambda r: new,
-        sweep,
+        sweeps,
+        amount=get_new_cost(instance, "cost"),
         defaults_can_mask=True,
     )
     # Expression (or flat) re-derivation for DERIVED rows of this accessory —
     # covers both a cost edit and a cost_expression edit.
     _rederive_accessory_rows(
-        _accessory_rows(lst).filter(contentweaponaccessory=instance),
-        sweep,
+        _accessory_rows(list_ids).filter(contentweaponaccessory=instance),
+        sweeps,
         require_expression=False,
     )
-    sweep.has_unpinned = (
-        sweep.has_unpinned
-        or _live_through(
-            _accessory_rows(lst).filter(
+    _flag(
+        sweeps,
+        _live_through(
+            _accessory_rows(list_ids).filter(
                 contentweaponaccessory=instance, pin_state=PinState.UNPINNED
             )
-        ).exists()
+        ),
+        "has_unpinned",
+        _THROUGH,
     )
-    return sweep
 
 
 def _single_stack_delta_rewrite(
-    lst, sweep, stack_upgrade_ids, delta, masked_fighter_ids
+    list_ids, sweeps, stack_upgrade_ids, delta, masked_fighter_ids
 ):
     """Apply a rung correction to SINGLE-stack DERIVED receipts BY DELTA.
 
@@ -410,43 +477,37 @@ def _single_stack_delta_rewrite(
     """
     if delta == 0:
         return
-
-    def new_amount(row):
-        fighter = row.listfighterequipmentassignment.list_fighter
-        if (
-            fighter.content_fighter_id in masked_fighter_ids
-            or fighter.legacy_content_fighter_id in masked_fighter_ids
-        ):
-            return None  # masked for this holder: receipt stands
-        return row.pinned_amount + delta
-
-    _rewrite_through_rows(
-        ListFighterEquipmentAssignmentUpgrade,
-        _upgrade_rows(lst).filter(
-            contentequipmentupgrade__in=stack_upgrade_ids,
-            pin_state=PinState.DERIVED,
-        ),
-        new_amount,
-        sweep,
+    rows = _upgrade_rows(list_ids).filter(
+        contentequipmentupgrade__in=stack_upgrade_ids,
+        pin_state=PinState.DERIVED,
     )
+    if masked_fighter_ids:
+        # Masked for this holder: receipt stands.
+        rows = rows.exclude(
+            **{f"{_THROUGH}list_fighter__content_fighter__in": masked_fighter_ids}
+        ).exclude(
+            **{
+                f"{_THROUGH}list_fighter__legacy_content_fighter__in": (
+                    masked_fighter_ids
+                )
+            }
+        )
+    _rewrite_through_rows(rows, sweeps, delta=delta)
 
 
-def _sweep_upgrade(instance, lst, old_cost=None):
+def _sweep_upgrade(instance, list_ids, sweeps, old_cost=None):
     from n23.content.models import (
         ContentEquipment,
         ContentFighterEquipmentListUpgrade,
     )
 
-    sweep = PinSweep(pin_capable=True)
     if instance.equipment.upgrade_mode == ContentEquipment.UpgradeMode.MULTI:
-        new = get_new_cost(instance, "cost")
         _rewrite_through_rows(
-            ListFighterEquipmentAssignmentUpgrade,
-            _upgrade_rows(lst).filter(
+            _upgrade_rows(list_ids).filter(
                 contentequipmentupgrade=instance, pin_state=PinState.CATALOG
             ),
-            lambda r: new,
-            sweep,
+            sweeps,
+            amount=get_new_cost(instance, "cost"),
         )
         affected_upgrade_ids = [instance.pk]
     else:
@@ -459,15 +520,15 @@ def _sweep_upgrade(instance, lst, old_cost=None):
             # No pre-change value (direct caller outside the task path):
             # the delta is unknowable, so leave the receipts and flag the
             # snapshot fallback rather than guess.
-            if (
-                _upgrade_rows(lst)
-                .filter(
+            _flag(
+                sweeps,
+                _upgrade_rows(list_ids).filter(
                     contentequipmentupgrade__in=stack_ids,
                     pin_state=PinState.DERIVED,
-                )
-                .exists()
-            ):
-                sweep.has_masked = True
+                ),
+                "has_masked",
+                _THROUGH,
+            )
         else:
             masked_fighter_ids = set(
                 ContentFighterEquipmentListUpgrade.objects.filter(
@@ -475,50 +536,49 @@ def _sweep_upgrade(instance, lst, old_cost=None):
                 ).values_list("fighter_id", flat=True)
             )
             _single_stack_delta_rewrite(
-                lst,
-                sweep,
+                list_ids,
+                sweeps,
                 stack_ids,
                 get_new_cost(instance, "cost") - old_cost,
                 masked_fighter_ids,
             )
         affected_upgrade_ids = stack_ids
-    sweep.has_unpinned = (
-        sweep.has_unpinned
-        or _live_through(
-            _upgrade_rows(lst).filter(
+    _flag(
+        sweeps,
+        _live_through(
+            _upgrade_rows(list_ids).filter(
                 contentequipmentupgrade__in=affected_upgrade_ids,
                 pin_state=PinState.UNPINNED,
             )
-        ).exists()
+        ),
+        "has_unpinned",
+        _THROUGH,
     )
-    return sweep
 
 
 # --- Per-source sweeps: override sources (pin-FK equality) --------------------
 
 
-def _sweep_equipment_list_item(instance, lst):
-    sweep = PinSweep(pin_capable=True)
+def _sweep_equipment_list_item(instance, list_ids, sweeps):
     new = instance.cost
     changed = _rewrite_base_rows(
-        _base_rows(lst).filter(
+        _base_rows(list_ids).filter(
             pinned_equipment_list_item=instance, pinned_base_state=PinState.SOURCE
         ),
-        lambda a: new,
-        sweep,
+        new,
+        sweeps,
     )
     _rewrite_through_rows(
-        ListFighterEquipmentAssignmentProfile,
-        _profile_rows(lst).filter(
+        _profile_rows(list_ids).filter(
             pinned_equipment_list_item=instance, pin_state=PinState.SOURCE
         ),
-        lambda r: new,
-        sweep,
+        sweeps,
+        amount=new,
         defaults_can_mask=True,
     )
     # Live-repricing UNPINNED rows: current-context assignments this row
     # still prices, split by whether it prices the base or a profile.
-    context_all = _base_rows(lst).filter(
+    context_all = _base_rows(list_ids).filter(
         _holder_context_q(instance.fighter),
         content_equipment=instance.equipment,
     )
@@ -532,69 +592,64 @@ def _sweep_equipment_list_item(instance, lst):
                 "pk", flat=True
             )
         )
-    _cascade_expression_accessories(lst, cascade_ids, sweep)
+    _cascade_expression_accessories(list_ids, cascade_ids, sweeps)
+    _flag_unpinned_context(sweeps, list_ids, _live(context_all), instance)
 
-    context = context_all.filter(archived=False, list_fighter__archived=False)
+
+def _flag_unpinned_context(sweeps, list_ids, context, instance):
+    """Flag lists whose context-matched UNPINNED rows ``instance`` prices live."""
     if instance.weapon_profile_id:
-        sweep.has_unpinned = sweep.has_unpinned or (
-            _profile_rows(lst)
-            .filter(
+        _flag(
+            sweeps,
+            _profile_rows(list_ids).filter(
                 listfighterequipmentassignment__in=context,
                 contentweaponprofile=instance.weapon_profile,
                 pin_state=PinState.UNPINNED,
-            )
-            .exists()
+            ),
+            "has_unpinned",
+            _THROUGH,
         )
     else:
-        sweep.has_unpinned = (
-            sweep.has_unpinned
-            or context.filter(pinned_base_state=PinState.UNPINNED).exists()
+        _flag(
+            sweeps,
+            context.filter(pinned_base_state=PinState.UNPINNED),
+            "has_unpinned",
         )
-    return sweep
 
 
-def _sweep_equipment_list_accessory(instance, lst):
-    sweep = PinSweep(pin_capable=True)
-    new = instance.cost
+def _sweep_equipment_list_accessory(instance, list_ids, sweeps):
     _rewrite_through_rows(
-        ListFighterEquipmentAssignmentAccessory,
-        _accessory_rows(lst).filter(
+        _accessory_rows(list_ids).filter(
             pinned_equipment_list_accessory=instance, pin_state=PinState.SOURCE
         ),
-        lambda r: new,
-        sweep,
+        sweeps,
+        amount=instance.cost,
         defaults_can_mask=True,
     )
-    sweep.has_unpinned = (
-        sweep.has_unpinned
-        or (
-            _live_through(
-                _accessory_rows(lst).filter(
-                    _holder_context_q(
-                        instance.fighter, prefix="listfighterequipmentassignment__"
-                    ),
-                    contentweaponaccessory=instance.weapon_accessory,
-                    pin_state=PinState.UNPINNED,
-                )
+    _flag(
+        sweeps,
+        _live_through(
+            _accessory_rows(list_ids).filter(
+                _holder_context_q(instance.fighter, prefix=_THROUGH),
+                contentweaponaccessory=instance.weapon_accessory,
+                pin_state=PinState.UNPINNED,
             )
-        ).exists()
+        ),
+        "has_unpinned",
+        _THROUGH,
     )
-    return sweep
 
 
-def _sweep_equipment_list_upgrade(instance, lst, old_cost=None):
+def _sweep_equipment_list_upgrade(instance, list_ids, sweeps, old_cost=None):
     from n23.content.models import ContentEquipment
 
-    sweep = PinSweep(pin_capable=True)
     # MULTI-mode pins are SOURCE rows carrying this override's FK: flat copy.
-    new = instance.cost
     _rewrite_through_rows(
-        ListFighterEquipmentAssignmentUpgrade,
-        _upgrade_rows(lst).filter(
+        _upgrade_rows(list_ids).filter(
             pinned_equipment_list_upgrade=instance, pin_state=PinState.SOURCE
         ),
-        lambda r: new,
-        sweep,
+        sweeps,
+        amount=instance.cost,
     )
     # SINGLE-mode pins are DERIVED amount-snapshots with no FK — this
     # override's contribution is folded into the cumulative receipt of every
@@ -604,46 +659,33 @@ def _sweep_equipment_list_upgrade(instance, lst, old_cost=None):
     # v1 amount-snapshot imprecision).
     if instance.upgrade.equipment.upgrade_mode == ContentEquipment.UpgradeMode.SINGLE:
         stack_ids = [u.pk for u in instance.upgrade.same_stack_from_position()]
-        derived_rows = _upgrade_rows(lst).filter(
-            _holder_context_q(
-                instance.fighter, prefix="listfighterequipmentassignment__"
-            ),
+        derived_rows = _upgrade_rows(list_ids).filter(
+            _holder_context_q(instance.fighter, prefix=_THROUGH),
             contentequipmentupgrade__in=stack_ids,
             pin_state=PinState.DERIVED,
         )
         if old_cost is None:
-            if derived_rows.exists():
-                sweep.has_masked = True  # delta unknowable outside the task path
+            # Delta unknowable outside the task path.
+            _flag(sweeps, derived_rows, "has_masked", _THROUGH)
         else:
-            delta = instance.cost - old_cost
-            if delta:
-                _rewrite_through_rows(
-                    ListFighterEquipmentAssignmentUpgrade,
-                    derived_rows,
-                    lambda r: r.pinned_amount + delta,
-                    sweep,
-                )
-    sweep.has_unpinned = (
-        sweep.has_unpinned
-        or (
-            _live_through(
-                _upgrade_rows(lst).filter(
-                    _holder_context_q(
-                        instance.fighter, prefix="listfighterequipmentassignment__"
-                    ),
-                    # Per-rung override in cumulative pricing: this rung and
-                    # every higher one reprice live (mirror of set_dirty).
-                    contentequipmentupgrade__in=instance.upgrade.same_stack_from_position(),
-                    pin_state=PinState.UNPINNED,
-                )
+            _rewrite_through_rows(derived_rows, sweeps, delta=instance.cost - old_cost)
+    _flag(
+        sweeps,
+        _live_through(
+            _upgrade_rows(list_ids).filter(
+                _holder_context_q(instance.fighter, prefix=_THROUGH),
+                # Per-rung override in cumulative pricing: this rung and
+                # every higher one reprice live (mirror of set_dirty).
+                contentequipmentupgrade__in=instance.upgrade.same_stack_from_position(),
+                pin_state=PinState.UNPINNED,
             )
-        ).exists()
+        ),
+        "has_unpinned",
+        _THROUGH,
     )
-    return sweep
 
 
-def _sweep_expansion_item(instance, lst):
-    sweep = PinSweep(pin_capable=True)
+def _sweep_expansion_item(instance, list_ids, sweeps):
     # Expansion semantics: a null cost means "use the base cost" — of the
     # equipment for base pins, of the profile for profile pins.
     if instance.cost is not None:
@@ -656,22 +698,21 @@ def _sweep_expansion_item(instance, lst):
             else base_new
         )
     changed = _rewrite_base_rows(
-        _base_rows(lst).filter(
+        _base_rows(list_ids).filter(
             pinned_expansion_item=instance, pinned_base_state=PinState.SOURCE
         ),
-        lambda a: base_new,
-        sweep,
+        base_new,
+        sweeps,
     )
     _rewrite_through_rows(
-        ListFighterEquipmentAssignmentProfile,
-        _profile_rows(lst).filter(
+        _profile_rows(list_ids).filter(
             pinned_expansion_item=instance, pin_state=PinState.SOURCE
         ),
-        lambda r: profile_new,
-        sweep,
+        sweeps,
+        amount=profile_new,
         defaults_can_mask=True,
     )
-    context_all = _base_rows(lst).filter(content_equipment=instance.equipment)
+    context_all = _base_rows(list_ids).filter(content_equipment=instance.equipment)
     cascade_ids = list(changed)
     if not instance.weapon_profile_id:
         # A base-pricing item also moves the live base of UNPINNED matching
@@ -682,25 +723,8 @@ def _sweep_expansion_item(instance, lst):
                 "pk", flat=True
             )
         )
-    _cascade_expression_accessories(lst, cascade_ids, sweep)
-
-    context = context_all.filter(archived=False, list_fighter__archived=False)
-    if instance.weapon_profile_id:
-        sweep.has_unpinned = sweep.has_unpinned or (
-            _profile_rows(lst)
-            .filter(
-                listfighterequipmentassignment__in=context,
-                contentweaponprofile=instance.weapon_profile,
-                pin_state=PinState.UNPINNED,
-            )
-            .exists()
-        )
-    else:
-        sweep.has_unpinned = (
-            sweep.has_unpinned
-            or context.filter(pinned_base_state=PinState.UNPINNED).exists()
-        )
-    return sweep
+    _cascade_expression_accessories(list_ids, cascade_ids, sweeps)
+    _flag_unpinned_context(sweeps, list_ids, _live(context_all), instance)
 
 
 # Handlers whose amount-snapshot (DERIVED) rewrites need the source's
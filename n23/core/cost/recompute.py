@@ -0,0 +1,265 @@
+"""Set-based facts recompute for many lists at once.
+
+``List.facts_from_db`` walks one list's fighters, and each dirty fighter's
+assignments, one instance at a time — a ``QuerySet.update`` per fighter and
+per list. That is right for a single list on a request, and it is O(fighters)
+round trips for anything that heals lists in bulk: the background refresh,
+the reconcile chain, the content-cost task.
+
+`recompute_list_facts` computes the same numbers for N lists in a fixed
+number of queries:
+
+1. one fighter query, carrying what the per-row path reads off each fighter
+   — the house override, the advancement and roll-result sums, whether it is
+   a linked child, whether it is captured or sold;
+2. one hydrated fetch of the assignments that must be re-priced (dirty ones
+   under dirty fighters, or every one when rebuilding), priced with the same
+   ``cost_int()`` the per-row path uses — pinned rows price from their stored
+   amounts with no further reads;
+3. one grouped aggregate of the clean assignments' cached ratings per fighter;
+4. one list query, and then one ``bulk_update`` per table.
+
+The semantics are those of the per-row path, deliberately: a clean fighter
+contributes its cached rating and its assignments are not visited, a dirty
+one is rebuilt from its clean assignments' caches plus the re-priced dirty
+ones, and the list totals clamp at zero when written while the returned
+facts carry the raw sums. ``rebuild=True`` is reconcile's variant — every
+assignment and fighter (archived fighters included) is re-priced whatever
+its dirty flag says, because drift hides behind a clean flag.
+
+Writes use ``bulk_update`` (no signals, no history churn), matching the
+``QuerySet.update`` writes of ``facts_from_db``.
+"""
+
+from django.db.models import Exists, OuterRef, Sum, Value
+from django.db.models.functions import Coalesce
+
+from gyrinx.tracing import traced
+from gyrinx.tracker import track
+from n23.core.models.facts import ListFacts
+from n23.core.models.list import (
+    CapturedFighter,
+    List,
+    ListFighter,
+    ListFighterEquipmentAssignment,
+)
+
+#: Rows per ``UPDATE`` statement. Bounds statement size on the largest
+#: batches without turning one table's write back into many round trips.
+BULK_UPDATE_BATCH_SIZE = 500
+
+
+@traced("recompute_list_facts")
+def recompute_list_facts(list_ids, update=True, rebuild=False) -> dict:
+    """Recompute facts for every list in ``list_ids``, in one pass.
+
+    Args:
+        list_ids: the lists to recompute. Ids of lists that no longer exist
+            are skipped.
+        update: write the recomputed caches and clear the dirty flags, as
+            ``facts_from_db(update=True)`` does.
+        rebuild: re-price every assignment and fighter, ignoring dirty flags.
+
+    Returns:
+        ``{list_id: ListFacts}`` with the raw (unclamped) sums.
+    """
+    list_ids = list(list_ids)
+    if not list_ids:
+        return {}
+
+    fighters = _fighter_rows(list_ids, rebuild)
+    to_rebuild = {pk: row for pk, row in fighters.items() if rebuild or row["dirty"]}
+    # A zero-cost fighter's kit is never visited by the per-row path —
+    # except by a rebuild, which re-prices it all.
+    priced = {pk for pk, row in to_rebuild.items() if rebuild or not _zero_cost(row)}
+
+    repriced = _repriced_assignments(priced, rebuild)
+    equipment = {} if rebuild else _clean_equipment_totals(priced)
+    for assignment in repriced.values():
+        fighter_id = assignment.list_fighter_id
+        equipment[fighter_id] = equipment.get(fighter_id, 0) + assignment.rating_current
+
+    ratings = {
+        pk: _fighter_rating(row, equipment.get(pk, 0))
+        if pk in to_rebuild
+        else row["rating_current"]
+        for pk, row in fighters.items()
+    }
+
+    # Archived fighters are re-priced by a rebuild but never counted.
+    totals = {}
+    for pk, row in fighters.items():
+        if row["archived"]:
+            continue
+        rating, stash = totals.get(row["list_id"], (0, 0))
+        if row["content_fighter__is_stash"]:
+            stash += ratings[pk]
+        else:
+            rating += ratings[pk]
+        totals[row["list_id"]] = (rating, stash)
+
+    facts = {}
+    written = []
+    for lst in List.objects.filter(pk__in=list_ids).only("id", "credits_current"):
+        rating, stash = totals.get(lst.pk, (0, 0))
+        facts[lst.pk] = ListFacts(
+            rating=rating, stash=stash, credits=lst.credits_current
+        )
+        if update and stash < 0:
+            track(
+                "list_stash_clamped_to_zero",
+                list_id=str(lst.pk),
+                raw_stash=stash,
+            )
+        # Clamped as facts_from_db clamps: the fields are positive-only.
+        lst.rating_current = max(0, rating)
+        lst.stash_current = max(0, stash)
+        lst.dirty = False
+        written.append(lst)
+
+    if update:
+        ListFighterEquipmentAssignment.objects.bulk_update(
+            repriced.values(),
+            ["rating_current", "dirty"],
+            batch_size=BULK_UPDATE_BATCH_SIZE,
+        )
+        ListFighter.objects.bulk_update(
+            [
+                ListFighter(pk=pk, rating_current=ratings[pk], dirty=False)
+                for pk in to_rebuild
+            ],
+            ["rating_current", "dirty"],
+            batch_size=BULK_UPDATE_BATCH_SIZE,
+        )
+        List.objects.bulk_update(
+            written,
+            ["rating_current", "stash_current", "dirty"],
+            batch_size=BULK_UPDATE_BATCH_SIZE,
+        )
+
+    return facts
+
+
+@traced("reprice_dirty_assignments")
+def reprice_dirty_assignments(fighter_ids) -> dict:
+    """Re-price and write the dirty assignments under ``fighter_ids``.
+
+    The assignment half of the recompute on its own, for writers that create
+    assignments in bulk and must leave them priced the way
+    ``ListFighterEquipmentAssignment.facts_from_db`` would: pack-aware, with
+    ``dirty`` cleared. Returns ``{pk: assignment}``.
+    """
+    repriced = _repriced_assignments(list(fighter_ids), rebuild=False)
+    ListFighterEquipmentAssignment.objects.bulk_update(
+        repriced.values(),
+        ["rating_current", "dirty"],
+        batch_size=BULK_UPDATE_BATCH_SIZE,
+    )
+    return repriced
+
+
+def _fighter_rows(list_ids, rebuild):
+    """Every fighter the recompute reads, as plain rows keyed by pk.
+
+    The default manager's annotations join ``source_assignment``; keying by
+    pk folds any row that join repeats.
+    """
+    qs = ListFighter.objects.filter(list_id__in=list_ids)
+    if not rebuild:
+        qs = qs.filter(archived=False)
+    rows = qs.annotate(
+        house_cost_override=ListFighter.objects.sq_house_cost_override(),
+        advancement_cost=Coalesce(
+            ListFighter.objects.sq_advancement_cost_sum(), Value(0)
+        ),
+        roll_result_cost=Coalesce(
+            ListFighter.objects.sq_roll_result_cost_sum(), Value(0)
+        ),
+        is_child=Exists(
+            ListFighterEquipmentAssignment.objects.filter(child_fighter=OuterRef("pk"))
+        ),
+        is_captured_or_sold=Exists(
+            CapturedFighter.objects.filter(fighter=OuterRef("pk"))
+        ),
+    ).values(
+        "id",
+        "list_id",
+        "archived",
+        "dirty",
+        "rating_current",
+        "injury_state",
+        "cost_override",
+        "content_fighter__base_cost",
+        "content_fighter__is_stash",
+        "house_cost_override",
+        "advancement_cost",
+        "roll_result_cost",
+        "is_child",
+        "is_captured_or_sold",
+    )
+    return {row["id"]: row for row in rows}
+
+
+def _zero_cost(row):
+    """``ListFighter.should_have_zero_cost``, read off a fighter row."""
+    return row["is_captured_or_sold"] or row["injury_state"] == ListFighter.DEAD
+
+
+def _fighter_rating(row, equipment_cost):
+    """``ListFighter.facts_from_db``'s rating, from a fighter row."""
+    if _zero_cost(row):
+        return 0
+    return (
+        _base_cost(row)
+        + row["advancement_cost"]
+        + row["roll_result_cost"]
+        + equipment_cost
+    )
+
+
+def _base_cost(row):
+    """``ListFighter._base_cost_int``, from a fighter row."""
+    if row["cost_override"] is not None:
+        return row["cost_override"]
+    if row["is_child"]:
+        return 0
+    if row["house_cost_override"]:
+        return row["house_cost_override"]["cost"]
+    return row["content_fighter__base_cost"]
+
+
+def _repriced_assignments(fighter_ids, rebuild):
+    """Re-price the assignments whose cached rating cannot be trusted.
+
+    Returns ``{pk: assignment}`` with ``rating_current`` and ``dirty`` set on
+    each instance, ready for the bulk write. Default-kit virtual assignments
+    are free by membership and have no row to price.
+    """
+    if not fighter_ids:
+        return {}
+    qs = ListFighterEquipmentAssignment.objects.with_related_data().filter(
+        list_fighter_id__in=fighter_ids
+    )
+    if not rebuild:
+        qs = qs.filter(dirty=True)
+    repriced = {}
+    for assignment in qs:
+        assignment.rating_current = assignment.cost_int()
+        assignment.dirty = False
+        repriced[assignment.pk] = assignment
+    return repriced
+
+
+def _clean_equipment_totals(fighter_ids):
+    """``{fighter_id: Σ cached rating}`` over the clean assignments."""
+    if not fighter_ids:
+        return {}
+    rows = (
+        ListFighterEquipmentAssignment.objects.filter(
+            list_fighter_id__in=fighter_ids, dirty=False
+        )
+        .values("list_fighter_id")
+        .annotate(total=Sum("rating_current"))
+        .values_list("list_fighter_id", "total")
+    )
+    return {fighter_id: total or 0 for fighter_id, total in rows}
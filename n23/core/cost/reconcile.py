@@ -22,6 +22,7 @@ from dataclasses import dataclass
 
 from django.db import transaction
 
+from n23.core.cost.recompute import recompute_list_facts
 from n23.core.models.action import ListAction, ListActionType
 from n23.core.models.list import (
     List,
@@ -89,69 +90,101 @@ def reconcile_list(lst, user=None, rebuild_fighters=True) -> ReconcileResult:
                 fighter.facts_from_db(update=True)
 
         facts = fresh.facts_from_db(update=True)
+        return _record(fresh, rating_before, stash_before, facts, user)
 
-        # facts_from_db RETURNS raw sums but WRITES zero-clamped values to
-        # the caches (the fields are positive-only). The ledger must book
-        # what was written — booking the raw negative would end the chain at
-        # a value the cache can never hold, minting a head desync on exactly
-        # the drifted population this tool exists to clean. A fired clamp is
-        # flagged on the result (§4.8.2).
-        rating_written = fresh.rating_current
-        stash_written = fresh.stash_current
-        clamped = facts.rating != rating_written or facts.stash != stash_written
-
-        # The action chains off the LEDGER HEAD, not the cached values —
-        # drift is by definition an un-audited cache mutation, so the chain's
-        # last "after" is the only continuous baseline (family 3 checks each
-        # action's before against the previous action's after, pairwise). The
-        # recorded delta is therefore the accumulated un-audited movement the
-        # ledger is absorbing.
-        action = None
-        head = fresh.latest_action
-        if head is not None:
-            head_rating = head.rating_before + head.rating_delta
-            head_stash = head.stash_before + head.stash_delta
-            head_credits = head.credits_before + head.credits_delta
-            rating_delta = rating_written - head_rating
-            stash_delta = stash_written - head_stash
-            if rating_delta or stash_delta:
-                parts = []
-                if rating_delta:
-                    parts.append(
-                        f"rating {format_cost_display(rating_delta, show_sign=True)}"
-                    )
-                if stash_delta:
-                    parts.append(
-                        f"stash {format_cost_display(stash_delta, show_sign=True)}"
-                    )
-                # facts_from_db already wrote the absolute values; the record
-                # is a pure audit entry (create_action never applies deltas).
-                action = fresh.create_action(
-                    user=user,
-                    action_type=ListActionType.RECONCILE,
-                    description=(
-                        "Reconciled cached values to computed ("
-                        + ", ".join(parts)
-                        + ")"
-                    ),
-                    rating_before=head_rating,
-                    stash_before=head_stash,
-                    # Credits chain off the head too — defaulting to the
-                    # cached value would mint a NEW chain break at this very
-                    # link on lists whose credits chain is already broken.
-                    credits_before=head_credits,
-                    rating_delta=rating_delta,
-                    stash_delta=stash_delta,
-                    credits_delta=0,
-                )
 
-        return ReconcileResult(
-            list_id=fresh.pk,
-            rating_before=rating_before,
-            stash_before=stash_before,
-            rating_after=rating_written,
-            stash_after=stash_written,
-            action=action,
-            tracked=head is not None,
-            clamped=clamped,
+def reconcile_lists(list_ids, user=None) -> list[ReconcileResult]:
+    """True up many lists' cache chains at once, recording any movement.
+
+    ``reconcile_list`` with ``rebuild_fighters``, for a batch: the whole
+    batch is locked, rebuilt by the set-based recompute in a fixed number of
+    queries, and recorded list by list. One transaction for the batch —
+    a failure leaves every list in it as it was, for a re-run to repair.
+    """
+    with transaction.atomic():
+        locked = list(
+            List.objects.select_for_update()
+            .filter(pk__in=list_ids)
+            .order_by("pk")
+            .with_latest_actions()
         )
+        before = {lst.pk: (lst.rating_current, lst.stash_current) for lst in locked}
+        recomputed = recompute_list_facts(list(before), rebuild=True)
+
+        results = []
+        for lst in locked:
+            facts = recomputed[lst.pk]
+            # Mirror what the recompute wrote, as facts_from_db would have.
+            lst.rating_current = max(0, facts.rating)
+            lst.stash_current = max(0, facts.stash)
+            lst.dirty = False
+            rating_before, stash_before = before[lst.pk]
+            results.append(_record(lst, rating_before, stash_before, facts, user))
+        return results
+
+
+def _record(fresh, rating_before, stash_before, facts, user) -> ReconcileResult:
+    """Book a recomputed list against its ledger head; say what moved."""
+    # facts_from_db RETURNS raw sums but WRITES zero-clamped values to
+    # the caches (the fields are positive-only). The ledger must book
+    # what was written — booking the raw negative would end the chain at
+    # a value the cache can never hold, minting a head desync on exactly
+    # the drifted population this tool exists to clean. A fired clamp is
+    # flagged on the result (§4.8.2).
+    rating_written = fresh.rating_current
+    stash_written = fresh.stash_current
+    clamped = facts.rating != rating_written or facts.stash != stash_written
+
+    # The action chains off the LEDGER HEAD, not the cached values —
+    # drift is by definition an un-audited cache mutation, so the chain's
+    # last "after" is the only continuous baseline (family 3 checks each
+    # action's before against the previous action's after, pairwise). The
+    # recorded delta is therefore the accumulated un-audited movement the
+    # ledger is absorbing.
+    action = None
+    head = fresh.latest_action
+    if head is not None:
+        head_rating = head.rating_before + head.rating_delta
+        head_stash = head.stash_before + head.stash_delta
+        head_credits = head.credits_before + head.credits_delta
+        rating_delta = rating_written - head_rating
+        stash_delta = stash_written - head_stash
+        if rating_delta or stash_delta:
+            parts = []
+            if rating_delta:
+                parts.append(
+                    f"rating {format_cost_display(rating_delta, show_sign=True)}"
+                )
+            if stash_delta:
+                parts.append(
+                    f"stash {format_cost_display(stash_delta, show_sign=True)}"
+                )
+            # facts_from_db already wrote the absolute values; the record
+            # is a pure audit entry (create_action never applies deltas).
+            action = fresh.create_action(
+                user=user,
+                action_type=ListActionType.RECONCILE,
+                description=(
+                    "Reconciled cached values to computed (" + ", ".join(parts) + ")"
+                ),
+                rating_before=head_rating,
+                stash_before=head_stash,
+                # Credits chain off the head too — defaulting to the
+                # cached value would mint a NEW chain break at this very
+                # link on lists whose credits chain is already broken.
+                credits_before=head_credits,
+                rating_delta=rating_delta,
+                stash_delta=stash_delta,
+                credits_delta=0,
+            )
+
+    return ReconcileResult(
+        list_id=fresh.pk,
+        rating_before=rating_before,
+        stash_before=stash_before,
+        rating_after=rating_written,
+        stash_after=stash_written,
+        action=action,
+        tracked=head is not None,
+        clamped=clamped,
+    )
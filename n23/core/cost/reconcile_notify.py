@@ -27,7 +27,11 @@ from collections import defaultdict
 from django.urls import reverse
 from django.utils.html import format_html, format_html_join
 
-from gyrinx.site.models import Notification, NotificationType
+from gyrinx.site.models import (
+    Notification,
+    NotificationType,
+    forget_unread_counts,
+)
 from n23.core.models.list import List
 from n23.models import format_cost_display
 
@@ -200,6 +204,7 @@ def notify_lists_reconciled(deltas, *, sender=None, batch_size=500):
             Notification.objects.bulk_create(
                 notifs[i : i + batch_size], batch_size=batch_size
             )
+        forget_unread_counts(n.owner_id for n in notifs)
         return (len(by_owner), len(by_arb))
     except Exception:
         logger.exception("notify_lists_reconciled failed for %s lists", len(list_ids))
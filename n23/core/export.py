@@ -0,0 +1,29 @@
+"""Lists as a streaming export (see :mod:`gyrinx.export`).
+
+One row per list, with its cached totals: a player's own lists, or every gang
+in a campaign. The totals are the cached facts as they stand — an export does
+not resolve a list's cost, or a campaign of twenty gangs would take as long to
+export as to view twenty times.
+"""
+
+from gyrinx.export import Export
+
+LISTS = Export(
+    "lists",
+    (
+        ("id", "pk"),
+        ("name", "name"),
+        ("house", "content_house__name"),
+        ("owner", "owner__username"),
+        ("status", "status"),
+        ("campaign_id", "campaign_id"),
+        ("campaign", "campaign__name"),
+        ("rating", "rating_current"),
+        ("stash", "stash_current"),
+        ("credits", "credits_current"),
+        ("public", "public"),
+        ("archived", "archived"),
+        ("created", "created"),
+        ("modified", "modified"),
+    ),
+)
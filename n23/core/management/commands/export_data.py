@@ -0,0 +1,110 @@
+"""Write a large table out as CSV or NDJSON, in constant memory.
+
+For the tables too big to download in one sitting — the analytics events,
+above all — and for the Streamlit tooling, which reads the events export
+rather than a dump restore. Rows are read in keyset pages and written as they
+arrive (see ``gyrinx.export``). The last id written goes to stderr; pass it
+back as ``--after`` to resume an interrupted export where it stopped.
+"""
+
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from gyrinx.analytics.export import EVENTS
+from gyrinx.analytics.models import Event
+from gyrinx.export import ENCODERS
+from n23.core.export import LISTS
+from n23.core.models.campaign import Campaign
+from n23.core.models.list import List
+
+
+class Command(BaseCommand):
+    help = "Stream analytics events, a user's lists or a campaign's gangs to CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=["events", "lists", "campaign"])
+        parser.add_argument("--format", choices=sorted(ENCODERS), default="csv")
+        parser.add_argument("--output", help="File to write (default: stdout)")
+        parser.add_argument(
+            "--after", help="Resume after this id, as reported by an earlier run"
+        )
+        parser.add_argument("--since", help="events: only those created from this date")
+        parser.add_argument("--username", help="lists: only this user's lists")
+        parser.add_argument("--campaign", help="campaign: the campaign's id")
+
+    def handle(self, *args, **options):
+        if options["after"]:
+            # A cursor is only ever a row's id, as the web export insists.
+            try:
+                options["after"] = uuid.UUID(options["after"])
+            except ValueError:
+                raise CommandError(
+                    f"--after must be a row id, not {options['after']!r}"
+                ) from None
+        export, queryset = self._source(options)
+        written = {"rows": 0, "last": None}
+
+        def counted(rows):
+            for row in rows:
+                written["rows"] += 1
+                written["last"] = row[0]
+                yield row
+
+        encode = ENCODERS[options["format"]]
+        lines = encode(
+            export.headings, counted(export.rows(queryset, after=options["after"]))
+        )
+        if options["output"]:
+            # Appending on a resume, so the file ends up whole.
+            mode = "a" if options["after"] else "w"
+            if options["after"] and options["format"] == "csv":
+                next(lines)  # the file has its heading already
+            with open(options["output"], mode, newline="") as out:
+                for line in lines:
+                    out.write(line)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
+
+        self.stderr.write(
+            self.style.SUCCESS(f"Wrote {written['rows']} {export.name} row(s).")
+        )
+        if written["last"] is not None:
+            self.stderr.write(f"Last id: {written['last']} (resume with --after)")
+
+    def _source(self, options):
+        kind = options["kind"]
+        if kind == "events":
+            queryset = Event.objects.all()
+            if options["since"]:
+                try:
+                    since = parse_date(options["since"])
+                except ValueError:
+                    since = None
+                if since is None:
+                    raise CommandError(
+                        f"--since must be a date (YYYY-MM-DD), not {options['since']!r}"
+                    )
+                queryset = queryset.filter(created__date__gte=since)
+            return EVENTS, queryset
+        if kind == "lists":
+            queryset = List.objects.all()
+            if options["username"]:
+                try:
+                    user = get_user_model().objects.get(username=options["username"])
+                except get_user_model().DoesNotExist:
+                    raise CommandError(f"No user {options['username']!r}") from None
+                queryset = queryset.filter(owner=user)
+            return LISTS, queryset
+        if not options["campaign"]:
+            raise CommandError("campaign needs --campaign")
+        # An id that is not a UUID fails validation rather than the lookup.
+        try:
+            campaign = Campaign.objects.get(pk=options["campaign"])
+        except ObjectDoesNotExist, ValidationError:
+            raise CommandError(f"No campaign {options['campaign']!r}") from None
+        return LISTS, campaign.lists.all()
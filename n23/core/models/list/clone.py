@@ -0,0 +1,492 @@
+"""Bulk cloning of list-fighters and their equipment.
+
+``ListFighter.clone`` used to copy one fighter at a time: a create, a ``.set()``
+per M2M relation, an ``.exists()`` per disabled default, and a create — plus a
+pack-aware re-price — for every assignment, component row, equipment set,
+psyker power, advancement, roll result, counter and stat override. Starting a
+campaign paid that for every fighter of every gang.
+
+`bulk_clone_fighters` copies a batch of fighters in a fixed number of queries:
+one read per related table, one ``bulk_create`` per table keyed on old→new id
+maps, then one pass re-pricing the new assignments with the same
+``cost_int()`` the per-row clone priced them with.
+
+Two things still need the per-row path, because they happen in ``post_save``
+handlers that ``bulk_create`` does not fire:
+
+- a clone whose content fighter has child-spawning default assignments
+  (``create_linked_objects`` materialises them when the fighter is saved);
+- gear whose equipment spawns a child fighter or linked equipment
+  (``create_related_objects``), which the clone must re-spawn and then copy
+  the child's attributes onto.
+
+Fighters touching either are cloned by ``ListFighter._clone_row`` as before;
+everything else takes the bulk path. Both produce the same rows.
+"""
+
+from django.db.models import Q
+from django.utils import timezone
+from simple_history.utils import bulk_create_with_history
+
+from gyrinx.tracing import traced
+from n23.content.models import (
+    ContentEquipmentEquipmentProfile,
+    ContentEquipmentFighterProfile,
+    ContentFighterDefaultAssignment,
+)
+from n23.core.models.list.advancement import ListFighterAdvancement
+from n23.core.models.list.assignment import (
+    ListFighterEquipmentAssignment,
+    ListFighterEquipmentAssignmentAccessory,
+    ListFighterEquipmentAssignmentProfile,
+    ListFighterEquipmentAssignmentUpgrade,
+)
+from n23.core.models.list.campaign_state import (
+    ListFighterCounter,
+    ListFighterStatOverride,
+)
+from n23.core.models.list.equipment_set import ListFighterEquipmentSet
+from n23.core.models.list.fighter import ListFighter
+from n23.core.models.list.list import List
+from n23.core.models.list.psyker import ListFighterPsykerPowerAssignment
+from n23.core.models.list.roll_result import ListFighterRollResult
+
+pylist = list
+
+#: M2M relations copied row for row. ``disabled_default_assignments`` is not
+#: here: which defaults stay disabled depends on the cloned gear.
+COPIED_M2M_FIELDS = (
+    "skills",
+    "disabled_skills",
+    "disabled_rules",
+    "custom_rules",
+    "disabled_pskyer_default_powers",
+)
+
+
+@traced("bulk_clone_fighters")
+def bulk_clone_fighters(fighters, **kwargs) -> dict:
+    """Clone every fighter in ``fighters``, as ``fighter.clone(**kwargs)`` would.
+
+    Args:
+        fighters: the source fighters. Each is cloned once.
+        **kwargs: field values for every clone, as for ``ListFighter.clone``
+            (typically ``list=``).
+
+    Returns:
+        ``{source_pk: clone}``. Clones are born dirty with a zero cached
+        rating, exactly as ``ListFighter.clone`` leaves them; their
+        assignments are priced.
+    """
+    sources = {fighter.pk: fighter for fighter in fighters}
+    if not sources:
+        return {}
+
+    assignments = _direct_assignments(sources)
+    per_row = _needs_signals(sources, assignments, kwargs)
+
+    clones = {
+        pk: source._clone_row(**kwargs)
+        for pk, source in sources.items()
+        if pk in per_row
+    }
+    bulk = {pk: source for pk, source in sources.items() if pk not in per_row}
+    if not bulk:
+        return clones
+
+    new_fighters = {}
+    for pk, source in bulk.items():
+        values = source._clone_values(**kwargs)
+        new_fighters[pk] = ListFighter(owner=values["list"].owner, **values)
+    ListFighter.bulk_create_with_history(pylist(new_fighters.values()))
+
+    # Gear auto-created from equipment-equipment links is re-spawned by its
+    # parent's clone, never copied.
+    assignment_map = _clone_assignments(
+        [
+            (assignment, new_fighters[assignment.list_fighter_id])
+            for assignment in assignments
+            if assignment.list_fighter_id in bulk
+            and assignment.linked_equipment_parent_id is None
+        ],
+        preserve_from_default_assignment=True,
+    )
+
+    _copy_m2m(bulk, new_fighters)
+    _copy_disabled_defaults(bulk, new_fighters, assignments, assignment_map)
+    _copy_equipment_sets(bulk, new_fighters, assignment_map)
+    _copy_fighter_rows(bulk, new_fighters)
+
+    # The per-row create touches the list through the fighter's post_save.
+    List.objects.filter(
+        pk__in={fighter.list_id for fighter in new_fighters.values()}
+    ).update(modified=timezone.now())
+
+    _price([fighter.pk for fighter in new_fighters.values()])
+
+    clones.update(new_fighters)
+    return clones
+
+
+@traced("bulk_clone_assignments")
+def bulk_clone_assignments(
+    assignments, list_fighter, preserve_from_default_assignment=False
+) -> pylist:
+    """Clone ``assignments`` onto ``list_fighter``, as ``assignment.clone`` would.
+
+    Gear whose equipment spawns child objects is cloned per row. Returns the
+    clones, priced.
+    """
+    assignments = pylist(
+        ListFighterEquipmentAssignment.objects.filter(
+            pk__in=[assignment.pk for assignment in assignments]
+        ).prefetch_related("profile_rows", "accessory_rows", "upgrade_rows")
+    )
+    spawning = _spawning_equipment_ids(
+        {assignment.content_equipment_id for assignment in assignments}
+    )
+
+    clones = [
+        assignment.clone(
+            list_fighter=list_fighter,
+            preserve_from_default_assignment=preserve_from_default_assignment,
+        )
+        for assignment in assignments
+        if assignment.content_equipment_id in spawning
+    ]
+    assignment_map = _clone_assignments(
+        [
+            (assignment, list_fighter)
+            for assignment in assignments
+            if assignment.content_equipment_id not in spawning
+        ],
+        preserve_from_default_assignment=preserve_from_default_assignment,
+    )
+    if assignment_map:
+        repriced = _price([list_fighter.pk])
+        for clone in assignment_map.values():
+            clone.rating_current = repriced[clone.pk].rating_current
+            clone.dirty = False
+    return clones + pylist(assignment_map.values())
+
+
+def _direct_assignments(sources):
+    """Every direct assignment of ``sources``, with its component rows."""
+    return pylist(
+        ListFighterEquipmentAssignment.objects.filter(
+            list_fighter_id__in=pylist(sources)
+        ).prefetch_related("profile_rows", "accessory_rows", "upgrade_rows")
+    )
+
+
+def _spawning_equipment_ids(equipment_ids):
+    """The equipment in ``equipment_ids`` that spawns a child fighter or gear."""
+    if not equipment_ids:
+        return set()
+    return set(
+        ContentEquipmentFighterProfile.objects.filter(
+            equipment_id__in=equipment_ids
+        ).values_list("equipment_id", flat=True)
+    ) | set(
+        ContentEquipmentEquipmentProfile.objects.filter(
+            equipment_id__in=equipment_ids
+        ).values_list("equipment_id", flat=True)
+    )
+
+
+def _needs_signals(sources, assignments, kwargs):
+    """The source pks whose clone depends on a ``post_save`` handler."""
+    content_fighter_ids = {
+        pk: kwargs["content_fighter"].pk
+        if "content_fighter" in kwargs
+        else source.content_fighter_id
+        for pk, source in sources.items()
+    }
+    # Same filter as _materialise_child_fighter_defaults, pack rows included:
+    # erring towards the per-row path is always safe.
+    materialising = set(
+        ContentFighterDefaultAssignment.objects.all_content()
+        .filter(fighter_id__in=set(content_fighter_ids.values()))
+        .exclude(
+            Q(equipment__contentequipmentfighterprofile__isnull=True)
+            & Q(equipment__contentequipmentequipmentprofile__isnull=True)
+        )
+        .values_list("fighter_id", flat=True)
+    )
+    spawning = _spawning_equipment_ids(
+        {assignment.content_equipment_id for assignment in assignments}
+    )
+
+    per_row = {
+        pk
+        for pk, content_fighter_id in content_fighter_ids.items()
+        if content_fighter_id in materialising
+    }
+    per_row.update(
+        assignment.list_fighter_id
+        for assignment in assignments
+        if assignment.linked_equipment_parent_id is None
+        and assignment.content_equipment_id in spawning
+    )
+    return per_row
+
+
+def _clone_assignments(pairs, preserve_from_default_assignment):
+    """Bulk-create a clone of each ``(assignment, target_fighter)`` pair.
+
+    Copies what ``ListFighterEquipmentAssignment.clone`` copies: the base pin,
+    the overrides, and every component through row with its pin. Component
+    rows are written by pk, like the per-row ``.add()``, so pack-scoped
+    components travel too. Returns ``{old_pk: clone}``, unpriced.
+    """
+    clones = {}
+    for assignment, list_fighter in pairs:
+        clones[assignment.pk] = ListFighterEquipmentAssignment(
+            list_fighter=list_fighter,
+            content_equipment_id=assignment.content_equipment_id,
+            pinned_base_amount=assignment.pinned_base_amount,
+            pinned_base_state=assignment.pinned_base_state,
+            pinned_equipment_list_item_id=assignment.pinned_equipment_list_item_id,
+            pinned_expansion_item_id=assignment.pinned_expansion_item_id,
+            from_default_assignment_id=assignment.from_default_assignment_id
+            if preserve_from_default_assignment
+            else None,
+            cost_override=assignment.cost_override,
+            total_cost_override=assignment.total_cost_override,
+        )
+    if not clones:
+        return clones
+    ListFighterEquipmentAssignment.bulk_create_with_history(pylist(clones.values()))
+
+    profiles, accessories, upgrades = [], [], []
+    for assignment, _ in pairs:
+        clone_id = clones[assignment.pk].pk
+        for row in assignment.profile_rows.all():
+            profiles.append(
+                ListFighterEquipmentAssignmentProfile(
+                    listfighterequipmentassignment_id=clone_id,
+                    contentweaponprofile_id=row.contentweaponprofile_id,
+                    pinned_amount=row.pinned_amount,
+                    pin_state=row.pin_state,
+                    pinned_equipment_list_item_id=row.pinned_equipment_list_item_id,
+                    pinned_expansion_item_id=row.pinned_expansion_item_id,
+                )
+            )
+        for row in assignment.accessory_rows.all():
+            accessories.append(
+                ListFighterEquipmentAssignmentAccessory(
+                    listfighterequipmentassignment_id=clone_id,
+                    contentweaponaccessory_id=row.contentweaponaccessory_id,
+                    pinned_amount=row.pinned_amount,
+                    pin_state=row.pin_state,
+                    pinned_equipment_list_accessory_id=row.pinned_equipment_list_accessory_id,
+                )
+            )
+        for row in assignment.upgrade_rows.all():
+            upgrades.append(
+                ListFighterEquipmentAssignmentUpgrade(
+                    listfighterequipmentassignment_id=clone_id,
+                    contentequipmentupgrade_id=row.contentequipmentupgrade_id,
+                    pinned_amount=row.pinned_amount,
+                    pin_state=row.pin_state,
+                    pinned_equipment_list_upgrade_id=row.pinned_equipment_list_upgrade_id,
+                )
+            )
+    # Through rows are added without history, as M2M .add() adds them.
+    ListFighterEquipmentAssignmentProfile.objects.bulk_create(profiles)
+    ListFighterEquipmentAssignmentAccessory.objects.bulk_create(accessories)
+    ListFighterEquipmentAssignmentUpgrade.objects.bulk_create(upgrades)
+    return clones
+
+
+def _through(field_name):
+    """``(through_model, source_column, target_column)`` for a ListFighter M2M."""
+    field = ListFighter._meta.get_field(field_name)
+    return (
+        field.remote_field.through,
+        field.m2m_field_name(),
+        field.m2m_reverse_field_name(),
+    )
+
+
+def _copy_m2m(sources, new_fighters):
+    for field_name in COPIED_M2M_FIELDS:
+        through, source, target = _through(field_name)
+        rows = through.objects.filter(
+            **{f"{source}_id__in": pylist(sources)}
+        ).values_list(f"{source}_id", f"{target}_id")
+        through.objects.bulk_create(
+            [
+                through(
+                    **{
+                        f"{source}_id": new_fighters[source_id].pk,
+                        f"{target}_id": target_id,
+                    }
+                )
+                for source_id, target_id in rows
+            ]
+        )
+
+
+def _copy_disabled_defaults(sources, new_fighters, assignments, assignment_map):
+    """Carry disabled defaults across, as ``_clone_row`` decides them.
+
+    A disabled default that was converted into a direct assignment is dropped,
+    and the default behind each cloned converted assignment is disabled on
+    the clone, so the two land on the same state.
+    """
+    converted = {
+        (a.list_fighter_id, a.content_equipment_id, a.from_default_assignment_id)
+        for a in assignments
+        if a.from_default_assignment_id is not None
+    }
+    through, source, target = _through("disabled_default_assignments")
+    rows = through.objects.filter(**{f"{source}_id__in": pylist(sources)}).values_list(
+        f"{source}_id", f"{target}_id", f"{target}__equipment_id"
+    )
+
+    disabled = {pk: set() for pk in sources}
+    for source_id, default_id, equipment_id in rows:
+        if (source_id, equipment_id, default_id) not in converted:
+            disabled[source_id].add(default_id)
+    source_of = {clone.pk: pk for pk, clone in new_fighters.items()}
+    for clone in assignment_map.values():
+        if clone.from_default_assignment_id is not None:
+            disabled[source_of[clone.list_fighter_id]].add(
+                clone.from_default_assignment_id
+            )
+
+    through.objects.bulk_create(
+        [
+            through(
+                **{
+                    f"{source}_id": new_fighters[source_id].pk,
+                    f"{target}_id": default_id,
+                }
+            )
+            for source_id, default_ids in disabled.items()
+            for default_id in default_ids
+        ]
+    )
+
+
+def _copy_equipment_sets(sources, new_fighters, assignment_map):
+    """Clone equipment sets (#1853), remapping membership onto the cloned gear."""
+    equipment_sets = pylist(
+        ListFighterEquipmentSet.objects.filter(list_fighter_id__in=pylist(sources))
+    )
+    if not equipment_sets:
+        return
+    set_map = {
+        equipment_set.pk: ListFighterEquipmentSet(
+            list_fighter=new_fighters[equipment_set.list_fighter_id],
+            name=equipment_set.name,
+            owner=new_fighters[equipment_set.list_fighter_id].owner,
+        )
+        for equipment_set in equipment_sets
+    }
+    ListFighterEquipmentSet.bulk_create_with_history(pylist(set_map.values()))
+
+    through = ListFighterEquipmentSet.assignments.through
+    members = through.objects.filter(
+        listfighterequipmentset_id__in=pylist(set_map)
+    ).values_list("listfighterequipmentset_id", "listfighterequipmentassignment_id")
+    through.objects.bulk_create(
+        [
+            through(
+                listfighterequipmentset_id=set_map[set_id].pk,
+                listfighterequipmentassignment_id=assignment_map[assignment_id].pk,
+            )
+            for set_id, assignment_id in members
+            if assignment_id in assignment_map
+        ]
+    )
+
+    # Preserve which card was active on the original fighter.
+    active = []
+    for pk, source in sources.items():
+        if source.active_equipment_set_id in set_map:
+            clone = new_fighters[pk]
+            clone.active_equipment_set = set_map[source.active_equipment_set_id]
+            active.append(clone)
+    ListFighter.objects.bulk_update(active, ["active_equipment_set"])
+
+
+def _copy_fighter_rows(sources, new_fighters):
+    """Psyker powers, advancements, roll results, counters and stat overrides."""
+    source_ids = pylist(sources)
+
+    bulk_create_with_history(
+        [
+            ListFighterPsykerPowerAssignment(
+                list_fighter=new_fighters[power.list_fighter_id],
+                psyker_power_id=power.psyker_power_id,
+            )
+            for power in ListFighterPsykerPowerAssignment.objects.filter(
+                list_fighter_id__in=source_ids
+            )
+        ],
+        ListFighterPsykerPowerAssignment,
+    )
+
+    # Advancements and roll results are copied whole, minus the campaign
+    # action that produced them on the original.
+    advancements = pylist(
+        ListFighterAdvancement.objects.filter(fighter_id__in=source_ids).select_related(
+            "owner"
+        )
+    )
+    for advancement in advancements:
+        advancement.pk = None
+        advancement._state.adding = True
+        advancement.fighter = new_fighters[advancement.fighter_id]
+        advancement.campaign_action = None
+    ListFighterAdvancement.bulk_create_with_history(advancements)
+
+    roll_results = pylist(
+        ListFighterRollResult.objects.filter(fighter_id__in=source_ids).select_related(
+            "owner"
+        )
+    )
+    for roll_result in roll_results:
+        roll_result.pk = None
+        roll_result._state.adding = True
+        roll_result.fighter = new_fighters[roll_result.fighter_id]
+        roll_result.campaign_action = None
+        # roll_token is unique per applied roll, and the clone was not
+        # produced by that roll.
+        roll_result.roll_token = None
+    ListFighterRollResult.bulk_create_with_history(roll_results)
+
+    ListFighterCounter.bulk_create_with_history(
+        [
+            ListFighterCounter(
+                fighter=new_fighters[counter.fighter_id],
+                counter_id=counter.counter_id,
+                value=counter.value,
+                owner=new_fighters[counter.fighter_id].owner,
+            )
+            for counter in ListFighterCounter.objects.filter(fighter_id__in=source_ids)
+        ]
+    )
+
+    ListFighterStatOverride.bulk_create_with_history(
+        [
+            ListFighterStatOverride(
+                list_fighter=new_fighters[override.list_fighter_id],
+                content_stat_id=override.content_stat_id,
+                value=override.value,
+                owner=new_fighters[override.list_fighter_id].owner,
+            )
+            for override in ListFighterStatOverride.objects.filter(
+                list_fighter_id__in=source_ids
+            )
+        ]
+    )
+
+
+def _price(fighter_ids):
+    """Price the cloned gear, as ``assignment.clone`` does row by row."""
+    from n23.core.cost.recompute import reprice_dirty_assignments
+
+    return reprice_dirty_assignments(fighter_ids)
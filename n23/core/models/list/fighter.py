@@ -20,12 +20,14 @@ from django.db.models import (
     When,
 )
 from django.db.models.functions import Coalesce, Concat, JSONObject
+from django.db.models.query import ModelIterable
 from django.utils.functional import cached_property
 from simple_history.models import HistoricalRecords
 
 from gyrinx.base_models import AppBase
 from gyrinx.models import QuerySetOf
 from gyrinx.tracing import traced
+from n23.content import catalogue
 from n23.content.models import (
     ContentEquipment,
     ContentEquipmentCategory,
@@ -309,6 +311,29 @@ class ListFighterQuerySet(models.QuerySet):
     Custom QuerySet for :model:`content.ListFighter`.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Set by with_related_data() when content fighters come from the
+        # content catalogue: the packs they are read through.
+        self._catalogue_packs = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._catalogue_packs = self._catalogue_packs
+        return clone
+
+    def _fetch_all(self):
+        if (
+            self._result_cache is None
+            and self._catalogue_packs is not None
+            and self._iterable_class is ModelIterable
+        ):
+            # Attached before the prefetches run, so none of them reach
+            # through a content fighter to the database.
+            self._result_cache = list(self._iterable_class(self))
+            catalogue.attach(self._result_cache, *self._catalogue_packs)
+        super()._fetch_all()
+
     def with_related_data(self, packs=None):
         """
         Optimize queries by selecting related content_fighter and list,
@@ -337,36 +362,35 @@ class ListFighterQuerySet(models.QuerySet):
             skill_prefetches = [
                 Prefetch("skills", queryset=skills_qs),
                 Prefetch("disabled_skills", queryset=skills_qs),
-                Prefetch("content_fighter__skills", queryset=skills_qs),
             ]
             rule_prefetches = [
                 Prefetch("disabled_rules", queryset=rules_qs),
                 Prefetch("custom_rules", queryset=rules_qs),
+            ]
+            content_skill_rule_prefetches = [
+                Prefetch("content_fighter__skills", queryset=skills_qs),
                 Prefetch("content_fighter__rules", queryset=rules_qs),
                 # Promoted fighters merge in the promoted type's rules (ruleline);
                 # prefetching keeps them on the query-free fast path.
                 Prefetch("promoted_content_fighter__rules", queryset=rules_qs),
             ]
         else:
-            skill_prefetches = [
-                "skills",
-                "disabled_skills",
+            skill_prefetches = ["skills", "disabled_skills"]
+            rule_prefetches = ["disabled_rules", "custom_rules"]
+            content_skill_rule_prefetches = [
                 "content_fighter__skills",
-            ]
-            rule_prefetches = [
-                "disabled_rules",
-                "custom_rules",
                 "content_fighter__rules",
                 "promoted_content_fighter__rules",
             ]
 
-        return (
-            self.prefetch_related(None)  # Clear inherited lookups to prevent
-            # doubling when called on a cached queryset (e.g. from
-            # with_fighter_data's Prefetch). Without this, Prefetch objects
-            # with custom querysets would appear twice and Django raises
-            # ValueError("lookup was already seen with a different queryset").
-            .select_related(
+        # Content fighters come from the process-wide catalogue when it is on
+        # (n23/content/catalogue.py): _fetch_all attaches them, already
+        # prefetched, so none of their lookups are made here.
+        if catalogue.enabled():
+            content_selects = []
+            content_prefetches = []
+        else:
+            content_selects = [
                 "content_fighter",
                 "content_fighter__house",
                 "content_fighter__custom_statline",
@@ -374,6 +398,59 @@ class ListFighterQuerySet(models.QuerySet):
                 "legacy_content_fighter__house",
                 "promoted_content_fighter",
                 "promoted_content_fighter__house",
+            ]
+            content_prefetches = [
+                *content_skill_rule_prefetches,
+                "content_fighter__counters",
+                "content_fighter__house",
+                "content_fighter__house__restricted_equipment_categories",
+                "content_fighter__house__restricted_equipment_categories__restricted_to",
+                Prefetch(
+                    "content_fighter__default_assignments__equipment__contentweaponprofile_set",
+                    queryset=ContentWeaponProfile.objects.all_content(),
+                ),
+                # Default-assignment M2Ms also need all_content() so that
+                # pack-scoped weapon profiles / accessories chosen on a
+                # ContentFighterDefaultAssignment aren't dropped by the
+                # default ContentManager when the fighter is hired.
+                Prefetch(
+                    "content_fighter__default_assignments__weapon_profiles_field",
+                    queryset=ContentWeaponProfile.objects.all_content(),
+                ),
+                Prefetch(
+                    "content_fighter__default_assignments__weapon_accessories_field",
+                    queryset=ContentWeaponAccessory.objects.all_content().prefetch_related(
+                        "modifiers"
+                    ),
+                ),
+                # Default-assignment equipment can carry injury links too, so
+                # a fighter template that grants a bionic doesn't drop to an
+                # N+1 when the card resolves treatments.
+                Prefetch(
+                    "content_fighter__default_assignments__equipment__injury_links",
+                    queryset=ContentEquipmentInjuryLink.objects.all_content(),
+                ),
+                # Prefetch equipment list items for cost override lookups
+                "content_fighter__contentfighterequipmentlistitem_set",
+                "legacy_content_fighter__contentfighterequipmentlistitem_set",
+                "promoted_content_fighter__contentfighterequipmentlistitem_set",
+            ]
+
+        qs = self
+        if catalogue.enabled():
+            # Wrapped, so that reading through no packs is told apart from
+            # not reading from the catalogue at all.
+            qs = self._chain()
+            qs._catalogue_packs = (packs,)
+
+        return (
+            qs.prefetch_related(None)  # Clear inherited lookups to prevent
+            # doubling when called on a cached queryset (e.g. from
+            # with_fighter_data's Prefetch). Without this, Prefetch objects
+            # with custom querysets would appear twice and Django raises
+            # ValueError("lookup was already seen with a different queryset").
+            .select_related(
+                *content_selects,
                 "capture_info",
                 "capture_info__capturing_list",
             )
@@ -435,39 +512,7 @@ class ListFighterQuerySet(models.QuerySet):
                 "listfighterequipmentassignment_set__profile_rows",
                 "listfighterequipmentassignment_set__accessory_rows",
                 "listfighterequipmentassignment_set__upgrade_rows",
-                "content_fighter__counters",
-                "content_fighter__house",
-                "content_fighter__house__restricted_equipment_categories",
-                "content_fighter__house__restricted_equipment_categories__restricted_to",
-                Prefetch(
-                    "content_fighter__default_assignments__equipment__contentweaponprofile_set",
-                    queryset=ContentWeaponProfile.objects.all_content(),
-                ),
-                # Default-assignment M2Ms also need all_content() so that
-                # pack-scoped weapon profiles / accessories chosen on a
-                # ContentFighterDefaultAssignment aren't dropped by the
-                # default ContentManager when the fighter is hired.
-                Prefetch(
-                    "content_fighter__default_assignments__weapon_profiles_field",
-                    queryset=ContentWeaponProfile.objects.all_content(),
-                ),
-                Prefetch(
-                    "content_fighter__default_assignments__weapon_accessories_field",
-                    queryset=ContentWeaponAccessory.objects.all_content().prefetch_related(
-                        "modifiers"
-                    ),
-                ),
-                # Default-assignment equipment can carry injury links too, so
-                # a fighter template that grants a bionic doesn't drop to an
-                # N+1 when the card resolves treatments.
-                Prefetch(
-                    "content_fighter__default_assignments__equipment__injury_links",
-                    queryset=ContentEquipmentInjuryLink.objects.all_content(),
-                ),
-                # Prefetch equipment list items for cost override lookups
-                "content_fighter__contentfighterequipmentlistitem_set",
-                "legacy_content_fighter__contentfighterequipmentlistitem_set",
-                "promoted_content_fighter__contentfighterequipmentlistitem_set",
+                *content_prefetches,
                 "source_assignment",
                 "source_assignment__list_fighter",
                 # Equipment sets (#1853): the fighter's cards and each card's
@@ -2883,11 +2928,19 @@ class ListFighter(AppBase):
 
     @traced("list_fighter_clone")
     def clone(self, **kwargs):
-        """Clone the fighter, creating a new fighter with the same equipment."""
-        from n23.core.models.list.campaign_state import ListFighterStatOverride
-        from n23.core.models.list.psyker import ListFighterPsykerPowerAssignment
+        """Clone the fighter, creating a new fighter with the same equipment.
 
-        values = {
+        Goes through the bulk clone engine (``n23.core.models.list.clone``),
+        which falls back to :meth:`_clone_row` when the clone depends on
+        child-spawning signals.
+        """
+        from n23.core.models.list.clone import bulk_clone_fighters
+
+        return bulk_clone_fighters([self], **kwargs)[self.pk]
+
+    def _clone_values(self, **kwargs):
+        """The field values a clone of this fighter is created with."""
+        return {
             "name": self.name,
             "content_fighter": self.content_fighter,
             "legacy_content_fighter": self.legacy_content_fighter,
@@ -2901,13 +2954,25 @@ class ListFighter(AppBase):
             "private_notes": self.private_notes,
             "list": self.list,
             "cost_override": self.cost_override,
-            # Stat overrides are cloned as ListFighterStatOverride rows below;
+            # Stat overrides are cloned as ListFighterStatOverride rows;
             # the 12 legacy `<stat>_override` columns are no longer read.
             "xp_current": self.xp_current,
             "xp_total": self.xp_total,
             **kwargs,
         }
 
+    @traced("list_fighter_clone_row")
+    def _clone_row(self, **kwargs):
+        """Clone the fighter row by row, letting ``post_save`` handlers run.
+
+        The path for fighters whose clone re-spawns child fighters or linked
+        equipment; everything else is cloned in bulk.
+        """
+        from n23.core.models.list.campaign_state import ListFighterStatOverride
+        from n23.core.models.list.psyker import ListFighterPsykerPowerAssignment
+
+        values = self._clone_values(**kwargs)
+
         clone = ListFighter.objects.create(
             owner=values["list"].owner,
             **values,
@@ -2920,19 +2985,17 @@ class ListFighter(AppBase):
         clone.custom_rules.set(self.custom_rules.all())
 
         # Don't clone disabled default assignments if they've been converted to direct assignments
-        disabled_defaults_to_clone = []
-        for disabled_default in self.disabled_default_assignments.all():
-            # Check if this disabled default has been converted to a direct assignment
-            has_direct_assignment = (
-                self._direct_assignments()
-                .filter(
-                    content_equipment=disabled_default.equipment,
-                    from_default_assignment=disabled_default,
-                )
-                .exists()
-            )
-            if not has_direct_assignment:
-                disabled_defaults_to_clone.append(disabled_default)
+        converted_defaults = set(
+            self._direct_assignments()
+            .filter(from_default_assignment__isnull=False)
+            .values_list("content_equipment_id", "from_default_assignment_id")
+        )
+        disabled_defaults_to_clone = [
+            disabled_default
+            for disabled_default in self.disabled_default_assignments.all()
+            if (disabled_default.equipment_id, disabled_default.pk)
+            not in converted_defaults
+        ]
 
         clone.disabled_default_assignments.set(disabled_defaults_to_clone)
         clone.disabled_pskyer_default_powers.set(
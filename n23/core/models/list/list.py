@@ -16,10 +16,12 @@ from django.db.models import (
 )
 from django.utils.functional import cached_property
 from simple_history.models import HistoricalRecords
+from simple_history.utils import bulk_create_with_history
 
 from gyrinx.base_models import AppBase
 from gyrinx.history_aware_manager import HistoryAwareManager
 from gyrinx.models import QuerySetOf
+from gyrinx.tasks import enqueue_coalesced
 from gyrinx.tracing import span, traced
 from gyrinx.tracker import track
 from n23.content.models import (
@@ -42,6 +44,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 pylist = list
 
+#: Seconds a pending facts refresh holds its list's claim before a further
+#: set_dirty may enqueue another. Only matters if the first was lost in transit.
+FACTS_REFRESH_COALESCE_WINDOW = 60
+
 
 ##
 ## Application Models
@@ -496,9 +502,19 @@ class List(AppBase):
                     transaction.on_commit(self._enqueue_facts_refresh)
 
     def _enqueue_facts_refresh(self) -> None:
-        """Fire-and-forget heal for a dirty list; never breaks the caller."""
+        """Fire-and-forget heal for a dirty list; never breaks the caller.
+
+        Coalesced per list: an edit session that dirties, heals and dirties
+        again within one pending delivery gets that one delivery, which
+        recomputes from whatever the list looks like when it runs.
+        """
         try:
-            refresh_list_facts.enqueue(list_id=str(self.pk))
+            enqueue_coalesced(
+                refresh_list_facts,
+                key=str(self.pk),
+                window=FACTS_REFRESH_COALESCE_WINDOW,
+                list_id=str(self.pk),
+            )
         except Exception as e:
             logger.warning(f"Failed to enqueue facts refresh for list {self.pk}: {e}")
             track("task_enqueue_failed", list_id=str(self.pk), error=str(e))
@@ -1402,10 +1418,17 @@ class List(AppBase):
         front and populate it later in a background task (issue #1222). :meth:`clone` still
         calls this, so the eager and deferred paths never diverge.
         """
+        from n23.core.cost.recompute import recompute_list_facts
+        from n23.core.models.list.assignment import ListFighterEquipmentAssignment
         from n23.core.models.list.campaign_state import (
             ListAttributeAssignment,
             ListSkillTreeAssignment,
         )
+        from n23.core.models.list.clone import (
+            bulk_clone_assignments,
+            bulk_clone_fighters,
+        )
+        from n23.core.models.list.fighter import ListFighter
 
         if owner is None:
             owner = self.owner
@@ -1420,37 +1443,53 @@ class List(AppBase):
         # Clone attributes first - this must happen before fighters so that
         # equipment cost calculations can use expansion costs from affiliations
         # See: https://github.com/gyrinx-app/gyrinx/issues/1333
-        for attribute_assignment in source.listattributeassignment_set.filter(
-            archived=False
-        ):
-            ListAttributeAssignment.objects.create(
-                list=self,
-                attribute_value=attribute_assignment.attribute_value,
-            )
+        bulk_create_with_history(
+            [
+                ListAttributeAssignment(
+                    list=self,
+                    attribute_value_id=attribute_assignment.attribute_value_id,
+                )
+                for attribute_assignment in source.listattributeassignment_set.filter(
+                    archived=False
+                )
+            ],
+            ListAttributeAssignment,
+        )
 
         # Clone gang-wide skill-tree picks
-        for skill_tree_assignment in source.listskilltreeassignment_set.filter(
-            archived=False
-        ):
-            ListSkillTreeAssignment.objects.create(
-                list=self,
-                slot=skill_tree_assignment.slot,
-                skill_category=skill_tree_assignment.skill_category,
-            )
-
-        with span("list_clone_fighters"):
-            # Clone fighters, but skip linked fighters and stash fighters
-            for fighter in source.fighters():
-                # Skip if this fighter is linked to an equipment assignment
-                is_linked = (
-                    hasattr(fighter, "source_assignment")
-                    and fighter.source_assignment.exists()
+        bulk_create_with_history(
+            [
+                ListSkillTreeAssignment(
+                    list=self,
+                    slot=skill_tree_assignment.slot,
+                    skill_category_id=skill_tree_assignment.skill_category_id,
+                )
+                for skill_tree_assignment in source.listskilltreeassignment_set.filter(
+                    archived=False
                 )
-                # Skip if this is a stash fighter
-                is_stash = fighter.content_fighter.is_stash
+            ],
+            ListSkillTreeAssignment,
+        )
 
-                if not is_linked and not is_stash:
-                    fighter.clone(list=self)
+        with span("list_clone_fighters"):
+            # Clone fighters, but skip linked fighters (their parent's gear
+            # re-spawns them) and the stash fighter (handled below)
+            linked_ids = set(
+                ListFighterEquipmentAssignment.objects.filter(
+                    child_fighter__list=source
+                ).values_list("child_fighter_id", flat=True)
+            )
+            bulk_clone_fighters(
+                [
+                    fighter
+                    for fighter in source.listfighter_set.filter(
+                        archived=False
+                    ).select_related("content_fighter", "list")
+                    if fighter.pk not in linked_ids
+                    and not fighter.content_fighter.is_stash
+                ],
+                list=self,
+            )
 
         # Clone stash fighter
         original_stash = source.listfighter_set.filter(
@@ -1462,11 +1501,10 @@ class List(AppBase):
             new_stash = self.ensure_stash(owner=owner)
             # Clone equipment from original stash if it existed
             if original_stash:
-                for assignment in original_stash._direct_assignments():
-                    assignment.clone(list_fighter=new_stash)
-                # Update stash fighter's rating after all equipment is cloned
-                # (assignment.clone only updates the assignment, not the fighter)
-                new_stash.facts_from_db(update=True)
+                bulk_clone_assignments(original_stash._direct_assignments(), new_stash)
+                # The stash's rating is settled with the rest below
+                # (cloning gear only prices the gear, not the fighter)
+                ListFighter.objects.filter(pk=new_stash.pk).update(dirty=True)
 
         track(
             "list_cloned",
@@ -1476,8 +1514,13 @@ class List(AppBase):
         )
 
         # Always recalculate cached values after cloning
-        # Cloning is not part of the action/propagation system - it needs explicit recalculation
-        self.facts_from_db(update=True)
+        # Cloning is not part of the action/propagation system - it needs explicit recalculation.
+        # Every clone is dirty, so recompute the list in one set-based pass
+        # rather than walking it fighter by fighter.
+        facts = recompute_list_facts([self.pk])[self.pk]
+        self.rating_current = max(0, facts.rating)
+        self.stash_current = max(0, facts.stash)
+        self.dirty = False
 
     class Meta:
         verbose_name = "List"
@@ -1,4 +1,6 @@
 import logging
+import time
+import uuid
 from collections import defaultdict
 
 from django.tasks import task
@@ -120,13 +122,14 @@ def refresh_list_facts(list_id: str):
     Enqueued (on commit) by List.set_dirty, so a list that goes dirty heals
     in the background instead of waiting to be viewed.
     """
-    from n23.core.models import List
+    from n23.core.cost.recompute import recompute_list_facts
 
-    try:
-        lst: List = List.objects.with_related_data(with_fighters=True).get(pk=list_id)
-        lst.facts_from_db(update=True)
+    # The set-based recompute heals the list in a fixed number of queries —
+    # the same numbers facts_from_db writes, without hydrating the list's
+    # whole render tree to get them.
+    if recompute_list_facts([list_id]):
         logger.info(f"Refreshed facts for list {list_id}")
-    except List.DoesNotExist:
+    else:
         logger.warning(f"List {list_id} not found for facts refresh")
 
 
@@ -352,7 +355,12 @@ def propagate_default_child_fighter_assignment(default_assignment_id: str):
 
 
 def _update_backfill(
-    backfill_id, summary_patch=None, status=None, error="", summary_extend=None
+    backfill_id,
+    summary_patch=None,
+    status=None,
+    error="",
+    summary_extend=None,
+    shard=None,
 ):
     """Merge progress into a Backfill audit record's summary.
 
@@ -366,6 +374,11 @@ def _update_backfill(
     practice: a redelivered batch re-reconciles already-corrected lists, which
     no longer move, so they contribute no new rows.
 
+    ``shard`` names one chain of a sharded run: ``summary_patch`` then lands in
+    that shard's entry under ``summary["shards"]``, the top-level counters are
+    re-summed across shards, and DONE is only written once every shard has
+    finished — until then a shard's DONE just marks the shard.
+
     Returns ``True`` only when this call actually transitions the record from a
     non-terminal state to DONE — i.e. the first, real completion. Callers use
     that to fire one-shot completion work (e.g. notifications) exactly once, so
@@ -406,6 +419,25 @@ def _update_backfill(
                 backfill.status,
             )
             return False
+        if shard is not None:
+            shards = backfill.summary.setdefault("shards", {})
+            entry = shards.get(shard, {})
+            if entry.get("done"):
+                # A redelivered fork of a shard that has already finished.
+                logger.warning(
+                    "Backfill %s shard %s already done; dropping write",
+                    backfill_id,
+                    shard,
+                )
+                return False
+            shard_done = status == Backfill.Status.DONE
+            shards[shard] = {**entry, **(summary_patch or {}), "done": shard_done}
+            summary_patch = {
+                key: sum(each.get(key, 0) for each in shards.values())
+                for key in SHARD_COUNTERS
+            }
+            if shard_done and not all(each.get("done") for each in shards.values()):
+                status = None
         if summary_patch:
             backfill.summary = {**backfill.summary, **summary_patch}
         if summary_extend:
@@ -419,6 +451,22 @@ def _update_backfill(
         return status == Backfill.Status.DONE and not was_terminal
 
 
+def _is_stopped(backfill_id):
+    """True once a sharded run has stopped being RUNNING.
+
+    A shard's siblings carry on after it fails unless they look; this is the
+    sharded chains' top-of-batch check, covering cancel and a sibling's
+    FAILED alike.
+    """
+    if backfill_id is None:
+        return False
+    from gyrinx.maintenance.models import Backfill
+
+    return not Backfill.objects.filter(
+        pk=backfill_id, status=Backfill.Status.RUNNING
+    ).exists()
+
+
 def _is_cancelled(backfill_id):
     """True if an operator has cancelled this run (records the stop request on
     the Backfill row). The self-re-enqueueing task chains check this at the top
@@ -433,6 +481,80 @@ def _is_cancelled(backfill_id):
     ).exists()
 
 
+#: The per-chain counters a sharded run sums into its record's top level.
+SHARD_COUNTERS = ("lists", "corrected", "clamped")
+
+#: Bounds on the adaptive batch size: small enough that one slow list cannot
+#: push a batch past its ack deadline, large enough to amortise the per-batch
+#: overhead (record write, re-enqueue, delivery).
+MIN_RECONCILE_BATCH = 5
+MAX_RECONCILE_BATCH = 500
+
+
+def _shard_bounds(shards):
+    """Split the list id space into ``shards`` equal ``(after_id, before_id)``
+    ranges, open at both ends.
+
+    List ids are random UUIDs, so equal slices of the 128-bit space hold equal
+    shares of the lists. ``after_id`` is exclusive (the chain's cursor filter is
+    ``id__gt``), so each range starts one below its boundary.
+    """
+    edges = [(1 << 128) * k // shards for k in range(1, shards)]
+    after = [None] + [str(uuid.UUID(int=edge - 1)) for edge in edges]
+    before = [str(uuid.UUID(int=edge)) for edge in edges] + [None]
+    return list(zip(after, before, strict=True))
+
+
+def _next_batch_size(batch_size, elapsed, batch_len, target_seconds):
+    """The batch size that should take ``target_seconds``, given how long this
+    batch took per list. Moves at most by a factor of two per batch, so one
+    outlier batch cannot swing the chain from one bound to the other."""
+    if not target_seconds or not batch_len or elapsed <= 0:
+        return batch_size
+    ideal = int(target_seconds / (elapsed / batch_len))
+    ideal = max(batch_size // 2, min(batch_size * 2, ideal))
+    return max(MIN_RECONCILE_BATCH, min(MAX_RECONCILE_BATCH, ideal))
+
+
+def _fan_out_reconcile(shards, **kwargs):
+    """Start one ``reconcile_all_lists`` chain per id range of a sharded run.
+
+    Every shard's entry is written before any chain is enqueued, so the run
+    cannot be marked DONE while a shard that has not started yet is missing
+    from the record. A redelivered fan-out finds them there and stops, rather
+    than forking every chain.
+    """
+    from gyrinx.maintenance.models import Backfill
+
+    backfill_id = kwargs["backfill_id"]
+    if Backfill.objects.filter(pk=backfill_id, summary__has_key="shards").exists():
+        logger.info("reconcile_all_lists: backfill %s already fanned out", backfill_id)
+        return
+    bounds = _shard_bounds(shards)
+    _update_backfill(
+        backfill_id,
+        {
+            "shards": {
+                str(k): {
+                    "cursor": None,
+                    "done": False,
+                    **dict.fromkeys(SHARD_COUNTERS, 0),
+                }
+                for k in range(shards)
+            }
+        },
+    )
+    for k, (after_id, before_id) in enumerate(bounds):
+        reconcile_all_lists.enqueue(
+            after_id=after_id,
+            before_id=before_id,
+            shards=shards,
+            shard=str(k),
+            **kwargs,
+        )
+    logger.info("reconcile_all_lists: fanned out into %s shards", shards)
+
+
 @task
 def reconcile_all_lists(
     after_id: str | None = None,
@@ -443,6 +565,10 @@ def reconcile_all_lists(
     lists_done: int = 0,
     corrected: int = 0,
     clamped: int = 0,
+    shards: int = 1,
+    shard: str | None = None,
+    before_id: str | None = None,
+    target_seconds: float | None = None,
 ):
     """Audited cache reconciliation across every list (#1826 §4.8.2).
 
@@ -460,11 +586,22 @@ def reconcile_all_lists(
     arbitrator exactly once (#721). Persisting it on the record (rather than
     threading it through the task payload) keeps the payload bounded and makes
     the run auditable while it's still in flight.
+
+    ``shards > 1`` splits a full run into that many chains over disjoint id
+    ranges (``after_id``, ``before_id``), which run concurrently on the task
+    runner. The first call only fans out; each chain then reports into its
+    own entry under the record's ``summary["shards"]``, and the last to finish
+    completes the run. A sharded chain stops at its next batch once the record
+    is no longer RUNNING, so cancel — and a sibling's failure — still stop the
+    whole run within one batch per shard.
+
+    ``target_seconds`` makes ``batch_size`` adaptive: each batch is timed and
+    the next is sized to take about that long at the observed per-list cost.
     """
     from django.contrib.auth import get_user_model
 
     from gyrinx.maintenance.models import Backfill
-    from n23.core.cost.reconcile import reconcile_list
+    from n23.core.cost.reconcile import reconcile_lists
     from n23.core.models.list import List
 
     user = None
@@ -479,19 +616,41 @@ def reconcile_all_lists(
         )
         return
 
+    if shards > 1 and shard is None and not list_id:
+        _fan_out_reconcile(
+            shards,
+            batch_size=batch_size,
+            backfill_id=backfill_id,
+            user_id=user_id,
+            target_seconds=target_seconds,
+        )
+        return
+    if shard is not None and _is_stopped(backfill_id):
+        logger.info(
+            "reconcile_all_lists: run stopped (backfill %s); shard %s stopping",
+            backfill_id,
+            shard,
+        )
+        return
+
+    started = time.monotonic()
     qs = List.objects.order_by("id")
     if list_id:
         # Incremental rollout: scope the whole run to one list.
         qs = qs.filter(pk=list_id)
     if after_id:
         qs = qs.filter(id__gt=after_id)
+    if before_id:
+        qs = qs.filter(id__lt=before_id)
     batch = list(qs.values_list("id", flat=True)[:batch_size])
 
     batch_moved = []  # per-list detail for the lists THIS batch actually moved
     try:
-        for batch_list_id in batch:
-            lst_obj = List.objects.get(pk=batch_list_id)
-            result = reconcile_list(lst_obj, user=user)
+        # The whole batch is rebuilt by the set-based recompute in a fixed
+        # number of queries, rather than a full fighter walk per list.
+        names = dict(List.objects.filter(pk__in=batch).values_list("id", "name"))
+        for result in reconcile_lists(batch, user=user):
+            batch_list_id = result.list_id
             lists_done += 1
             if result.moved or result.action:
                 corrected += 1
@@ -502,7 +661,7 @@ def reconcile_all_lists(
                 batch_moved.append(
                     {
                         "list_id": str(batch_list_id),
-                        "list_name": lst_obj.name,
+                        "list_name": names[batch_list_id],
                         "rating_before": result.rating_before,
                         "rating_after": result.rating_after,
                         "stash_before": result.stash_before,
@@ -532,6 +691,7 @@ def reconcile_all_lists(
             error=f"Failed in batch after cursor {after_id}: {e}. "
             "Fix the cause and re-trigger.",
             summary_extend={"per_list": batch_moved},
+            shard=shard,
         )
         return
 
@@ -543,17 +703,26 @@ def reconcile_all_lists(
     }
     if len(batch) == batch_size:
         _update_backfill(
-            backfill_id, progress, summary_extend={"per_list": batch_moved}
+            backfill_id,
+            progress,
+            summary_extend={"per_list": batch_moved},
+            shard=shard,
         )
         reconcile_all_lists.enqueue(
             after_id=str(batch[-1]),
-            batch_size=batch_size,
+            batch_size=_next_batch_size(
+                batch_size, time.monotonic() - started, len(batch), target_seconds
+            ),
             backfill_id=backfill_id,
             user_id=user_id,
             list_id=list_id,
             lists_done=lists_done,
             corrected=corrected,
             clamped=clamped,
+            shards=shards,
+            shard=shard,
+            before_id=before_id,
+            target_seconds=target_seconds,
         )
     else:
         just_completed = _update_backfill(
@@ -561,6 +730,7 @@ def reconcile_all_lists(
             progress,
             status=Backfill.Status.DONE,
             summary_extend={"per_list": batch_moved},
+            shard=shard,
         )
         logger.info(
             "reconcile_all_lists: complete — %s lists, %s corrected, %s clamped",
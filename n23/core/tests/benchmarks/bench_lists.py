@@ -0,0 +1,75 @@
+"""Benchmarks for the list pages and the cost machinery behind them."""
+
+import itertools
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+
+from n23.content.models import ContentEquipment
+from n23.core.cost.reconcile import reconcile_list
+from n23.core.models.list import List, ListFighter, ListFighterEquipmentAssignment
+from n23.core.tasks import propagate_content_cost_change
+
+pytestmark = pytest.mark.django_db
+
+
+def test_list_detail(benchmark, logged_in_client, heavy_gang):
+    url = reverse("core:list", args=[heavy_gang.id])
+
+    def run():
+        assert logged_in_client.get(url).status_code == 200
+
+    benchmark("list_detail", run)
+
+
+def test_list_print(benchmark, logged_in_client, heavy_gang):
+    url = reverse("core:list-print", args=[heavy_gang.id])
+
+    def run():
+        assert logged_in_client.get(url).status_code == 200
+
+    benchmark("list_print", run)
+
+
+def test_list_facts_from_db(benchmark, heavy_gang):
+    """Every fighter and assignment dirty, as after a content edit, so the
+    whole gang is resolved rather than read back from its caches."""
+
+    def run():
+        ListFighterEquipmentAssignment.objects.filter(
+            list_fighter__list=heavy_gang
+        ).update(dirty=True)
+        ListFighter.objects.filter(list=heavy_gang).update(dirty=True)
+        List.objects.get(pk=heavy_gang.pk).facts_from_db(update=True)
+
+    benchmark("list_facts_from_db", run)
+
+
+def test_reconcile_list(benchmark, user, heavy_gang):
+    benchmark("reconcile_list", lambda: reconcile_list(heavy_gang, user=user))
+
+
+def test_propagate_content_cost_change(benchmark, large_campaign):
+    """A weapon every gang in the campaign carries changes price.
+
+    Each pass moves the price the other way, so every pass has a real change
+    to propagate rather than finding the last one already booked.
+    """
+    weapon = ContentEquipment.objects.get(name="Bench gun 0")
+    content_type = ContentType.objects.get_for_model(ContentEquipment)
+    lists = List.objects.filter(campaign=large_campaign)
+    prices = itertools.cycle(["15", "10"])
+
+    def run():
+        before = {
+            str(pk): [rating, stash]
+            for pk, rating, stash in lists.values_list(
+                "pk", "rating_current", "stash_current"
+            )
+        }
+        ContentEquipment.objects.filter(pk=weapon.pk).update(cost=next(prices))
+        weapon.set_dirty()
+        propagate_content_cost_change.func(content_type.id, str(weapon.pk), before)
+
+    benchmark("propagate_content_cost_change", run)
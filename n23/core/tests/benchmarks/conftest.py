@@ -0,0 +1,225 @@
+"""Seeded datasets for the n23 benchmarks.
+
+Sized like the largest gangs, campaigns and packs in production rather than
+like a test: a 30-fighter campaign gang carrying two weapons with a priced
+firing line, an accessory, wargear with an upgrade and a pack weapon apiece;
+a campaign of 20 such gangs; and a pack of a few hundred items that gang
+subscribes to. The benchmarks themselves are in ``bench_*.py`` and run from
+``scripts/benchmark.sh`` (see ``gyrinx/benchmark.py``).
+"""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from gyrinx.benchmark import (
+    ROUNDS,
+    Baseline,
+    baseline_path,
+    check,
+    production_settings,
+)
+from n23.content.models import (
+    ContentEquipment,
+    ContentRule,
+    ContentSkill,
+    ContentWeaponProfile,
+)
+from n23.content.models.skill import ContentSkillCategory
+from n23.core.models.list import List, ListFighterAdvancement
+from n23.core.models.pack import CustomContentPackItem
+from n23.models import FighterCategoryChoices
+
+#: Fighters in a heavy gang, and gangs in a large campaign.
+FIGHTERS = 30
+GANGS = 20
+
+#: Items of each kind in the large pack.
+PACK_EQUIPMENT = 300
+PACK_RULES = 60
+PACK_SKILLS = 60
+
+#: Weapons and wargear in the armoury a heavy gang buys from.
+WEAPONS = 12
+WARGEAR = 8
+
+STATS = {
+    "movement": '5"',
+    "weapon_skill": "4+",
+    "ballistic_skill": "4+",
+    "strength": "3",
+    "toughness": "3",
+    "wounds": "1",
+    "initiative": "4+",
+    "attacks": "1",
+    "leadership": "7+",
+    "cool": "7+",
+    "willpower": "8+",
+    "intelligence": "8+",
+}
+
+
+@pytest.fixture(autouse=True)
+def deployed_settings(settings):
+    """The process caches on, as deployed, and cold: the root conftest forgets
+    what n23's held before every test."""
+    for name, value in production_settings().items():
+        setattr(settings, name, value)
+
+
+@pytest.fixture
+def benchmark():
+    """Measure a callable and hold it to the baseline (see gyrinx/benchmark.py)."""
+    baseline = Baseline(baseline_path())
+
+    def benchmark_(name, run, rounds=ROUNDS):
+        measurement, found = check(name, run, baseline, rounds=rounds)
+        print(f"\nbenchmark {measurement}")
+        assert not found, f"{name} regressed: " + "; ".join(found)
+        return measurement
+
+    return benchmark_
+
+
+@pytest.fixture
+def fighter_types(content_house, make_content_fighter, make_statline):
+    """A leader, a champion, a ganger and a juve, each with a statline."""
+    types = []
+    for category, cost in (
+        (FighterCategoryChoices.LEADER, 120),
+        (FighterCategoryChoices.CHAMPION, 95),
+        (FighterCategoryChoices.GANGER, 50),
+        (FighterCategoryChoices.JUVE, 30),
+    ):
+        fighter = make_content_fighter(
+            type=category.label,
+            category=category,
+            house=content_house,
+            base_cost=cost,
+            **STATS,
+        )
+        make_statline(fighter)
+        types.append(fighter)
+    return types
+
+
+@pytest.fixture
+def armoury(
+    content_equipment_categories,
+    make_weapon_accessory,
+    make_equipment_upgrade,
+):
+    """Weapons with a free and a priced firing line, accessories, wargear."""
+    weapons_category = content_equipment_categories.get(name="Basic Weapons")
+    gear_category = content_equipment_categories.get(name="Personal Equipment")
+    weapons = []
+    for n in range(WEAPONS):
+        weapon = ContentEquipment.objects.create(
+            name=f"Bench gun {n}", cost=str(10 + n), category=weapons_category
+        )
+        ContentWeaponProfile.objects.create(equipment=weapon, name="", cost=0)
+        priced = ContentWeaponProfile.objects.create(
+            equipment=weapon, name="Special round", cost=5
+        )
+        weapons.append((weapon, priced))
+    accessories = [
+        make_weapon_accessory(f"Bench sight {n}", cost=10 + n) for n in range(4)
+    ]
+    wargear = []
+    for n in range(WARGEAR):
+        gear = ContentEquipment.objects.create(
+            name=f"Bench gear {n}", cost=str(15 + n), category=gear_category
+        )
+        wargear.append((gear, make_equipment_upgrade(gear, f"Bench upgrade {n}", 10)))
+    return {"weapons": weapons, "accessories": accessories, "wargear": wargear}
+
+
+@pytest.fixture
+def large_pack(pack, content_equipment_categories):
+    """A pack of a few hundred equipment, rule and skill rows."""
+    category = content_equipment_categories.get(name="Special Weapons")
+    equipment = ContentEquipment.objects.bulk_create(
+        ContentEquipment(name=f"Pack gun {n}", cost="25", category=category)
+        for n in range(PACK_EQUIPMENT)
+    )
+    rules = ContentRule.objects.bulk_create(
+        ContentRule(name=f"Pack rule {n}") for n in range(PACK_RULES)
+    )
+    skill_category, _ = ContentSkillCategory.objects.get_or_create(name="Pack")
+    skills = ContentSkill.objects.bulk_create(
+        ContentSkill(name=f"Pack skill {n}", category=skill_category)
+        for n in range(PACK_SKILLS)
+    )
+    CustomContentPackItem.objects.bulk_create(
+        CustomContentPackItem(
+            pack=pack,
+            content_type=ContentType.objects.get_for_model(item),
+            object_id=item.pk,
+            owner=pack.owner,
+        )
+        for item in (*equipment, *rules, *skills)
+    )
+    return pack
+
+
+@pytest.fixture
+def heavy_gang(
+    user,
+    campaign,
+    make_list,
+    make_list_fighter,
+    make_content_skill,
+    fighter_types,
+    armoury,
+    large_pack,
+):
+    """A 30-fighter campaign gang with heavy kit, subscribed to the large pack."""
+    lst = make_list(
+        "Heavy gang", status=List.CAMPAIGN_MODE, campaign=campaign, credits_current=500
+    )
+    campaign.lists.add(lst)
+    lst.packs.add(large_pack)
+    skills = [make_content_skill(f"Bench skill {n}") for n in range(6)]
+    pack_guns = list(
+        ContentEquipment.objects.all_content().filter(name__startswith="Pack gun")
+    )
+    weapons, accessories, wargear = (
+        armoury["weapons"],
+        armoury["accessories"],
+        armoury["wargear"],
+    )
+
+    for n in range(FIGHTERS):
+        fighter = make_list_fighter(
+            lst, f"Fighter {n}", content_fighter=fighter_types[n % len(fighter_types)]
+        )
+        for offset in range(2):
+            weapon, priced = weapons[(n + offset) % len(weapons)]
+            fighter.assign(
+                weapon,
+                weapon_profiles=[priced],
+                weapon_accessories=[accessories[(n + offset) % len(accessories)]],
+            )
+        gear, upgrade = wargear[n % len(wargear)]
+        fighter.assign(gear).upgrades_field.add(upgrade)
+        fighter.assign(pack_guns[n % len(pack_guns)])
+        fighter.skills.add(*skills[n % 3 : n % 3 + 3])
+        ListFighterAdvancement.objects.create(
+            fighter=fighter,
+            advancement_type=ListFighterAdvancement.ADVANCEMENT_STAT,
+            stat_increased="weapon_skill",
+            xp_cost=6,
+            cost_increase=20,
+            owner=user,
+        )
+
+    lst.facts_from_db(update=True)
+    return List.objects.get(pk=lst.pk)
+
+
+@pytest.fixture
+def large_campaign(campaign, heavy_gang):
+    """The heavy gang's campaign, grown to 20 gangs like it."""
+    for n in range(GANGS - 1):
+        clone = heavy_gang.clone(name=f"Rival gang {n}", for_campaign=campaign)
+        campaign.lists.add(clone)
+    return campaign
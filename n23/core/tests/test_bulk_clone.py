@@ -0,0 +1,140 @@
+"""Tests for the bulk clone engine (n23/core/models/list/clone.py).
+
+A bulk clone must leave the same rows behind as the per-row
+``ListFighter._clone_row`` — gear, component rows, M2M rows, equipment sets,
+campaign history — in a number of queries that does not grow with the gang.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n23.content.models import ContentFighterDefaultAssignment
+from n23.core.models.list import (
+    List,
+    ListFighter,
+    ListFighterAdvancement,
+    ListFighterEquipmentAssignment,
+    ListFighterEquipmentSet,
+)
+from n23.core.models.list.clone import bulk_clone_fighters
+
+
+@pytest.fixture
+def make_kitted_fighter(
+    user, make_list_fighter, make_equipment, make_weapon_profile, make_content_skill
+):
+    counter = iter(range(1000))
+
+    def make_kitted_fighter_(lst, **assignment_fields):
+        n = next(counter)
+        fighter = make_list_fighter(lst, f"Ganger {n}")
+        gun = make_equipment(f"Autogun {n}", cost="15")
+        profile = make_weapon_profile(gun, name=f"Burst {n}", cost=5)
+        assignment = fighter.assign(gun, weapon_profiles=[profile])
+        ListFighterEquipmentAssignment.objects.filter(pk=assignment.pk).update(
+            **assignment_fields
+        )
+        fighter.skills.add(make_content_skill(f"Skill {n}", category="Combat"))
+        ListFighterAdvancement.objects.create(
+            fighter=fighter,
+            advancement_type=ListFighterAdvancement.ADVANCEMENT_STAT,
+            stat_increased="weapon_skill",
+            xp_cost=6,
+            cost_increase=20,
+            owner=user,
+        )
+        return fighter
+
+    return make_kitted_fighter_
+
+
+def clone_queries(lst):
+    with CaptureQueriesContext(connection) as ctx:
+        clone = lst.clone()
+    return clone, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_list_clone_queries_do_not_grow_with_fighters(make_list, make_kitted_fighter):
+    # A total override keeps pricing read-free, so only the copy is counted.
+    small = make_list("Small")
+    for _ in range(2):
+        make_kitted_fighter(small, total_cost_override=20)
+    large = make_list("Large")
+    for _ in range(8):
+        make_kitted_fighter(large, total_cost_override=20)
+
+    _, small_queries = clone_queries(small)
+    large_clone, large_queries = clone_queries(large)
+
+    assert large_queries == small_queries
+    assert large_clone.fighters().count() == 8
+
+
+@pytest.mark.django_db
+def test_bulk_clone_matches_per_row_clone(make_list, make_kitted_fighter):
+    lst = make_list("Gang")
+    fighter = make_kitted_fighter(lst)
+
+    bulk = bulk_clone_fighters([fighter], list=lst)[fighter.pk]
+    per_row = fighter._clone_row(list=lst)
+
+    ratings = []
+    for clone in (bulk, per_row):
+        clone = ListFighter.objects.get(pk=clone.pk)
+        assert set(clone.skills.values_list("pk", flat=True)) == set(
+            fighter.skills.values_list("pk", flat=True)
+        )
+        assert clone.advancements.count() == 1
+        assignment = ListFighterEquipmentAssignment.objects.get(list_fighter=clone)
+        assert assignment.profile_rows.count() == 1
+        assert assignment.dirty is False
+        ratings.append(assignment.rating_current)
+
+    assert ratings[0] == ratings[1] > 0
+    assert List.objects.get(pk=lst.pk).fighters().count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_clone_carries_converted_defaults_and_equipment_sets(
+    user, make_list, make_list_fighter, make_equipment, content_fighter
+):
+    lst = make_list("Gang")
+    fighter = make_list_fighter(lst, "Ganger")
+    knife = make_equipment("Knife", cost="5")
+    default = ContentFighterDefaultAssignment.objects.create(
+        fighter=content_fighter, equipment=knife
+    )
+    fighter.disabled_default_assignments.add(default)
+    converted = fighter.assign(knife, from_default_assignment=default)
+    card = ListFighterEquipmentSet.objects.create(
+        list_fighter=fighter, name="Close combat", owner=user
+    )
+    card.assignments.add(converted)
+    fighter.active_equipment_set = card
+    fighter.save()
+
+    clone = ListFighter.objects.get(pk=fighter.clone(list=lst).pk)
+
+    assert list(clone.disabled_default_assignments.all()) == [default]
+    cloned_knife = ListFighterEquipmentAssignment.objects.get(list_fighter=clone)
+    assert cloned_knife.from_default_assignment == default
+    assert clone.active_equipment_set.name == "Close combat"
+    assert list(clone.active_equipment_set.assignments.all()) == [cloned_knife]
+
+
+@pytest.mark.django_db
+def test_bulk_clone_falls_back_to_per_row_for_child_fighters(
+    make_list, make_list_fighter, make_vehicle_equipment
+):
+    lst = make_list("Gang")
+    fighter = make_list_fighter(lst, "Driver")
+    vehicle, vehicle_fighter = make_vehicle_equipment()
+    fighter.assign(vehicle)
+
+    clone = fighter.clone(list=lst)
+
+    cloned_vehicle = ListFighterEquipmentAssignment.objects.get(list_fighter=clone)
+    assert cloned_vehicle.child_fighter is not None
+    assert cloned_vehicle.child_fighter.content_fighter == vehicle_fighter
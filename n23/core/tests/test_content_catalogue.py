@@ -0,0 +1,95 @@
+"""The content catalogue: content fighters shared by every fighter card.
+
+Once a process has loaded a fighter type with everything its card reads, the
+next list to show that type takes it from memory — until content moves, after
+which the next load reads it afresh and sees the edit. Pack-scoped rules stay
+with the lists subscribed to the pack.
+"""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n23.content.catalogue import _reset_catalogue
+from n23.content.models import ContentRule
+from n23.core.models.list import List
+from n23.core.models.pack import CustomContentPackItem
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def catalogue(settings):
+    settings.N23_CONTENT_CATALOGUE = True
+    _reset_catalogue()
+    yield
+    _reset_catalogue()
+
+
+def fetch(lst):
+    """The list's fighters, as a fresh request would read them."""
+    with CaptureQueriesContext(connection) as ctx:
+        fighters = list(List.objects.get(pk=lst.pk).fighters())
+    return fighters, len(ctx.captured_queries)
+
+
+def rule_names(fighter):
+    return sorted(rule.name for rule in fighter.content_fighter.rules.all())
+
+
+def test_a_second_list_reads_content_fighters_from_memory(
+    catalogue, make_list, make_list_fighter, content_fighter, django_assert_num_queries
+):
+    content_fighter.rules.add(ContentRule.objects.create(name="Infiltrate"))
+    first = make_list("First")
+    make_list_fighter(first, "Ganger")
+    second = make_list("Second")
+    make_list_fighter(second, "Ganger")
+
+    (cold,), cold_queries = fetch(first)
+    (warm,), warm_queries = fetch(second)
+
+    assert warm_queries < cold_queries
+    # One instance, shared, with its prefetches already in place.
+    assert warm.content_fighter is cold.content_fighter
+    with django_assert_num_queries(0):
+        assert rule_names(warm) == ["Infiltrate"]
+        assert warm.content_fighter.house.name == content_fighter.house.name
+
+
+def test_a_content_edit_drops_the_catalogue(
+    catalogue, make_list, make_list_fighter, content_fighter
+):
+    lst = make_list("Gang")
+    make_list_fighter(lst, "Ganger")
+    fetch(lst)
+
+    content_fighter.rules.add(ContentRule.objects.create(name="Gang Fighter"))
+
+    (fighter,), _ = fetch(lst)
+    assert rule_names(fighter) == ["Gang Fighter"]
+
+
+def test_pack_rules_stay_with_subscribed_lists(
+    catalogue, make_list, make_list_fighter, content_fighter, pack
+):
+    rule = ContentRule.objects.create(name="Pack Rule")
+    CustomContentPackItem.objects.create(
+        pack=pack,
+        content_type=ContentType.objects.get_for_model(ContentRule),
+        object_id=rule.pk,
+        owner=pack.owner,
+    )
+    content_fighter.rules.add(rule)
+    subscribed = make_list("Subscribed")
+    subscribed.packs.add(pack)
+    make_list_fighter(subscribed, "Ganger")
+    plain = make_list("Plain")
+    make_list_fighter(plain, "Ganger")
+
+    (with_pack,), _ = fetch(subscribed)
+    (without_pack,), _ = fetch(plain)
+
+    assert rule_names(with_pack) == ["Pack Rule"]
+    assert rule_names(without_pack) == []
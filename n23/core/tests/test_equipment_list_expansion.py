@@ -1,8 +1,13 @@
 """
 Tests for Equipment List Expansion functionality.
+
+Every test runs twice: matched by the database aggregate, and by the
+in-memory expansion engine, which must agree with it.
 """
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from n23.content.models import (
     ContentAttribute,
@@ -23,6 +28,12 @@ from n23.core.models.list import ListFighter
 from n23.models import FighterCategoryChoices
 
 
+@pytest.fixture(autouse=True, params=[False, True], ids=["aggregate", "engine"])
+def expansion_engine(request, settings):
+    settings.N23_EXPANSION_ENGINE = request.param
+    return request.param
+
+
 @pytest.mark.django_db
 def test_expansion_rule_by_attribute_with_specific_values():
     """Test attribute rule matching with specific values."""
@@ -1316,3 +1327,66 @@ def test_house_additional_gearline_display_with_expansions():
             assert gl["filter"] == "equipment-list"
         elif gl["category"] in ["House Restricted", "Expansion Category"]:
             assert gl["filter"] == "all"
+
+
+@pytest.mark.django_db
+def test_engine_answers_a_repeat_lookup_without_queries(expansion_engine):
+    """Test that the engine matches a second list of the same house from memory."""
+    if not expansion_engine:
+        pytest.skip("the aggregate queries every time")
+    house = ContentHouse.objects.create(name="Test House")
+    category = ContentEquipmentCategory.objects.create(name="Test")
+    item = ContentEquipment.objects.create(name="Item", category=category, cost=100)
+    expansion = ContentEquipmentListExpansion.objects.create(name="Test Expansion")
+    expansion.rules.add(
+        ContentEquipmentListExpansionRuleByHouse.objects.create(house=house)
+    )
+    ContentEquipmentListExpansionItem.objects.create(
+        expansion=expansion, equipment=item, cost=50
+    )
+    first = List.objects.create(name="First", content_house=house)
+    second = List.objects.create(name="Second", content_house=house)
+    assert [
+        eq.expansion_cost_override
+        for eq in ContentEquipmentListExpansion.get_expansion_equipment(
+            ExpansionRuleInputs(list=first)
+        )
+    ] == [50]
+    list(second.active_attributes_cached)
+
+    with CaptureQueriesContext(connection) as ctx:
+        equipment = ContentEquipmentListExpansion.get_expansion_equipment(
+            ExpansionRuleInputs(list=second)
+        )
+    assert ctx.captured_queries == []
+    assert [eq.expansion_cost_override for eq in equipment] == [50]
+
+
+@pytest.mark.django_db
+def test_engine_lookups_from_many_threads_never_lose_a_key(
+    expansion_engine, monkeypatch
+):
+    """Test that threads sharing the engine's LRU never trip over an eviction."""
+    if not expansion_engine:
+        pytest.skip("the aggregate keeps no LRU")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from n23.content import expansion_engine as engine_module
+
+    house = ContentHouse.objects.create(name="Test House")
+    expansion = ContentEquipmentListExpansion.objects.create(name="Test Expansion")
+    expansion.rules.add(
+        ContentEquipmentListExpansionRuleByHouse.objects.create(house=house)
+    )
+    engine = engine_module._Engine(stamp=None)
+    # A tiny LRU, so every thread's inserts evict what the others look up.
+    monkeypatch.setattr(engine_module, "MAX_MATCHES", 2)
+    keys = [(house.pk, frozenset(), None), *((n, frozenset(), None) for n in range(4))]
+
+    def hammer(_):
+        return [engine.match(key) for _ in range(500) for key in keys]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        answers = [found for batch in pool.map(hammer, range(8)) for found in batch]
+
+    assert set(answers) == {(expansion.pk,), ()}
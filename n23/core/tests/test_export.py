@@ -0,0 +1,136 @@
+"""Streaming exports of lists, campaign gangs and analytics events."""
+
+import csv
+import io
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import Client
+from django.urls import reverse
+
+from gyrinx import export as export_module
+from gyrinx.analytics.models import Event, EventVerb, log_event
+from gyrinx.export import lines
+from n23.core.events import EventNoun
+from n23.core.export import LISTS
+from n23.core.models.list import List
+
+pytestmark = pytest.mark.django_db
+
+
+def body(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def test_lists_export_as_csv(logged_in_client, make_list, make_user, content_house):
+    mine = make_list("Mine")
+    List.objects.create(
+        name="Theirs", content_house=content_house, owner=make_user("other", "pw")
+    )
+
+    response = logged_in_client.get(reverse("core:lists-export", args=["csv"]))
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+    assert 'filename="lists.csv"' in response["Content-Disposition"]
+    rows = list(csv.DictReader(io.StringIO(body(response))))
+    assert [row["id"] for row in rows] == [str(mine.id)]
+    assert rows[0]["name"] == "Mine"
+    assert Event.objects.filter(verb=EventVerb.EXPORT).exists()
+
+
+def test_lists_export_as_ndjson(logged_in_client, make_list):
+    make_list("One")
+    make_list("Two")
+
+    response = logged_in_client.get(reverse("core:lists-export", args=["ndjson"]))
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in body(response).splitlines()]
+    assert sorted(row["name"] for row in rows) == ["One", "Two"]
+
+
+def test_an_unknown_format_is_not_found(logged_in_client):
+    response = logged_in_client.get(reverse("core:lists-export", args=["xlsx"]))
+    assert response.status_code == 404
+
+
+def test_a_cursor_that_is_not_an_id_is_refused(logged_in_client):
+    url = reverse("core:lists-export", args=["csv"])
+    assert logged_in_client.get(url + "?after=nope").status_code == 400
+
+
+def test_an_export_resumes_after_the_last_id(monkeypatch, logged_in_client, make_list):
+    # Smaller than the lists, so the export crosses a page boundary.
+    monkeypatch.setattr(export_module, "CHUNK", 2)
+    made = sorted(str(make_list(f"List {n}").id) for n in range(5))
+    url = reverse("core:lists-export", args=["ndjson"])
+
+    whole = [
+        json.loads(line)["id"] for line in body(logged_in_client.get(url)).splitlines()
+    ]
+    rest = [
+        json.loads(line)["id"]
+        for line in body(logged_in_client.get(f"{url}?after={made[1]}")).splitlines()
+    ]
+
+    assert whole == made
+    assert rest == made[2:]
+
+
+def test_campaign_export_is_for_its_admins(user, make_user, make_list, campaign):
+    gang = make_list("Gang", campaign=campaign)
+    campaign.lists.add(gang)
+    url = reverse("core:campaign-lists-export", args=[campaign.id, "csv"])
+
+    stranger = Client()
+    stranger.force_login(make_user("stranger", "pw"))
+    assert stranger.get(url).status_code == 404
+
+    owner = Client()
+    owner.force_login(user)
+    rows = list(csv.DictReader(io.StringIO(body(owner.get(url)))))
+    assert [row["id"] for row in rows] == [str(gang.id)]
+
+
+def test_a_cell_a_spreadsheet_would_run_is_escaped(make_list):
+    make_list('=HYPERLINK("http://example.com")')
+
+    text = "".join(lines(LISTS, List.objects.all(), "csv"))
+
+    row = next(csv.DictReader(io.StringIO(text)))
+    assert row["name"] == '\'=HYPERLINK("http://example.com")'
+
+
+def test_the_command_writes_events_and_says_where_it_stopped(tmp_path, user):
+    log_event(user=user, noun=EventNoun.LIST, verb=EventVerb.VIEW)
+    output = tmp_path / "events.ndjson"
+    err = io.StringIO()
+
+    call_command(
+        "export_data", "events", "--format", "ndjson", "--output", output, stderr=err
+    )
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["verb"] for row in rows] == ["view"]
+    assert "ip_address" not in rows[0]
+    assert f"Last id: {rows[0]['id']}" in err.getvalue()
+
+
+@pytest.mark.parametrize(
+    "arguments, message",
+    [
+        (["campaign", "--campaign", "not-a-uuid"], "No campaign 'not-a-uuid'"),
+        (
+            ["campaign", "--campaign", "00000000-0000-0000-0000-000000000000"],
+            "No campaign",
+        ),
+        (["events", "--after", "42"], "--after must be a row id"),
+        (["events", "--since", "last week"], "--since must be a date"),
+    ],
+    ids=["bad-campaign-id", "unknown-campaign", "bad-after", "bad-since"],
+)
+def test_the_command_refuses_bad_arguments_in_words(arguments, message):
+    with pytest.raises(CommandError, match=message):
+        call_command("export_data", *arguments)
@@ -441,10 +441,10 @@ def test_reconcile_exception_marks_failed_and_stops(
     """A batch exception marks the record FAILED and RETURNS (acks) — the
     chain stops instead of Pub/Sub redelivering it forever."""
 
-    def boom(lst, user=None, rebuild_fighters=True):
+    def boom(list_ids, user=None):
         raise RuntimeError("reconcile exploded")
 
-    monkeypatch.setattr("n23.core.cost.reconcile.reconcile_list", boom)
+    monkeypatch.setattr("n23.core.cost.reconcile.reconcile_lists", boom)
 
     record = Backfill.objects.create(
         operation=Operation.RECONCILE_LISTS,
@@ -651,3 +651,95 @@ def test_running_detail_page_shows_cancel_button(client, superuser):
     record.save(update_fields=["status"])
     r = client.get(reverse("admin:maintenance_backfill_detail", args=[record.pk]))
     assert b"Cancel this run" not in r.content
+
+
+# --- Sharded reconcile: K concurrent chains, one record ------------------------
+
+
+@pytest.mark.django_db
+def test_sharded_reconcile_covers_every_list_once(tracked_list, superuser, make_list):
+    lst, _, _ = tracked_list
+    for i in range(6):
+        make_list(f"Shard Gang {i}")
+    true_rating = fresh(lst).rating_current
+    List.objects.filter(pk=lst.pk).update(rating_current=true_rating + 10, dirty=False)
+    record = Backfill.objects.create(
+        operation=Operation.RECONCILE_LISTS,
+        triggered_by=superuser,
+        status=Backfill.Status.RUNNING,
+    )
+
+    # Eager backend: the fan-out runs every shard's chain inline.
+    reconcile_all_lists.func(
+        backfill_id=str(record.id), user_id=superuser.pk, batch_size=2, shards=3
+    )
+
+    record.refresh_from_db()
+    assert record.status == Backfill.Status.DONE
+    assert record.summary["lists"] == List.objects.count()
+    assert set(record.summary["shards"]) == {"0", "1", "2"}
+    assert all(shard["done"] for shard in record.summary["shards"].values())
+    assert [row["list_id"] for row in record.summary["per_list"]] == [str(lst.pk)]
+    assert fresh(lst).rating_current == true_rating
+
+
+@pytest.mark.django_db
+def test_a_shard_is_not_the_whole_run(superuser):
+    record = Backfill.objects.create(
+        operation=Operation.RECONCILE_LISTS,
+        triggered_by=superuser,
+        status=Backfill.Status.RUNNING,
+        summary={"shards": {"0": {"done": False}, "1": {"done": False}}},
+    )
+
+    done = Backfill.Status.DONE
+    assert not _update_backfill(str(record.id), {"lists": 3}, status=done, shard="0")
+    record.refresh_from_db()
+    assert record.status == Backfill.Status.RUNNING
+    assert record.summary["lists"] == 3
+
+    # A redelivered fork of the finished shard changes nothing.
+    assert not _update_backfill(str(record.id), {"lists": 9}, status=done, shard="0")
+    assert _update_backfill(str(record.id), {"lists": 4}, status=done, shard="1")
+    record.refresh_from_db()
+    assert record.status == Backfill.Status.DONE
+    assert record.summary["lists"] == 7
+
+
+@pytest.mark.django_db
+def test_a_shard_stops_once_the_run_has(tracked_list, superuser):
+    lst, _, _ = tracked_list
+    true_rating = fresh(lst).rating_current
+    List.objects.filter(pk=lst.pk).update(rating_current=true_rating + 10, dirty=False)
+    record = Backfill.objects.create(
+        operation=Operation.RECONCILE_LISTS,
+        triggered_by=superuser,
+        status=Backfill.Status.FAILED,  # a sibling shard failed
+    )
+
+    reconcile_all_lists.func(backfill_id=str(record.id), shards=2, shard="1")
+
+    assert fresh(lst).rating_current == true_rating + 10
+
+
+def test_batch_size_adapts_to_list_latency():
+    from n23.core.tasks import _next_batch_size
+
+    # 10 lists in 0.1s against a 4s target: 400, but no more than double.
+    assert _next_batch_size(25, 0.1, 10, 4.0) == 50
+    # 25 lists in 50s against a 30s target: 15.
+    assert _next_batch_size(25, 50.0, 25, 30.0) == 15
+    assert _next_batch_size(6, 60.0, 6, 1.0) == 5  # floor
+    assert _next_batch_size(25, 1.0, 25, None) == 25  # fixed unless asked
+
+
+def test_shard_bounds_tile_the_id_space():
+    import uuid
+
+    from n23.core.tasks import _shard_bounds
+
+    bounds = _shard_bounds(4)
+    assert bounds[0][0] is None and bounds[-1][1] is None
+    for (_, before), (after, _) in zip(bounds, bounds[1:], strict=False):
+        # Each range starts exactly where the previous one ends.
+        assert uuid.UUID(after).int == uuid.UUID(before).int - 1
@@ -0,0 +1,94 @@
+"""Pack scope: hiding pack content by a per-process set of pack-owned ids.
+
+With the set on, a default content query, ``with_packs`` and archive
+semantics answer exactly as the database subqueries do — and a pack item
+added or removed is seen by the next query, including one compiled from a
+queryset built before the change.
+"""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n23.content.models import ContentRule
+from n23.content.pack_scope import _reset_scope
+from n23.core.models.pack import CustomContentPackItem
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(params=[False, True], ids=["subquery", "pack-scope"])
+def scope(request, settings):
+    settings.N23_PACK_SCOPE_CACHE = request.param
+    _reset_scope()
+    yield request.param
+    _reset_scope()
+
+
+@pytest.fixture
+def rules(pack, make_pack):
+    """A base rule, one in ``pack``, and one archived out of another pack."""
+    other = make_pack("Other Pack")
+    base = ContentRule.objects.create(name="Base")
+    packed = ContentRule.objects.create(name="Packed")
+    archived = ContentRule.objects.create(name="Archived")
+    rule_type = ContentType.objects.get_for_model(ContentRule)
+    CustomContentPackItem.objects.create(
+        pack=pack, content_type=rule_type, object_id=packed.pk, owner=pack.owner
+    )
+    CustomContentPackItem.objects.create(
+        pack=other,
+        content_type=rule_type,
+        object_id=archived.pk,
+        owner=other.owner,
+        archived=True,
+    )
+    return base, packed, archived, other
+
+
+def names(queryset):
+    return sorted(queryset.values_list("name", flat=True))
+
+
+def test_default_queries_hide_pack_content(scope, rules):
+    assert names(ContentRule.objects.all()) == ["Base"]
+    assert names(ContentRule.objects.all_content()) == ["Archived", "Base", "Packed"]
+
+
+def test_with_packs_keeps_archive_semantics(scope, pack, rules):
+    *_, other = rules
+
+    assert names(ContentRule.objects.with_packs([pack])) == ["Base", "Packed"]
+    assert names(ContentRule.objects.with_packs([other])) == ["Base"]
+    assert names(
+        ContentRule.objects.with_packs([other], include_archived_items=True)
+    ) == ["Archived", "Base"]
+
+
+def test_a_new_pack_item_hides_a_queryset_built_before_it(scope, pack, rules):
+    base, *_ = rules
+    built_earlier = ContentRule.objects.all()
+    assert names(built_earlier) == ["Base"]
+
+    CustomContentPackItem.objects.create(
+        pack=pack,
+        content_type=ContentType.objects.get_for_model(ContentRule),
+        object_id=base.pk,
+        owner=pack.owner,
+    )
+
+    assert names(built_earlier.all()) == []
+
+
+def test_pack_items_are_read_once_and_not_per_query(settings, rules):
+    settings.N23_PACK_SCOPE_CACHE = True
+    _reset_scope()
+    names(ContentRule.objects.all())
+
+    with CaptureQueriesContext(connection) as ctx:
+        names(ContentRule.objects.all())
+
+    (query,) = ctx.captured_queries
+    assert "customcontentpackitem" not in query["sql"].lower()
+    _reset_scope()
@@ -15,9 +15,12 @@ and its `_affected_list_ids` mirror, which must stay in lockstep.
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from unittest.mock import patch
 
 import pytest
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from n23.content.models import (
     ContentEquipment,
@@ -29,12 +32,16 @@ from n23.content.models import (
     ContentFighterEquipmentListUpgrade,
     ContentFighterEquipmentListWeaponAccessory,
     ContentWeaponAccessory,
+    signal_handlers,
 )
 from n23.content.models.signal_handlers import (
     _affected_list_ids,
     _create_content_cost_change_actions,
 )
-from n23.core.cost.pin_sweep import rewrite_pinned_amounts_for_list
+from n23.core.cost.pin_sweep import (
+    rewrite_pinned_amounts_for_list,
+    rewrite_pinned_amounts_for_lists,
+)
 from n23.core.models.action import ListAction, ListActionType
 from n23.core.models.list import (
     List,
@@ -1166,3 +1173,110 @@ def test_single_stack_without_old_cost_masks_instead_of_guessing(single_stack_ct
     assert sweep.has_masked is True
     assert sweep.use_row_deltas is False
     assert ctx["assignment"].upgrade_rows.get().pinned_amount == 26
+
+
+# --- Bulk sweeps: one rewrite across many lists ------------------------------
+
+
+@pytest.fixture
+def pinned_lists(make_list, make_list_fighter, make_equipment):
+    """Four gangs each holding the same gear, base pinned to its catalog 15."""
+    equipment = make_equipment("Lasgun", cost="15")
+    lists, assignments = [], []
+    for i in range(4):
+        lst = make_list(f"Bulk Gang {i}")
+        assignment = ListFighterEquipmentAssignment.objects.create(
+            list_fighter=make_list_fighter(lst, "Holder"), content_equipment=equipment
+        )
+        ListFighterEquipmentAssignment.objects.filter(pk=assignment.pk).update(
+            pinned_base_amount=15, pinned_base_state=PinState.CATALOG
+        )
+        lists.append(lst)
+        assignments.append(assignment)
+    return equipment, lists, assignments
+
+
+@pytest.mark.django_db
+def test_bulk_sweep_books_each_list_its_own_delta(pinned_lists):
+    """One sweep over every list rewrites each row and books each list
+    exactly what the per-list sweep would have."""
+    equipment, lists, assignments = pinned_lists
+    equipment.cost = "20"
+
+    sweeps = rewrite_pinned_amounts_for_lists(equipment, [lst.pk for lst in lists])
+
+    assert list(sweeps) == [lst.pk for lst in lists]
+    for sweep in sweeps.values():
+        assert (sweep.rewrote, sweep.rating_delta, sweep.stash_delta) == (1, 5, 0)
+        assert sweep.use_row_deltas is True
+    assert {fresh(a).pinned_base_amount for a in assignments} == {20}
+
+
+@pytest.mark.django_db
+def test_bulk_sweep_queries_do_not_grow_with_the_lists(pinned_lists):
+    equipment, lists, _ = pinned_lists
+    equipment.cost = "20"
+
+    with CaptureQueriesContext(connection) as one:
+        rewrite_pinned_amounts_for_lists(equipment, [lists[0].pk])
+    with CaptureQueriesContext(connection) as three:
+        rewrite_pinned_amounts_for_lists(equipment, [lst.pk for lst in lists[1:]])
+
+    assert len(three) == len(one)
+
+
+@pytest.mark.django_db
+def test_a_batch_recomputes_its_lists_in_one_pass(pinned_lists):
+    """Under the batch's locks the facts come from one set-based recompute,
+    never a walk of each list, and each list still books its own delta."""
+    equipment, lists, _ = pinned_lists
+    before = {lst.pk: fresh(lst).rating_current for lst in lists}
+    equipment.cost = "20"
+    equipment.save()
+
+    with patch.object(List, "facts_from_db", side_effect=AssertionError("walked")):
+        _create_content_cost_change_actions(equipment)
+
+    booked = set(
+        ListAction.objects.filter(
+            action_type=ListActionType.CONTENT_COST_CHANGE, subject_id=equipment.pk
+        ).values_list("list_id", "rating_delta")
+    )
+    assert booked == {(lst.pk, 5) for lst in lists}
+    assert {
+        lst.pk: (lst.rating_current - before[lst.pk], lst.dirty)
+        for lst in List.objects.filter(pk__in=before)
+    } == {pk: (5, False) for pk in before}
+
+
+@pytest.mark.django_db
+def test_failed_batch_falls_back_to_one_list_at_a_time(pinned_lists):
+    """One list failing its recording costs only that list: the batch rolls
+    back and is redone per list, so the others still get their correction
+    and action, and the failed one keeps its old amount and gets a heal."""
+    equipment, lists, assignments = pinned_lists
+    bad = lists[1]
+    record = signal_handlers._record_content_cost_change
+
+    def record_or_fail(instance, instance_name, lst, *args):
+        if lst.pk == bad.pk:
+            raise RuntimeError("boom")
+        return record(instance, instance_name, lst, *args)
+
+    equipment.cost = "20"
+    equipment.save()
+    with (
+        patch.object(signal_handlers, "_record_content_cost_change", record_or_fail),
+        patch("n23.core.tasks.refresh_list_facts") as heal,
+    ):
+        _create_content_cost_change_actions(equipment)
+
+    heal.enqueue.assert_called_once_with(list_id=str(bad.pk))
+    recorded = set(
+        ListAction.objects.filter(
+            action_type=ListActionType.CONTENT_COST_CHANGE, subject_id=equipment.pk
+        ).values_list("list_id", flat=True)
+    )
+    assert recorded == {lst.pk for lst in lists} - {bad.pk}
+    amounts = [fresh(a).pinned_base_amount for a in assignments]
+    assert amounts == [20, 15, 20, 20]
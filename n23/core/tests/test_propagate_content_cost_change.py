@@ -236,7 +236,7 @@ def test_sweep_failure_enqueues_background_heal(
 
     with (
         patch(
-            "n23.core.cost.pin_sweep.rewrite_pinned_amounts_for_list",
+            "n23.core.cost.pin_sweep.rewrite_pinned_amounts_for_lists",
             side_effect=RuntimeError("boom"),
         ),
         patch("n23.core.tasks.refresh_list_facts") as mock_task,
@@ -0,0 +1,140 @@
+"""Tests for the set-based facts recompute (n23/core/cost/recompute.py).
+
+The recompute must produce exactly what the per-row ``facts_from_db`` walk
+produces — same lazy treatment of clean rows, same zero-cost rules, same
+clamping — in a number of queries that does not grow with the lists.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n23.core.cost.recompute import recompute_list_facts
+from n23.core.cost.reconcile import reconcile_list, reconcile_lists
+from n23.core.models.list import (
+    CapturedFighter,
+    List,
+    ListFighter,
+    ListFighterAdvancement,
+    ListFighterEquipmentAssignment,
+)
+
+
+@pytest.fixture
+def make_gang(user, make_list, make_list_fighter, make_equipment):
+    """A list with a dirty fighter, a clean one, and dirty kit on the first."""
+    counter = iter(range(1000))
+
+    def make_gang_(name):
+        n = next(counter)
+        lst = make_list(name)
+        dirty = make_list_fighter(lst, f"Dirty {n}", dirty=True, rating_current=0)
+        make_list_fighter(lst, f"Clean {n}", dirty=False, rating_current=70)
+        ListFighterEquipmentAssignment.objects.create(
+            list_fighter=dirty,
+            content_equipment=make_equipment(f"Laspistol {n}", cost="15"),
+            rating_current=0,
+            dirty=True,
+        )
+        ListFighterEquipmentAssignment.objects.create(
+            list_fighter=dirty,
+            content_equipment=make_equipment(f"Knife {n}", cost="5"),
+            rating_current=5,
+            dirty=False,
+        )
+        ListFighterAdvancement.objects.create(
+            fighter=dirty,
+            advancement_type=ListFighterAdvancement.ADVANCEMENT_STAT,
+            stat_increased="weapon_skill",
+            xp_cost=6,
+            cost_increase=20,
+            owner=user,
+        )
+        List.objects.filter(pk=lst.pk).update(dirty=True)
+        return List.objects.get(pk=lst.pk)
+
+    return make_gang_
+
+
+def per_row(lst):
+    return List.objects.get(pk=lst.pk).facts_from_db(update=False)
+
+
+@pytest.mark.django_db
+def test_matches_the_per_row_walk(make_gang):
+    gangs = [make_gang(f"Gang {i}") for i in range(3)]
+    expected = {lst.pk: per_row(lst) for lst in gangs}
+
+    assert recompute_list_facts([lst.pk for lst in gangs], update=False) == expected
+
+
+@pytest.mark.django_db
+def test_writes_the_caches_and_clears_the_flags(make_gang):
+    lst = make_gang("Gang")
+    expected = per_row(lst)
+
+    recompute_list_facts([lst.pk])
+
+    lst.refresh_from_db()
+    assert lst.dirty is False
+    assert lst.rating_current == expected.rating
+    assert not ListFighter.objects.filter(list=lst, dirty=True).exists()
+    assert not ListFighterEquipmentAssignment.objects.filter(
+        list_fighter__list=lst, dirty=True
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_query_count_does_not_grow_with_the_lists(make_gang):
+    one = [make_gang("One").pk]
+    many = [make_gang(f"Many {i}").pk for i in range(5)]
+
+    with CaptureQueriesContext(connection) as for_one:
+        recompute_list_facts(one, update=False)
+    with CaptureQueriesContext(connection) as for_many:
+        recompute_list_facts(many, update=False)
+
+    assert len(for_many) == len(for_one)
+
+
+@pytest.mark.django_db
+def test_captured_and_dead_fighters_cost_nothing(make_gang, user):
+    lst = make_gang("Gang")
+    rival = make_gang("Rival")
+    dirty = ListFighter.objects.get(list=lst, dirty=True)
+    CapturedFighter.objects.create(fighter=dirty, capturing_list=rival, owner=user)
+    ListFighter.objects.filter(list=rival, dirty=True).update(
+        injury_state=ListFighter.DEAD
+    )
+
+    facts = recompute_list_facts([lst.pk, rival.pk], update=False)
+
+    assert facts[lst.pk] == per_row(lst)
+    assert facts[rival.pk] == per_row(rival)
+
+
+@pytest.mark.django_db
+def test_missing_lists_are_skipped(make_gang):
+    import uuid
+
+    assert recompute_list_facts([uuid.uuid4()]) == {}
+
+
+@pytest.mark.django_db
+def test_batched_reconcile_matches_reconcile_list(make_gang):
+    # Drift hidden behind clean flags: only a rebuild finds it.
+    batched = make_gang("Batched")
+    single = make_gang("Single")
+    for lst in (batched, single):
+        ListFighterEquipmentAssignment.objects.filter(list_fighter__list=lst).update(
+            dirty=False, rating_current=999
+        )
+        ListFighter.objects.filter(list=lst).update(dirty=False)
+        List.objects.filter(pk=lst.pk).update(dirty=False)
+
+    (result,) = reconcile_lists([batched.pk])
+    expected = reconcile_list(single)
+
+    assert result.rating_after == expected.rating_after
+    assert result.stash_after == expected.stash_after
+    assert (result.action is None) == (expected.action is None)
@@ -2,6 +2,7 @@ from django.urls import path
 
 from ..views import battle
 from ..views import crew as crew_views
+from ..views import export as export_views
 from ..views.campaign import actions as campaign_actions
 from ..views.campaign import arbitrators as campaign_arbitrators
 from ..views.campaign import assets as campaign_assets
@@ -42,6 +43,11 @@ patterns = [
         campaign_lists.campaign_remove_list,
         name="campaign-remove-list",
     ),
+    path(
+        "campaign/<id>/lists/export.<fmt>",
+        export_views.export_campaign_lists,
+        name="campaign-lists-export",
+    ),
     path(
         "campaign/<id>/gangs/set-default-sort",
         campaign_lists.campaign_set_default_gang_sort,
@@ -1,5 +1,6 @@
 from django.urls import path
 
+from ..views import export as export_views
 from ..views import pack as pack_views
 from ..views import print_config, vehicle
 from ..views.list import attributes as list_attributes
@@ -12,6 +13,7 @@ patterns = [
     path("lists/", list_views.ListsListView.as_view(), name="lists"),
     path("lists/new/packs", list_views.new_list_packs, name="lists-new-packs"),
     path("lists/new", list_views.new_list, name="lists-new"),
+    path("lists/export.<fmt>", export_views.export_lists, name="lists-export"),
     path("list/<id>", list_views.ListDetailView.as_view(), name="list"),
     path(
         "list/<id>/perf",
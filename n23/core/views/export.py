@@ -0,0 +1,84 @@
+"""Streaming exports of lists: a player's own, and a campaign's gangs."""
+
+import uuid
+
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpResponseBadRequest
+
+from gyrinx.analytics.models import EventVerb, log_event
+from gyrinx.export import FORMATS, streaming_response
+from n23.core.events import EventNoun
+from n23.core.export import LISTS
+from n23.core.models.list import List
+from n23.core.views.campaign.common import get_campaign_admin_or_404
+
+
+def _cursor(request):
+    """The ``after`` cursor a resumed export passes back, if any.
+
+    Returns ``(cursor, None)``, or ``(None, response)`` for one that is not an
+    id — a cursor is only ever a row's id.
+    """
+    after = request.GET.get("after")
+    if not after:
+        return None, None
+    try:
+        return uuid.UUID(after), None
+    except ValueError:
+        return None, HttpResponseBadRequest("after must be a row id")
+
+
+@login_required
+def export_lists(request, fmt):
+    """
+    Stream the user's lists as CSV or NDJSON.
+
+    Resumable: ``?after=<id>`` continues from the row after that id.
+    """
+    if fmt not in FORMATS:
+        raise Http404("No such format")
+    after, refused = _cursor(request)
+    if refused:
+        return refused
+
+    log_event(
+        user=request.user,
+        noun=EventNoun.LIST,
+        verb=EventVerb.EXPORT,
+        request=request,
+        format=fmt,
+    )
+    return streaming_response(
+        LISTS, List.objects.filter(owner=request.user), fmt, after=after
+    )
+
+
+@login_required
+def export_campaign_lists(request, id, fmt):
+    """
+    Stream a campaign's gangs as CSV or NDJSON, for its owner or admins.
+
+    Resumable: ``?after=<id>`` continues from the row after that id.
+    """
+    campaign = get_campaign_admin_or_404(request, id)
+    if fmt not in FORMATS:
+        raise Http404("No such format")
+    after, refused = _cursor(request)
+    if refused:
+        return refused
+
+    log_event(
+        user=request.user,
+        noun=EventNoun.CAMPAIGN,
+        verb=EventVerb.EXPORT,
+        object=campaign,
+        request=request,
+        format=fmt,
+    )
+    return streaming_response(
+        LISTS,
+        campaign.lists.all(),
+        fmt,
+        after=after,
+        filename=f"campaign-{campaign.id}-lists",
+    )
@@ -21,7 +21,11 @@ from django.views import generic
 from django.views.decorators.http import require_POST
 
 from gyrinx.http import safe_redirect
-from gyrinx.site.models import Notification, NotificationType
+from gyrinx.site.models import (
+    Notification,
+    NotificationType,
+    forget_unread_counts,
+)
 
 VALID_BUCKETS = {"inbox", "archived"}
 VALID_STATUSES = {"all", "unread", "read"}
@@ -212,4 +216,7 @@ def notifications_bulk(request):
         count = qs.update(deleted_at=now, modified=now)
         messages.success(request, f"Deleted {count}.")
 
+    # update() bypasses save(), which is what normally drops the badge count.
+    forget_unread_counts([request.user.pk])
+
     return _back(request)
@@ -15,9 +15,24 @@ is about.
 
 Built on ``render_gang``, the same derivation every screen uses, so the
 capture cannot agree with a broken page.
+
+A sweep proving many gangs unchanged captures them in shared passes
+(``gang_states``) and keeps each capture sealed (``seal``): a digest to
+compare, and the capture itself compressed, opened only to say what
+differs where a digest moved.
 """
 
-from n26.core.render import render_gang
+import hashlib
+import pickle  # nosec B403 - seals this process's own captures, never stored
+import zlib
+from dataclasses import dataclass
+
+from n26.core.render import gang_assignables, render_gang
+
+#: Gangs captured per shared pass. Their cards and one modifier index are
+#: held at once, so this bounds what a sweep keeps in memory; past a few
+#: dozen, another gang in the pass saves almost nothing.
+BATCH = 50
 
 
 def _names(lines):
@@ -83,10 +98,13 @@ def _model_state(card):
     }
 
 
-def gang_state(gang):
+def gang_state(gang, *, card=None, index=None):
     """One gang's pages, as comparable data. Models are keyed by their
-    stored ids, so a diff names the fighter rather than an index."""
-    sheet = render_gang(gang)
+    stored ids, so a diff names the fighter rather than an index.
+
+    ``card`` and ``index`` are handed on to ``render_gang`` — see
+    ``gang_states``, which builds them for many gangs at once."""
+    sheet = render_gang(gang, card=card, index=index)
     return {
         "name": sheet.name,
         "gang_type": sheet.gang_type,
@@ -127,3 +145,86 @@ def differences(before, after, at=""):
     if before != after:
         return [f"{at}: {before!r} -> {after!r}"]
     return []
+
+
+def gang_states(gangs):
+    """``(str(pk), capture)`` for each gang, in shared passes.
+
+    ``BATCH`` gangs at a time: their cards come from one set of fetches
+    (``build_gang_cards``) and are computed against one modifier index
+    over all their assignables, so a sweep over thousands of gangs costs
+    a few queries per pass rather than a full render's per gang. What is
+    left per gang is its roster. Pass the gangs with ``gang_type``
+    selected, or that is one more.
+    """
+    from n26.core.card import build_gang_cards, build_modifier_index
+
+    gangs = list(gangs)
+    for start in range(0, len(gangs), BATCH):
+        batch = gangs[start : start + BATCH]
+        cards = build_gang_cards(batch)
+        index = build_modifier_index(
+            [thing for card in cards.values() for thing in gang_assignables(card)]
+        )
+        for gang in batch:
+            yield str(gang.pk), gang_state(gang, card=cards[gang.pk], index=index)
+
+
+@dataclass(frozen=True)
+class Sealed:
+    """A capture kept small while the world changes under it.
+
+    ``digest`` is what two captures are compared by; ``packed`` is the
+    capture itself, compressed, for saying what differs once they are
+    found to. A sweep holds one of these per gang between its two
+    readings rather than the captures themselves.
+    """
+
+    digest: bytes
+    packed: bytes
+
+    def open(self):
+        # Packed by ``seal`` in this process and never persisted, so nothing
+        # opened here came from outside it.
+        return pickle.loads(zlib.decompress(self.packed))  # nosec B301
+
+
+def _digest(state):
+    # Of the repr rather than the pickle: pickling writes the same string
+    # twice or once depending on whether it was one object, so two equal
+    # captures could seal differently.
+    return hashlib.blake2b(repr(state).encode(), digest_size=16).digest()
+
+
+def seal(state):
+    return Sealed(
+        digest=_digest(state),
+        packed=zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)),
+    )
+
+
+def sealed_states(gangs):
+    """Each gang's capture, sealed, by ``str(pk)``."""
+    return {pk: seal(state) for pk, state in gang_states(gangs)}
+
+
+def changes(before, gangs):
+    """Every place the gangs' pages now disagree with ``before``.
+
+    ``before`` is ``sealed_states`` from the first reading. A gang whose
+    digest has not moved reads the same and is never opened; one whose
+    digest has is opened and compared in full, so what comes back is
+    what ``differences`` would say of the two captures whole.
+    """
+    found = {}
+    for pk, state in gang_states(gangs):
+        was = before.get(pk)
+        if was is not None and was.digest == _digest(state):
+            found[pk] = []
+            continue
+        found[pk] = differences(
+            {pk: was.open()} if was is not None else {}, {pk: state}
+        )
+    for pk in before.keys() - found.keys():
+        found[pk] = differences({pk: before[pk].open()}, {})
+    return [line for pk in sorted(found) for line in found[pk]]
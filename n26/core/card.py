@@ -693,13 +693,55 @@ def build_gang_card(gang, with_statlines=True, assignment_set=None):
     seam ``build_card`` uses — a selection of equipment roots that may
     span the whole gang, as a print run's ticked weapons do.
     """
-    grouped = {}
-    shared = []
     rows = _flat_rows(gang_root=gang, stash_root__isnull=True)
     # The stash's assignments ride the same hydration pass as everyone's
     # — a second pass would repeat every narrow query for a handful.
     stash_rows = _flat_rows(gang_root=gang, stash_root__isnull=False)
     hydrate_rows([*rows, *stash_rows], with_statlines=with_statlines)
+    return _gang_card(
+        gang,
+        rows,
+        stash_rows,
+        # One query for the whole roster's settings, dealt out below —
+        # asking model by model is how a gang's budget starts growing
+        # with the number of models in it.
+        set_by_hand(miniature__membership__gang=gang) if with_statlines else {},
+        assignment_set=assignment_set,
+    )
+
+
+def build_gang_cards(gangs, with_statlines=True):
+    """``build_gang_card`` for many gangs, keyed by gang id.
+
+    The same fetches, each made once for every gang rather than once per
+    gang: two assignment queries, one hydration pass, one query for the
+    settings. Whatever kinds the gangs hold between them are hydrated
+    together, so a hundred gangs cost little more than one — the shape a
+    sweep over many gangs wants, where the pages are compared rather than
+    drawn.
+    """
+    gangs = list(gangs)
+    rows = _flat_rows(gang_root__in=gangs, stash_root__isnull=True)
+    stash_rows = _flat_rows(gang_root__in=gangs, stash_root__isnull=False)
+    hydrate_rows([*rows, *stash_rows], with_statlines=with_statlines)
+    # Keyed by model, so every gang may be handed all of them: a card
+    # only ever asks for its own models' settings.
+    stat_overrides = (
+        set_by_hand(miniature__membership__gang__in=gangs) if with_statlines else {}
+    )
+    held = {gang.pk: ([], []) for gang in gangs}
+    for row in rows:
+        held[row.gang_root_id][0].append(row)
+    for row in stash_rows:
+        held[row.gang_root_id][1].append(row)
+    return {gang.pk: _gang_card(gang, *held[gang.pk], stat_overrides) for gang in gangs}
+
+
+def _gang_card(gang, rows, stash_rows, stat_overrides, assignment_set=None):
+    """A gang's card assembled from its hydrated rows. No queries beyond
+    the set's selection, when one is given."""
+    grouped = {}
+    shared = []
     for row in rows:
         if row.miniature_root_id is None:
             shared.append(row)
@@ -711,12 +753,7 @@ def build_gang_card(gang, with_statlines=True, assignment_set=None):
         stash_roots=_forest(stash_rows),
         member_rows=grouped,
         shared_rows=shared,
-        # One query for the whole roster's settings, dealt out below —
-        # asking model by model is how a gang's budget starts growing
-        # with the number of models in it.
-        stat_overrides=(
-            set_by_hand(miniature__membership__gang=gang) if with_statlines else {}
-        ),
+        stat_overrides=stat_overrides,
     )
     # Every member's card carries the gang's, so what the gang holds by
     # grant is dealt onto all of them from one computation of it.
@@ -848,6 +885,11 @@ def build_modifier_index(assignables, max_depth=3):
     kit: one narrow query per assignable kind per level, then one small
     query per relation the modifiers' sentences read. ``compute`` then
     runs entirely off this, touching the database not at all.
+
+    Carriers already hydrated since library content last changed are
+    taken from the process-wide cache instead (``N26_MODIFIER_INDEX_CACHE``),
+    so hot content costs no queries at all; only the carriers this process
+    has not met yet are fetched, in the same passes as before.
     """
     from django.db.models import Prefetch, prefetch_related_objects
 
@@ -905,17 +947,28 @@ def build_modifier_index(assignables, max_depth=3):
     index = ModifierIndex()
     seen = set()
     frontier = list(assignables)
+    carried = _carried_now()
 
     for _ in range(max_depth):
         by_model = {}
+        granted = []
         for thing in frontier:
             key = ModifierIndex.key(thing)
             if key in seen:
                 continue
             seen.add(key)
+            hit = carried.get(key) if carried is not None else None
+            if hit is not None:
+                entries, grants = hit
+                index.adopt(key, entries)
+                granted.extend(grants)
+                continue
             by_model.setdefault(type(thing), []).append(thing)
         if not by_model:
-            break
+            if not granted:
+                break
+            frontier = granted
+            continue
 
         # The attachment rows first — one narrow query per kind, onto the
         # objects we already hold. What the modifiers' halves read is then
@@ -932,7 +985,6 @@ def build_modifier_index(assignables, max_depth=3):
                     hydrated.setdefault(modifier.pk, modifier)
         prefetch_related_objects(list(hydrated.values()), *related, *also_prefetch)
 
-        granted = []
         for things in by_model.values():
             for thing in things:
                 # A carrier reached from two kinds must resolve to the one
@@ -940,10 +992,53 @@ def build_modifier_index(assignables, max_depth=3):
                 # with the lazy queries it is forbidden to make.
                 modifiers = [hydrated[m.pk] for m in thing.modifiers.all()]
                 index.add(thing, modifiers)
+                grants = []
                 for modifier in modifiers:
                     granted_thing = getattr(modifier.effect, "thing", None)
                     if granted_thing is not None:
-                        granted.append(granted_thing)
+                        grants.append(granted_thing)
+                granted.extend(grants)
+                if carried is not None:
+                    _carry(carried, thing, index.for_thing(thing), grants)
         frontier = granted
 
     return index
+
+
+#: How many carriers the process keeps. The whole library is a few thousand
+#: assignables, so this only bites if something goes badly wrong.
+MAX_CARRIED = 20000
+
+#: ``(library version, {carrier key: (entries, granted things)})``. What a
+#: carrier's modifiers are, scored, and what they grant, depends on library
+#: content alone — so one hydration serves every gang, every request, until
+#: content changes and the version moves under it.
+_carried = (None, {})
+
+
+def _carried_now():
+    """The carriers cached against the current library version, or ``None``.
+
+    A version that has moved drops every entry at once: a carrier's entries
+    hold hydrated rows, and which of them an edit touched is not worth
+    working out.
+    """
+    global _carried
+    from django.conf import settings
+
+    from n26.library import version
+
+    if not settings.N26_MODIFIER_INDEX_CACHE:
+        return None
+    now = version.current()
+    if _carried[0] != now:
+        _carried = (now, {})
+    return _carried[1]
+
+
+def _carry(carried, thing, entries, grants):
+    # Entries and grants are shared by every render from here on, and only
+    # ever read — compute works on the card, never on the modifiers.
+    if len(carried) >= MAX_CARRIED:
+        carried.clear()
+    carried[ModifierIndex.key(thing)] = (entries, tuple(grants))
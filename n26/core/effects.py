@@ -580,6 +580,10 @@ class ModifierIndex:
             entries.append((modifier, spec))
         self._by_key[self.key(thing)] = entries
 
+    def adopt(self, key, entries):
+        """Store entries ``add`` already worked out — a cached carrier's."""
+        self._by_key[key] = entries
+
     def for_thing(self, thing):
         """``[(modifier, specificity)]`` for one carrier."""
         return self._by_key.get(self.key(thing), [])
@@ -28,9 +28,13 @@ fighter's own (``Offer``, ``collection_offers``).
 Query budget, as everywhere: previewing a whole gang list is a fixed
 number of queries whatever its length, and so is a gang's carried
 collections however many it carries.
+
+And a gang list depends on library content alone, so a process keeps each
+sectioned list it has built until that content moves (``kept_hire_list``):
+the same screen for every gang of a type, built once per library version.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from n26.core.card import build_card_from_profile, build_modifier_index
 from n26.core.effects import compute
@@ -550,6 +554,94 @@ def supplementary_profiles():
     return hireable_profiles().filter(category__section__name=SUPPLEMENTARY_SECTION)
 
 
+#: How many sectioned lists the process keeps: a few per gang type at most,
+#: so this only bites if something goes badly wrong.
+MAX_KEPT_LISTS = 256
+
+#: ``(library version, {(scope, gang type pk, with cards): sections})``.
+_kept_lists = (None, {})
+
+
+def _reset_kept_lists():
+    """Forget every kept hire list, so the next one is built afresh. For tests."""
+    global _kept_lists
+    _kept_lists = (None, {})
+
+
+def kept_hire_list(scope, gang_type=None, with_cards=True):
+    """The sectioned hire list for a scope, kept until library content moves.
+
+    ``scope`` is "gang" for ``gang_type``'s own list, "supplementary" or
+    "all", as the hire screen's tabs name them. What each holds and what it
+    costs is worked out from library content alone — never from a gang — so
+    one build serves every gang of the type until an edit moves the library
+    version, and the first read after that builds it again.
+
+    Every call hands back fresh sections, categories, entries, groups and
+    options, so a view decorating its copy (``card_url``) never writes into
+    the next reader's. The profiles and drawn cards under them are shared,
+    and only ever read. With ``N26_HIRE_LIST_CACHE`` off it is the plain
+    build, every time.
+    """
+    global _kept_lists
+    from django.conf import settings
+
+    from n26.library import version
+
+    if not settings.N26_HIRE_LIST_CACHE:
+        return _build_scope(scope, gang_type, with_cards)
+    # Read before building: an edit landing mid-build leaves this list
+    # stamped with the version it was built from, and the next read drops it.
+    now = version.current()
+    if _kept_lists[0] != now:
+        _kept_lists = (now, {})
+    kept = _kept_lists[1]
+    key = (scope, gang_type.pk if gang_type is not None else None, with_cards)
+    sections = kept.get(key)
+    if sections is None:
+        sections = _build_scope(scope, gang_type, with_cards)
+        if len(kept) >= MAX_KEPT_LISTS:
+            kept.clear()
+        kept[key] = sections
+    return _fresh(sections)
+
+
+def _build_scope(scope, gang_type, with_cards):
+    if scope == "supplementary":
+        return section_hire_list(
+            build_entries(list(supplementary_profiles()), with_cards=with_cards)
+        )
+    if scope == "all":
+        return section_by_gang_type(
+            build_entries(list(hireable_profiles()), with_cards=with_cards)
+        )
+    return section_hire_list(build_hire_list(gang_type, with_cards=with_cards))
+
+
+def _fresh(sections):
+    return [
+        replace(
+            section,
+            categories=[
+                replace(
+                    category,
+                    entries=[_fresh_entry(entry) for entry in category.entries],
+                )
+                for category in section.categories
+            ],
+        )
+        for section in sections
+    ]
+
+
+def _fresh_entry(entry):
+    groups = [
+        replace(group, options=[replace(option) for option in group.options])
+        for group in entry.groups
+    ]
+    return replace(entry, groups=groups)
+
+
 def _entry_order(entry):
     # Cheapest first within a category: a gang list is read to find what
     # this many credits will buy.
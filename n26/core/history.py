@@ -9,6 +9,8 @@ rather than earning a line of its own.
 
 Structures before renderers: the view gets a flat list of acts as plain
 dataclasses, filters and groups them, and the template draws the result.
+``build`` tells the whole story; ``page`` tells one screenful of it,
+newest first, reading only as far back as that screenful needs.
 
 Three readings are not literal:
 
@@ -25,7 +27,10 @@ Three readings are not literal:
 """
 
 from dataclasses import dataclass, field
+from datetime import datetime
 
+from django.core.exceptions import ValidationError
+from django.db.models import Q
 from django.urls import reverse
 
 from n26.core.effects import kind_of
@@ -111,28 +116,221 @@ def build(gang, viewer=None):
     length — the events, their records, the living — and nothing per
     row.
     """
-    from n26.core.models import Miniature
-
     events = list(
         gang.ledger_events.select_related("miniature", "actor").order_by(
             "created", "id"
         )
     )
-    rows = _rows_for(events)
-    # The history keeps the dead, but only the living have a page to
-    # link to — a departed model's name reads as words.
-    alive = set(
+    told = _tell_events(events, _rows_for(events), {}, viewer, _alive(gang))
+    return [act for _, acts in told for act in acts]
+
+
+@dataclass
+class Page:
+    """One screenful of acts, newest first.
+
+    ``older`` is where the next screenful starts — pass it back as
+    ``before`` — and empty once the page reaches the founding.
+    """
+
+    acts: list
+    older: str = ""
+
+
+#: Events read per trip back through the ledger while filling a page. A
+#: screenful of renames is one trip; a screenful of hires, a few.
+READ_BATCH = 100
+
+
+def page(gang, viewer=None, before="", size=50):
+    """The ``size`` newest acts older than ``before``, newest first.
+
+    The ledger is read backwards from ``before`` a batch at a time, and
+    only until the acts told reach ``size``, so the first screenful of a
+    gang played for years costs what a new gang's does. A page ends on
+    the edge of an operation, never inside one: a mark's events are told
+    together or not at all, so a page may run a few acts over ``size``.
+
+    An unmarked grant folds through its recorded cause on whichever page
+    that cause was told: if the cause is older than what was read, the
+    grant is left to that page; if a later grant folds under an act here,
+    it is read forward and folded in. Both are the lines ``build`` draws.
+    A cursor that cannot be read starts again from the newest act.
+    """
+    newest = gang.ledger_events.select_related("miniature", "actor").order_by(
+        "-created", "-id"
+    )
+    cursor = _read_cursor(before)
+    if cursor is not None:
+        newest = newest.filter(_older_than(*cursor))
+    alive = _alive(gang)
+
+    window = []  # newest first, as read
+    rows = {}
+    while True:
+        batch = newest.filter(_older_than(*_mark(window[-1]))) if window else newest
+        read = list(batch[:READ_BATCH])
+        window += read
+        rows.update(_rows_for(read))
+        exhausted = len(read) < READ_BATCH
+        events = window[::-1]
+        act_of = _told_before(gang, events, rows)
+        told = _tell_events(events, rows, act_of, viewer, alive)
+        # Until the ledger runs out, the oldest operation read may carry
+        # on past the batch: it is told, for what folds into it, but
+        # never shown.
+        candidates = told if exhausted else told[1:]
+        shown = []
+        count = 0
+        for cluster, acts in reversed(candidates):
+            if count >= size:
+                break
+            shown.append((cluster, acts))
+            count += len(acts)
+        if count >= size or exhausted:
+            break
+
+    if cursor is not None:
+        _fold_later_grants(gang, cursor, rows, act_of)
+
+    acts = [act for _, acts_ in shown for act in reversed(acts_)]
+    older = ""
+    if shown and (not exhausted or len(shown) < len(told)):
+        older = _write_cursor(shown[-1][0][0])
+    return Page(acts=acts, older=older)
+
+
+def _alive(gang):
+    """The models still on the roster.
+
+    The history keeps the dead, but only the living have a page to link
+    to — a departed model's name reads as words.
+    """
+    from n26.core.models import Miniature
+
+    return set(
         Miniature.objects.filter(
             membership__gang=gang, membership__archived=False
         ).values_list("pk", flat=True)
     )
+
+
+def named_models(gang):
+    """``(pk, name)`` of every model the history is about, alive or not.
+
+    For a filter over a history that is read a page at a time: the
+    models come from one query rather than from every act.
+    """
+    from n26.core.models import Miniature
+
+    events = gang.ledger_events
+    return [
+        (str(pk), name)
+        for pk, name in Miniature.objects.filter(
+            Q(pk__in=events.values("miniature"))
+            | Q(pk__in=events.values("assignment__miniature_root"))
+            | Q(
+                pk__in=events.filter(assignment__miniature_root__isnull=True).values(
+                    "assignment__miniature"
+                )
+            )
+        ).values_list("pk", "name")
+    ]
+
+
+def _tell_events(events, rows, act_of, viewer, alive):
+    """Each operation's events, oldest first, with the acts told of it."""
     acts = []
-    #: Where each thing's opening act landed, so an old record's grant
-    #: can fold under it rather than stand beside it.
-    act_of = {}
+    told = []
     for cluster in _clusters(events):
+        start = len(acts)
         _tell_cluster(cluster, rows, acts, act_of, viewer, alive)
-    return acts
+        told.append((cluster, acts[start:]))
+    return told
+
+
+#: The kinds that open a record's story: an unmarked grant folds under
+#: the act one of these told.
+OPENINGS = {Kind.PURCHASED, Kind.ADDED, Kind.GRANTED}
+
+
+def _told_before(gang, events, rows):
+    """Records whose opening act is older than ``events``, each mapped to
+    a stand-in act.
+
+    An unmarked grant whose cause opened there folds into the stand-in
+    and so drops out of this page — on the page that cause is told, it
+    is one of its lines.
+    """
+    rides = set()
+    for e in events:
+        row = rows.get(e.assignment_id)
+        if e.kind == Kind.GRANTED and e.batch is None and row is not None:
+            if row.caused_by_id is not None:
+                rides.add(row.caused_by_id)
+    if not rides or not events:
+        return {}
+    opened = (
+        gang.ledger_events.filter(assignment_id__in=rides, kind__in=OPENINGS)
+        .filter(_older_than(*_mark(events[0])))
+        .values_list("assignment_id", flat=True)
+        .distinct()
+    )
+    elsewhere = Act(when=None, actor="", spans=())
+    return dict.fromkeys(opened, elsewhere)
+
+
+def _fold_later_grants(gang, cursor, rows, act_of):
+    """Fold unmarked grants from newer pages under acts told here.
+
+    They were told on no newer page — ``build`` folds them back under
+    their cause, and their cause is here.
+    """
+    later = list(
+        gang.ledger_events.filter(
+            kind=Kind.GRANTED,
+            batch__isnull=True,
+            assignment__caused_by__in=list(rows),
+        )
+        .exclude(_older_than(*cursor))
+        .order_by("created", "id")
+    )
+    if not later:
+        return
+    rows.update(_rows_for(later))
+    for e in later:
+        row = rows.get(e.assignment_id)
+        if _machinery(e, row):
+            continue
+        home = act_of.get(row.caused_by_id)
+        if home is not None:
+            home.subs.append(Sub(name=_name(row), kind=_kindword(row)))
+            act_of.setdefault(row.pk, home)
+
+
+def _mark(e):
+    """Where an event sits in the ledger's order."""
+    return e.created, e.pk
+
+
+def _older_than(created, pk):
+    return Q(created__lt=created) | Q(created=created, id__lt=pk)
+
+
+def _write_cursor(e):
+    created, pk = _mark(e)
+    return f"{created.isoformat()}_{pk}"
+
+
+def _read_cursor(text):
+    """``(created, pk)`` from a cursor, or None where it says nothing
+    readable."""
+    when, _, pk = (text or "").rpartition("_")
+    try:
+        created, pk = datetime.fromisoformat(when), LedgerEvent._meta.pk.to_python(pk)
+    except ValueError, ValidationError:
+        return None
+    return (created, pk) if pk is not None else None
 
 
 def _rows_for(events):
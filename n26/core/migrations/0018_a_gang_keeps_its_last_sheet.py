@@ -0,0 +1,53 @@
+# Generated by Django 6.0.7 on 2026-10-16 09:12
+
+import django.db.models.deletion
+import ulid
+from django.db import migrations, models
+
+import n26.core.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("n26", "0017_the_budget_is_part_of_the_story"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GangSheetSnapshot",
+            fields=[
+                (
+                    "id",
+                    n26.core.fields.ULIDField(
+                        default=ulid.ULID,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(auto_now=True, db_index=True)),
+                (
+                    "ledger_head",
+                    n26.core.fields.ULIDField(blank=True, default=None, null=True),
+                ),
+                ("gang_modified", models.DateTimeField()),
+                ("library_version", models.BigIntegerField()),
+                ("shape", models.CharField(max_length=16)),
+                ("refs", models.JSONField(default=dict)),
+                ("data", models.BinaryField()),
+                (
+                    "gang",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sheet_snapshot",
+                        to="n26.gang",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "gang sheet snapshot",
+                "verbose_name_plural": "gang sheet snapshots",
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-16 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("n26", "0018_a_gang_keeps_its_last_sheet"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ledgerevent",
+            index=models.Index(
+                fields=["gang", "-created", "-id"], name="ledger_event_history_idx"
+            ),
+        ),
+    ]
@@ -11,6 +11,7 @@ from n26.core.models.settings import (
     CounterValue,
     ProfileRole,
 )
+from n26.core.models.snapshot import GangSheetSnapshot
 from n26.core.models.stash import Stash
 from n26.core.models.stat_override import StatOverride
 
@@ -23,6 +24,7 @@ __all__ = [
     "ChosenProfileOption",
     "CounterValue",
     "Gang",
+    "GangSheetSnapshot",
     "LedgerEntry",
     "LedgerEvent",
     "Miniature",
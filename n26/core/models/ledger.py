@@ -187,6 +187,13 @@ class LedgerEvent(Base):
                 name="ledger_event_about_at_most_one",
             ),
         ]
+        indexes = [
+            # A page of history reads a gang's events backwards from a
+            # cursor, in (created, id) order.
+            models.Index(
+                fields=["gang", "-created", "-id"], name="ledger_event_history_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_kind_display()}: {self.about}"
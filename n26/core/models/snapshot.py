@@ -0,0 +1,37 @@
+"""Gang sheet snapshots — a gang's rendered sheet, kept between reads.
+
+Derived data and nothing else: the row can be deleted at any moment and the
+next read rebuilds it. What it holds and when it stands is
+``n26.core.snapshot``'s business.
+"""
+
+from django.db import models
+
+from n26.core.fields import ULIDField
+from n26.core.models.abstract import Base
+
+
+class GangSheetSnapshot(Base):
+    gang = models.OneToOneField(
+        "n26.Gang", on_delete=models.CASCADE, related_name="sheet_snapshot"
+    )
+    #: The newest ledger event the sheet was drawn after. Null for a gang
+    #: that had none.
+    ledger_head = ULIDField(null=True, blank=True, default=None)
+    gang_modified = models.DateTimeField()
+    #: The committed library version the sheet's content was read at.
+    library_version = models.BigIntegerField()
+    #: The render structures' own shape, so a deploy that changes them
+    #: never unpickles an old sheet into the new classes.
+    shape = models.CharField(max_length=16)
+    #: ``{model label: [pk, …]}`` — the rows the sheet refers to, fetched
+    #: back on read rather than pickled whole.
+    refs = models.JSONField(default=dict)
+    data = models.BinaryField()
+
+    class Meta:
+        verbose_name = "gang sheet snapshot"
+        verbose_name_plural = "gang sheet snapshots"
+
+    def __str__(self):
+        return f"Sheet of {self.gang_id}"
@@ -137,6 +137,7 @@ def owned_gangs(request):
     "no section at all".
     """
     from n26.core.models import Gang
+    from n26.library.artwork import prefetch
 
     found = getattr(request, "_n26_owned_gangs", None)
     if found is not None:
@@ -151,6 +152,8 @@ def owned_gangs(request):
             .select_related("gang_type")
             .order_by("name")[:NAV_SIBLINGS]
         )
+        # The drawer draws each one's type badge, so they are read together.
+        prefetch(gang.gang_type.icon_url for gang in found)
     request._n26_owned_gangs = found
     return found
 
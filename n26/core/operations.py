@@ -1452,10 +1452,19 @@ def _hold(gang):
 
 @contextmanager
 def operation(gang, actor=None):
-    """One transaction; pinned numbers rewritten when it closes."""
+    """One transaction; pinned numbers rewritten when it closes.
+
+    The gang's kept sheet is dropped in the same breath: whatever the
+    operation did, a reader's next look derives the sheet anew
+    (``n26.core.snapshot``).
+    """
+    from n26.core.snapshot import forget_sheet
+
     op = Operation(gang, actor=actor)
     with transaction.atomic():
         if gang is not None and gang.pk is not None:
             _hold(gang)
         yield op
         op.settle()
+        if gang is not None:
+            forget_sheet(gang)
@@ -1615,8 +1615,25 @@ def stash_lines(gang_card):
     ]
 
 
-def render_gang(gang, with_effects=True, *, card=None):
-    """A whole gang sheet. A fixed number of queries, whatever its size."""
+def gang_assignables(gang_card):
+    """Everything a gang's cards carry, for a modifier index over them.
+
+    The gang's own nodes are listed too — they also ride member cards as
+    broadcast, and the index's seen-set makes the overlap free.
+    """
+    cards = gang_card.members.values()
+    return [node.assignable for card in cards for node in card.all_nodes()] + [
+        node.assignable for node in gang_card.all_nodes()
+    ]
+
+
+def render_gang(gang, with_effects=True, *, card=None, index=None):
+    """A whole gang sheet. A fixed number of queries, whatever its size.
+
+    ``card`` and ``index`` may be handed in by a caller that built them for
+    many gangs at once — ``build_gang_cards``, and one modifier index over
+    all of their assignables — so each sheet pays for neither.
+    """
     from n26.core.card import build_gang_card, build_modifier_index
     from n26.core.effects import compute, compute_gang, counter_readings
 
@@ -1628,13 +1645,9 @@ def render_gang(gang, with_effects=True, *, card=None):
     gang_computed = None
     recategorised = {}
     if with_effects:
-        # One index for the whole gang, not one per model. The gang's own
-        # nodes are listed too — they also ride member cards as broadcast,
-        # and the index's seen-set makes the overlap free.
-        assignables = [
-            node.assignable for card in cards.values() for node in card.all_nodes()
-        ] + [node.assignable for node in gang_card.all_nodes()]
-        index = build_modifier_index(assignables)
+        # One index for the whole gang, not one per model.
+        if index is None:
+            index = build_modifier_index(gang_assignables(gang_card))
         # The gang first: what it holds by grant is dealt onto every
         # member's card, and it is settled — after the gang's own
         # removals — before any member reads it.
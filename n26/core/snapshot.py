@@ -0,0 +1,209 @@
+"""Gang sheets kept between reads, so a reader is not charged the derivation.
+
+``render_gang`` is a fixed number of queries, but it still hydrates every
+assignment, indexes the modifiers and folds every card, on every view and
+every print. Most of those change nothing: a shared roster link is read far
+more often than its gang is played. ``sheet_for`` serves a reader the last
+sheet derived, kept in ``GangSheetSnapshot``.
+
+A snapshot stands for as long as three things stand still:
+
+- **the gang's newest ledger event.** Every act on a gang writes one;
+- **the gang's own ``modified``.** ``settle`` moves it, and so does a plain
+  save that writes no event — a repin by ``n26.core.reconcile``;
+- **the committed library version** (``n26.library.version``): nothing the
+  sheet was drawn from has been edited since. The process-local part of the
+  version is left out — a row every process shares cannot be keyed on what
+  only one of them has seen. A commit re-reads the number here, so an edit
+  still reaches this process's snapshots at once, and others within
+  ``N26_LIBRARY_VERSION_TTL``.
+
+Checking all three is the snapshot read itself — one query, plus one per
+kind of row the sheet refers to. ``operation`` drops the gang's snapshot as
+it closes, too, so none outlives the act that made it wrong.
+
+The sheet is pickled, but the rows it refers to — a counter's thing, the
+content a note is about — are not: they are stored as references and fetched
+back by primary key, one query per model, rather than dragging along
+everything hung off them. A deploy that changes the render structures
+changes ``_shape()``, and every snapshot taken before it is simply missed.
+
+Only an untouched sheet is kept. A view that points the sheet's controls at
+their URLs (the owner's) works on its own sheet and never writes one back.
+"""
+
+import hashlib
+import io
+import logging
+import pickle  # nosec B403 - see _restore
+import zlib
+from dataclasses import fields, is_dataclass
+from functools import cache
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Subquery
+
+logger = logging.getLogger(__name__)
+
+
+def sheet_for(gang):
+    """The gang's sheet — from its snapshot while that stands, else derived
+    and kept.
+
+    For readers: the sheet comes back exactly as ``render_gang`` built it,
+    with no control pointed anywhere.
+    """
+    from n26.core.models import GangSheetSnapshot
+    from n26.core.render import render_gang
+    from n26.library import version
+
+    if not settings.N26_GANG_SHEET_SNAPSHOTS:
+        return render_gang(gang)
+    library_version = version.current()[0]
+    kept = (
+        GangSheetSnapshot.objects.filter(gang=gang)
+        .annotate(head=Subquery(_ledger_head(gang)))
+        .values_list(
+            "ledger_head",
+            "head",
+            "gang_modified",
+            "library_version",
+            "shape",
+            "refs",
+            "data",
+        )
+        .first()
+    )
+    if kept is None:
+        head = _ledger_head(gang).values_list("pk", flat=True).first()
+    else:
+        was_head, head, was_modified, was_version, was_shape, refs, data = kept
+        if (was_head, was_modified, was_version, was_shape) == (
+            head,
+            gang.modified,
+            library_version,
+            _shape(),
+        ):
+            sheet = _restore(gang, refs, data)
+            if sheet is not None:
+                return sheet
+    # The key is read before the sheet is derived: anything landing in
+    # between is in the sheet but not the key, which misses next time
+    # rather than serving stale.
+    sheet = render_gang(gang)
+    _keep(gang, head, library_version, sheet)
+    return sheet
+
+
+def forget_sheet(gang):
+    """Drop the gang's snapshot — its next reader derives the sheet anew."""
+    from n26.core.models import GangSheetSnapshot
+
+    if settings.N26_GANG_SHEET_SNAPSHOTS and gang.pk is not None:
+        GangSheetSnapshot.objects.filter(gang=gang).delete()
+
+
+def _ledger_head(gang):
+    from n26.core.models import LedgerEvent
+
+    # ULIDs order by creation, so the greatest is the newest.
+    return LedgerEvent.objects.filter(gang=gang).order_by("-pk").values("pk")[:1]
+
+
+@cache
+def _shape():
+    """A fingerprint of every render structure a sheet can be pickled from."""
+    from n26.core import effects, notes, render
+
+    described = sorted(
+        f"{module.__name__}.{name}:{','.join(f.name for f in fields(thing))}"
+        for module in (render, effects, notes)
+        for name, thing in vars(module).items()
+        if isinstance(thing, type)
+        and is_dataclass(thing)
+        and thing.__module__ == module.__name__
+    )
+    return hashlib.sha256("\n".join(described).encode()).hexdigest()[:16]
+
+
+class _Packer(pickle.Pickler):
+    """Pickles a sheet, writing each model instance as a reference."""
+
+    def __init__(self, file):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.refs = {}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, models.Model):
+            pk = str(obj.pk)
+            self.refs.setdefault(obj._meta.label, set()).add(pk)
+            return (obj._meta.label, pk)
+        return None
+
+
+class _Unpacker(pickle.Unpickler):
+    def __init__(self, file, found):
+        super().__init__(file)
+        self.found = found
+
+    def persistent_load(self, pid):
+        # A row gone since is a KeyError, and the sheet is derived anew.
+        return self.found[tuple(pid)]
+
+
+def _keep(gang, head, library_version, sheet):
+    from n26.core.models import GangSheetSnapshot
+
+    try:
+        buffer = io.BytesIO()
+        packer = _Packer(buffer)
+        packer.dump(sheet)
+        snapshot = GangSheetSnapshot(
+            gang=gang,
+            ledger_head=head,
+            gang_modified=gang.modified,
+            library_version=library_version,
+            shape=_shape(),
+            refs={label: sorted(pks) for label, pks in packer.refs.items()},
+            data=zlib.compress(buffer.getvalue()),
+        )
+        # A savepoint, so a failed write never spoils a caller's transaction.
+        with transaction.atomic():
+            GangSheetSnapshot.objects.bulk_create(
+                [snapshot],
+                update_conflicts=True,
+                unique_fields=["gang"],
+                update_fields=[
+                    "ledger_head",
+                    "gang_modified",
+                    "library_version",
+                    "shape",
+                    "refs",
+                    "data",
+                    "modified",
+                ],
+            )
+    except Exception:
+        # The reader already has the sheet; only the next one pays for this.
+        logger.warning("Could not keep the sheet of gang %s", gang.pk, exc_info=True)
+
+
+def _restore(gang, refs, data):
+    """The kept sheet, or None where it can no longer be read back."""
+    try:
+        found = {}
+        for label, pks in refs.items():
+            model = apps.get_model(label)
+            for pk, obj in model._base_manager.in_bulk(pks).items():
+                found[(label, str(pk))] = obj
+        # Only _keep writes snapshot rows, from a sheet this site rendered, and
+        # the table is the site's own: nothing unpickled here was user input.
+        # Rows come back by reference, not from the pickle.
+        return _Unpacker(io.BytesIO(zlib.decompress(data)), found).load()  # nosec B301
+    except Exception:
+        logger.warning(
+            "Could not read back the sheet of gang %s", gang.pk, exc_info=True
+        )
+        return None
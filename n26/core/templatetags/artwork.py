@@ -14,22 +14,13 @@ model, and a security boundary is the last thing that should exist twice and
 drift.
 """
 
-from hashlib import sha256
-
 from django import template
-from django.core.cache import cache
 from django.utils.safestring import mark_safe
 
-from gyrinx.svg import sanitize_inline_svg
+from gyrinx.svg import cached_inline_svg
 
 register = template.Library()
 
-# Cleaning is not cheap and a page draws one badge per row, so the result is
-# kept against a hash of the markup itself: two gangs of the same type share
-# the entry, and editing the artwork lands on a different key rather than
-# needing anything invalidated.
-_CACHE_PREFIX = "n26-artwork:"
-
 
 @register.filter
 def safe_artwork(value):
@@ -47,13 +38,12 @@ def safe_artwork(value):
     if not value:
         return ""
 
-    raw = str(value)
-    key = _CACHE_PREFIX + sha256(raw.encode()).hexdigest()
-    cleaned = cache.get(key)
-    if cleaned is None:
-        cleaned = sanitize_inline_svg(raw)
-        cache.set(key, cleaned)
+    # Cleaning is not cheap and a page draws one badge per row, so the result
+    # is kept against a hash of the markup itself: two gangs of the same type
+    # share the entry, and editing the artwork lands on a different key rather
+    # than needing anything invalidated.
+    cleaned = cached_inline_svg(str(value))
 
-    # nosec B703 B308 - sanitize_inline_svg is the bleach allowlist; the stored
+    # nosec B703 B308 - cached_inline_svg is the bleach allowlist; the stored
     # value never reaches a template without going through it.
     return mark_safe(cleaned)  # nosec B703 B308
@@ -53,7 +53,7 @@ class TestWhatSurvives:
         lands on a different key, so nothing has to be invalidated."""
         cache.clear()
         with mock.patch(
-            "n26.core.templatetags.artwork.sanitize_inline_svg",
+            "gyrinx.svg.sanitize_inline_svg",
             return_value="<svg></svg>",
         ) as cleaner:
             safe_artwork(SIMPLE)
@@ -64,7 +64,7 @@ class TestWhatSurvives:
         cache.clear()
         other = SIMPLE.replace("M0 0h8v8H0Z", "M1 1h6v6H1Z")
         with mock.patch(
-            "n26.core.templatetags.artwork.sanitize_inline_svg",
+            "gyrinx.svg.sanitize_inline_svg",
             return_value="<svg></svg>",
         ) as cleaner:
             safe_artwork(SIMPLE)
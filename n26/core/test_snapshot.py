@@ -0,0 +1,127 @@
+"""Gang sheets kept for readers, and what makes one stand no longer.
+
+``sheet_for`` serves the last sheet derived while the gang's ledger, its
+``modified`` and the committed library version all stand still. These check
+each of the three moves it on, and that a kept sheet reads back as the one
+that was derived.
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from n26.core import render
+from n26.core.models import Gang, GangSheetSnapshot
+from n26.core.operations import operation
+from n26.core.snapshot import sheet_for
+from n26.library import version
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def kept(settings):
+    """Snapshots on, with the committed library version read once."""
+    settings.N26_GANG_SHEET_SNAPSHOTS = True
+    settings.N26_LIBRARY_VERSION_TTL = 3600
+    version._seen = None
+    yield
+    version._seen = None
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Every sheet ``sheet_for`` derives rather than reads back."""
+    derived = []
+    render_gang = render.render_gang
+
+    def counted(*args, **kwargs):
+        derived.append(None)
+        return render_gang(*args, **kwargs)
+
+    monkeypatch.setattr(render, "render_gang", counted)
+    return derived
+
+
+@pytest.fixture
+def tester(db):
+    return User.objects.create_user("player")
+
+
+@pytest.fixture
+def gang(gang_type, tester):
+    return Gang.objects.create(
+        name="The Ashen Choir",
+        owner=tester,
+        gang_type=gang_type,
+        starting_credits=1000,
+        credits=340,
+    )
+
+
+def test_a_second_read_is_the_kept_sheet(kept, renders, gang):
+    first = sheet_for(gang)
+    second = sheet_for(Gang.objects.get(pk=gang.pk))
+
+    assert len(renders) == 1
+    assert second == first
+
+
+def test_off_it_derives_every_time(renders, gang):
+    sheet_for(gang)
+    sheet_for(gang)
+
+    assert len(renders) == 2
+    assert not GangSheetSnapshot.objects.exists()
+
+
+def test_an_operation_drops_the_snapshot(kept, gang, make_profile, tester):
+    sheet_for(gang)
+    with operation(gang, actor=tester) as op:
+        op.hire(make_profile("Ganger", price=0), "Vex")
+
+    assert not GangSheetSnapshot.objects.filter(gang=gang).exists()
+    sheet = sheet_for(Gang.objects.get(pk=gang.pk))
+    assert "Vex" in [card.name for card in sheet.models]
+
+
+def test_a_save_that_writes_no_event_still_misses(kept, renders, gang):
+    sheet_for(gang)
+    gang.credits = 200
+    gang.save()
+
+    assert sheet_for(Gang.objects.get(pk=gang.pk)).credits == 200
+    assert len(renders) == 2
+
+
+def test_a_committed_library_edit_misses(
+    kept, renders, gang, django_capture_on_commit_callbacks
+):
+    from n26.library.authoring import create_rule
+
+    sheet_for(gang)
+    with django_capture_on_commit_callbacks(execute=True):
+        create_rule("Fresh")
+    sheet_for(gang)
+
+    assert len(renders) == 2
+
+
+def test_a_kept_sheet_that_cannot_be_read_back_is_derived_anew(kept, renders, gang):
+    sheet_for(gang)
+    GangSheetSnapshot.objects.filter(gang=gang).update(data=b"not a sheet")
+
+    assert sheet_for(gang).name == gang.name
+    assert len(renders) == 2
+
+
+def test_a_reader_keeps_the_sheet_and_the_owner_does_not(kept, client, tester, gang):
+    client.force_login(tester)
+    assert client.get(reverse("n26-gang", args=[gang.pk])).status_code == 200
+    assert not GangSheetSnapshot.objects.exists()
+
+    client.logout()
+    response = client.get(reverse("n26-gang", args=[gang.pk]))
+    assert response.status_code == 200
+    assert gang.name in response.content.decode()
+    assert GangSheetSnapshot.objects.filter(gang=gang).exists()
@@ -88,6 +88,7 @@ def _gang_table_context(request, everyone=False, per_page=None):
     """
     from gyrinx.querysets import search_queryset
     from n26.core.models import Gang
+    from n26.library.artwork import prefetch
 
     query = request.GET.get("q", "").strip()
     listed = Gang.objects.filter(archived=False)
@@ -102,6 +103,9 @@ def _gang_table_context(request, everyone=False, per_page=None):
         total = page.paginator.count
         pages = _pages(request, page) if page.paginator.num_pages > 1 else None
         found = page.object_list
+    # Every row draws its type's badge: read them all now, the cold ones side
+    # by side, rather than a storage round trip per row as the table draws.
+    prefetch(gang.gang_type.icon_url for gang in found)
     return {
         "gangs": found,
         "query": query,
@@ -182,7 +186,9 @@ def gang_sheet(request, pk):
     what adds the controls: the reader who does not gets the sheet with
     every button, dialog and picker left off, and choices nobody has
     made read as words rather than as something to click. An
-    archived gang is nobody's to read.
+    archived gang is nobody's to read. That reader is served the sheet
+    kept from the last read (``n26.core.snapshot``) for as long as the
+    gang stands still, so a shared link costs no derivation at all.
 
     Every choice slot on the sheet — the gang's own and every member's —
     is pointed at its picker here, in one pass over what has already been
@@ -198,6 +204,7 @@ def gang_sheet(request, pk):
     from n26.core.card import build_gang_card
     from n26.core.owned import DIALOGS, EquipHost
     from n26.core.render import render_gang
+    from n26.core.snapshot import sheet_for
     from n26.core.views.choose import link_slots
     from n26.core.views.learn import link_skills
     from n26.core.views.owned import link_stash_actions, owned_dialog
@@ -205,8 +212,13 @@ def gang_sheet(request, pk):
     gang = _any_gang_or_404(pk)
     yours = gang.owner_id == getattr(request.user, "id", None)
     at = reverse("n26-gang", args=[gang.pk])
-    card = build_gang_card(gang)
-    sheet = render_gang(gang, card=card)
+    if yours:
+        card = build_gang_card(gang)
+        sheet = render_gang(gang, card=card)
+    else:
+        # A reader changes nothing and is pointed nowhere, so the sheet
+        # the last reader was drawn is theirs too, until the gang moves.
+        sheet = sheet_for(gang)
     dialog = None
     if yours:
         link_slots(gang, sheet, *sheet.models)
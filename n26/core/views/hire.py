@@ -383,15 +383,10 @@ def hire_fighter(request, pk):
     from n26.core.access import gang_collections
     from n26.core.forms import HireFighterForm
     from n26.core.hire import (
-        build_entries,
         build_hire_entry,
-        build_hire_list,
         collection_offers,
         collection_sections,
-        hireable_profiles,
-        section_by_gang_type,
-        section_hire_list,
-        supplementary_profiles,
+        kept_hire_list,
     )
     from n26.core.operations import Refusal, operation
     from n26.core.render import roster, summarise_roster
@@ -584,14 +579,10 @@ def hire_fighter(request, pk):
     # and almost nobody opens most of them, so each is fetched from
     # ``hire_card`` the first time its disclosure opens instead of every
     # one being built into and shipped with the page.
-    if scope == "supplementary":
-        hire_list = section_hire_list(
-            build_entries(list(supplementary_profiles()), with_cards=False)
-        )
-    elif scope == "all":
-        hire_list = section_by_gang_type(
-            build_entries(list(hireable_profiles()), with_cards=False)
-        )
+    # Kept per library version: only the gang's collections and the card
+    # addresses below are worked out per request.
+    if scope in ("supplementary", "all"):
+        hire_list = kept_hire_list(scope, with_cards=False)
     else:
         # The gang's own list, then a section for each collection it
         # carries that offers fighters. After the house's own sections
@@ -599,7 +590,7 @@ def hire_fighter(request, pk):
         # founds with is what it is, and a corruption's roster is
         # something it took on.
         hire_list = [
-            *section_hire_list(build_hire_list(gang.gang_type, with_cards=False)),
+            *kept_hire_list("gang", gang.gang_type, with_cards=False),
             *collection_sections(offers(), with_cards=False),
         ]
     _link_cards(gang, hire_list)
@@ -10,7 +10,11 @@ page works with no script at all.
 
 A campaign's gang accumulates acts for as long as it is played, so the
 page is paged: the story is read a screenful at a time rather than
-handing a browser every act a gang ever did.
+handing a browser every act a gang ever did. Unnarrowed, it is read from
+the ledger a screenful at a time too (``history.page``) — each page links
+to the acts before it with ``?before=`` — so the newest acts of a long
+story cost what a short one's do. A narrowed page still tells the whole
+story: a search has to read every act to say which ones match.
 """
 
 from dataclasses import dataclass
@@ -49,23 +53,24 @@ class Day:
 @login_required
 def gang_history(request, pk):
     gang = _own_gang_or_404(request, pk)
-    acts = history.build(gang, viewer=request.user)
-    total = len(acts)
 
     query = request.GET.get("q", "").strip()
     kind = request.GET.get("kind", "")
     if kind not in KINDS:
         kind = ""
     model = request.GET.get("model", "")
+    narrowed = bool(query or kind or model)
+
+    if narrowed:
+        shown = _narrowed(request, gang, query, kind, model)
+    else:
+        shown = _newest(request, gang)
 
     #: Every model the history names, whether or not it is still on the
     #: roster — a filter that cannot find the dead cannot explain them.
     #: Which option is selected is decided here: the template only reads
     #: flags.
-    named = sorted(
-        {(a.miniature_pk, a.miniature_name) for a in acts if a.miniature_pk},
-        key=lambda pair: pair[1].casefold(),
-    )
+    named = sorted(shown.pop("named"), key=lambda pair: pair[1].casefold())
     model_options = [
         {"value": pk, "label": name, "selected": pk == model} for pk, name in named
     ]
@@ -74,6 +79,26 @@ def gang_history(request, pk):
         for value, label in KINDS.items()
     ]
 
+    return render(
+        request,
+        "n26/gang_history.html",
+        {
+            "gang": gang,
+            **shown,
+            "query": query,
+            "kind_options": kind_options,
+            "model_options": model_options,
+            "narrowed": narrowed,
+        },
+    )
+
+
+def _narrowed(request, gang, query, kind, model):
+    """The whole story, filtered, a numbered page of it at a time."""
+    acts = history.build(gang, viewer=request.user)
+    total = len(acts)
+    named = {(a.miniature_pk, a.miniature_name) for a in acts if a.miniature_pk}
+
     if query:
         want = query.casefold()
         acts = [a for a in acts if want in a.search]
@@ -86,25 +111,35 @@ def gang_history(request, pk):
     # rather than the founding.
     matched = len(acts)
     page = Paginator(list(reversed(acts)), PER_PAGE).get_page(request.GET.get("page"))
-
-    return render(
-        request,
-        "n26/gang_history.html",
-        {
-            "gang": gang,
-            "days": _by_day(page.object_list),
-            # What this screenful carries, and what the whole answer
-            # holds, so the count can say "50 of 312".
-            "shown": len(page.object_list),
-            "matched": matched,
-            "total": total,
-            "pages": _pages(request, page) if page.paginator.num_pages > 1 else None,
-            "query": query,
-            "kind_options": kind_options,
-            "model_options": model_options,
-            "narrowed": bool(query or kind or model),
-        },
-    )
+    return {
+        "named": named,
+        "days": _by_day(page.object_list),
+        # What this screenful carries, and what the whole answer
+        # holds, so the count can say "50 of 312".
+        "shown": len(page.object_list),
+        "matched": matched,
+        "total": total,
+        "pages": _pages(request, page) if page.paginator.num_pages > 1 else None,
+    }
+
+
+def _newest(request, gang):
+    """A screenful read back from ``?before=``, and the way further back."""
+    before = request.GET.get("before", "")
+    page = history.page(gang, viewer=request.user, before=before, size=PER_PAGE)
+    older = ""
+    if page.older:
+        asked = request.GET.copy()
+        asked["before"] = page.older
+        older = f"?{asked.urlencode()}"
+    return {
+        "named": history.named_models(gang),
+        "days": _by_day(page.acts),
+        "shown": len(page.acts),
+        "older": older,
+        # Back to the top once the reader has gone back at all.
+        "newest": bool(before),
+    }
 
 
 def _by_day(acts):
@@ -197,7 +197,7 @@ def print_setup(request, pk):
     keeping it.
     """
     from n26.core.models import Assignment, Miniature, PrintConfig
-    from n26.core.render import render_gang
+    from n26.core.snapshot import sheet_for
 
     if request.method == "POST":
         gang = _own_gang_or_404(request, pk)
@@ -231,7 +231,8 @@ def print_setup(request, pk):
     gang = _any_gang_or_404(pk)
     yours = gang.owner_id == request.user.id
     loaded = _config_for(request, gang)
-    sheet = render_gang(gang)
+    # Read and never pointed anywhere, so the kept sheet serves.
+    sheet = sheet_for(gang)
     # The gang's named setups, whoever is reading: each is one click to
     # print, and a reader printing for somebody else wants the setup that
     # somebody else already settled on. The model count is counted in the
@@ -11,3 +11,8 @@ class LibraryConfig(AppConfig):
     #: Edition-prefixed for the admin index, as on N26Config. Display
     #: only — the label above is the contract.
     verbose_name = "N26 · Library"
+
+    def ready(self):
+        from n26.library import version
+
+        version.connect(self)
@@ -15,6 +15,7 @@ cleaned at render (``n26.core.templatetags.artwork``), not on the way in.
 from gyrinx.artwork import (
     MAX_BYTES,
     NOT_OURS,
+    prefetch,
     read,
     storage_bases,
     storage_key,
@@ -30,6 +31,7 @@ __all__ = [
     "NOT_OURS",
     "UPLOAD_PREFIX",
     "clean_onto",
+    "prefetch",
     "read",
     "storage_bases",
     "storage_key",
@@ -612,15 +612,17 @@ def _one_snapshot():
 
 
 def _perform(plan, report):
-    from n26.core.capture import differences, gang_state
+    from n26.core.capture import changes, sealed_states
     from n26.core.models import Gang
     from n26.core.reconcile import assert_reconciled
 
     with _one_snapshot(), transaction.atomic():
-        before = {
-            str(gang.pk): gang_state(gang)
-            for gang in Gang.objects.filter(pk__in=plan.gang_ids)
-        }
+        # Captured in shared passes and kept sealed: the transaction is
+        # open for as long as both readings take, and a reading of
+        # hundreds of gangs one render at a time is most of that.
+        before = sealed_states(
+            Gang.objects.filter(pk__in=plan.gang_ids).select_related("gang_type")
+        )
         made = _Made()
         for step in plan.steps:
             try:
@@ -634,9 +636,10 @@ def _perform(plan, report):
                 ) from failed
         # Fresh instances: the steps may have moved column-backed facts,
         # and a stale row would compare stale with stale.
-        gangs = list(Gang.objects.filter(pk__in=plan.gang_ids))
-        after = {str(gang.pk): gang_state(gang) for gang in gangs}
-        changed = differences(before, after)
+        gangs = list(
+            Gang.objects.filter(pk__in=plan.gang_ids).select_related("gang_type")
+        )
+        changed = changes(before, gangs)
         if changed:
             raise ConversionRefused(
                 f"[{plan.system}] refused — the pages would change:\n  "
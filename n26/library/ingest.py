@@ -29,9 +29,10 @@ An uploaded file is **held** between those stages
 file input back in, so a page that previewed an upload and then asked
 for the file again was asking the author to promise it was the same one;
 holding it makes the preview and the import two readings of one thing.
-What is not held is the plan: it is made again on the visit that shows
-it and again on the post that imports, because the contract is about the
-library as it stands.
+What is not held is the plan: it is about the library as it stands, so
+it may be kept only as long as both of the things it read stand still.
+:func:`plan_held` keeps it against the held bytes and the library
+version together, and plans again the moment either moves.
 
 Three standing rules are load-bearing here:
 
@@ -90,6 +91,7 @@ meaning "equipment-list only, priced by the list".
 """
 
 import csv
+import hashlib
 import io
 import random
 import re
@@ -583,7 +585,78 @@ def held_sheets(owner):
 
 def rows_of(held):
     """Held uploads → the rows :func:`plan_ingest` takes."""
-    return {name: read_csv(upload.text()) for name, upload in held.items()}
+    return _rows_of_texts({name: upload.text() for name, upload in held.items()})
+
+
+# --- Plans kept between the preview and its import ----------------------------
+
+#: Plans kept at once, across every author. A plan of the house sheets is
+#: tens of thousands of rows, and an author keeps one set of sheets, so a
+#: handful covers everyone previewing at the same time.
+MAX_KEPT_PLANS = 8
+
+#: ``{(sheets digest, pack, library version): plan}``.
+_kept = {}
+
+
+def _reset_kept_plans():
+    """Forget every kept plan, so the next reading plans afresh. For tests."""
+    _kept.clear()
+
+
+def _digest(texts):
+    """One hash for a set of sheets, in planning order, named as they go."""
+    digest = hashlib.sha256()
+    for name in SHEET_NAMES:
+        if name in texts:
+            digest.update(f"{name}\0{len(texts[name])}\0".encode())
+            digest.update(texts[name].encode())
+    return digest.hexdigest()
+
+
+def plan_held(held, pack=None):
+    """Held uploads → their :class:`IngestPlan`, planned once per reading.
+
+    A preview and the import after it plan the same bytes against the same
+    library, and planning the house sheets takes seconds each time — every
+    row resolved against the pack, then the whole pack settled. So the plan
+    is kept against the sheets' content and the library version
+    (``N26_INGEST_PLAN_CACHE``), and a second reading of either hands back
+    the first one's plan. Replace a sheet, or edit anything in the library
+    (an import included), and the next reading plans again.
+
+    The version is read fresh rather than as last seen, because this plan
+    may be the one performed: another process's edit a moment ago is
+    exactly what the import must not write past.
+
+    A kept plan is shared by every reading of it. Read it; never change it.
+    """
+    from django.conf import settings
+
+    from n26.library import version
+    from n26.library.models import get_default_pack
+
+    texts = {name: upload.text() for name, upload in held.items()}
+    pack = pack or get_default_pack()
+    if not settings.N26_INGEST_PLAN_CACHE:
+        return plan_ingest(pack=pack, **_rows_of_texts(texts))
+
+    key = (_digest(texts), pack.pk, version.current(fresh=True))
+    plan = _kept.get(key)
+    if plan is None:
+        plan = plan_ingest(pack=pack, **_rows_of_texts(texts))
+        # A plan of an older library can never be read again: the version
+        # only moves forward.
+        for stale in [kept for kept in list(_kept) if kept[2] != key[2]]:
+            _kept.pop(stale, None)
+        if len(_kept) >= MAX_KEPT_PLANS:
+            _kept.clear()
+        _kept[key] = plan
+    return plan
+
+
+def _rows_of_texts(texts):
+    return {name: read_csv(text) for name, text in texts.items()}
 
 
 def discard_sheets(owner, sheets=None):
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.7 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+def create_the_one_row(apps, schema_editor):
+    apps.get_model("library", "LibraryVersion").objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0064_sheets_are_held_between_upload_and_import"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LibraryVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "library version",
+                "verbose_name_plural": "library version",
+            },
+        ),
+        migrations.RunPython(create_the_one_row, migrations.RunPython.noop),
+    ]
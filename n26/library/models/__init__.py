@@ -79,6 +79,7 @@ from n26.library.models.statline import (
     StatlineType,
     StatlineTypeStat,
 )
+from n26.library.models.version import LibraryVersion
 
 __all__ = [
     "EMPTY_VALUE",
@@ -124,6 +125,7 @@ __all__ = [
     "SkillTree",
     "PlacesCategory",
     "LastingEffect",
+    "LibraryVersion",
     "Rule",
     "OffersChoice",
     "OpAddsMiniature",
@@ -0,0 +1,31 @@
+"""The library's content version — one number that moves whenever content does.
+
+Not content. It exists so that things worked out from content alone — the
+modifier index a card is computed against, first of all — can be kept
+between requests and thrown away the moment the content they came from
+changes. See ``n26.library.version``, which owns reading and moving it.
+"""
+
+from django.db import models
+
+#: The one row. A singleton by primary key rather than by constraint, so
+#: moving the number is a single ``UPDATE`` with no lookup in front of it.
+SINGLETON_PK = 1
+
+
+class LibraryVersion(models.Model):
+    """How many times library content has been committed to.
+
+    The value means nothing on its own — only that it differs from the last
+    one seen. It is never reset: a cache keyed on an old number must never
+    find itself matching again.
+    """
+
+    number = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "library version"
+        verbose_name_plural = "library version"
+
+    def __str__(self):
+        return f"Library version {self.number}"
@@ -443,7 +443,7 @@ def apply(fossils):
     """Delete exactly what was read, and prove every page unmoved."""
     from django.db.models import ProtectedError
 
-    from n26.core.capture import differences, gang_state
+    from n26.core.capture import changes, sealed_states
     from n26.core.models import Gang
     from n26.core.reconcile import assert_reconciled
     from n26.library.conversion.base import _one_snapshot
@@ -463,8 +463,9 @@ def apply(fossils):
     report = list(fossils.preview())
     try:
         with _one_snapshot(), transaction.atomic():
-            gangs = list(Gang.objects.filter(pk__in=fossils.gang_ids))
-            before = {str(gang.pk): gang_state(gang) for gang in gangs}
+            before = sealed_states(
+                Gang.objects.filter(pk__in=fossils.gang_ids).select_related("gang_type")
+            )
 
             # The order is what protects what. An offer names the menu
             # section it asks from, and a grant names the marker it
@@ -481,9 +482,10 @@ def apply(fossils):
             for model, pk in fossils.kind_rows:
                 model.objects.filter(pk=pk).delete()
 
-            gangs = list(Gang.objects.filter(pk__in=fossils.gang_ids))
-            after = {str(gang.pk): gang_state(gang) for gang in gangs}
-            changed = differences(before, after)
+            gangs = list(
+                Gang.objects.filter(pk__in=fossils.gang_ids).select_related("gang_type")
+            )
+            changed = changes(before, gangs)
             if changed:
                 raise Refused(
                     "refused — what a reader is told would change:\n  "
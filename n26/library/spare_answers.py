@@ -208,7 +208,7 @@ def _what_it_carries(row):
 
 def apply(spares):
     """Clear exactly the spares named, and prove the pages otherwise whole."""
-    from n26.core.capture import differences, gang_state
+    from n26.core.capture import differences, gang_states
     from n26.core.models import Assignment, Gang
     from n26.core.reconcile import assert_reconciled
     from n26.library.conversion.base import _one_snapshot
@@ -220,8 +220,13 @@ def apply(spares):
 
     report = list(spares.preview())
     with _one_snapshot(), transaction.atomic():
-        gangs = list(Gang.objects.filter(pk__in=spares.gang_ids))
-        before = {str(gang.pk): gang_state(gang) for gang in gangs}
+        # Whole captures rather than sealed ones: what the pages should
+        # read afterwards is worked out from them.
+        before = dict(
+            gang_states(
+                Gang.objects.filter(pk__in=spares.gang_ids).select_related("gang_type")
+            )
+        )
         want = _without_those_lines(before, spares)
 
         # The history events describing these rows ride the deletion:
@@ -234,8 +239,10 @@ def apply(spares):
         if not deleted:
             raise Refused("refused — nothing was there to clear")
 
-        gangs = list(Gang.objects.filter(pk__in=spares.gang_ids))
-        after = {str(gang.pk): gang_state(gang) for gang in gangs}
+        gangs = list(
+            Gang.objects.filter(pk__in=spares.gang_ids).select_related("gang_type")
+        )
+        after = dict(gang_states(gangs))
         changed = differences(want, after)
         if changed:
             raise Refused(
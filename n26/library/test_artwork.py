@@ -128,6 +128,36 @@ class TestReadingWhatAnAddressNames:
         assert artwork.read(address) == SOURCE
 
 
+class TestPrefetchingAPage:
+    """A page's artwork read up front, the cold drawings side by side."""
+
+    def test_every_address_comes_back_with_its_source(self, store_artwork, own_storage):
+        first = store_artwork(SOURCE, "first.svg")
+        second = store_artwork(SOURCE.replace("M2 2", "M3 3"), "second.svg")
+        elsewhere = "https://evil.example/badge.svg"
+
+        assert artwork.prefetch([first, second, first, elsewhere, ""]) == {
+            first: SOURCE,
+            second: SOURCE.replace("M2 2", "M3 3"),
+            elsewhere: "",
+        }
+
+    def test_the_rows_drawn_after_it_do_not_go_back_to_storage(
+        self, store_artwork, own_storage
+    ):
+        addresses = [store_artwork(SOURCE, f"badge-{n}.svg") for n in range(3)]
+        artwork.prefetch(addresses)
+        for path in (own_storage / "gang-type-icons").iterdir():
+            path.unlink()
+
+        assert [artwork.read(address) for address in addresses] == [SOURCE] * 3
+
+    def test_a_missing_object_reads_as_nothing(self, store_artwork, own_storage):
+        present = store_artwork(SOURCE)
+        gone = "/media/gang-type-icons/gone.svg"
+        assert artwork.prefetch([present, gone]) == {present: SOURCE, gone: ""}
+
+
 class TestWhatAGangTypeSays:
     """One accessor, so no surface has to know an address is involved."""
 
@@ -0,0 +1,100 @@
+"""Reading and moving the library's content version.
+
+Anything worked out from library content alone — never from a gang — may be
+kept between requests if it is keyed on ``current()``. The key moves when
+content does:
+
+- **In this process, at once.** Any save, delete or many-to-many change to a
+  library row bumps a process-local generation before the transaction has
+  even committed, so the request that made the edit never reads its own
+  stale cache.
+- **In every other process, within ``N26_LIBRARY_VERSION_TTL`` seconds.** The
+  committed number lives in one ``LibraryVersion`` row, moved on commit, and
+  each process re-reads it at most that often. Reading it on every render
+  would put a query back on exactly the paths the caches exist to empty.
+
+Signals are the whole mechanism, so a queryset ``update()`` or
+``bulk_create()`` over library rows moves nothing — call ``bump()`` after
+one. Data migrations need not: a deploy starts every process cold.
+"""
+
+import itertools
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+#: Library models that are not content: moving them changes nothing a
+#: content cache could have read.
+NOT_CONTENT = {"library.libraryversion", "library.uploadedsheet"}
+
+_generation = itertools.count(1)
+_local = 0
+#: ``(number, when it was read)`` — the committed number, as last seen here.
+_seen = None
+
+
+def current(fresh=False):
+    """The version to key content caches on: ``(committed, local)``.
+
+    ``fresh`` reads the committed number now rather than trusting the last
+    reading — for a cache whose answer may be written back, where one query
+    costs nothing next to writing past another process's edit.
+    """
+    global _seen
+    now = time.monotonic()
+    if fresh or _seen is None or now - _seen[1] >= settings.N26_LIBRARY_VERSION_TTL:
+        _seen = (_read(), now)
+    return (_seen[0], _local)
+
+
+def bump():
+    """Content changed: move the version here now, everywhere on commit."""
+    global _local
+    _local = next(_generation)
+    transaction.on_commit(_advance)
+
+
+def _read():
+    from n26.library.models.version import SINGLETON_PK, LibraryVersion
+
+    number = (
+        LibraryVersion.objects.filter(pk=SINGLETON_PK)
+        .values_list("number", flat=True)
+        .first()
+    )
+    return number or 0
+
+
+def _advance():
+    global _seen
+    from n26.library.models.version import SINGLETON_PK, LibraryVersion
+
+    moved = LibraryVersion.objects.filter(pk=SINGLETON_PK).update(
+        number=F("number") + 1
+    )
+    if not moved:
+        LibraryVersion.objects.get_or_create(pk=SINGLETON_PK, defaults={"number": 1})
+    # Read it back on next use rather than guessing: another process may
+    # have moved it too.
+    _seen = None
+
+
+def _content_changed(sender, **kwargs):
+    # A many-to-many signal fires before and after; one bump is enough.
+    if kwargs.get("action", "post_").startswith("post_"):
+        bump()
+
+
+def connect(app_config):
+    """Watch every content model the library app holds, through tables too."""
+    for model in app_config.get_models(include_auto_created=True):
+        if model._meta.label_lower in NOT_CONTENT:
+            continue
+        uid = f"library_version_{model._meta.label_lower}"
+        post_save.connect(_content_changed, sender=model, dispatch_uid=uid)
+        post_delete.connect(_content_changed, sender=model, dispatch_uid=uid)
+        # A many-to-many change is sent by its through model, declared or not.
+        m2m_changed.connect(_content_changed, sender=model, dispatch_uid=uid)
@@ -3462,25 +3462,26 @@ def ingest_sheet(request, sheet):
 def ingest_preview(request):
     """What the held sheets would write, and the button that writes it.
 
-    Planning happens on the way in, every time — on the visit that shows
-    the preview, and again on the post that imports. The preview *is*
-    the contract, and it is a contract about the library as it stands:
-    two plannings of the same files say the same thing, so what was
-    shown is what is written, while a preview kept from earlier would be
-    a promise about a library that has since moved.
+    The plan is read on the way in — on the visit that shows the preview,
+    and again on the post that imports. The preview *is* the contract,
+    and it is a contract about the library as it stands: two plannings of
+    the same files say the same thing, so what was shown is what is
+    written. That is also what lets the second reading reuse the first's
+    plan (``plan_held``) for as long as neither the files nor the library
+    have moved, and never a moment longer.
 
     The files themselves are the ones already held, which is what lets
     this page be looked at twice, reloaded, or read tomorrow.
     """
     from n26.analytics import EventVerb, N26Noun, record
-    from n26.library.ingest import held_sheets, perform, plan_ingest, rows_of
+    from n26.library.ingest import held_sheets, perform, plan_held
 
     held = held_sheets(request.user)
     if not held:
         messages.error(request, "No sheets are held. Upload one first.")
         return redirect("authoring-ingest")
 
-    plan = plan_ingest(**rows_of(held))
+    plan = plan_held(held)
     preview = plan.preview(examples=2)
     preview["shapes"] = _problems_by_shape(plan.problems)
     preview["errors"] = sum(1 for p in plan.problems if p.severity == "error")
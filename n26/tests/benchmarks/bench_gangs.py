@@ -0,0 +1,21 @@
+"""Benchmarks for the gang sheet and the hire screen."""
+
+import pytest
+
+from n26.core.hire import build_hire_list
+from n26.core.models import Gang
+from n26.core.render import render_gang
+
+pytestmark = pytest.mark.django_db
+
+
+def test_render_gang(benchmark, heavy_gang):
+    def run():
+        gang = Gang.objects.select_related("gang_type").get(pk=heavy_gang.pk)
+        assert render_gang(gang).models
+
+    benchmark("render_gang", run)
+
+
+def test_build_hire_list(benchmark, gang_type, hire_list):
+    benchmark("build_hire_list", lambda: build_hire_list(gang_type))
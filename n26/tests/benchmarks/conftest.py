@@ -0,0 +1,115 @@
+"""Seeded datasets for the n26 benchmarks.
+
+A gang type with a full hire list — every profile with a statline, a subtype,
+a rule and a weapon built in — and a 30-model gang of that type, each model
+carrying two weapons, a piece of wargear and two skills. The benchmarks are
+in ``bench_*.py`` and run from ``scripts/benchmark.sh`` (see
+``gyrinx/benchmark.py``).
+"""
+
+import pytest
+from django.contrib.auth.models import User
+
+from gyrinx.benchmark import (
+    ROUNDS,
+    Baseline,
+    baseline_path,
+    check,
+    production_settings,
+)
+from n26.core import card
+from n26.core.hire import _reset_kept_lists
+from n26.library import version
+from n26.library.ingest import _reset_kept_plans
+from n26.tests.sandbox.actions import (
+    add_built_in,
+    assign,
+    create_rule,
+    create_skill,
+    create_subtype,
+    create_wargear,
+    create_weapon,
+    found_gang,
+    give_weapon,
+    hire,
+    learn,
+)
+
+#: Profiles on the hire list, and models in the heavy gang.
+PROFILES = 40
+MODELS = 30
+
+#: Weapons and wargear the heavy gang's models carry between them.
+WEAPONS = 12
+WARGEAR = 8
+
+
+def _forget():
+    _reset_kept_lists()
+    _reset_kept_plans()
+    card._carried = (None, {})
+    version._seen = None
+
+
+@pytest.fixture(autouse=True)
+def deployed_settings(settings):
+    """The process caches on, as deployed, and cold at the start of each
+    benchmark; the version is read afresh, since the last one rolled back."""
+    for name, value in production_settings().items():
+        setattr(settings, name, value)
+    _forget()
+    yield
+    _forget()
+
+
+@pytest.fixture
+def benchmark():
+    """Measure a callable and hold it to the baseline (see gyrinx/benchmark.py)."""
+    baseline = Baseline(baseline_path())
+
+    def benchmark_(name, run, rounds=ROUNDS):
+        measurement, found = check(name, run, baseline, rounds=rounds)
+        print(f"\nbenchmark {measurement}")
+        assert not found, f"{name} regressed: " + "; ".join(found)
+        return measurement
+
+    return benchmark_
+
+
+@pytest.fixture
+def hire_list(make_profile, make_statline):
+    """Forty hireable profiles, each with its own built-ins."""
+    sidearm = create_weapon("Bench sidearm", profiles=[("Shot", 0), ("Burst", 5)])
+    profiles = []
+    for n in range(PROFILES):
+        profile = make_profile(f"Bench fighter {n}", price=40 + n)
+        make_statline(profile, movement=5, weapon_skill=4, toughness=3)
+        add_built_in(profile, create_subtype(f"Bench subtype {n % 5}"))
+        add_built_in(profile, create_rule(f"Bench rule {n}"))
+        add_built_in(profile, sidearm)
+        profiles.append(profile)
+    return profiles
+
+
+@pytest.fixture
+def heavy_gang(gang_type, hire_list):
+    """A 30-model gang of the hire list's type, with kit on every model."""
+    owner = User.objects.create_user("bench-owner")
+    gang = found_gang("Heavy gang", gang_type, owner=owner, budget=100000)
+    weapons = [
+        create_weapon(f"Bench gun {n}", profiles=[("Shot", 0), ("Special", 10)])
+        for n in range(WEAPONS)
+    ]
+    wargear = [create_wargear(f"Bench gear {n}", price=15) for n in range(WARGEAR)]
+    skills = [create_skill(f"Bench skill {n}") for n in range(6)]
+
+    for n in range(MODELS):
+        model = hire(gang, hire_list[n % len(hire_list)], f"Model {n}", paid=50)
+        for offset in range(2):
+            give_weapon(model, weapons[(n + offset) % len(weapons)], paid=20)
+        assign(wargear[n % len(wargear)], miniature=model, paid=15)
+        for skill in skills[n % 4 : n % 4 + 2]:
+            learn(model, skill)
+
+    gang.refresh_from_db()
+    return gang
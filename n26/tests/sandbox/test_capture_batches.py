@@ -0,0 +1,109 @@
+"""Capturing many gangs at once, and comparing the captures sealed.
+
+A sweep proving hundreds of gangs unchanged captures them in shared
+passes and keeps each capture sealed between its two readings. Neither
+may change what the proof says: a batch captures what one gang at a time
+would, and a sealed comparison finds exactly the differences a whole one
+does.
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n26.core import capture
+from n26.core.capture import (
+    changes,
+    differences,
+    gang_state,
+    gang_states,
+    sealed_states,
+)
+from n26.core.models import Gang, Miniature
+from n26.core.operations import operation
+from n26.library.authoring import add_built_in, create_rule, create_subtype
+from n26.tests.sandbox.actions import found_gang, hire
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def owner(db):
+    return User.objects.create_user("the-owner")
+
+
+@pytest.fixture
+def ganger(make_profile, make_statline):
+    profile = make_profile("Ganger", price=55)
+    make_statline(profile, movement=5, weapon_skill=4, toughness=3)
+    add_built_in(profile, create_subtype("Loner"))
+    add_built_in(profile, create_rule("Grit"))
+    return profile
+
+
+@pytest.fixture
+def make_gangs(gang_type, ganger, owner):
+    def make_gangs_(count):
+        gangs = []
+        for number in range(count):
+            gang = found_gang(f"Gang {number}", gang_type, owner=owner, budget=1000)
+            hire(gang, ganger, f"Vex {number}", paid=55, actor=owner)
+            hire(gang, ganger, f"Krago {number}", paid=55, actor=owner)
+            gangs.append(gang)
+        return gangs
+
+    return make_gangs_
+
+
+def fresh(gangs):
+    return list(
+        Gang.objects.filter(pk__in=[g.pk for g in gangs]).select_related("gang_type")
+    )
+
+
+def test_a_batch_captures_what_one_gang_at_a_time_does(monkeypatch, make_gangs):
+    # Smaller than the gangs, so a pass boundary falls among them.
+    monkeypatch.setattr(capture, "BATCH", 2)
+    gangs = fresh(make_gangs(3))
+
+    batched = dict(gang_states(gangs))
+
+    assert batched == {str(gang.pk): gang_state(gang) for gang in gangs}
+
+
+def test_a_sealed_comparison_finds_what_a_whole_one_does(make_gangs):
+    gangs = fresh(make_gangs(2))
+    whole = {str(gang.pk): gang_state(gang) for gang in gangs}
+    sealed = sealed_states(gangs)
+    assert changes(sealed, fresh(gangs)) == []
+
+    member = Miniature.objects.get(name="Vex 1")
+    with operation(gangs[1], actor=gangs[1].owner) as op:
+        op.rename(member, "Vex the Bold")
+
+    after = fresh(gangs)
+    found = changes(sealed, after)
+    assert found
+    assert found == differences(whole, {str(g.pk): gang_state(g) for g in after})
+
+
+def test_a_gang_gone_from_the_second_reading_is_said(make_gangs):
+    gangs = fresh(make_gangs(2))
+    sealed = sealed_states(gangs)
+
+    found = changes(sealed, gangs[:1])
+
+    assert found == [f"{gangs[1].pk}: vanishes ({sealed[str(gangs[1].pk)].open()!r})"]
+
+
+def test_a_batch_costs_less_than_its_gangs_one_by_one(make_gangs):
+    gangs = fresh(make_gangs(4))
+
+    with CaptureQueriesContext(connection) as one_by_one:
+        for gang in gangs:
+            gang_state(gang)
+    with CaptureQueriesContext(connection) as batched:
+        list(gang_states(gangs))
+
+    assert len(batched.captured_queries) < len(one_by_one.captured_queries)
@@ -370,6 +370,91 @@ class TestTheCostDoesNotFollowTheLength:
             history.build(long, viewer=gang.owner)
 
 
+class TestAPageAtATime:
+    """Read back from the newest act a screenful at a time, the story is
+    the one ``build`` tells — however the pages and the reads fall."""
+
+    def told(self, acts):
+        return [
+            ("".join(s.text for s in a.spans), [sub.name for sub in a.subs])
+            for a in acts
+        ]
+
+    def every_page(self, gang, size):
+        acts, before = [], ""
+        while True:
+            page = history.page(Gang.objects.get(pk=gang.pk), before=before, size=size)
+            acts += page.acts
+            if not page.older:
+                return acts
+            before = page.older
+
+    def the_whole_story(self, gang):
+        return self.told(reversed(history.build(Gang.objects.get(pk=gang.pk))))
+
+    @pytest.mark.parametrize("size", [1, 2, 5])
+    def test_the_pages_tell_what_build_tells(
+        self, monkeypatch, gang, ganger, owner, vex, size
+    ):
+        monkeypatch.setattr(history, "READ_BATCH", 3)
+        for number in range(3):
+            with edit(gang) as op:
+                op.rename(vex, f"Vex {number}")
+        hire(gang, ganger, "Krago", paid=55, actor=owner)
+        assert self.told(self.every_page(gang, size)) == self.the_whole_story(gang)
+
+    def test_an_operation_is_never_split_across_pages(self, monkeypatch, gang, vex):
+        monkeypatch.setattr(history, "READ_BATCH", 2)
+        first = history.page(Gang.objects.get(pk=gang.pk), size=1)
+        hired = act_saying(gang, "hired Vex")
+        assert [sub.name for sub in first.acts[0].subs] == [
+            sub.name for sub in hired.subs
+        ]
+
+    def test_unmarked_grants_fold_across_pages(self, monkeypatch, gang, vex):
+        from n26.core.models import LedgerEvent
+
+        monkeypatch.setattr(history, "READ_BATCH", 2)
+        with edit(gang) as op:
+            op.assign(
+                create_rule("Ferocity"),
+                miniature=vex,
+                caused_by=vex.membership,
+                kind=history.Kind.GRANTED,
+            )
+        LedgerEvent.objects.update(batch=None)
+        with edit(gang) as op:
+            op.rename(vex, "Vex the Bold")
+
+        told = self.told(self.every_page(gang, 1))
+        assert told == self.the_whole_story(gang)
+        assert not any("Ferocity" in sentence for sentence, _ in told)
+
+    def test_a_cursor_that_says_nothing_starts_at_the_newest(self, gang, vex):
+        newest = history.page(gang, size=1)
+        garbled = history.page(gang, before="not-a-cursor", size=1)
+        assert self.told(garbled.acts) == self.told(newest.acts)
+
+    def test_the_newest_page_costs_the_same_however_long_the_story(self, gang, vex):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        def queries():
+            with CaptureQueriesContext(connection) as ctx:
+                history.page(Gang.objects.get(pk=gang.pk), size=10)
+            return len(ctx.captured_queries)
+
+        for number in range(15):
+            with edit(gang) as op:
+                op.rename(vex, f"Vex {number}")
+        short = queries()
+        # Past one read back through the ledger.
+        for number in range(history.READ_BATCH):
+            with edit(gang) as op:
+                op.rename(vex, f"Vex again {number}")
+        assert queries() == short
+
+
 class TestThePageIsTheOwners:
     """The history says things the roster does not, so only the owner
     reads it — and every narrowing is an address."""
@@ -392,8 +477,8 @@ class TestThePageIsTheOwners:
         assert response.status_code == 302
 
     def test_a_long_story_is_read_a_page_at_a_time(self, client, gang, vex):
-        """A gang played for a season has more acts than a screen holds,
-        and the pager keeps whatever question the reader asked."""
+        """A gang played for a season has more acts than a screen holds:
+        each screenful links to the acts before it."""
         from n26.core.views.history import PER_PAGE
 
         for number in range(PER_PAGE + 2):
@@ -403,9 +488,32 @@ class TestThePageIsTheOwners:
         at = reverse("n26-gang-history", args=[gang.pk])
         first = client.get(at)
         assert first.context["shown"] == PER_PAGE
+        assert first.context["pages"] is None
+        assert not first.context["newest"]
+        # The link is really drawn, not merely computed.
+        older = first.context["older"]
+        assert "before=" in older
+        assert "Older acts" in first.content.decode()
+        second = client.get(at + older)
+        assert second.status_code == 200
+        assert second.context["newest"]
+        assert second.context["older"] == ""
+        assert "hired" in second.content.decode()
+
+    def test_a_narrowed_story_is_paged_by_number(self, client, gang, vex):
+        """The pager keeps whatever question the reader asked."""
+        from n26.core.views.history import PER_PAGE
+
+        for number in range(PER_PAGE + 2):
+            with edit(gang) as op:
+                op.rename(vex, f"Vex {number}")
+        client.force_login(gang.owner)
+        at = reverse("n26-gang-history", args=[gang.pk])
+        first = client.get(at, {"q": "renamed"})
+        assert first.context["shown"] == PER_PAGE
         assert first.context["pages"]["of"] == 2
-        # The pager is really drawn, not merely computed — and the end
-        # it cannot go to is dead rather than a live link to nowhere.
+        # The pager is really drawn — and the end it cannot go to is dead
+        # rather than a live link to nowhere.
         drawn = first.content.decode()
         assert "page=2" in drawn
         back = drawn[drawn.index('aria-label="Previous page"') - 200 :][:400]
@@ -0,0 +1,86 @@
+"""The hire list, kept between renders until library content changes.
+
+What a gang type may hire, and at what price, depends on library content
+alone, so a process that has built the list hands it to every gang of that
+type that follows — each reader getting a copy of its own to decorate —
+until an edit moves the library version and the next read builds afresh.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n26.core.hire import _reset_kept_lists, kept_hire_list
+from n26.library import version
+from n26.library.models import Profile
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cached(settings):
+    """The cache on, starting cold, with the committed version read once."""
+    settings.N26_HIRE_LIST_CACHE = True
+    settings.N26_LIBRARY_VERSION_TTL = 3600
+    _reset_kept_lists()
+    version._seen = None
+    yield
+    _reset_kept_lists()
+    version._seen = None
+
+
+@pytest.fixture
+def roster(make_profile, make_statline, gang_type):
+    for name, price in [("Juve", 25), ("Ganger", 55)]:
+        make_statline(make_profile(name, price=price), movement=5)
+    return gang_type
+
+
+def priced(sections):
+    return [
+        (entry.name, entry.base_price)
+        for section in sections
+        for entry in section.all_entries()
+    ]
+
+
+class TestTheCache:
+    def test_a_second_read_costs_no_queries(
+        self, cached, roster, django_assert_num_queries
+    ):
+        kept_hire_list("gang", roster)
+
+        with django_assert_num_queries(0):
+            assert priced(kept_hire_list("gang", roster)) == [
+                ("Juve", 25),
+                ("Ganger", 55),
+            ]
+
+    def test_an_edit_builds_it_again(self, cached, roster):
+        kept_hire_list("gang", roster)
+
+        juve = Profile.objects.get(name="Juve")
+        juve.price = 60
+        juve.save()
+
+        assert priced(kept_hire_list("gang", roster)) == [
+            ("Ganger", 55),
+            ("Juve", 60),
+        ]
+
+    def test_decorating_a_copy_leaves_the_next_reader_alone(self, cached, roster):
+        for section in kept_hire_list("gang", roster):
+            for entry in section.all_entries():
+                entry.card_url = "/one/gang/"
+                entry.options[0].card_url = "/one/gang/option/"
+
+        (entry, *_) = kept_hire_list("gang", roster)[0].all_entries()
+        assert entry.card_url == ""
+        assert entry.options[0].card_url == ""
+
+    def test_off_it_builds_every_time(self, roster):
+        kept_hire_list("gang", roster)
+
+        with CaptureQueriesContext(connection) as queries:
+            kept_hire_list("gang", roster)
+        assert len(queries) > 0
@@ -12,7 +12,10 @@ library back to its foundations.
 import pytest
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from n26.library.ingest import _reset_kept_plans
 from n26.library.models import Profile, UploadedSheet, Wargear, Weapon
 from n26.library.models.collection import Collection
 from n26.library.standard_content import STANDARD_CONTENT
@@ -360,6 +363,58 @@ Equipment List,Escher,Ranged weapons,Web weapons,Web pisol,,90,,x
         assert Weapon.objects.count() == weapons
 
 
+class TestKeepingThePlan:
+    """A second reading of the same sheets against the same library
+    reuses the first one's plan — and only then."""
+
+    @pytest.fixture(autouse=True)
+    def kept(self, settings):
+        settings.N26_INGEST_PLAN_CACHE = True
+        _reset_kept_plans()
+        yield
+        _reset_kept_plans()
+
+    def read(self, client):
+        with CaptureQueriesContext(connection) as ctx:
+            body = client.get(PREVIEW_URL).content.decode()
+        return body, len(ctx.captured_queries)
+
+    def test_a_second_preview_is_not_planned_again(self, author, client, foundation):
+        hold_all(client)
+
+        first, planned = self.read(client)
+        second, kept = self.read(client)
+
+        assert kept < planned
+        assert "to create" in second
+        assert first.count("to create") == second.count("to create")
+
+    def test_a_replaced_sheet_is_planned_afresh(self, author, client, foundation):
+        hold_all(client)
+        self.read(client)
+
+        hold(
+            client,
+            "equipment",
+            text=EQUIPMENT_CSV
+            + "Wargear,Wargear,Personal equipment,Grapnel launcher,,30,1,x\n",
+        )
+        client.post(PREVIEW_URL, follow=True)
+
+        assert Wargear.objects.filter(name="Grapnel launcher").exists()
+
+    def test_an_import_is_read_back_against_the_library_it_made(
+        self, author, client, foundation
+    ):
+        hold_all(client)
+        self.read(client)
+
+        body = client.post(PREVIEW_URL, follow=True).content.decode()
+
+        assert Weapon.objects.count() == 6
+        assert "0 to create" in body
+
+
 class TestTheDangerZone:
     """Undoing an import is its own page: it says what would go, and
     only a post takes it."""
@@ -0,0 +1,104 @@
+"""The modifier index, kept between renders until library content changes.
+
+What a carrier's modifiers are depends on library content alone, so once a
+process has hydrated them it may hand the same rows to every gang that
+follows — until an edit moves the library version, after which the next
+build fetches afresh and sees the edit.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from n26.core import card as card_module
+from n26.core.card import build_modifier_index
+from n26.library import version
+from n26.library.models import LibraryVersion, Profile
+from n26.tests.sandbox.actions import (
+    adds,
+    create_rule,
+    modifier,
+    targets_model,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cached(settings):
+    """The cache on, starting cold, with the committed version read once."""
+    settings.N26_MODIFIER_INDEX_CACHE = True
+    settings.N26_LIBRARY_VERSION_TTL = 3600
+    card_module._carried = (None, {})
+    version._seen = None
+    yield
+    card_module._carried = (None, {})
+    version._seen = None
+
+
+@pytest.fixture
+def juve(make_profile):
+    """A profile granting a rule that itself carries a modifier."""
+    profile = make_profile("Juve", price=25)
+    sprint = create_rule("Sprint")
+    modifier("Juves are nimble", targets_model(), adds(sprint), carried_by=profile)
+    modifier(
+        "Sprinters dodge",
+        targets_model(),
+        adds(create_rule("Dodge")),
+        carried_by=sprint,
+    )
+    return profile, sprint
+
+
+def names(index, thing):
+    return [modifier.name for modifier, _ in index.for_thing(thing)]
+
+
+class TestTheCache:
+    def test_a_second_build_costs_no_queries(
+        self, cached, juve, django_assert_num_queries
+    ):
+        profile, sprint = juve
+        build_modifier_index([profile])
+
+        with django_assert_num_queries(0):
+            index = build_modifier_index([profile])
+            assert names(index, profile) == ["Juves are nimble"]
+            # Granted carriers are followed from the cache too.
+            assert names(index, sprint) == ["Sprinters dodge"]
+
+    def test_an_edit_drops_what_was_kept(self, cached, juve):
+        profile, _ = juve
+        build_modifier_index([profile])
+
+        edited = profile.modifiers.get()
+        edited.name = "Juves are quick"
+        edited.save()
+
+        # A fresh read, as the next request would make.
+        profile = Profile.objects.get(pk=profile.pk)
+        assert names(build_modifier_index([profile]), profile) == ["Juves are quick"]
+
+    def test_off_it_fetches_every_time(self, juve):
+        profile, _ = juve
+        build_modifier_index([profile])
+
+        with CaptureQueriesContext(connection) as queries:
+            build_modifier_index([profile])
+        assert len(queries) > 0
+
+
+class TestTheVersion:
+    def test_an_edit_moves_it_here_at_once(self, cached, juve):
+        before = version.current()
+        create_rule("Fresh")
+        assert version.current() != before
+
+    def test_and_everywhere_on_commit(
+        self, cached, juve, django_capture_on_commit_callbacks
+    ):
+        before = version._read()
+        with django_capture_on_commit_callbacks(execute=True):
+            create_rule("Fresh")
+        assert LibraryVersion.objects.get().number == before + 1
@@ -0,0 +1,27 @@
+#!/bin/bash
+# Run the benchmark suites against the local PostgreSQL database.
+#
+# Seeds campaign-sized gangs, campaigns and packs, then times the hot paths
+# and compares queries, time and peak memory with the stored baseline
+# (gyrinx/benchmark.py). Serial, because parallel workers would be timing
+# each other.
+#
+# Usage:
+#   ./scripts/benchmark.sh                  # measure, fail on regressions
+#   ./scripts/benchmark.sh --update         # record the baseline instead
+#   ./scripts/benchmark.sh -k list_print    # extra args go to pytest
+#
+# Record on main, then measure the branch, on the same machine: a baseline
+# from another machine compares nothing.
+
+set -e
+
+cd "$(dirname "$0")/.."
+
+if [ "$1" = "--update" ]; then
+    export BENCHMARK_UPDATE=1
+    shift
+fi
+
+exec pytest -n 0 -s -o python_files="bench_*.py" \
+    n23/core/tests/benchmarks n26/tests/benchmarks "$@"